@@ -0,0 +1,118 @@
+from datetime import datetime, timezone, timedelta
+
+from app.application import Instruction
+from app.application.apply_price_retention.apply_price_retention_command_response import (
+    ApplyPriceRetentionCommandResponse,
+)
+from app.domain.crypto.models.candle_interval import CandleInterval
+from app.domain.crypto.models.price_partition_interval import (
+    PricePartitionInterval,
+)
+from app.domain.crypto.repositories.price_archive_repository import (
+    PriceArchiveRepository,
+)
+from app.domain.crypto.repositories.price_partition_repository import (
+    PricePartitionRepository,
+)
+from app.domain.crypto.repositories.price_repository import PriceRepository
+from app.domain.crypto.repositories.ticker_repository import TickerRepository
+
+
+class ApplyPriceRetentionCommand(Instruction):
+    def __init__(
+        self,
+        price_partition_repository: PricePartitionRepository,
+        price_repository: PriceRepository,
+        ticker_repository: TickerRepository,
+        price_archive_repository: PriceArchiveRepository,
+        interval: PricePartitionInterval,
+        prices_retention_days: int,
+        candles_retention_days: dict[CandleInterval, int],
+        drop_partitions: bool,
+    ):
+        self.__price_partition_repository = price_partition_repository
+        self.__price_repository = price_repository
+        self.__ticker_repository = ticker_repository
+        self.__price_archive_repository = price_archive_repository
+        self.__interval = interval
+        self.__prices_retention_days = prices_retention_days
+        self.__candles_retention_days = candles_retention_days
+        self.__drop_partitions = drop_partitions
+
+    def execute(
+        self, instant: None | datetime = None
+    ) -> ApplyPriceRetentionCommandResponse:
+        now = instant or datetime.now(timezone.utc).replace(tzinfo=None)
+
+        removed_partitions, skipped_partitions = self.__remove_expired_partitions(now)
+
+        return ApplyPriceRetentionCommandResponse(
+            removed_partitions=removed_partitions,
+            skipped_partitions=skipped_partitions,
+            deleted_candles=self.__delete_expired_candles(now),
+        )
+
+    def __remove_expired_partitions(
+        self, now: datetime
+    ) -> tuple[list[datetime], list[datetime]]:
+        if self.__prices_retention_days <= 0:
+            return [], []
+
+        end_date = now - timedelta(days=self.__prices_retention_days)
+        removed_partitions: list[datetime] = []
+        skipped_partitions: list[datetime] = []
+        archive_ends = {
+            ticker.id: self.__price_archive_repository.get_archive_end_by_ticker_id(
+                ticker.id
+            )
+            for ticker in self.__ticker_repository.get_all()
+        }
+
+        for start_date in self.__price_partition_repository.get_partition_start_dates():
+            partition_end_date = self.__interval.next(start_date)
+
+            if partition_end_date > end_date:
+                continue
+
+            if not self.__is_archived(start_date, partition_end_date, archive_ends):
+                skipped_partitions.append(start_date)
+                continue
+
+            if self.__price_partition_repository.remove_partition(
+                start_date, self.__drop_partitions
+            ):
+                removed_partitions.append(start_date)
+
+        return removed_partitions, skipped_partitions
+
+    def __is_archived(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        archive_ends: dict[int, None | datetime],
+    ) -> bool:
+        for ticker_id, archive_end in archive_ends.items():
+            timestamp_range = self.__price_repository.get_timestamp_range_by_ticker_id(
+                ticker_id, start_date, end_date
+            )
+
+            if timestamp_range is None:
+                continue
+
+            if archive_end is None or timestamp_range[1] >= archive_end:
+                return False
+
+        return True
+
+    def __delete_expired_candles(self, now: datetime) -> dict[CandleInterval, int]:
+        deleted_candles: dict[CandleInterval, int] = {}
+
+        for interval, retention_days in self.__candles_retention_days.items():
+            if retention_days <= 0:
+                continue
+
+            deleted_candles[interval] = self.__price_repository.delete_candles_before(
+                interval, now - timedelta(days=retention_days)
+            )
+
+        return deleted_candles
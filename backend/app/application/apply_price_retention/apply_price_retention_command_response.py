@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.application import Response
+from app.domain.crypto.models.candle_interval import CandleInterval
+
+
+@dataclass(frozen=True)
+class ApplyPriceRetentionCommandResponse(Response):
+    removed_partitions: list[datetime]
+    skipped_partitions: list[datetime]
+    deleted_candles: dict[CandleInterval, int]
@@ -0,0 +1,85 @@
+from datetime import date, datetime, timezone, timedelta
+
+from app.application import Instruction
+from app.application.archive_prices.archive_prices_command_response import (
+    ArchivePricesCommandResponse,
+)
+from app.domain.crypto.repositories.price_archive_repository import (
+    PriceArchiveRepository,
+)
+from app.domain.crypto.repositories.price_repository import PriceRepository
+from app.domain.crypto.repositories.ticker_repository import TickerRepository
+
+
+class ArchivePricesCommand(Instruction):
+    def __init__(
+        self,
+        ticker_repository: TickerRepository,
+        price_repository: PriceRepository,
+        price_archive_repository: PriceArchiveRepository,
+        max_days: int,
+    ):
+        self.__ticker_repository = ticker_repository
+        self.__price_repository = price_repository
+        self.__price_archive_repository = price_archive_repository
+        self.__max_days = max_days
+
+    def execute(self, instant: None | datetime = None) -> ArchivePricesCommandResponse:
+        today = (instant or datetime.now(timezone.utc).replace(tzinfo=None)).date()
+        archived_days: dict[int, list[date]] = {}
+
+        for ticker in self.__ticker_repository.get_all():
+            ticker_archived_days = self.__archive_ticker(ticker.id, today)
+
+            if ticker_archived_days:
+                archived_days[ticker.id] = ticker_archived_days
+
+        return ArchivePricesCommandResponse(archived_days=archived_days)
+
+    def __archive_ticker(self, ticker_id: int, today: date) -> list[date]:
+        day_start = self.__price_archive_repository.get_archive_end_by_ticker_id(
+            ticker_id
+        )
+
+        if day_start is None:
+            timestamp_range = self.__price_repository.get_timestamp_range_by_ticker_id(
+                ticker_id, None, None
+            )
+
+            if timestamp_range is None:
+                return []
+
+            day_start = datetime.combine(timestamp_range[0].date(), datetime.min.time())
+
+        archived_days: list[date] = []
+
+        while len(archived_days) < self.__max_days:
+            if day_start.date() >= today:
+                break
+
+            day_end = day_start + timedelta(days=1)
+            prices = self.__price_repository.get_all_or_fail_by_ticker_id(
+                ticker_id, day_start, day_end, include_end=False, check_ticker=False
+            )
+
+            if not prices:
+                timestamp_range = (
+                    self.__price_repository.get_timestamp_range_by_ticker_id(
+                        ticker_id, day_end, None
+                    )
+                )
+
+                if timestamp_range is None:
+                    break
+
+                day_start = datetime.combine(
+                    timestamp_range[0].date(), datetime.min.time()
+                )
+                continue
+
+            self.__price_archive_repository.save(ticker_id, day_start.date(), prices)
+            archived_days.append(day_start.date())
+
+            day_start = day_end
+
+        return archived_days
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from datetime import date
+
+from app.application import Response
+
+
+@dataclass(frozen=True)
+class ArchivePricesCommandResponse(Response):
+    archived_days: dict[int, list[date]]
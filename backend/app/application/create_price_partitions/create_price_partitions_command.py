@@ -0,0 +1,44 @@
+from datetime import datetime, timezone
+
+from app.application import Instruction
+from app.application.create_price_partitions.create_price_partitions_command_response import (
+    CreatePricePartitionsCommandResponse,
+)
+from app.domain.crypto.models.price_partition_interval import (
+    PricePartitionInterval,
+)
+from app.domain.crypto.repositories.price_partition_repository import (
+    PricePartitionRepository,
+)
+
+
+class CreatePricePartitionsCommand(Instruction):
+    def __init__(
+        self,
+        price_partition_repository: PricePartitionRepository,
+        interval: PricePartitionInterval,
+        premake: int,
+    ):
+        self.__price_partition_repository = price_partition_repository
+        self.__interval = interval
+        self.__premake = premake
+
+    def execute(
+        self, instant: None | datetime = None
+    ) -> CreatePricePartitionsCommandResponse:
+        start_date = self.__interval.floor(
+            instant or datetime.now(timezone.utc).replace(tzinfo=None)
+        )
+        created_partitions: list[datetime] = []
+
+        for _ in range(self.__premake + 1):
+            end_date = self.__interval.next(start_date)
+
+            if self.__price_partition_repository.create_partition(start_date, end_date):
+                created_partitions.append(start_date)
+
+            start_date = end_date
+
+        return CreatePricePartitionsCommandResponse(
+            created_partitions=created_partitions
+        )
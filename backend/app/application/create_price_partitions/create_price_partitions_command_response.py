@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.application import Response
+
+
+@dataclass(frozen=True)
+class CreatePricePartitionsCommandResponse(Response):
+    created_partitions: list[datetime]
@@ -3,14 +3,16 @@ from app.application.create_ticker.create_ticker_command_response import (
     CreateTickerCommandResponse,
 )
 from app.domain.crypto.models.ticker import Ticker
-from app.domain.crypto.repositories.ticker_repository import TickerRepository
+from app.domain.crypto.repositories.async_ticker_repository import (
+    AsyncTickerRepository,
+)
 
 
 class CreateTickerCommand(Instruction):
-    def __init__(self, ticker_repository: TickerRepository):
+    def __init__(self, ticker_repository: AsyncTickerRepository):
         self.__ticker_repository = ticker_repository
 
-    def execute(self, ticker: Ticker) -> CreateTickerCommandResponse:
+    async def execute(self, ticker: Ticker) -> CreateTickerCommandResponse:
         return CreateTickerCommandResponse(
-            created_ticker=self.__ticker_repository.insert(ticker)
+            created_ticker=await self.__ticker_repository.insert(ticker)
         )
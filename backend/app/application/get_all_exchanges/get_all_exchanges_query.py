@@ -2,14 +2,16 @@ from app.application import Instruction
 from app.application.get_all_exchanges.get_all_exchanges_query_response import (
     GetAllExchangesQueryResponse,
 )
-from app.domain.exchange.repositories.exchange_repository import ExchangeRepository
+from app.domain.exchange.repositories.async_exchange_repository import (
+    AsyncExchangeRepository,
+)
 
 
 class GetAllExchangesQuery(Instruction):
-    def __init__(self, exchange_repository: ExchangeRepository):
+    def __init__(self, exchange_repository: AsyncExchangeRepository):
         self.__exchange_repository = exchange_repository
 
-    def execute(self) -> GetAllExchangesQueryResponse:
+    async def execute(self) -> GetAllExchangesQueryResponse:
         return GetAllExchangesQueryResponse(
-            exchanges=self.__exchange_repository.get_all()
+            exchanges=await self.__exchange_repository.get_all()
         )
@@ -4,14 +4,16 @@ from app.application import Instruction
 from app.application.get_all_prices_by_ticker_id.get_all_prices_by_ticker_id_query_response import (
     GetAllPricesByTickerIdQueryResponse,
 )
-from app.domain.crypto.repositories.price_repository import PriceRepository
+from app.domain.crypto.repositories.async_price_repository import (
+    AsyncPriceRepository,
+)
 
 
 class GetAllPricesByTickerIdQuery(Instruction):
-    def __init__(self, price_repository: PriceRepository):
+    def __init__(self, price_repository: AsyncPriceRepository):
         self.__price_repository = price_repository
 
-    def execute(
+    async def execute(
         self,
         ticker_id: int,
         start_date: None | datetime,
@@ -20,7 +22,7 @@ class GetAllPricesByTickerIdQuery(Instruction):
         check_ticker=True,
     ) -> GetAllPricesByTickerIdQueryResponse:
         return GetAllPricesByTickerIdQueryResponse(
-            prices=self.__price_repository.get_all_or_fail_by_ticker_id(
+            prices=await self.__price_repository.get_all_or_fail_by_ticker_id(
                 ticker_id, start_date, end_date, include_end, check_ticker
             )
         )
@@ -0,0 +1,25 @@
+from datetime import datetime
+
+from app.application import Instruction
+from app.application.get_all_prices_by_ticker_ids.get_all_prices_by_ticker_ids_query_response import (
+    GetAllPricesByTickerIdsQueryResponse,
+)
+from app.domain.crypto.repositories.price_repository import PriceRepository
+
+
+class GetAllPricesByTickerIdsQuery(Instruction):
+    def __init__(self, price_repository: PriceRepository):
+        self.__price_repository = price_repository
+
+    def execute(
+        self,
+        ticker_ids: list[int],
+        start_date: None | datetime,
+        end_date: None | datetime,
+    ) -> GetAllPricesByTickerIdsQueryResponse:
+        return GetAllPricesByTickerIdsQueryResponse(
+            ticker_ids=ticker_ids,
+            prices=self.__price_repository.stream_all_or_fail_by_ticker_ids(
+                ticker_ids, start_date, end_date
+            ),
+        )
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from typing import Iterator
+
+from app.application import Response
+from app.domain.crypto.models.price import Price
+
+
+@dataclass(frozen=True)
+class GetAllPricesByTickerIdsQueryResponse(Response):
+    ticker_ids: list[int]
+    prices: Iterator[Price]
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+from app.application import Response
+from app.domain.crypto.models.candle import Candle
+from app.domain.crypto.models.candle_interval import CandleInterval
+
+
+@dataclass(frozen=True)
+class GetCandlesByTickerIdQueryResponse(Response):
+    interval: CandleInterval
+    candles: list[Candle]
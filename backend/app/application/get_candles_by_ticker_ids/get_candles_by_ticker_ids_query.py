@@ -0,0 +1,49 @@
+from datetime import datetime
+
+from app.application import Instruction
+from app.application.get_candles_by_ticker_ids.get_candles_by_ticker_ids_query_response import (
+    GetCandlesByTickerIdsQueryResponse,
+)
+from app.domain.crypto.models.candle_interval import CandleInterval
+from app.domain.crypto.repositories.price_repository import PriceRepository
+
+
+class GetCandlesByTickerIdsQuery(Instruction):
+    def __init__(self, price_repository: PriceRepository, auto_points: int):
+        self.__price_repository = price_repository
+        self.__auto_points = auto_points
+
+    def execute(
+        self,
+        ticker_ids: list[int],
+        start_date: None | datetime,
+        end_date: None | datetime,
+        interval: CandleInterval,
+        points: None | int = None,
+    ) -> GetCandlesByTickerIdsQueryResponse:
+        if interval is CandleInterval.AUTO:
+            interval = self.__resolve_auto_interval(
+                ticker_ids, start_date, end_date, points or self.__auto_points
+            )
+
+        return GetCandlesByTickerIdsQueryResponse(
+            interval=interval,
+            candles=self.__price_repository.get_candles_or_fail_by_ticker_ids(
+                ticker_ids, start_date, end_date, interval
+            ),
+        )
+
+    def __resolve_auto_interval(
+        self,
+        ticker_ids: list[int],
+        start_date: None | datetime,
+        end_date: None | datetime,
+        points: int,
+    ) -> CandleInterval:
+        timestamp_range = None
+        if start_date is None or end_date is None:
+            timestamp_range = self.__price_repository.get_timestamp_range_by_ticker_ids(
+                ticker_ids, start_date, end_date
+            )
+
+        return CandleInterval.fit_range(start_date, end_date, timestamp_range, points)
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+from app.application import Response
+from app.domain.crypto.models.candle import Candle
+from app.domain.crypto.models.candle_interval import CandleInterval
+
+
+@dataclass(frozen=True)
+class GetCandlesByTickerIdsQueryResponse(Response):
+    interval: CandleInterval
+    candles: dict[int, list[Candle]]
@@ -2,14 +2,16 @@ from app.application import Instruction
 from app.application.get_exchange_by_id.get_exchange_by_id_query_response import (
     GetExchangeByIdQueryResponse,
 )
-from app.domain.exchange.repositories.exchange_repository import ExchangeRepository
+from app.domain.exchange.repositories.async_exchange_repository import (
+    AsyncExchangeRepository,
+)
 
 
 class GetExchangeByIdQuery(Instruction):
-    def __init__(self, exchange_repository: ExchangeRepository):
+    def __init__(self, exchange_repository: AsyncExchangeRepository):
         self.__exchange_repository = exchange_repository
 
-    def execute(self, exchange_id: int) -> GetExchangeByIdQueryResponse:
+    async def execute(self, exchange_id: int) -> GetExchangeByIdQueryResponse:
         return GetExchangeByIdQueryResponse(
-            exchange=self.__exchange_repository.get_or_fail_by_id(exchange_id)
+            exchange=await self.__exchange_repository.get_or_fail_by_id(exchange_id)
         )
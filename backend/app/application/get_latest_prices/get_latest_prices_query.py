@@ -0,0 +1,23 @@
+from app.application import Instruction
+from app.application.get_latest_prices.get_latest_prices_query_response import (
+    GetLatestPricesQueryResponse,
+)
+from app.domain.crypto.repositories.async_latest_price_repository import (
+    AsyncLatestPriceRepository,
+)
+
+
+class GetLatestPricesQuery(Instruction):
+    def __init__(self, latest_price_repository: AsyncLatestPriceRepository):
+        self.__latest_price_repository = latest_price_repository
+
+    async def execute(
+        self,
+        ticker_ids: None | list[int] = None,
+        exchange_ids: None | list[int] = None,
+    ) -> GetLatestPricesQueryResponse:
+        return GetLatestPricesQueryResponse(
+            prices=await self.__latest_price_repository.get_all(
+                ticker_ids, exchange_ids
+            )
+        )
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+from app.application import Response
+from app.domain.crypto.models.price import Price
+
+
+@dataclass(frozen=True)
+class GetLatestPricesQueryResponse(Response):
+    prices: list[Price]
@@ -2,14 +2,16 @@ from app.application import Instruction
 from app.application.get_symbol_by_id.get_symbol_by_id_query_response import (
     GetSymbolByIdQueryResponse,
 )
-from app.domain.crypto.repositories.symbol_repository import SymbolRepository
+from app.domain.crypto.repositories.async_symbol_repository import (
+    AsyncSymbolRepository,
+)
 
 
 class GetSymbolByIdQuery(Instruction):
-    def __init__(self, symbol_repository: SymbolRepository):
+    def __init__(self, symbol_repository: AsyncSymbolRepository):
         self.__symbol_repository = symbol_repository
 
-    def execute(self, symbol_id: int) -> GetSymbolByIdQueryResponse:
+    async def execute(self, symbol_id: int) -> GetSymbolByIdQueryResponse:
         return GetSymbolByIdQueryResponse(
-            symbol=self.__symbol_repository.get_or_fail_by_id(symbol_id)
+            symbol=await self.__symbol_repository.get_or_fail_by_id(symbol_id)
         )
@@ -0,0 +1,27 @@
+from datetime import datetime
+
+from app.application import Instruction
+from app.application.stream_price_columns_by_ticker_id.stream_price_columns_by_ticker_id_query_response import (
+    StreamPriceColumnsByTickerIdQueryResponse,
+)
+from app.domain.crypto.models.price_cursor import PriceCursor
+from app.domain.crypto.repositories.price_repository import PriceRepository
+
+
+class StreamPriceColumnsByTickerIdQuery(Instruction):
+    def __init__(self, price_repository: PriceRepository):
+        self.__price_repository = price_repository
+
+    def execute(
+        self,
+        ticker_id: int,
+        start_date: None | datetime,
+        end_date: None | datetime,
+        after: None | PriceCursor = None,
+        limit: None | int = None,
+    ) -> StreamPriceColumnsByTickerIdQueryResponse:
+        return StreamPriceColumnsByTickerIdQueryResponse(
+            price_columns=self.__price_repository.stream_columns_or_fail_by_ticker_id(
+                ticker_id, start_date, end_date, after, limit
+            )
+        )
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from typing import Iterator
+
+from app.application import Response
+from app.domain.crypto.models.price_columns import PriceColumns
+
+
+@dataclass(frozen=True)
+class StreamPriceColumnsByTickerIdQueryResponse(Response):
+    price_columns: Iterator[PriceColumns]
@@ -0,0 +1,27 @@
+from datetime import datetime
+
+from app.application import Instruction
+from app.application.stream_prices_by_ticker_id.stream_prices_by_ticker_id_query_response import (
+    StreamPricesByTickerIdQueryResponse,
+)
+from app.domain.crypto.models.price_cursor import PriceCursor
+from app.domain.crypto.repositories.price_repository import PriceRepository
+
+
+class StreamPricesByTickerIdQuery(Instruction):
+    def __init__(self, price_repository: PriceRepository):
+        self.__price_repository = price_repository
+
+    def execute(
+        self,
+        ticker_id: int,
+        start_date: None | datetime,
+        end_date: None | datetime,
+        after: None | PriceCursor = None,
+        limit: None | int = None,
+    ) -> StreamPricesByTickerIdQueryResponse:
+        return StreamPricesByTickerIdQueryResponse(
+            prices=self.__price_repository.stream_all_or_fail_by_ticker_id(
+                ticker_id, start_date, end_date, after, limit
+            )
+        )
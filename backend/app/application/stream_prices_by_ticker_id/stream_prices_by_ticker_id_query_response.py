@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from typing import Iterator
+
+from app.application import Response
+from app.domain.crypto.models.price import Price
+
+
+@dataclass(frozen=True)
+class StreamPricesByTickerIdQueryResponse(Response):
+    prices: Iterator[Price]
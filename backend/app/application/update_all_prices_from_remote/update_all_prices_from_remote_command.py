@@ -0,0 +1,69 @@
+import asyncio
+
+from app.application import Instruction
+from app.application.update_all_prices_from_remote.update_all_prices_from_remote_command_response import (
+    UpdateAllPricesFromRemoteCommandResponse,
+)
+from app.domain.crypto.models.price import Price
+from app.domain.crypto.repositories.async_price_repository import (
+    AsyncPriceRepository,
+)
+from app.domain.exchange.clients.async_exchange_client import AsyncExchangeClient
+from app.domain.exchange.repositories.async_exchange_repository import (
+    AsyncExchangeRepository,
+)
+
+
+class UpdateAllPricesFromRemoteCommand(Instruction):
+    def __init__(
+        self,
+        exchange_clients: list[AsyncExchangeClient],
+        exchange_repository: AsyncExchangeRepository,
+        price_repository: AsyncPriceRepository,
+    ):
+        self.__exchange_clients = {
+            exchange_client.exchange_name: exchange_client
+            for exchange_client in exchange_clients
+        }
+        self.__exchange_repository = exchange_repository
+        self.__price_repository = price_repository
+
+    async def execute(self) -> UpdateAllPricesFromRemoteCommandResponse:
+        exchanges = [
+            exchange
+            for exchange in await self.__exchange_repository.get_all(fetch_tickers=True)
+            if exchange.name in self.__exchange_clients
+        ]
+
+        fetch_results = await asyncio.gather(
+            *(
+                self.__exchange_clients[exchange.name].fetch_price_for_tickers(
+                    exchange.tickers
+                )
+                for exchange in exchanges
+            ),
+            return_exceptions=True,
+        )
+
+        fetched_prices: list[Price] = []
+        failed_exchanges: dict[str, Exception] = {}
+
+        for exchange, fetch_result in zip(exchanges, fetch_results):
+            if isinstance(fetch_result, Exception):
+                failed_exchanges[exchange.name] = fetch_result
+            else:
+                fetched_prices.extend(fetch_result)
+
+        await self.__price_repository.bulk_save(fetched_prices)
+
+        found_exchange_names = {exchange.name for exchange in exchanges}
+
+        return UpdateAllPricesFromRemoteCommandResponse(
+            saved_prices=len(fetched_prices),
+            missing_exchanges=[
+                exchange_name
+                for exchange_name in self.__exchange_clients
+                if exchange_name not in found_exchange_names
+            ],
+            failed_exchanges=failed_exchanges,
+        )
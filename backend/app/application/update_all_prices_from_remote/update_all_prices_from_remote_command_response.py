@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+from app.application import Response
+
+
+@dataclass(frozen=True)
+class UpdateAllPricesFromRemoteCommandResponse(Response):
+    saved_prices: int
+    missing_exchanges: list[str]
+    failed_exchanges: dict[str, Exception]
@@ -1,19 +1,79 @@
-from typing import Generator
+from time import perf_counter
+from typing import Any, Generator, AsyncGenerator
 
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker, Session
 from sqlalchemy import create_engine
-from contextlib import contextmanager
+from contextlib import contextmanager, asynccontextmanager
 
-from app.settings import DATABASE_URL
+from app.infrastructure.database.pool_metrics import PoolMetrics, PoolMetricsSnapshot
+from app.settings import (
+    DATABASE_URL,
+    ASYNC_DATABASE_URL,
+    DATABASE_POOL_SIZE,
+    DATABASE_MAX_OVERFLOW,
+    DATABASE_POOL_TIMEOUT,
+    DATABASE_POOL_RECYCLE,
+    DATABASE_POOL_PRE_PING,
+    DATABASE_STATEMENT_TIMEOUT,
+    DATABASE_SLOW_CHECKOUT,
+)
 
-engine = create_engine(DATABASE_URL, echo=False)
+
+def _engine_options(connect_args: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "echo": False,
+        "pool_size": DATABASE_POOL_SIZE,
+        "max_overflow": DATABASE_MAX_OVERFLOW,
+        "pool_timeout": DATABASE_POOL_TIMEOUT,
+        "pool_recycle": DATABASE_POOL_RECYCLE,
+        "pool_pre_ping": DATABASE_POOL_PRE_PING,
+        "connect_args": connect_args if DATABASE_STATEMENT_TIMEOUT > 0 else {},
+    }
+
+
+engine = create_engine(
+    DATABASE_URL,
+    **_engine_options(
+        {"options": f"-c statement_timeout={DATABASE_STATEMENT_TIMEOUT}"}
+    ),
+)
 SessionLocal = sessionmaker(engine, expire_on_commit=False)
 
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    **_engine_options(
+        {"server_settings": {"statement_timeout": str(DATABASE_STATEMENT_TIMEOUT)}}
+    ),
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
+pool_metrics = PoolMetrics(DATABASE_SLOW_CHECKOUT)
+async_pool_metrics = PoolMetrics(DATABASE_SLOW_CHECKOUT)
+
+
+def get_pool_metrics() -> list[PoolMetricsSnapshot]:
+    return [
+        pool_metrics.snapshot("sync", engine.pool),
+        async_pool_metrics.snapshot("async", async_engine.pool),
+    ]
+
 
 @contextmanager
 def get_session() -> Generator[Session, None, None]:
     session = SessionLocal()
     try:
+        checkout_start = perf_counter()
+        try:
+            connection = session.connection()
+        except TimeoutError:
+            pool_metrics.record_timeout(engine.pool)
+            raise
+        pool_metrics.record_checkout(
+            perf_counter() - checkout_start, connection.engine.pool
+        )
+
         yield session
         session.commit()
     except:
@@ -23,6 +83,29 @@ def get_session() -> Generator[Session, None, None]:
         session.close()
 
 
+@asynccontextmanager
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    session = AsyncSessionLocal()
+    try:
+        checkout_start = perf_counter()
+        try:
+            connection = await session.connection()
+        except TimeoutError:
+            async_pool_metrics.record_timeout(async_engine.pool)
+            raise
+        async_pool_metrics.record_checkout(
+            perf_counter() - checkout_start, connection.engine.pool
+        )
+
+        yield session
+        await session.commit()
+    except:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
 Base = declarative_base()
 
 
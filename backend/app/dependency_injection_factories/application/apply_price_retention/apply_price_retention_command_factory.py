@@ -0,0 +1,46 @@
+from app.application.apply_price_retention.apply_price_retention_command import (
+    ApplyPriceRetentionCommand,
+)
+from app.dependency_injection_factories.infrastructure.crypto.archive.repositories.parquet_price_archive_repository_factory import (
+    ParquetPriceArchiveRepositoryFactory,
+)
+from app.dependency_injection_factories.infrastructure.crypto.database.repositories.db_price_partition_repository_factory import (
+    DbPricePartitionRepositoryFactory,
+)
+from app.dependency_injection_factories.infrastructure.crypto.database.repositories.db_price_repository_factory import (
+    DbPriceRepositoryFactory,
+)
+from app.dependency_injection_factories.infrastructure.crypto.database.repositories.db_ticker_repository_factory import (
+    DbTickerRepositoryFactory,
+)
+from app.domain.crypto.models.candle_interval import CandleInterval
+from app.domain.crypto.models.price_partition_interval import (
+    PricePartitionInterval,
+)
+from app.settings import (
+    PRICES_PARTITION_INTERVAL,
+    PRICES_RETENTION_DAYS,
+    PRICES_RETENTION_DROP_PARTITIONS,
+    PRICE_CANDLES_MINUTE_RETENTION_DAYS,
+    PRICE_CANDLES_HOUR_RETENTION_DAYS,
+    PRICE_CANDLES_DAY_RETENTION_DAYS,
+)
+
+
+class ApplyPriceRetentionCommandFactory:
+    @staticmethod
+    def create() -> ApplyPriceRetentionCommand:
+        return ApplyPriceRetentionCommand(
+            DbPricePartitionRepositoryFactory.create(),
+            DbPriceRepositoryFactory.create(),
+            DbTickerRepositoryFactory.create(),
+            ParquetPriceArchiveRepositoryFactory.create(),
+            PricePartitionInterval(PRICES_PARTITION_INTERVAL),
+            PRICES_RETENTION_DAYS,
+            {
+                CandleInterval.ONE_MINUTE: PRICE_CANDLES_MINUTE_RETENTION_DAYS,
+                CandleInterval.ONE_HOUR: PRICE_CANDLES_HOUR_RETENTION_DAYS,
+                CandleInterval.ONE_DAY: PRICE_CANDLES_DAY_RETENTION_DAYS,
+            },
+            PRICES_RETENTION_DROP_PARTITIONS,
+        )
@@ -0,0 +1,24 @@
+from app.application.archive_prices.archive_prices_command import (
+    ArchivePricesCommand,
+)
+from app.dependency_injection_factories.infrastructure.crypto.archive.repositories.parquet_price_archive_repository_factory import (
+    ParquetPriceArchiveRepositoryFactory,
+)
+from app.dependency_injection_factories.infrastructure.crypto.database.repositories.db_price_repository_factory import (
+    DbPriceRepositoryFactory,
+)
+from app.dependency_injection_factories.infrastructure.crypto.database.repositories.db_ticker_repository_factory import (
+    DbTickerRepositoryFactory,
+)
+from app.settings import PRICES_ARCHIVE_MAX_DAYS
+
+
+class ArchivePricesCommandFactory:
+    @staticmethod
+    def create() -> ArchivePricesCommand:
+        return ArchivePricesCommand(
+            DbTickerRepositoryFactory.create(),
+            DbPriceRepositoryFactory.create(),
+            ParquetPriceArchiveRepositoryFactory.create(),
+            PRICES_ARCHIVE_MAX_DAYS,
+        )
@@ -0,0 +1,20 @@
+from app.application.create_price_partitions.create_price_partitions_command import (
+    CreatePricePartitionsCommand,
+)
+from app.dependency_injection_factories.infrastructure.crypto.database.repositories.db_price_partition_repository_factory import (
+    DbPricePartitionRepositoryFactory,
+)
+from app.domain.crypto.models.price_partition_interval import (
+    PricePartitionInterval,
+)
+from app.settings import PRICES_PARTITION_INTERVAL, PRICES_PARTITION_PREMAKE
+
+
+class CreatePricePartitionsCommandFactory:
+    @staticmethod
+    def create() -> CreatePricePartitionsCommand:
+        return CreatePricePartitionsCommand(
+            DbPricePartitionRepositoryFactory.create(),
+            PricePartitionInterval(PRICES_PARTITION_INTERVAL),
+            PRICES_PARTITION_PREMAKE,
+        )
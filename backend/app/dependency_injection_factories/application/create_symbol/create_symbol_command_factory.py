@@ -1,10 +1,10 @@
 from app.application.create_symbol.create_symbol_command import CreateSymbolCommand
-from app.dependency_injection_factories.infrastructure.crypto.database.repositories.db_symbol_repository_factory import (
-    DbSymbolRepositoryFactory,
+from app.dependency_injection_factories.infrastructure.crypto.database.repositories.async_db_symbol_repository_factory import (
+    AsyncDbSymbolRepositoryFactory,
 )
 
 
 class CreateSymbolCommandFactory:
     @staticmethod
     def create() -> CreateSymbolCommand:
-        return CreateSymbolCommand(DbSymbolRepositoryFactory.create())
+        return CreateSymbolCommand(AsyncDbSymbolRepositoryFactory.create())
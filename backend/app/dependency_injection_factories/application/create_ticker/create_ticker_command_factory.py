@@ -1,10 +1,10 @@
 from app.application.create_ticker.create_ticker_command import CreateTickerCommand
-from app.dependency_injection_factories.infrastructure.crypto.database.repositories.db_ticker_repository_factory import (
-    DbTickerRepositoryFactory,
+from app.dependency_injection_factories.infrastructure.crypto.database.repositories.async_db_ticker_repository_factory import (
+    AsyncDbTickerRepositoryFactory,
 )
 
 
 class CreateTickerCommandFactory:
     @staticmethod
     def create() -> CreateTickerCommand:
-        return CreateTickerCommand(DbTickerRepositoryFactory.create())
+        return CreateTickerCommand(AsyncDbTickerRepositoryFactory.create())
@@ -1,12 +1,12 @@
 from app.application.get_all_exchanges.get_all_exchanges_query import (
     GetAllExchangesQuery,
 )
-from app.dependency_injection_factories.infrastructure.exchange.database.repositories.db_exchange_repository_factory import (
-    DbExchangeRepositoryFactory,
+from app.dependency_injection_factories.infrastructure.exchange.database.repositories.async_db_exchange_repository_factory import (
+    AsyncDbExchangeRepositoryFactory,
 )
 
 
 class GetAllExchangesQueryFactory:
     @staticmethod
     def create() -> GetAllExchangesQuery:
-        return GetAllExchangesQuery(DbExchangeRepositoryFactory.create())
+        return GetAllExchangesQuery(AsyncDbExchangeRepositoryFactory.create())
@@ -0,0 +1,12 @@
+from app.application.get_all_prices_by_ticker_ids.get_all_prices_by_ticker_ids_query import (
+    GetAllPricesByTickerIdsQuery,
+)
+from app.dependency_injection_factories.infrastructure.crypto.archive.repositories.archived_price_repository_factory import (
+    ArchivedPriceRepositoryFactory,
+)
+
+
+class GetAllPricesByTickerIdsQueryFactory:
+    @staticmethod
+    def create() -> GetAllPricesByTickerIdsQuery:
+        return GetAllPricesByTickerIdsQuery(ArchivedPriceRepositoryFactory.create())
@@ -1,10 +1,10 @@
 from app.application.get_all_symbols.get_all_symbols_query import GetAllSymbolsQuery
-from app.dependency_injection_factories.infrastructure.crypto.database.repositories.db_symbol_repository_factory import (
-    DbSymbolRepositoryFactory,
+from app.dependency_injection_factories.infrastructure.crypto.database.repositories.async_db_symbol_repository_factory import (
+    AsyncDbSymbolRepositoryFactory,
 )
 
 
 class GetAllSymbolsQueryFactory:
     @staticmethod
     def create() -> GetAllSymbolsQuery:
-        return GetAllSymbolsQuery(DbSymbolRepositoryFactory.create())
+        return GetAllSymbolsQuery(AsyncDbSymbolRepositoryFactory.create())
@@ -0,0 +1,15 @@
+from app.application.get_candles_by_ticker_id.get_candles_by_ticker_id_query import (
+    GetCandlesByTickerIdQuery,
+)
+from app.dependency_injection_factories.infrastructure.crypto.archive.repositories.archived_price_repository_factory import (
+    ArchivedPriceRepositoryFactory,
+)
+from app.settings import PRICE_CANDLES_AUTO_POINTS
+
+
+class GetCandlesByTickerIdQueryFactory:
+    @staticmethod
+    def create() -> GetCandlesByTickerIdQuery:
+        return GetCandlesByTickerIdQuery(
+            ArchivedPriceRepositoryFactory.create(), PRICE_CANDLES_AUTO_POINTS
+        )
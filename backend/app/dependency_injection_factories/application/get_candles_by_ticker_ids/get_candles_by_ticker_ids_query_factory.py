@@ -0,0 +1,15 @@
+from app.application.get_candles_by_ticker_ids.get_candles_by_ticker_ids_query import (
+    GetCandlesByTickerIdsQuery,
+)
+from app.dependency_injection_factories.infrastructure.crypto.archive.repositories.archived_price_repository_factory import (
+    ArchivedPriceRepositoryFactory,
+)
+from app.settings import PRICE_CANDLES_AUTO_POINTS
+
+
+class GetCandlesByTickerIdsQueryFactory:
+    @staticmethod
+    def create() -> GetCandlesByTickerIdsQuery:
+        return GetCandlesByTickerIdsQuery(
+            ArchivedPriceRepositoryFactory.create(), PRICE_CANDLES_AUTO_POINTS
+        )
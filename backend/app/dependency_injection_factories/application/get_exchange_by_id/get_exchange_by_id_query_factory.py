@@ -1,8 +1,8 @@
 from app.application.get_exchange_by_id.get_exchange_by_id_query import (
     GetExchangeByIdQuery,
 )
-from app.dependency_injection_factories.infrastructure.exchange.database.repositories.db_exchange_repository_factory import (
-    DbExchangeRepositoryFactory,
+from app.dependency_injection_factories.infrastructure.exchange.database.repositories.async_db_exchange_repository_factory import (
+    AsyncDbExchangeRepositoryFactory,
 )
 
 
@@ -10,5 +10,5 @@ class GetExchangeByIdQueryFactory:
     @staticmethod
     def create() -> GetExchangeByIdQuery:
         return GetExchangeByIdQuery(
-            DbExchangeRepositoryFactory.create(),
+            AsyncDbExchangeRepositoryFactory.create(),
         )
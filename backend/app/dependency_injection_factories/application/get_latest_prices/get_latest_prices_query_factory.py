@@ -0,0 +1,12 @@
+from app.application.get_latest_prices.get_latest_prices_query import (
+    GetLatestPricesQuery,
+)
+from app.dependency_injection_factories.infrastructure.crypto.caches.latest_price_cache_factory import (
+    LatestPriceCacheFactory,
+)
+
+
+class GetLatestPricesQueryFactory:
+    @staticmethod
+    def create() -> GetLatestPricesQuery:
+        return GetLatestPricesQuery(LatestPriceCacheFactory.create())
@@ -0,0 +1,14 @@
+from app.application.stream_price_columns_by_ticker_id.stream_price_columns_by_ticker_id_query import (
+    StreamPriceColumnsByTickerIdQuery,
+)
+from app.dependency_injection_factories.infrastructure.crypto.archive.repositories.archived_price_repository_factory import (
+    ArchivedPriceRepositoryFactory,
+)
+
+
+class StreamPriceColumnsByTickerIdQueryFactory:
+    @staticmethod
+    def create() -> StreamPriceColumnsByTickerIdQuery:
+        return StreamPriceColumnsByTickerIdQuery(
+            ArchivedPriceRepositoryFactory.create()
+        )
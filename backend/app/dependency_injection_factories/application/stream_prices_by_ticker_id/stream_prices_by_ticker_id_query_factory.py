@@ -0,0 +1,12 @@
+from app.application.stream_prices_by_ticker_id.stream_prices_by_ticker_id_query import (
+    StreamPricesByTickerIdQuery,
+)
+from app.dependency_injection_factories.infrastructure.crypto.archive.repositories.archived_price_repository_factory import (
+    ArchivedPriceRepositoryFactory,
+)
+
+
+class StreamPricesByTickerIdQueryFactory:
+    @staticmethod
+    def create() -> StreamPricesByTickerIdQuery:
+        return StreamPricesByTickerIdQuery(ArchivedPriceRepositoryFactory.create())
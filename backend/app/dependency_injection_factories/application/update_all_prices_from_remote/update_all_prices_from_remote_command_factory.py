@@ -0,0 +1,25 @@
+from app.application.update_all_prices_from_remote.update_all_prices_from_remote_command import (
+    UpdateAllPricesFromRemoteCommand,
+)
+from app.dependency_injection_factories.infrastructure.crypto.database.repositories.async_db_price_repository_factory import (
+    AsyncDbPriceRepositoryFactory,
+)
+from app.dependency_injection_factories.infrastructure.exchange.clients.async_binance_client_factory import (
+    AsyncBinanceClientFactory,
+)
+from app.dependency_injection_factories.infrastructure.exchange.clients.async_kraken_client_factory import (
+    AsyncKrakenClientFactory,
+)
+from app.dependency_injection_factories.infrastructure.exchange.database.repositories.async_db_exchange_repository_factory import (
+    AsyncDbExchangeRepositoryFactory,
+)
+
+
+class UpdateAllPricesFromRemoteCommandFactory:
+    @staticmethod
+    def create() -> UpdateAllPricesFromRemoteCommand:
+        return UpdateAllPricesFromRemoteCommand(
+            [AsyncBinanceClientFactory.create(), AsyncKrakenClientFactory.create()],
+            AsyncDbExchangeRepositoryFactory.create(),
+            AsyncDbPriceRepositoryFactory.create(),
+        )
@@ -0,0 +1,12 @@
+from app.entrypoints.routes.v1.get_all_exchanges_handler import GetAllExchangesHandler
+
+
+class GetAllExchangesHandlerFactory:
+    __instance: None | GetAllExchangesHandler = None
+
+    @staticmethod
+    def create() -> GetAllExchangesHandler:
+        if GetAllExchangesHandlerFactory.__instance is None:
+            GetAllExchangesHandlerFactory.__instance = GetAllExchangesHandler()
+
+        return GetAllExchangesHandlerFactory.__instance
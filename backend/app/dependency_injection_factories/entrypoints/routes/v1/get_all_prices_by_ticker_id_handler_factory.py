@@ -0,0 +1,16 @@
+from app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler import (
+    GetAllPricesByTickerIdHandler,
+)
+
+
+class GetAllPricesByTickerIdHandlerFactory:
+    __instance: None | GetAllPricesByTickerIdHandler = None
+
+    @staticmethod
+    def create() -> GetAllPricesByTickerIdHandler:
+        if GetAllPricesByTickerIdHandlerFactory.__instance is None:
+            GetAllPricesByTickerIdHandlerFactory.__instance = (
+                GetAllPricesByTickerIdHandler()
+            )
+
+        return GetAllPricesByTickerIdHandlerFactory.__instance
@@ -0,0 +1,16 @@
+from app.entrypoints.routes.v1.get_all_prices_by_ticker_ids_handler import (
+    GetAllPricesByTickerIdsHandler,
+)
+
+
+class GetAllPricesByTickerIdsHandlerFactory:
+    __instance: None | GetAllPricesByTickerIdsHandler = None
+
+    @staticmethod
+    def create() -> GetAllPricesByTickerIdsHandler:
+        if GetAllPricesByTickerIdsHandlerFactory.__instance is None:
+            GetAllPricesByTickerIdsHandlerFactory.__instance = (
+                GetAllPricesByTickerIdsHandler()
+            )
+
+        return GetAllPricesByTickerIdsHandlerFactory.__instance
@@ -0,0 +1,12 @@
+from app.entrypoints.routes.v1.get_all_symbols_handler import GetAllSymbolsHandler
+
+
+class GetAllSymbolsHandlerFactory:
+    __instance: None | GetAllSymbolsHandler = None
+
+    @staticmethod
+    def create() -> GetAllSymbolsHandler:
+        if GetAllSymbolsHandlerFactory.__instance is None:
+            GetAllSymbolsHandlerFactory.__instance = GetAllSymbolsHandler()
+
+        return GetAllSymbolsHandlerFactory.__instance
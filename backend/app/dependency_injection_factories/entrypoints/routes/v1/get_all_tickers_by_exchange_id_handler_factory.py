@@ -0,0 +1,16 @@
+from app.entrypoints.routes.v1.get_all_tickers_by_exchange_id_handler import (
+    GetAllTickersByExchangeIdHandler,
+)
+
+
+class GetAllTickersByExchangeIdHandlerFactory:
+    __instance: None | GetAllTickersByExchangeIdHandler = None
+
+    @staticmethod
+    def create() -> GetAllTickersByExchangeIdHandler:
+        if GetAllTickersByExchangeIdHandlerFactory.__instance is None:
+            GetAllTickersByExchangeIdHandlerFactory.__instance = (
+                GetAllTickersByExchangeIdHandler()
+            )
+
+        return GetAllTickersByExchangeIdHandlerFactory.__instance
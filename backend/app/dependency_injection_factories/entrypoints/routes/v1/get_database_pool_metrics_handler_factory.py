@@ -0,0 +1,16 @@
+from app.entrypoints.routes.v1.get_database_pool_metrics_handler import (
+    GetDatabasePoolMetricsHandler,
+)
+
+
+class GetDatabasePoolMetricsHandlerFactory:
+    __instance: None | GetDatabasePoolMetricsHandler = None
+
+    @staticmethod
+    def create() -> GetDatabasePoolMetricsHandler:
+        if GetDatabasePoolMetricsHandlerFactory.__instance is None:
+            GetDatabasePoolMetricsHandlerFactory.__instance = (
+                GetDatabasePoolMetricsHandler()
+            )
+
+        return GetDatabasePoolMetricsHandlerFactory.__instance
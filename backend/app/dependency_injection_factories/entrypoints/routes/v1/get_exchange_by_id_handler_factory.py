@@ -0,0 +1,12 @@
+from app.entrypoints.routes.v1.get_exchange_by_id_handler import GetExchangeByIdHandler
+
+
+class GetExchangeByIdHandlerFactory:
+    __instance: None | GetExchangeByIdHandler = None
+
+    @staticmethod
+    def create() -> GetExchangeByIdHandler:
+        if GetExchangeByIdHandlerFactory.__instance is None:
+            GetExchangeByIdHandlerFactory.__instance = GetExchangeByIdHandler()
+
+        return GetExchangeByIdHandlerFactory.__instance
@@ -0,0 +1,12 @@
+from app.entrypoints.routes.v1.get_latest_prices_handler import GetLatestPricesHandler
+
+
+class GetLatestPricesHandlerFactory:
+    __instance: None | GetLatestPricesHandler = None
+
+    @staticmethod
+    def create() -> GetLatestPricesHandler:
+        if GetLatestPricesHandlerFactory.__instance is None:
+            GetLatestPricesHandlerFactory.__instance = GetLatestPricesHandler()
+
+        return GetLatestPricesHandlerFactory.__instance
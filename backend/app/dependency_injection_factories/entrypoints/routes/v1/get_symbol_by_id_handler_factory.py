@@ -0,0 +1,12 @@
+from app.entrypoints.routes.v1.get_symbol_by_id_handler import GetSymbolByIdHandler
+
+
+class GetSymbolByIdHandlerFactory:
+    __instance: None | GetSymbolByIdHandler = None
+
+    @staticmethod
+    def create() -> GetSymbolByIdHandler:
+        if GetSymbolByIdHandlerFactory.__instance is None:
+            GetSymbolByIdHandlerFactory.__instance = GetSymbolByIdHandler()
+
+        return GetSymbolByIdHandlerFactory.__instance
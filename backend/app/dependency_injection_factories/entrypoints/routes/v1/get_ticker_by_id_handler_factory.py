@@ -0,0 +1,12 @@
+from app.entrypoints.routes.v1.get_ticker_by_id_handler import GetTickerByIdHandler
+
+
+class GetTickerByIdHandlerFactory:
+    __instance: None | GetTickerByIdHandler = None
+
+    @staticmethod
+    def create() -> GetTickerByIdHandler:
+        if GetTickerByIdHandlerFactory.__instance is None:
+            GetTickerByIdHandlerFactory.__instance = GetTickerByIdHandler()
+
+        return GetTickerByIdHandlerFactory.__instance
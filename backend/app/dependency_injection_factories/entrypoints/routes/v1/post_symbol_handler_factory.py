@@ -0,0 +1,12 @@
+from app.entrypoints.routes.v1.post_symbol_handler import PostSymbolHandler
+
+
+class PostSymbolHandlerFactory:
+    __instance: None | PostSymbolHandler = None
+
+    @staticmethod
+    def create() -> PostSymbolHandler:
+        if PostSymbolHandlerFactory.__instance is None:
+            PostSymbolHandlerFactory.__instance = PostSymbolHandler()
+
+        return PostSymbolHandlerFactory.__instance
@@ -0,0 +1,12 @@
+from app.entrypoints.routes.v1.post_ticker_handler import PostTickerHandler
+
+
+class PostTickerHandlerFactory:
+    __instance: None | PostTickerHandler = None
+
+    @staticmethod
+    def create() -> PostTickerHandler:
+        if PostTickerHandlerFactory.__instance is None:
+            PostTickerHandlerFactory.__instance = PostTickerHandler()
+
+        return PostTickerHandlerFactory.__instance
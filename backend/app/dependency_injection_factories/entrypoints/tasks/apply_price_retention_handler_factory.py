@@ -0,0 +1,14 @@
+from app.entrypoints.tasks.apply_price_retention_handler import (
+    ApplyPriceRetentionHandler,
+)
+
+
+class ApplyPriceRetentionHandlerFactory:
+    __instance: None | ApplyPriceRetentionHandler = None
+
+    @staticmethod
+    def create() -> ApplyPriceRetentionHandler:
+        if ApplyPriceRetentionHandlerFactory.__instance is None:
+            ApplyPriceRetentionHandlerFactory.__instance = ApplyPriceRetentionHandler()
+
+        return ApplyPriceRetentionHandlerFactory.__instance
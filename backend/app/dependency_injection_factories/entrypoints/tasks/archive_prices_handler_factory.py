@@ -0,0 +1,12 @@
+from app.entrypoints.tasks.archive_prices_handler import ArchivePricesHandler
+
+
+class ArchivePricesHandlerFactory:
+    __instance: None | ArchivePricesHandler = None
+
+    @staticmethod
+    def create() -> ArchivePricesHandler:
+        if ArchivePricesHandlerFactory.__instance is None:
+            ArchivePricesHandlerFactory.__instance = ArchivePricesHandler()
+
+        return ArchivePricesHandlerFactory.__instance
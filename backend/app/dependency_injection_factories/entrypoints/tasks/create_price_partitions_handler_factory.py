@@ -0,0 +1,16 @@
+from app.entrypoints.tasks.create_price_partitions_handler import (
+    CreatePricePartitionsHandler,
+)
+
+
+class CreatePricePartitionsHandlerFactory:
+    __instance: None | CreatePricePartitionsHandler = None
+
+    @staticmethod
+    def create() -> CreatePricePartitionsHandler:
+        if CreatePricePartitionsHandlerFactory.__instance is None:
+            CreatePricePartitionsHandlerFactory.__instance = (
+                CreatePricePartitionsHandler()
+            )
+
+        return CreatePricePartitionsHandlerFactory.__instance
@@ -0,0 +1,12 @@
+from app.entrypoints.tasks.fetch_all_prices_handler import FetchAllPricesHandler
+
+
+class FetchAllPricesHandlerFactory:
+    __instance: None | FetchAllPricesHandler = None
+
+    @staticmethod
+    def create() -> FetchAllPricesHandler:
+        if FetchAllPricesHandlerFactory.__instance is None:
+            FetchAllPricesHandlerFactory.__instance = FetchAllPricesHandler()
+
+        return FetchAllPricesHandlerFactory.__instance
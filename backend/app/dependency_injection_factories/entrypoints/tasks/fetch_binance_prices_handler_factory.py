@@ -0,0 +1,12 @@
+from app.entrypoints.tasks.fetch_binance_prices_handler import FetchBinancePricesHandler
+
+
+class FetchBinancePricesHandlerFactory:
+    __instance: None | FetchBinancePricesHandler = None
+
+    @staticmethod
+    def create() -> FetchBinancePricesHandler:
+        if FetchBinancePricesHandlerFactory.__instance is None:
+            FetchBinancePricesHandlerFactory.__instance = FetchBinancePricesHandler()
+
+        return FetchBinancePricesHandlerFactory.__instance
@@ -0,0 +1,12 @@
+from app.entrypoints.tasks.fetch_kraken_prices_handler import FetchKrakenPricesHandler
+
+
+class FetchKrakenPricesHandlerFactory:
+    __instance: None | FetchKrakenPricesHandler = None
+
+    @staticmethod
+    def create() -> FetchKrakenPricesHandler:
+        if FetchKrakenPricesHandlerFactory.__instance is None:
+            FetchKrakenPricesHandlerFactory.__instance = FetchKrakenPricesHandler()
+
+        return FetchKrakenPricesHandlerFactory.__instance
@@ -0,0 +1,18 @@
+from app.dependency_injection_factories.infrastructure.crypto.archive.repositories.parquet_price_archive_repository_factory import (
+    ParquetPriceArchiveRepositoryFactory,
+)
+from app.dependency_injection_factories.infrastructure.crypto.database.repositories.db_price_repository_factory import (
+    DbPriceRepositoryFactory,
+)
+from app.infrastructure.crypto.archive.repositories.archived_price_repository import (
+    ArchivedPriceRepository,
+)
+
+
+class ArchivedPriceRepositoryFactory:
+    @staticmethod
+    def create() -> ArchivedPriceRepository:
+        return ArchivedPriceRepository(
+            DbPriceRepositoryFactory.create(),
+            ParquetPriceArchiveRepositoryFactory.create(),
+        )
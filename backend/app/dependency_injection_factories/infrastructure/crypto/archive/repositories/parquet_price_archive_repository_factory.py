@@ -0,0 +1,17 @@
+from app.dependency_injection_factories.infrastructure.crypto.archive.translators.arrow_price_translator_factory import (
+    ArrowPriceTranslatorFactory,
+)
+from app.infrastructure.crypto.archive.repositories.parquet_price_archive_repository import (
+    ParquetPriceArchiveRepository,
+)
+from app.settings import PRICES_ARCHIVE_PATH, PRICES_ARCHIVE_COMPRESSION
+
+
+class ParquetPriceArchiveRepositoryFactory:
+    @staticmethod
+    def create() -> ParquetPriceArchiveRepository:
+        return ParquetPriceArchiveRepository(
+            PRICES_ARCHIVE_PATH,
+            PRICES_ARCHIVE_COMPRESSION,
+            ArrowPriceTranslatorFactory.create(),
+        )
@@ -0,0 +1,9 @@
+from app.infrastructure.crypto.archive.translators.arrow_price_translator import (
+    ArrowPriceTranslator,
+)
+
+
+class ArrowPriceTranslatorFactory:
+    @staticmethod
+    def create() -> ArrowPriceTranslator:
+        return ArrowPriceTranslator()
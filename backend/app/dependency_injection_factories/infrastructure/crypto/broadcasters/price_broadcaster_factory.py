@@ -0,0 +1,25 @@
+from app.dependency_injection_factories.infrastructure.crypto.database.repositories.async_db_price_repository_factory import (
+    AsyncDbPriceRepositoryFactory,
+)
+from app.infrastructure.crypto.broadcasters.price_broadcaster import PriceBroadcaster
+from app.settings import (
+    PRICE_WEBSOCKET_INTERVAL,
+    PRICE_WEBSOCKET_MAX_PENDING_BATCHES,
+    PRICE_WEBSOCKET_OVERLAP,
+)
+
+
+class PriceBroadcasterFactory:
+    __instance: None | PriceBroadcaster = None
+
+    @staticmethod
+    def create() -> PriceBroadcaster:
+        if PriceBroadcasterFactory.__instance is None:
+            PriceBroadcasterFactory.__instance = PriceBroadcaster(
+                AsyncDbPriceRepositoryFactory.create(),
+                PRICE_WEBSOCKET_INTERVAL,
+                PRICE_WEBSOCKET_MAX_PENDING_BATCHES,
+                PRICE_WEBSOCKET_OVERLAP,
+            )
+
+        return PriceBroadcasterFactory.__instance
@@ -0,0 +1,15 @@
+from app.infrastructure.crypto.caches.catalog_version_cache import CatalogVersionCache
+from app.settings import CATALOG_VERSION_TTL
+
+
+class CatalogVersionCacheFactory:
+    __instance: None | CatalogVersionCache = None
+
+    @staticmethod
+    def create() -> CatalogVersionCache:
+        if CatalogVersionCacheFactory.__instance is None:
+            CatalogVersionCacheFactory.__instance = CatalogVersionCache(
+                CATALOG_VERSION_TTL
+            )
+
+        return CatalogVersionCacheFactory.__instance
@@ -0,0 +1,12 @@
+from app.infrastructure.crypto.caches.known_ticker_cache import KnownTickerCache
+
+
+class KnownTickerCacheFactory:
+    __instance: None | KnownTickerCache = None
+
+    @staticmethod
+    def create() -> KnownTickerCache:
+        if KnownTickerCacheFactory.__instance is None:
+            KnownTickerCacheFactory.__instance = KnownTickerCache()
+
+        return KnownTickerCacheFactory.__instance
@@ -0,0 +1,27 @@
+from app.dependency_injection_factories.infrastructure.crypto.database.repositories.async_db_price_repository_factory import (
+    AsyncDbPriceRepositoryFactory,
+)
+from app.dependency_injection_factories.infrastructure.crypto.database.repositories.async_db_ticker_repository_factory import (
+    AsyncDbTickerRepositoryFactory,
+)
+from app.infrastructure.crypto.caches.latest_price_cache import LatestPriceCache
+from app.settings import (
+    LATEST_PRICES_REFRESH_INTERVAL,
+    LATEST_PRICES_REFRESH_OVERLAP,
+)
+
+
+class LatestPriceCacheFactory:
+    __instance: None | LatestPriceCache = None
+
+    @staticmethod
+    def create() -> LatestPriceCache:
+        if LatestPriceCacheFactory.__instance is None:
+            LatestPriceCacheFactory.__instance = LatestPriceCache(
+                AsyncDbPriceRepositoryFactory.create(),
+                AsyncDbTickerRepositoryFactory.create(),
+                LATEST_PRICES_REFRESH_INTERVAL,
+                LATEST_PRICES_REFRESH_OVERLAP,
+            )
+
+        return LatestPriceCacheFactory.__instance
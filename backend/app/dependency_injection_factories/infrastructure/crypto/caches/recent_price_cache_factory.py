@@ -0,0 +1,27 @@
+from datetime import timedelta
+
+from app.dependency_injection_factories.infrastructure.crypto.database.repositories.async_db_price_repository_factory import (
+    AsyncDbPriceRepositoryFactory,
+)
+from app.infrastructure.crypto.caches.recent_price_cache import RecentPriceCache
+from app.settings import (
+    PRICES_BUFFER_CAPACITY,
+    PRICES_BUFFER_SETTLE_DELAY,
+    PRICES_BUFFER_WINDOW_MINUTES,
+)
+
+
+class RecentPriceCacheFactory:
+    __instance: None | RecentPriceCache = None
+
+    @staticmethod
+    def create() -> RecentPriceCache:
+        if RecentPriceCacheFactory.__instance is None:
+            RecentPriceCacheFactory.__instance = RecentPriceCache(
+                AsyncDbPriceRepositoryFactory.create(),
+                timedelta(minutes=PRICES_BUFFER_WINDOW_MINUTES),
+                PRICES_BUFFER_CAPACITY,
+                timedelta(seconds=PRICES_BUFFER_SETTLE_DELAY),
+            )
+
+        return RecentPriceCacheFactory.__instance
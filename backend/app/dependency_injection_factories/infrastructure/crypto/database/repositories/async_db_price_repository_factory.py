@@ -0,0 +1,26 @@
+from app.dependency_injection_factories.infrastructure.crypto.caches.known_ticker_cache_factory import (
+    KnownTickerCacheFactory,
+)
+from app.dependency_injection_factories.infrastructure.crypto.database.translators.db_candle_translator_factory import (
+    DbCandleTranslatorFactory,
+)
+from app.dependency_injection_factories.infrastructure.crypto.database.translators.db_price_translator_factory import (
+    DbPriceTranslatorFactory,
+)
+from app.dependency_injection_factories.infrastructure.exchange.caches.exchange_catalog_cache_factory import (
+    ExchangeCatalogCacheFactory,
+)
+from app.infrastructure.crypto.database.repositories.async_db_price_repository import (
+    AsyncDbPriceRepository,
+)
+
+
+class AsyncDbPriceRepositoryFactory:
+    @staticmethod
+    def create() -> AsyncDbPriceRepository:
+        return AsyncDbPriceRepository(
+            DbPriceTranslatorFactory.create(),
+            DbCandleTranslatorFactory.create(),
+            KnownTickerCacheFactory.create(),
+            ExchangeCatalogCacheFactory.create(),
+        )
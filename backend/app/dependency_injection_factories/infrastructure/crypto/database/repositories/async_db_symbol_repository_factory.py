@@ -0,0 +1,12 @@
+from app.dependency_injection_factories.infrastructure.crypto.database.translators.db_symbol_translator_factory import (
+    DbSymbolTranslatorFactory,
+)
+from app.infrastructure.crypto.database.repositories.async_db_symbol_repository import (
+    AsyncDbSymbolRepository,
+)
+
+
+class AsyncDbSymbolRepositoryFactory:
+    @staticmethod
+    def create() -> AsyncDbSymbolRepository:
+        return AsyncDbSymbolRepository(DbSymbolTranslatorFactory.create())
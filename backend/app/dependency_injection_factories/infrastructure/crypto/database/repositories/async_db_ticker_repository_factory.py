@@ -0,0 +1,22 @@
+from app.dependency_injection_factories.infrastructure.crypto.caches.known_ticker_cache_factory import (
+    KnownTickerCacheFactory,
+)
+from app.dependency_injection_factories.infrastructure.exchange.caches.exchange_catalog_cache_factory import (
+    ExchangeCatalogCacheFactory,
+)
+from app.dependency_injection_factories.infrastructure.crypto.database.translators.db_ticker_translator_factory import (
+    DbTickerTranslatorFactory,
+)
+from app.infrastructure.crypto.database.repositories.async_db_ticker_repository import (
+    AsyncDbTickerRepository,
+)
+
+
+class AsyncDbTickerRepositoryFactory:
+    @staticmethod
+    def create() -> AsyncDbTickerRepository:
+        return AsyncDbTickerRepository(
+            DbTickerTranslatorFactory.create(),
+            ExchangeCatalogCacheFactory.create(),
+            KnownTickerCacheFactory.create(),
+        )
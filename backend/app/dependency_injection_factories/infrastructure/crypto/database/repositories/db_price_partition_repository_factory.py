@@ -0,0 +1,9 @@
+from app.infrastructure.crypto.database.repositories.db_price_partition_repository import (
+    DbPricePartitionRepository,
+)
+
+
+class DbPricePartitionRepositoryFactory:
+    @staticmethod
+    def create() -> DbPricePartitionRepository:
+        return DbPricePartitionRepository()
@@ -1,6 +1,15 @@
+from app.dependency_injection_factories.infrastructure.crypto.caches.known_ticker_cache_factory import (
+    KnownTickerCacheFactory,
+)
+from app.dependency_injection_factories.infrastructure.crypto.database.translators.db_candle_translator_factory import (
+    DbCandleTranslatorFactory,
+)
 from app.dependency_injection_factories.infrastructure.crypto.database.translators.db_price_translator_factory import (
     DbPriceTranslatorFactory,
 )
+from app.dependency_injection_factories.infrastructure.exchange.caches.exchange_catalog_cache_factory import (
+    ExchangeCatalogCacheFactory,
+)
 from app.infrastructure.crypto.database.repositories.db_price_repository import (
     DbPriceRepository,
 )
@@ -9,4 +18,9 @@ from app.infrastructure.crypto.database.repositories.db_price_repository import
 class DbPriceRepositoryFactory:
     @staticmethod
     def create() -> DbPriceRepository:
-        return DbPriceRepository(DbPriceTranslatorFactory.create())
+        return DbPriceRepository(
+            DbPriceTranslatorFactory.create(),
+            DbCandleTranslatorFactory.create(),
+            KnownTickerCacheFactory.create(),
+            ExchangeCatalogCacheFactory.create(),
+        )
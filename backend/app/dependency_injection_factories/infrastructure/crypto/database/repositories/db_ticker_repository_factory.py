@@ -1,3 +1,9 @@
+from app.dependency_injection_factories.infrastructure.crypto.caches.known_ticker_cache_factory import (
+    KnownTickerCacheFactory,
+)
+from app.dependency_injection_factories.infrastructure.exchange.caches.exchange_catalog_cache_factory import (
+    ExchangeCatalogCacheFactory,
+)
 from app.dependency_injection_factories.infrastructure.crypto.database.translators.db_ticker_translator_factory import (
     DbTickerTranslatorFactory,
 )
@@ -9,4 +15,8 @@ from app.infrastructure.crypto.database.repositories.db_ticker_repository import
 class DbTickerRepositoryFactory:
     @staticmethod
     def create() -> DbTickerRepository:
-        return DbTickerRepository(DbTickerTranslatorFactory.create())
+        return DbTickerRepository(
+            DbTickerTranslatorFactory.create(),
+            ExchangeCatalogCacheFactory.create(),
+            KnownTickerCacheFactory.create(),
+        )
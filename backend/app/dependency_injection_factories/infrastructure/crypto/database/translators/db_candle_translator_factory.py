@@ -0,0 +1,9 @@
+from app.infrastructure.crypto.database.translators.db_candle_translator import (
+    DbCandleTranslator,
+)
+
+
+class DbCandleTranslatorFactory:
+    @staticmethod
+    def create() -> DbCandleTranslator:
+        return DbCandleTranslator()
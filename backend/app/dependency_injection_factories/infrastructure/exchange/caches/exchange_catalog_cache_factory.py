@@ -0,0 +1,17 @@
+from app.infrastructure.exchange.caches.exchange_catalog_cache import (
+    ExchangeCatalogCache,
+)
+from app.settings import EXCHANGE_CATALOG_TTL
+
+
+class ExchangeCatalogCacheFactory:
+    __instance: None | ExchangeCatalogCache = None
+
+    @staticmethod
+    def create() -> ExchangeCatalogCache:
+        if ExchangeCatalogCacheFactory.__instance is None:
+            ExchangeCatalogCacheFactory.__instance = ExchangeCatalogCache(
+                EXCHANGE_CATALOG_TTL
+            )
+
+        return ExchangeCatalogCacheFactory.__instance
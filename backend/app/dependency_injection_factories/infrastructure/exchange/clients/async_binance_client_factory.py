@@ -0,0 +1,13 @@
+from app.dependency_injection_factories.infrastructure.exchange.clients.async_http_client_factory import (
+    AsyncHttpClientFactory,
+)
+from app.infrastructure.exchange.clients.async_binance_client import (
+    AsyncBinanceClient,
+)
+from app.settings import BINANCE_API_URL
+
+
+class AsyncBinanceClientFactory:
+    @staticmethod
+    def create() -> AsyncBinanceClient:
+        return AsyncBinanceClient(BINANCE_API_URL, AsyncHttpClientFactory.create())
@@ -0,0 +1,40 @@
+import httpx
+
+from app.settings import (
+    EXCHANGE_HTTP_TIMEOUT,
+    EXCHANGE_HTTP_CONNECT_TIMEOUT,
+    EXCHANGE_HTTP_MAX_CONNECTIONS,
+    EXCHANGE_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    EXCHANGE_HTTP_KEEPALIVE_EXPIRY,
+    EXCHANGE_HTTP2,
+)
+
+
+class AsyncHttpClientFactory:
+    __instance: None | httpx.AsyncClient = None
+
+    @staticmethod
+    def create() -> httpx.AsyncClient:
+        if (
+            AsyncHttpClientFactory.__instance is None
+            or AsyncHttpClientFactory.__instance.is_closed
+        ):
+            AsyncHttpClientFactory.__instance = httpx.AsyncClient(
+                http2=EXCHANGE_HTTP2,
+                timeout=httpx.Timeout(
+                    EXCHANGE_HTTP_TIMEOUT, connect=EXCHANGE_HTTP_CONNECT_TIMEOUT
+                ),
+                limits=httpx.Limits(
+                    max_connections=EXCHANGE_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=EXCHANGE_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=EXCHANGE_HTTP_KEEPALIVE_EXPIRY,
+                ),
+            )
+
+        return AsyncHttpClientFactory.__instance
+
+    @staticmethod
+    async def close() -> None:
+        if AsyncHttpClientFactory.__instance is not None:
+            await AsyncHttpClientFactory.__instance.aclose()
+            AsyncHttpClientFactory.__instance = None
@@ -0,0 +1,11 @@
+from app.dependency_injection_factories.infrastructure.exchange.clients.async_http_client_factory import (
+    AsyncHttpClientFactory,
+)
+from app.infrastructure.exchange.clients.async_kraken_client import AsyncKrakenClient
+from app.settings import KRAKEN_API_URL
+
+
+class AsyncKrakenClientFactory:
+    @staticmethod
+    def create() -> AsyncKrakenClient:
+        return AsyncKrakenClient(KRAKEN_API_URL, AsyncHttpClientFactory.create())
@@ -1,3 +1,6 @@
+from app.dependency_injection_factories.infrastructure.exchange.clients.http_client_factory import (
+    HttpClientFactory,
+)
 from app.infrastructure.exchange.clients.binance_client import BinanceClient
 from app.settings import BINANCE_API_URL
 
@@ -5,4 +8,4 @@ from app.settings import BINANCE_API_URL
 class BinanceClientFactory:
     @staticmethod
     def create() -> BinanceClient:
-        return BinanceClient(BINANCE_API_URL)
+        return BinanceClient(BINANCE_API_URL, HttpClientFactory.create())
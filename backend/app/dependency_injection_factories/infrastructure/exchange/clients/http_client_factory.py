@@ -0,0 +1,40 @@
+import httpx
+
+from app.settings import (
+    EXCHANGE_HTTP_TIMEOUT,
+    EXCHANGE_HTTP_CONNECT_TIMEOUT,
+    EXCHANGE_HTTP_MAX_CONNECTIONS,
+    EXCHANGE_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    EXCHANGE_HTTP_KEEPALIVE_EXPIRY,
+    EXCHANGE_HTTP2,
+)
+
+
+class HttpClientFactory:
+    __instance: None | httpx.Client = None
+
+    @staticmethod
+    def create() -> httpx.Client:
+        if (
+            HttpClientFactory.__instance is None
+            or HttpClientFactory.__instance.is_closed
+        ):
+            HttpClientFactory.__instance = httpx.Client(
+                http2=EXCHANGE_HTTP2,
+                timeout=httpx.Timeout(
+                    EXCHANGE_HTTP_TIMEOUT, connect=EXCHANGE_HTTP_CONNECT_TIMEOUT
+                ),
+                limits=httpx.Limits(
+                    max_connections=EXCHANGE_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=EXCHANGE_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=EXCHANGE_HTTP_KEEPALIVE_EXPIRY,
+                ),
+            )
+
+        return HttpClientFactory.__instance
+
+    @staticmethod
+    def close() -> None:
+        if HttpClientFactory.__instance is not None:
+            HttpClientFactory.__instance.close()
+            HttpClientFactory.__instance = None
@@ -1,3 +1,6 @@
+from app.dependency_injection_factories.infrastructure.exchange.clients.http_client_factory import (
+    HttpClientFactory,
+)
 from app.infrastructure.exchange.clients.kraken_client import KrakenClient
 from app.settings import KRAKEN_API_URL
 
@@ -5,4 +8,4 @@ from app.settings import KRAKEN_API_URL
 class KrakenClientFactory:
     @staticmethod
     def create() -> KrakenClient:
-        return KrakenClient(KRAKEN_API_URL)
+        return KrakenClient(KRAKEN_API_URL, HttpClientFactory.create())
@@ -0,0 +1,17 @@
+from app.dependency_injection_factories.infrastructure.exchange.caches.exchange_catalog_cache_factory import (
+    ExchangeCatalogCacheFactory,
+)
+from app.dependency_injection_factories.infrastructure.exchange.database.translators.db_exchange_translator_factory import (
+    DbExchangeTranslatorFactory,
+)
+from app.infrastructure.exchange.database.repositories.async_db_exchange_repository import (
+    AsyncDbExchangeRepository,
+)
+
+
+class AsyncDbExchangeRepositoryFactory:
+    @staticmethod
+    def create() -> AsyncDbExchangeRepository:
+        return AsyncDbExchangeRepository(
+            DbExchangeTranslatorFactory.create(), ExchangeCatalogCacheFactory.create()
+        )
@@ -1,3 +1,6 @@
+from app.dependency_injection_factories.infrastructure.exchange.caches.exchange_catalog_cache_factory import (
+    ExchangeCatalogCacheFactory,
+)
 from app.dependency_injection_factories.infrastructure.exchange.database.translators.db_exchange_translator_factory import (
     DbExchangeTranslatorFactory,
 )
@@ -9,4 +12,6 @@ from app.infrastructure.exchange.database.repositories.db_exchange_repository im
 class DbExchangeRepositoryFactory:
     @staticmethod
     def create() -> DbExchangeRepository:
-        return DbExchangeRepository(DbExchangeTranslatorFactory.create())
+        return DbExchangeRepository(
+            DbExchangeTranslatorFactory.create(), ExchangeCatalogCacheFactory.create()
+        )
@@ -0,0 +1,6 @@
+class PriceSubscriptionOverflowException(Exception):
+    def __init__(self, ticker_id: int, max_pending_batches: int):
+        super().__init__(
+            f"Subscription to prices of ticker with id '{ticker_id}' exceeded "
+            f"{max_pending_batches} pending batches."
+        )
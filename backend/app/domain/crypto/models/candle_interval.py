@@ -0,0 +1,78 @@
+from __future__ import annotations
+from datetime import datetime, timedelta
+from enum import Enum
+
+from app.domain.crypto.models.utc_datetime import to_naive_utc
+
+
+class CandleInterval(str, Enum):
+    ONE_MINUTE = "1m"
+    FIVE_MINUTES = "5m"
+    ONE_HOUR = "1h"
+    ONE_DAY = "1d"
+    AUTO = "auto"
+
+    @property
+    def seconds(self) -> int:
+        return _CANDLE_INTERVAL_SECONDS[self]
+
+    def floor(self, instant: datetime) -> datetime:
+        elapsed_seconds = (to_naive_utc(instant) - _EPOCH).total_seconds()
+
+        return _EPOCH + timedelta(
+            seconds=elapsed_seconds // self.seconds * self.seconds
+        )
+
+    @property
+    def rollup(self) -> CandleInterval:
+        return max(
+            (
+                rollup_interval
+                for rollup_interval in ROLLUP_CANDLE_INTERVALS
+                if self.seconds % rollup_interval.seconds == 0
+            ),
+            key=lambda rollup_interval: rollup_interval.seconds,
+        )
+
+    @staticmethod
+    def fit(range_seconds: float, points: int) -> CandleInterval:
+        for interval, seconds in _CANDLE_INTERVAL_SECONDS.items():
+            if range_seconds / seconds <= points:
+                return interval
+
+        return CandleInterval.ONE_DAY
+
+    @staticmethod
+    def fit_range(
+        start_date: None | datetime,
+        end_date: None | datetime,
+        timestamp_range: None | tuple[datetime, datetime],
+        points: int,
+    ) -> CandleInterval:
+        if start_date is None or end_date is None:
+            if timestamp_range is None:
+                return CandleInterval.ONE_MINUTE
+
+            start_date = start_date or timestamp_range[0]
+            end_date = end_date or timestamp_range[1]
+
+        return CandleInterval.fit(
+            (to_naive_utc(end_date) - to_naive_utc(start_date)).total_seconds(),
+            points,
+        )
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+_CANDLE_INTERVAL_SECONDS = {
+    CandleInterval.ONE_MINUTE: 60,
+    CandleInterval.FIVE_MINUTES: 5 * 60,
+    CandleInterval.ONE_HOUR: 60 * 60,
+    CandleInterval.ONE_DAY: 24 * 60 * 60,
+}
+
+ROLLUP_CANDLE_INTERVALS = (
+    CandleInterval.ONE_MINUTE,
+    CandleInterval.ONE_HOUR,
+    CandleInterval.ONE_DAY,
+)
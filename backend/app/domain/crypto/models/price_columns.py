@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass
+class PriceColumns:
+    ticker_id: int
+    ids: list[int]
+    prices: list[float]
+    timestamps: list[datetime]
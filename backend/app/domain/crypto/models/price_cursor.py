@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass
+class PriceCursor:
+    timestamp: datetime
+    id: int
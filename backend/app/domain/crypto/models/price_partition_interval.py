@@ -0,0 +1,25 @@
+from __future__ import annotations
+from datetime import datetime, timedelta
+from enum import Enum
+
+
+class PricePartitionInterval(str, Enum):
+    DAY = "day"
+    MONTH = "month"
+
+    def floor(self, instant: datetime) -> datetime:
+        if self is PricePartitionInterval.DAY:
+            return datetime(instant.year, instant.month, instant.day)
+
+        return datetime(instant.year, instant.month, 1)
+
+    def next(self, instant: datetime) -> datetime:
+        start = self.floor(instant)
+
+        if self is PricePartitionInterval.DAY:
+            return start + timedelta(days=1)
+
+        if start.month == 12:
+            return datetime(start.year + 1, 1, 1)
+
+        return datetime(start.year, start.month + 1, 1)
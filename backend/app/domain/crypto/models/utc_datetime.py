@@ -0,0 +1,17 @@
+from datetime import datetime, timezone
+from typing import overload
+
+
+@overload
+def to_naive_utc(instant: datetime) -> datetime: ...
+
+
+@overload
+def to_naive_utc(instant: None) -> None: ...
+
+
+def to_naive_utc(instant: None | datetime) -> None | datetime:
+    if instant is None or instant.tzinfo is None:
+        return instant
+
+    return instant.astimezone(timezone.utc).replace(tzinfo=None)
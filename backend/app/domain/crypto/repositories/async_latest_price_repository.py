@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from app.domain.crypto.models.price import Price
+
+
+class AsyncLatestPriceRepository(ABC):
+    @abstractmethod
+    async def get_all(
+        self,
+        ticker_ids: None | list[int] = None,
+        exchange_ids: None | list[int] = None,
+    ) -> list[Price]:
+        pass
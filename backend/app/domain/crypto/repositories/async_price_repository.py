@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from app.domain.crypto.models.price import Price
+
+
+class AsyncPriceRepository(ABC):
+    @abstractmethod
+    async def bulk_save(self, prices: list[Price]) -> None:
+        pass
+
+    @abstractmethod
+    async def get_all_or_fail_by_ticker_id(
+        self,
+        ticker_id: int,
+        start_date: None | datetime,
+        end_date: None | datetime,
+        include_end=True,
+        check_ticker=True,
+    ) -> list[Price]:
+        pass
+
+    @abstractmethod
+    async def get_version_by_ticker_id(
+        self, ticker_id: int, start_date: datetime, end_date: datetime
+    ) -> tuple[int, None | int]:
+        pass
+
+    @abstractmethod
+    async def get_all_latest(self, after_id: None | int = None) -> list[Price]:
+        pass
+
+    @abstractmethod
+    async def get_all_by_ticker_ids_after_id(
+        self, ticker_ids: list[int], after_id: None | int
+    ) -> list[Price]:
+        pass
+
+    @abstractmethod
+    async def get_last_id(self) -> None | int:
+        pass
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+from app.domain.crypto.models.symbol import Symbol
+
+
+class AsyncSymbolRepository(ABC):
+    @abstractmethod
+    async def get_all(self) -> list[Symbol]:
+        pass
+
+    @abstractmethod
+    async def get_or_fail_by_id(self, symbol_id: int) -> Symbol:
+        pass
+
+    @abstractmethod
+    async def insert(self, symbol: Symbol) -> Symbol:
+        pass
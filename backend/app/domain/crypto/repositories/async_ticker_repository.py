@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+
+from app.domain.crypto.models.ticker import Ticker
+
+
+class AsyncTickerRepository(ABC):
+    @abstractmethod
+    async def get_all(self) -> list[Ticker]:
+        pass
+
+    @abstractmethod
+    async def get_all_or_fail_by_exchange_id(self, exchange_id: int) -> list[Ticker]:
+        pass
+
+    @abstractmethod
+    async def get_or_fail_by_id(self, ticker_id: int) -> Ticker:
+        pass
+
+    @abstractmethod
+    async def insert(self, ticker: Ticker) -> Ticker:
+        pass
@@ -0,0 +1,46 @@
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import Iterator
+
+from app.domain.crypto.models.price import Price
+from app.domain.crypto.models.price_columns import PriceColumns
+
+
+class PriceArchiveRepository(ABC):
+    @abstractmethod
+    def save(self, ticker_id: int, day: date, prices: list[Price]) -> None:
+        pass
+
+    @abstractmethod
+    def get_archive_end_by_ticker_id(self, ticker_id: int) -> None | datetime:
+        pass
+
+    @abstractmethod
+    def stream_all_by_ticker_id(
+        self,
+        ticker_id: int,
+        start_date: None | datetime,
+        end_date: None | datetime,
+        include_end=True,
+    ) -> Iterator[Price]:
+        pass
+
+    @abstractmethod
+    def stream_columns_by_ticker_id(
+        self,
+        ticker_id: int,
+        start_date: None | datetime,
+        end_date: None | datetime,
+        include_end=True,
+    ) -> Iterator[PriceColumns]:
+        pass
+
+    @abstractmethod
+    def get_timestamp_range_by_ticker_id(
+        self,
+        ticker_id: int,
+        start_date: None | datetime,
+        end_date: None | datetime,
+        include_end=True,
+    ) -> None | tuple[datetime, datetime]:
+        pass
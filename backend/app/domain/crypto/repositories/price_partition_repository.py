@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+
+class PricePartitionRepository(ABC):
+    @abstractmethod
+    def create_partition(self, start_date: datetime, end_date: datetime) -> bool:
+        pass
+
+    @abstractmethod
+    def get_partition_start_dates(self) -> list[datetime]:
+        pass
+
+    @abstractmethod
+    def remove_partition(self, start_date: datetime, drop: bool) -> bool:
+        pass
@@ -1,7 +1,12 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
+from typing import Iterator
 
+from app.domain.crypto.models.candle import Candle
+from app.domain.crypto.models.candle_interval import CandleInterval
 from app.domain.crypto.models.price import Price
+from app.domain.crypto.models.price_columns import PriceColumns
+from app.domain.crypto.models.price_cursor import PriceCursor
 
 
 class PriceRepository(ABC):
@@ -19,3 +24,78 @@ class PriceRepository(ABC):
         check_ticker=True,
     ) -> list[Price]:
         pass
+
+    @abstractmethod
+    def stream_all_or_fail_by_ticker_id(
+        self,
+        ticker_id: int,
+        start_date: None | datetime,
+        end_date: None | datetime,
+        after: None | PriceCursor = None,
+        limit: None | int = None,
+    ) -> Iterator[Price]:
+        pass
+
+    @abstractmethod
+    def stream_all_or_fail_by_ticker_ids(
+        self,
+        ticker_ids: list[int],
+        start_date: None | datetime,
+        end_date: None | datetime,
+    ) -> Iterator[Price]:
+        pass
+
+    @abstractmethod
+    def stream_columns_or_fail_by_ticker_id(
+        self,
+        ticker_id: int,
+        start_date: None | datetime,
+        end_date: None | datetime,
+        after: None | PriceCursor = None,
+        limit: None | int = None,
+    ) -> Iterator[PriceColumns]:
+        pass
+
+    @abstractmethod
+    def get_timestamp_range_by_ticker_id(
+        self,
+        ticker_id: int,
+        start_date: None | datetime,
+        end_date: None | datetime,
+    ) -> None | tuple[datetime, datetime]:
+        pass
+
+    @abstractmethod
+    def get_timestamp_range_by_ticker_ids(
+        self,
+        ticker_ids: list[int],
+        start_date: None | datetime,
+        end_date: None | datetime,
+    ) -> None | tuple[datetime, datetime]:
+        pass
+
+    @abstractmethod
+    def get_candles_or_fail_by_ticker_id(
+        self,
+        ticker_id: int,
+        start_date: None | datetime,
+        end_date: None | datetime,
+        interval: CandleInterval,
+    ) -> list[Candle]:
+        pass
+
+    @abstractmethod
+    def get_candles_or_fail_by_ticker_ids(
+        self,
+        ticker_ids: list[int],
+        start_date: None | datetime,
+        end_date: None | datetime,
+        interval: CandleInterval,
+    ) -> dict[int, list[Candle]]:
+        pass
+
+    @abstractmethod
+    def delete_candles_before(
+        self, interval: CandleInterval, end_date: datetime
+    ) -> int:
+        pass
@@ -4,6 +4,10 @@ from app.domain.crypto.models.ticker import Ticker
 
 
 class TickerRepository(ABC):
+    @abstractmethod
+    def get_all(self) -> list[Ticker]:
+        pass
+
     @abstractmethod
     def get_all_or_fail_by_exchange_id(self, exchange_id: int) -> list[Ticker]:
         pass
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from app.domain.exchange.models.exchange import Exchange
+
+
+class AsyncExchangeRepository(ABC):
+    @abstractmethod
+    async def get_all(self, fetch_tickers=False) -> list[Exchange]:
+        pass
+
+    @abstractmethod
+    async def get_or_fail_by_id(self, exchange_id: int) -> Exchange:
+        pass
@@ -0,0 +1,37 @@
+import pyarrow as pa
+from starlette.middleware.gzip import IdentityResponder
+from starlette.types import ASGIApp
+
+from app.entrypoints.middlewares.drainable_buffer import DrainableBuffer
+
+
+class CodecResponder(IdentityResponder):
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int,
+        content_encoding: str,
+        codec: pa.Codec,
+    ):
+        super().__init__(app, minimum_size)
+        self.content_encoding = content_encoding
+        self.__codec = codec
+        self.__buffer = DrainableBuffer()
+        self.__stream: None | pa.CompressedOutputStream = None
+
+    def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        if self.__stream is None and not more_body:
+            return self.__codec.compress(body, asbytes=True)
+
+        if self.__stream is None:
+            self.__stream = pa.CompressedOutputStream(
+                pa.PythonFile(self.__buffer, mode="w"), self.__codec.name
+            )
+
+        self.__stream.write(body)
+        if more_body:
+            self.__stream.flush()
+        else:
+            self.__stream.close()
+
+        return self.__buffer.drain()
@@ -0,0 +1,97 @@
+import pyarrow as pa
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.gzip import GZipResponder, IdentityResponder
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.entrypoints.middlewares.codec_responder import CodecResponder
+
+
+class CompressionMiddleware:
+    __GZIP = "gzip"
+    __CODECS = {"br": "brotli", "zstd": "zstd"}
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int,
+        encodings: list[str],
+        gzip_level: int,
+        brotli_level: int,
+        zstd_level: int,
+    ):
+        self.__app = app
+        self.__minimum_size = minimum_size
+        self.__encodings = [
+            encoding
+            for encoding in encodings
+            if encoding == self.__GZIP
+            or (
+                encoding in self.__CODECS
+                and pa.Codec.is_available(self.__CODECS[encoding])
+            )
+        ]
+        self.__gzip_level = gzip_level
+        self.__levels = {"br": brotli_level, "zstd": zstd_level}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.__app(scope, receive, send)
+            return
+
+        encoding = self.negotiate(
+            Headers(scope=scope).get("Accept-Encoding", ""), self.__encodings
+        )
+
+        responder: ASGIApp
+        if encoding is None:
+            responder = IdentityResponder(self.__app, self.__minimum_size)
+        elif encoding == self.__GZIP:
+            responder = GZipResponder(
+                self.__app, self.__minimum_size, compresslevel=self.__gzip_level
+            )
+        else:
+            responder = CodecResponder(
+                self.__app,
+                self.__minimum_size,
+                encoding,
+                pa.Codec(
+                    self.__CODECS[encoding], compression_level=self.__levels[encoding]
+                ),
+            )
+
+        async def send_with_weak_entity_tag(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=message["headers"])
+                entity_tag = headers.get("etag", "")
+                if "content-encoding" in headers and entity_tag.startswith('"'):
+                    headers["ETag"] = f"W/{entity_tag}"
+
+            await send(message)
+
+        await responder(scope, receive, send_with_weak_entity_tag)
+
+    @staticmethod
+    def negotiate(accept_encoding: str, encodings: list[str]) -> None | str:
+        qualities: dict[str, float] = {}
+        for item in accept_encoding.split(","):
+            name, _, parameters = item.strip().partition(";")
+            if not name:
+                continue
+
+            quality = 1.0
+            parameter_name, _, value = parameters.strip().partition("=")
+            if parameter_name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+
+            qualities[name.strip().lower()] = quality
+
+        candidates = [
+            (qualities.get(encoding, qualities.get("*", 0.0)), -index, encoding)
+            for index, encoding in enumerate(encodings)
+        ]
+        quality, _, encoding = max(candidates, default=(0.0, 0, None))
+
+        return encoding if quality > 0 else None
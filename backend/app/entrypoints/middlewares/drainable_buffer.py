@@ -0,0 +1,21 @@
+import io
+
+
+class DrainableBuffer(io.RawIOBase):
+    def __init__(self):
+        super().__init__()
+        self.__chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:
+        self.__chunks.append(bytes(data))
+
+        return len(data)
+
+    def drain(self) -> bytes:
+        content = b"".join(self.__chunks)
+        self.__chunks.clear()
+
+        return content
@@ -0,0 +1,68 @@
+import hashlib
+import time
+from datetime import datetime
+
+from fastapi.responses import Response
+
+from app.settings import PRICES_BUFFER_SETTLE_DELAY, PRICES_CLOSED_RANGE_MAX_AGE
+
+
+class HttpCache:
+    NO_CACHE = "no-cache"
+    CLOSED_RANGE = f"public, max-age={PRICES_CLOSED_RANGE_MAX_AGE}, immutable"
+
+    @staticmethod
+    def entity_tag(content: bytes) -> str:
+        return f'"{hashlib.sha256(content).hexdigest()[:32]}"'
+
+    @staticmethod
+    def closed_range_entity_tag(
+        end_date: None | datetime, *parameters: object
+    ) -> None | str:
+        if (
+            end_date is None
+            or end_date.timestamp() > time.time() - PRICES_BUFFER_SETTLE_DELAY
+        ):
+            return None
+
+        return HttpCache.entity_tag(repr((end_date, *parameters)).encode())
+
+    @staticmethod
+    def matches(if_none_match: None | str, entity_tag: str) -> bool:
+        if if_none_match is None:
+            return False
+
+        entity_tags = [tag.strip() for tag in if_none_match.split(",")]
+
+        return "*" in entity_tags or entity_tag in (
+            tag.removeprefix("W/") for tag in entity_tags
+        )
+
+    @staticmethod
+    def headers(entity_tag: str, cache_control: str) -> dict[str, str]:
+        return {"ETag": entity_tag, "Cache-Control": cache_control}
+
+    @staticmethod
+    def json_response(
+        content: bytes,
+        entity_tag: str,
+        cache_control: str,
+        if_none_match: None | str,
+    ) -> Response:
+        if HttpCache.matches(if_none_match, entity_tag):
+            return HttpCache.not_modified(entity_tag, cache_control)
+
+        return Response(
+            content=content,
+            media_type="application/json",
+            headers=HttpCache.headers(entity_tag, cache_control),
+        )
+
+    @staticmethod
+    def not_modified(
+        entity_tag: str, cache_control: str, headers: None | dict[str, str] = None
+    ) -> Response:
+        return Response(
+            status_code=304,
+            headers=HttpCache.headers(entity_tag, cache_control) | (headers or {}),
+        )
@@ -1,4 +1,6 @@
+import orjson
 from fastapi import HTTPException
+from fastapi.responses import Response
 
 from app.application.get_all_exchanges.get_all_exchanges_query import (
     GetAllExchangesQuery,
@@ -6,25 +8,54 @@ from app.application.get_all_exchanges.get_all_exchanges_query import (
 from app.dependency_injection_factories.application.get_all_exchanges.get_all_exchanges_query_factory import (
     GetAllExchangesQueryFactory,
 )
+from app.dependency_injection_factories.infrastructure.crypto.caches.catalog_version_cache_factory import (
+    CatalogVersionCacheFactory,
+)
 from app.entrypoints.routes import RouteHandler
+from app.entrypoints.routes.http_cache import HttpCache
+from app.infrastructure.crypto.caches.catalog_version_cache import CatalogVersionCache
 from app.interfaces.api.v1.schemas.exchange_schema import ExchangeSchema
-from app.main import logger
+from app.logger import logger
 
 
 class GetAllExchangesHandler(RouteHandler):
-    def __init__(self, query: None | GetAllExchangesQuery = None):
+    __CATALOG_KEY = "exchanges"
+
+    def __init__(
+        self,
+        query: None | GetAllExchangesQuery = None,
+        catalog_version_cache: None | CatalogVersionCache = None,
+    ):
         self.__query = query or GetAllExchangesQueryFactory.create()
+        self.__catalog_version_cache = (
+            catalog_version_cache or CatalogVersionCacheFactory.create()
+        )
+
+    async def handle(self, if_none_match: None | str = None) -> Response:
+        entity_tag = self.__catalog_version_cache.get(self.__CATALOG_KEY)
+        if entity_tag is not None and HttpCache.matches(if_none_match, entity_tag):
+            logger.info(f"Exchanges not modified since version {entity_tag}")
+            return HttpCache.not_modified(entity_tag, HttpCache.NO_CACHE)
 
-    def handle(self) -> list[ExchangeSchema]:
         try:
             logger.info("Getting all exchanges from database")
-            response = self.__query.execute()
+            response = await self.__query.execute()
 
-            return [
-                ExchangeSchema.from_domain(exchange) for exchange in response.exchanges
-            ]
+            content = orjson.dumps(
+                [
+                    ExchangeSchema.from_domain(exchange).model_dump(mode="json")
+                    for exchange in response.exchanges
+                ]
+            )
         except Exception as e:
             logger.error(
                 f"An unexpected error happened while querying all exchanges: {e}"
             )
             raise HTTPException(status_code=500, detail="An unexpected error happened.")
+
+        entity_tag = HttpCache.entity_tag(content)
+        self.__catalog_version_cache.set(self.__CATALOG_KEY, entity_tag)
+
+        return HttpCache.json_response(
+            content, entity_tag, HttpCache.NO_CACHE, if_none_match
+        )
@@ -1,37 +1,118 @@
-import asyncio
-from datetime import datetime, timedelta
+import csv
+import io
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Iterator
 
+import pyarrow as pa
 from fastapi import HTTPException, WebSocket
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response, StreamingResponse
 from starlette.websockets import WebSocketDisconnect
 
 from app.application.get_all_prices_by_ticker_id.get_all_prices_by_ticker_id_query import (
     GetAllPricesByTickerIdQuery,
 )
+from app.application.get_candles_by_ticker_id.get_candles_by_ticker_id_query import (
+    GetCandlesByTickerIdQuery,
+)
+from app.application.stream_price_columns_by_ticker_id.stream_price_columns_by_ticker_id_query import (
+    StreamPriceColumnsByTickerIdQuery,
+)
+from app.application.stream_prices_by_ticker_id.stream_prices_by_ticker_id_query import (
+    StreamPricesByTickerIdQuery,
+)
 from app.dependency_injection_factories.application.get_all_prices_by_ticker_id.get_all_prices_by_ticker_id_query_factory import (
     GetAllPricesByTickerIdQueryFactory,
 )
+from app.dependency_injection_factories.application.get_candles_by_ticker_id.get_candles_by_ticker_id_query_factory import (
+    GetCandlesByTickerIdQueryFactory,
+)
+from app.dependency_injection_factories.application.stream_price_columns_by_ticker_id.stream_price_columns_by_ticker_id_query_factory import (
+    StreamPriceColumnsByTickerIdQueryFactory,
+)
+from app.dependency_injection_factories.application.stream_prices_by_ticker_id.stream_prices_by_ticker_id_query_factory import (
+    StreamPricesByTickerIdQueryFactory,
+)
+from app.dependency_injection_factories.infrastructure.crypto.broadcasters.price_broadcaster_factory import (
+    PriceBroadcasterFactory,
+)
+from app.domain.crypto.exceptions.price_subscription_overflow_exception import (
+    PriceSubscriptionOverflowException,
+)
 from app.domain.crypto.exceptions.ticker_not_found_exception import (
     TickerNotFoundException,
 )
+from app.domain.crypto.models.candle_interval import CandleInterval
 from app.domain.crypto.models.price import Price
+from app.domain.crypto.models.price_columns import PriceColumns
+from app.domain.crypto.models.price_cursor import PriceCursor
+from app.domain.crypto.models.utc_datetime import to_naive_utc
 from app.entrypoints.routes import RouteHandler
+from app.entrypoints.routes.http_cache import HttpCache
+from app.infrastructure.crypto.broadcasters.price_broadcaster import PriceBroadcaster
+from app.interfaces.api.v1.schemas.candle_schema import CandleSchema
+from app.interfaces.api.v1.schemas.price_columns_schema import PriceColumnsSchema
+from app.interfaces.api.v1.schemas.price_cursor_schema import PriceCursorSchema
+from app.interfaces.api.v1.schemas.price_export_format import PriceExportFormat
+from app.interfaces.api.v1.schemas.price_frame_format import PriceFrameFormat
 from app.interfaces.api.v1.schemas.price_schema import PriceSchema
-from app.main import logger
-from app.settings import PRICE_WEBSOCKET_INTERVAL
+from app.logger import logger
+from app.settings import PRICES_BUFFER_WINDOW_MINUTES
 
 
 class GetAllPricesByTickerIdHandler(RouteHandler):
+    __NEXT_CURSOR_HEADER = "X-Next-Cursor"
+    __CANDLE_INTERVAL_HEADER = "X-Candle-Interval"
+    __VARY_HEADER = "Vary"
+    __STREAM_CHUNK_SIZE = 1000
+    __WEBSOCKET_FRAME_SIZE = 1000
+    __CSV_HEADER = ("id", "ticker_id", "price", "timestamp")
+    __ARROW_SCHEMA = pa.schema(
+        [
+            ("id", pa.int64()),
+            ("ticker_id", pa.int64()),
+            ("price", pa.float64()),
+            ("timestamp", pa.timestamp("us")),
+        ]
+    )
+
     def __init__(
         self,
         query: None | GetAllPricesByTickerIdQuery = None,
-        websocket_interval: None | float = None,
+        broadcaster: None | PriceBroadcaster = None,
+        stream_query: None | StreamPricesByTickerIdQuery = None,
+        candles_query: None | GetCandlesByTickerIdQuery = None,
+        columns_query: None | StreamPriceColumnsByTickerIdQuery = None,
+        recent_window: None | timedelta = None,
     ):
         self.__query = query or GetAllPricesByTickerIdQueryFactory.create()
-        self.__websocket_interval = websocket_interval or PRICE_WEBSOCKET_INTERVAL
+        self.__broadcaster = broadcaster or PriceBroadcasterFactory.create()
+        self.__stream_query = (
+            stream_query or StreamPricesByTickerIdQueryFactory.create()
+        )
+        self.__candles_query = (
+            candles_query or GetCandlesByTickerIdQueryFactory.create()
+        )
+        self.__columns_query = (
+            columns_query or StreamPriceColumnsByTickerIdQueryFactory.create()
+        )
+        self.__recent_window = recent_window or timedelta(
+            minutes=PRICES_BUFFER_WINDOW_MINUTES
+        )
 
-    def handle(
-        self, ticker_id: int, start_date: None | datetime, end_date: None | datetime
-    ) -> list[PriceSchema]:
+    async def handle(
+        self,
+        ticker_id: int,
+        start_date: None | datetime,
+        end_date: None | datetime,
+        limit: None | int = None,
+        cursor: None | str = None,
+        bucket: None | CandleInterval = None,
+        points: None | int = None,
+        export_format: None | PriceExportFormat = None,
+        accept: None | str = None,
+        if_none_match: None | str = None,
+    ) -> StreamingResponse | Response:
         if start_date is not None and end_date is not None and start_date > end_date:
             logger.error(
                 f"Invalid date range [{start_date}, {end_date}] for querying prices for ticker '{ticker_id}'"
@@ -40,13 +121,66 @@ class GetAllPricesByTickerIdHandler(RouteHandler):
                 status_code=400, detail="start_date must be before end_date"
             )
 
+        if bucket is not None and (limit is not None or cursor is not None):
+            logger.error(
+                f"Bucket '{bucket.value}' cannot be paginated for querying prices for ticker '{ticker_id}'"
+            )
+            raise HTTPException(
+                status_code=400, detail="bucket cannot be combined with limit or cursor"
+            )
+
+        if bucket is not None and export_format not in (None, PriceExportFormat.JSON):
+            logger.error(
+                f"Bucket '{bucket.value}' cannot be exported as '{export_format.value}' for querying prices for ticker '{ticker_id}'"
+            )
+            raise HTTPException(
+                status_code=400, detail="bucket is only available in json format"
+            )
+
+        export_format = export_format or PriceExportFormat.from_accept(accept)
+
+        after: None | PriceCursor = None
+        if cursor is not None:
+            try:
+                after = PriceCursorSchema.to_domain(PriceCursorSchema.decode(cursor))
+            except ValueError:
+                logger.error(
+                    f"Invalid cursor '{cursor}' for querying prices for ticker '{ticker_id}'"
+                )
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+
+        entity_tag = HttpCache.closed_range_entity_tag(
+            end_date, ticker_id, start_date, limit, after, bucket, points, export_format
+        )
+        if entity_tag is not None and HttpCache.matches(if_none_match, entity_tag):
+            logger.info(
+                f"Prices for ticker '{ticker_id}' in date range [{start_date}, {end_date}] not modified"
+            )
+            return HttpCache.not_modified(
+                entity_tag, HttpCache.CLOSED_RANGE, {self.__VARY_HEADER: "Accept"}
+            )
+
         try:
             logger.info(
                 f"Getting prices for ticker '{ticker_id}' in date range [{start_date}, {end_date}]"
             )
-            response = self.__query.execute(ticker_id, start_date, end_date)
 
-            return [PriceSchema.from_domain(price) for price in response.prices]
+            if self.__is_recent_window(start_date, after, limit, bucket, export_format):
+                result = await self.__handle_recent_prices(
+                    ticker_id, start_date, end_date
+                )
+            else:
+                result = await run_in_threadpool(
+                    self.__handle_prices,
+                    ticker_id,
+                    start_date,
+                    end_date,
+                    after,
+                    limit,
+                    bucket,
+                    points,
+                    export_format,
+                )
         except TickerNotFoundException:
             logger.error(f"Ticker with id '{ticker_id}' not found")
             raise HTTPException(status_code=404, detail="Ticker not found")
@@ -56,47 +190,344 @@ class GetAllPricesByTickerIdHandler(RouteHandler):
             )
             raise HTTPException(status_code=500, detail="An unexpected error happened.")
 
+        result.headers[self.__VARY_HEADER] = "Accept"
+        if entity_tag is not None:
+            result.headers.update(HttpCache.headers(entity_tag, HttpCache.CLOSED_RANGE))
+
+        return result
+
     async def handle_websocket(
-        self, websocket: WebSocket, ticker_id: int, last_minutes: int
+        self,
+        websocket: WebSocket,
+        ticker_id: int,
+        last_minutes: int,
+        frame: PriceFrameFormat = PriceFrameFormat.SINGLE,
     ):
+        subscription = self.__broadcaster.subscribe(ticker_id)
         try:
-            instant = datetime.now()
-            response = self.__query.execute(
+            instant = datetime.now(timezone.utc).replace(tzinfo=None)
+            response = await self.__query.execute(
                 ticker_id, instant - timedelta(minutes=last_minutes), instant, False
             )
 
-            await self.__flush_prices(websocket, response.prices)
+            await self.__flush_prices(websocket, ticker_id, response.prices, frame)
+            sent_ids = {price.id for price in response.prices}
 
-            previous_instant = instant
             while True:
-                next_instant = datetime.now()
+                message = await subscription.get()
+                if isinstance(message, Exception):
+                    raise message
 
-                response = self.__query.execute(
-                    ticker_id, previous_instant, next_instant, False, False
+                await self.__flush_prices(
+                    websocket,
+                    ticker_id,
+                    [price for price in message if price.id not in sent_ids],
+                    frame,
                 )
-                await self.__flush_prices(websocket, response.prices)
-
-                previous_instant = next_instant
-                await asyncio.sleep(self.__websocket_interval)
         except TickerNotFoundException:
             logger.error(f"Ticker with id '{ticker_id}' not found")
             await websocket.send_json({"error": "Ticker not found"})
             raise
+        except PriceSubscriptionOverflowException as e:
+            logger.warning(str(e))
+            await websocket.send_json({"error": "Client is too slow"})
+            raise
         except WebSocketDisconnect:
             raise
         except Exception as e:
             logger.error(f"An unexpected error happened in price websocket: {e}")
             await websocket.send_json({"error": "An unexpected error happened"})
             raise
+        finally:
+            self.__broadcaster.unsubscribe(ticker_id, subscription)
+
+    def __is_recent_window(
+        self,
+        start_date: None | datetime,
+        after: None | PriceCursor,
+        limit: None | int,
+        bucket: None | CandleInterval,
+        export_format: PriceExportFormat,
+    ) -> bool:
+        if (
+            start_date is None
+            or after is not None
+            or limit is not None
+            or bucket is not None
+            or export_format != PriceExportFormat.JSON
+        ):
+            return False
+
+        return (
+            to_naive_utc(start_date)
+            >= datetime.now(timezone.utc).replace(tzinfo=None) - self.__recent_window
+        )
+
+    async def __handle_recent_prices(
+        self,
+        ticker_id: int,
+        start_date: datetime,
+        end_date: None | datetime,
+    ) -> Response:
+        response = await self.__query.execute(ticker_id, start_date, end_date)
+
+        return Response(
+            content=PriceSchema.dump_json(response.prices),
+            media_type="application/json",
+        )
+
+    def __handle_prices(
+        self,
+        ticker_id: int,
+        start_date: None | datetime,
+        end_date: None | datetime,
+        after: None | PriceCursor,
+        limit: None | int,
+        bucket: None | CandleInterval,
+        points: None | int,
+        export_format: PriceExportFormat,
+    ) -> StreamingResponse | Response:
+        if bucket is not None:
+            return self.__handle_candles(
+                ticker_id, start_date, end_date, bucket, points
+            )
+
+        if export_format != PriceExportFormat.JSON:
+            return self.__handle_export(
+                ticker_id, start_date, end_date, after, limit, export_format
+            )
+
+        if limit is None:
+            response = self.__stream_query.execute(
+                ticker_id, start_date, end_date, after
+            )
+
+            return StreamingResponse(
+                self.__encode_prices(ticker_id, response.prices),
+                media_type="application/json",
+            )
+
+        response = self.__stream_query.execute(
+            ticker_id, start_date, end_date, after, limit + 1
+        )
+        prices = list(response.prices)
+
+        headers: dict[str, str] = {}
+        if len(prices) > limit:
+            prices = prices[:limit]
+            headers[self.__NEXT_CURSOR_HEADER] = PriceCursorSchema.encode(
+                PriceCursorSchema.from_domain(prices[-1])
+            )
+
+        return StreamingResponse(
+            self.__encode_prices(ticker_id, prices),
+            media_type="application/json",
+            headers=headers,
+        )
+
+    def __handle_candles(
+        self,
+        ticker_id: int,
+        start_date: None | datetime,
+        end_date: None | datetime,
+        bucket: CandleInterval,
+        points: None | int,
+    ) -> Response:
+        response = self.__candles_query.execute(
+            ticker_id, start_date, end_date, bucket, points
+        )
+
+        return Response(
+            content=CandleSchema.dump_json(response.candles),
+            media_type="application/json",
+            headers={self.__CANDLE_INTERVAL_HEADER: response.interval.value},
+        )
+
+    def __handle_export(
+        self,
+        ticker_id: int,
+        start_date: None | datetime,
+        end_date: None | datetime,
+        after: None | PriceCursor,
+        limit: None | int,
+        export_format: PriceExportFormat,
+    ) -> StreamingResponse:
+        if limit is None:
+            response = self.__columns_query.execute(
+                ticker_id, start_date, end_date, after
+            )
+
+            return StreamingResponse(
+                self.__encode_price_columns(
+                    ticker_id, response.price_columns, export_format
+                ),
+                media_type=export_format.media_type,
+            )
+
+        response = self.__columns_query.execute(
+            ticker_id, start_date, end_date, after, limit + 1
+        )
+        price_columns = PriceColumns(
+            ticker_id=ticker_id, ids=[], prices=[], timestamps=[]
+        )
+        for price_columns_batch in response.price_columns:
+            price_columns.ids.extend(price_columns_batch.ids)
+            price_columns.prices.extend(price_columns_batch.prices)
+            price_columns.timestamps.extend(price_columns_batch.timestamps)
+
+        headers: dict[str, str] = {}
+        if len(price_columns.ids) > limit:
+            price_columns = PriceColumns(
+                ticker_id=ticker_id,
+                ids=price_columns.ids[:limit],
+                prices=price_columns.prices[:limit],
+                timestamps=price_columns.timestamps[:limit],
+            )
+            headers[self.__NEXT_CURSOR_HEADER] = PriceCursorSchema.encode(
+                PriceCursorSchema(
+                    timestamp=price_columns.timestamps[-1], id=price_columns.ids[-1]
+                )
+            )
+
+        return StreamingResponse(
+            self.__encode_price_columns(ticker_id, [price_columns], export_format),
+            media_type=export_format.media_type,
+            headers=headers,
+        )
+
+    def __encode_price_columns(
+        self,
+        ticker_id: int,
+        price_columns_batches: Iterable[PriceColumns],
+        export_format: PriceExportFormat,
+    ) -> Iterator[str | bytes]:
+        try:
+            if export_format == PriceExportFormat.ARROW:
+                yield from self.__encode_arrow(price_columns_batches)
+            elif export_format == PriceExportFormat.CSV:
+                yield from self.__encode_csv(price_columns_batches)
+            else:
+                yield from self.__encode_ndjson(price_columns_batches)
+        except Exception as e:
+            logger.error(
+                f"Unexpected error occurred while exporting prices as '{export_format.value}' for ticker with id '{ticker_id}': {e}"
+            )
+            raise
+
+    @staticmethod
+    def __encode_ndjson(
+        price_columns_batches: Iterable[PriceColumns],
+    ) -> Iterator[str]:
+        for price_columns in price_columns_batches:
+            yield "".join(
+                f'{{"id":{price_id},"ticker_id":{price_columns.ticker_id},'
+                f'"price":{price!r},"timestamp":"{timestamp.isoformat()}"}}\n'
+                for price_id, price, timestamp in zip(
+                    price_columns.ids, price_columns.prices, price_columns.timestamps
+                )
+            )
 
-    async def __flush_prices(self, websocket: WebSocket, prices: list[Price]) -> None:
-        for price in prices:
-            price_schema = PriceSchema.from_domain(price)
-            await websocket.send_json(
-                {
-                    "id": price_schema.id,
-                    "ticker_id": price_schema.ticker_id,
-                    "price": price_schema.price,
-                    "timestamp": price_schema.timestamp.isoformat(),
-                }
+    def __encode_csv(
+        self, price_columns_batches: Iterable[PriceColumns]
+    ) -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(self.__CSV_HEADER)
+
+        for price_columns in price_columns_batches:
+            writer.writerows(
+                (price_id, price_columns.ticker_id, price, timestamp.isoformat())
+                for price_id, price, timestamp in zip(
+                    price_columns.ids, price_columns.prices, price_columns.timestamps
+                )
             )
+            yield self.__drain(buffer)
+
+        yield self.__drain(buffer)
+
+    def __encode_arrow(
+        self, price_columns_batches: Iterable[PriceColumns]
+    ) -> Iterator[bytes]:
+        buffer = io.BytesIO()
+
+        with pa.ipc.new_stream(buffer, self.__ARROW_SCHEMA) as writer:
+            for price_columns in price_columns_batches:
+                writer.write_batch(
+                    pa.record_batch(
+                        [
+                            pa.array(price_columns.ids, pa.int64()),
+                            pa.repeat(
+                                pa.scalar(price_columns.ticker_id, pa.int64()),
+                                len(price_columns.ids),
+                            ),
+                            pa.array(price_columns.prices, pa.float64()),
+                            pa.array(price_columns.timestamps, pa.timestamp("us")),
+                        ],
+                        schema=self.__ARROW_SCHEMA,
+                    )
+                )
+                yield self.__drain(buffer)
+
+        yield self.__drain(buffer)
+
+    @staticmethod
+    def __drain(buffer: io.StringIO | io.BytesIO) -> str | bytes:
+        content = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+        return content
+
+    def __encode_prices(
+        self, ticker_id: int, prices: Iterable[Price]
+    ) -> Iterator[bytes]:
+        try:
+            yield b"["
+            separator = b""
+            chunk: list[Price] = []
+            for price in prices:
+                chunk.append(price)
+
+                if len(chunk) == self.__STREAM_CHUNK_SIZE:
+                    yield separator + PriceSchema.dump_json(chunk)[1:-1]
+                    separator = b","
+                    chunk = []
+
+            if chunk:
+                yield separator + PriceSchema.dump_json(chunk)[1:-1]
+            yield b"]"
+        except Exception as e:
+            logger.error(
+                f"Unexpected error occurred while streaming prices for ticker with id '{ticker_id}': {e}"
+            )
+            raise
+
+    async def __flush_prices(
+        self,
+        websocket: WebSocket,
+        ticker_id: int,
+        prices: list[Price],
+        frame: PriceFrameFormat,
+    ) -> None:
+        if frame == PriceFrameFormat.SINGLE:
+            for price in prices:
+                price_schema = PriceSchema.from_domain(price)
+                await websocket.send_json(
+                    {
+                        "id": price_schema.id,
+                        "ticker_id": price_schema.ticker_id,
+                        "price": price_schema.price,
+                        "timestamp": price_schema.timestamp.isoformat(),
+                    }
+                )
+            return
+
+        for start in range(0, len(prices), self.__WEBSOCKET_FRAME_SIZE):
+            chunk = prices[start : start + self.__WEBSOCKET_FRAME_SIZE]
+
+            if frame == PriceFrameFormat.COLUMNAR:
+                await websocket.send_text(
+                    PriceColumnsSchema.dump_json(ticker_id, chunk).decode()
+                )
+            else:
+                await websocket.send_text(PriceSchema.dump_json(chunk).decode())
@@ -0,0 +1,148 @@
+from datetime import datetime
+from itertools import groupby
+from typing import Iterable, Iterator
+
+from fastapi import HTTPException
+from fastapi.responses import Response, StreamingResponse
+
+from app.application.get_all_prices_by_ticker_ids.get_all_prices_by_ticker_ids_query import (
+    GetAllPricesByTickerIdsQuery,
+)
+from app.application.get_candles_by_ticker_ids.get_candles_by_ticker_ids_query import (
+    GetCandlesByTickerIdsQuery,
+)
+from app.dependency_injection_factories.application.get_all_prices_by_ticker_ids.get_all_prices_by_ticker_ids_query_factory import (
+    GetAllPricesByTickerIdsQueryFactory,
+)
+from app.dependency_injection_factories.application.get_candles_by_ticker_ids.get_candles_by_ticker_ids_query_factory import (
+    GetCandlesByTickerIdsQueryFactory,
+)
+from app.domain.crypto.exceptions.ticker_not_found_exception import (
+    TickerNotFoundException,
+)
+from app.domain.crypto.models.candle_interval import CandleInterval
+from app.domain.crypto.models.price import Price
+from app.entrypoints.routes import RouteHandler
+from app.entrypoints.routes.http_cache import HttpCache
+from app.interfaces.api.v1.schemas.candle_series_schema import CandleSeriesSchema
+from app.interfaces.api.v1.schemas.price_schema import PriceSchema
+from app.logger import logger
+
+
+class GetAllPricesByTickerIdsHandler(RouteHandler):
+    __CANDLE_INTERVAL_HEADER = "X-Candle-Interval"
+    __STREAM_CHUNK_SIZE = 1000
+
+    def __init__(
+        self,
+        query: None | GetAllPricesByTickerIdsQuery = None,
+        candles_query: None | GetCandlesByTickerIdsQuery = None,
+    ):
+        self.__query = query or GetAllPricesByTickerIdsQueryFactory.create()
+        self.__candles_query = (
+            candles_query or GetCandlesByTickerIdsQueryFactory.create()
+        )
+
+    def handle(
+        self,
+        ticker_ids: list[int],
+        start_date: None | datetime,
+        end_date: None | datetime,
+        bucket: None | CandleInterval = None,
+        points: None | int = None,
+        if_none_match: None | str = None,
+    ) -> StreamingResponse | Response:
+        ticker_ids = sorted(set(ticker_ids))
+
+        if start_date is not None and end_date is not None and start_date > end_date:
+            logger.error(
+                f"Invalid date range [{start_date}, {end_date}] for querying prices for tickers {ticker_ids}"
+            )
+            raise HTTPException(
+                status_code=400, detail="start_date must be before end_date"
+            )
+
+        entity_tag = HttpCache.closed_range_entity_tag(
+            end_date, ticker_ids, start_date, bucket, points
+        )
+        if entity_tag is not None and HttpCache.matches(if_none_match, entity_tag):
+            logger.info(
+                f"Prices for tickers {ticker_ids} in date range [{start_date}, {end_date}] not modified"
+            )
+            return HttpCache.not_modified(entity_tag, HttpCache.CLOSED_RANGE)
+
+        headers = (
+            {}
+            if entity_tag is None
+            else HttpCache.headers(entity_tag, HttpCache.CLOSED_RANGE)
+        )
+
+        try:
+            logger.info(
+                f"Getting prices for tickers {ticker_ids} in date range [{start_date}, {end_date}]"
+            )
+
+            if bucket is not None:
+                response = self.__candles_query.execute(
+                    ticker_ids, start_date, end_date, bucket, points
+                )
+
+                return Response(
+                    content=CandleSeriesSchema.dump_json(response.candles),
+                    media_type="application/json",
+                    headers=headers
+                    | {self.__CANDLE_INTERVAL_HEADER: response.interval.value},
+                )
+
+            response = self.__query.execute(ticker_ids, start_date, end_date)
+
+            return StreamingResponse(
+                self.__encode_price_series(response.ticker_ids, response.prices),
+                media_type="application/json",
+                headers=headers,
+            )
+        except TickerNotFoundException as e:
+            logger.error(str(e))
+            raise HTTPException(status_code=404, detail="Ticker not found")
+        except Exception as e:
+            logger.error(
+                f"Unexpected error occurred while retrieving prices for tickers {ticker_ids} in date range [{start_date}, {end_date}]: {e}"
+            )
+            raise HTTPException(status_code=500, detail="An unexpected error happened.")
+
+    def __encode_price_series(
+        self, ticker_ids: list[int], prices: Iterator[Price]
+    ) -> Iterator[bytes]:
+        try:
+            yield b"["
+            prices_by_ticker_id = groupby(prices, lambda price: price.ticker_id)
+            next_series = next(prices_by_ticker_id, None)
+            series_separator = b""
+            for ticker_id in ticker_ids:
+                yield series_separator + b'{"ticker_id":%d,"prices":[' % ticker_id
+                series_separator = b","
+
+                if next_series is not None and next_series[0] == ticker_id:
+                    yield from self.__encode_prices(next_series[1])
+                    next_series = next(prices_by_ticker_id, None)
+                yield b"]}"
+            yield b"]"
+        except Exception as e:
+            logger.error(
+                f"Unexpected error occurred while streaming prices for tickers {ticker_ids}: {e}"
+            )
+            raise
+
+    def __encode_prices(self, prices: Iterable[Price]) -> Iterator[bytes]:
+        separator = b""
+        chunk: list[Price] = []
+        for price in prices:
+            chunk.append(price)
+
+            if len(chunk) == self.__STREAM_CHUNK_SIZE:
+                yield separator + PriceSchema.dump_json(chunk)[1:-1]
+                separator = b","
+                chunk = []
+
+        if chunk:
+            yield separator + PriceSchema.dump_json(chunk)[1:-1]
@@ -1,29 +1,59 @@
+import orjson
 from fastapi import HTTPException
+from fastapi.responses import Response
 
 from app.application.get_all_symbols.get_all_symbols_query import GetAllSymbolsQuery
 from app.dependency_injection_factories.application.get_all_symbols.get_all_symbols_query_factory import (
     GetAllSymbolsQueryFactory,
 )
+from app.dependency_injection_factories.infrastructure.crypto.caches.catalog_version_cache_factory import (
+    CatalogVersionCacheFactory,
+)
 from app.entrypoints.routes import RouteHandler
+from app.entrypoints.routes.http_cache import HttpCache
+from app.infrastructure.crypto.caches.catalog_version_cache import CatalogVersionCache
 from app.interfaces.api.v1.schemas.symbol_schema import SymbolSchema
-from app.main import logger
+from app.logger import logger
 
 
 class GetAllSymbolsHandler(RouteHandler):
-    def __init__(self, query: None | GetAllSymbolsQuery = None):
+    __CATALOG_KEY = "symbols"
+
+    def __init__(
+        self,
+        query: None | GetAllSymbolsQuery = None,
+        catalog_version_cache: None | CatalogVersionCache = None,
+    ):
         self.__query = query or GetAllSymbolsQueryFactory.create()
+        self.__catalog_version_cache = (
+            catalog_version_cache or CatalogVersionCacheFactory.create()
+        )
+
+    async def handle(self, if_none_match: None | str = None) -> Response:
+        entity_tag = self.__catalog_version_cache.get(self.__CATALOG_KEY)
+        if entity_tag is not None and HttpCache.matches(if_none_match, entity_tag):
+            logger.info(f"Symbols not modified since version {entity_tag}")
+            return HttpCache.not_modified(entity_tag, HttpCache.NO_CACHE)
 
-    def handle(self) -> list[SymbolSchema]:
         try:
             logger.info("Getting all symbols from database")
-            response = self.__query.execute()
+            response = await self.__query.execute()
 
-            return [
-                SymbolSchema.from_domain(domain_symbol)
-                for domain_symbol in response.symbols
-            ]
+            content = orjson.dumps(
+                [
+                    SymbolSchema.from_domain(domain_symbol).model_dump(mode="json")
+                    for domain_symbol in response.symbols
+                ]
+            )
         except Exception as e:
             logger.error(
                 f"An unexpected error happened while retrieving all symbols: {e}"
             )
             raise HTTPException(status_code=500, detail="An unexpected error happened.")
+
+        entity_tag = HttpCache.entity_tag(content)
+        self.__catalog_version_cache.set(self.__CATALOG_KEY, entity_tag)
+
+        return HttpCache.json_response(
+            content, entity_tag, HttpCache.NO_CACHE, if_none_match
+        )
@@ -1,4 +1,6 @@
+import orjson
 from fastapi import HTTPException
+from fastapi.responses import Response
 
 from app.application.get_all_tickers_by_exchange_id.get_all_tickers_by_exchange_id_query import (
     GetAllTickersByExchangeIdQuery,
@@ -6,26 +8,53 @@ from app.application.get_all_tickers_by_exchange_id.get_all_tickers_by_exchange_
 from app.dependency_injection_factories.application.get_all_tickers_by_exchange_id.get_all_tickers_by_exchange_id_query_factory import (
     GetAllTickersByExchangeIdQueryFactory,
 )
+from app.dependency_injection_factories.infrastructure.crypto.caches.catalog_version_cache_factory import (
+    CatalogVersionCacheFactory,
+)
 from app.domain.exchange.exceptions.exchange_not_found_exception import (
     ExchangeNotFoundException,
 )
 from app.entrypoints.routes import RouteHandler
+from app.entrypoints.routes.http_cache import HttpCache
+from app.infrastructure.crypto.caches.catalog_version_cache import CatalogVersionCache
 from app.interfaces.api.v1.schemas.ticker_schema import TickerSchema
-from app.main import logger
+from app.logger import logger
 
 
 class GetAllTickersByExchangeIdHandler(RouteHandler):
-    def __init__(self, query: None | GetAllTickersByExchangeIdQuery = None):
+    def __init__(
+        self,
+        query: None | GetAllTickersByExchangeIdQuery = None,
+        catalog_version_cache: None | CatalogVersionCache = None,
+    ):
         self.__query = query or GetAllTickersByExchangeIdQueryFactory.create()
+        self.__catalog_version_cache = (
+            catalog_version_cache or CatalogVersionCacheFactory.create()
+        )
+
+    async def handle(
+        self, exchange_id: int, if_none_match: None | str = None
+    ) -> Response:
+        catalog_key = f"exchanges/{exchange_id}/tickers"
+        entity_tag = self.__catalog_version_cache.get(catalog_key)
+        if entity_tag is not None and HttpCache.matches(if_none_match, entity_tag):
+            logger.info(
+                f"Tickers for exchange '{exchange_id}' not modified since version {entity_tag}"
+            )
+            return HttpCache.not_modified(entity_tag, HttpCache.NO_CACHE)
 
-    def handle(self, exchange_id: int) -> list[TickerSchema]:
         try:
             logger.info(
                 f"Getting all tickers for exchange '{exchange_id}' from database"
             )
-            response = self.__query.execute(exchange_id)
+            response = await self.__query.execute(exchange_id)
 
-            return [TickerSchema.from_domain(ticker) for ticker in response.tickers]
+            content = orjson.dumps(
+                [
+                    TickerSchema.from_domain(ticker).model_dump(mode="json")
+                    for ticker in response.tickers
+                ]
+            )
         except ExchangeNotFoundException:
             logger.error(f"Exchange with id '{exchange_id}' not found")
             raise HTTPException(status_code=404, detail="Exchange not found")
@@ -34,3 +63,10 @@ class GetAllTickersByExchangeIdHandler(RouteHandler):
                 f"Unexpected error occurred while retrieving tickers for exchange with id '{exchange_id}': {e}"
             )
             raise HTTPException(status_code=500, detail="An unexpected error happened.")
+
+        entity_tag = HttpCache.entity_tag(content)
+        self.__catalog_version_cache.set(catalog_key, entity_tag)
+
+        return HttpCache.json_response(
+            content, entity_tag, HttpCache.NO_CACHE, if_none_match
+        )
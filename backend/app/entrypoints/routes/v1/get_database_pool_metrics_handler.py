@@ -0,0 +1,31 @@
+from typing import Callable
+
+from fastapi import HTTPException
+
+from app.db import get_pool_metrics
+from app.entrypoints.routes import RouteHandler
+from app.infrastructure.database.pool_metrics import PoolMetricsSnapshot
+from app.interfaces.api.v1.schemas.database_pool_metrics_schema import (
+    DatabasePoolMetricsSchema,
+)
+from app.logger import logger
+
+
+class GetDatabasePoolMetricsHandler(RouteHandler):
+    def __init__(
+        self,
+        pool_metrics_provider: None | Callable[[], list[PoolMetricsSnapshot]] = None,
+    ):
+        self.__pool_metrics_provider = pool_metrics_provider or get_pool_metrics
+
+    def handle(self) -> list[DatabasePoolMetricsSchema]:
+        try:
+            return [
+                DatabasePoolMetricsSchema.from_snapshot(snapshot)
+                for snapshot in self.__pool_metrics_provider()
+            ]
+        except Exception as e:
+            logger.error(
+                f"An unexpected error happened while retrieving database pool metrics: {e}"
+            )
+            raise HTTPException(status_code=500, detail="An unexpected error happened.")
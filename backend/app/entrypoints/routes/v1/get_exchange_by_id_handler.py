@@ -11,17 +11,17 @@ from app.domain.exchange.exceptions.exchange_not_found_exception import (
 )
 from app.entrypoints.routes import RouteHandler
 from app.interfaces.api.v1.schemas.exchange_schema import ExchangeSchema
-from app.main import logger
+from app.logger import logger
 
 
 class GetExchangeByIdHandler(RouteHandler):
     def __init__(self, query: None | GetExchangeByIdQuery = None):
         self.__query = query or GetExchangeByIdQueryFactory.create()
 
-    def handle(self, exchange_id: int) -> ExchangeSchema:
+    async def handle(self, exchange_id: int) -> ExchangeSchema:
         try:
             logger.info(f"Getting exchange with id '{exchange_id}' from database")
-            response = self.__query.execute(exchange_id)
+            response = await self.__query.execute(exchange_id)
 
             return ExchangeSchema.from_domain(response.exchange)
         except ExchangeNotFoundException:
@@ -0,0 +1,34 @@
+from fastapi import HTTPException
+
+from app.application.get_latest_prices.get_latest_prices_query import (
+    GetLatestPricesQuery,
+)
+from app.dependency_injection_factories.application.get_latest_prices.get_latest_prices_query_factory import (
+    GetLatestPricesQueryFactory,
+)
+from app.entrypoints.routes import RouteHandler
+from app.interfaces.api.v1.schemas.price_schema import PriceSchema
+from app.logger import logger
+
+
+class GetLatestPricesHandler(RouteHandler):
+    def __init__(self, query: None | GetLatestPricesQuery = None):
+        self.__query = query or GetLatestPricesQueryFactory.create()
+
+    async def handle(
+        self,
+        ticker_ids: None | list[int] = None,
+        exchange_ids: None | list[int] = None,
+    ) -> list[PriceSchema]:
+        try:
+            logger.info(
+                f"Getting latest prices for tickers {ticker_ids} and exchanges {exchange_ids} from cache"
+            )
+            response = await self.__query.execute(ticker_ids, exchange_ids)
+
+            return [PriceSchema.from_domain(price) for price in response.prices]
+        except Exception as e:
+            logger.error(
+                f"Unexpected error occurred while retrieving latest prices for tickers {ticker_ids} and exchanges {exchange_ids}: {e}"
+            )
+            raise HTTPException(status_code=500, detail="An unexpected error happened.")
@@ -9,17 +9,17 @@ from app.domain.crypto.exceptions.symbol_not_found_exception import (
 )
 from app.entrypoints.routes import RouteHandler
 from app.interfaces.api.v1.schemas.symbol_schema import SymbolSchema
-from app.main import logger
+from app.logger import logger
 
 
 class GetSymbolByIdHandler(RouteHandler):
     def __init__(self, query: None | GetSymbolByIdQuery = None):
         self.__query = query or GetSymbolByIdQueryFactory.create()
 
-    def handle(self, symbol_id: int) -> SymbolSchema:
+    async def handle(self, symbol_id: int) -> SymbolSchema:
         try:
             logger.info(f"Getting symbol with id '{symbol_id}' from database")
-            response = self.__query.execute(symbol_id)
+            response = await self.__query.execute(symbol_id)
 
             return SymbolSchema.from_domain(response.symbol)
         except SymbolNotFoundException:
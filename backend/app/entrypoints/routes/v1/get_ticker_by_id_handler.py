@@ -9,17 +9,17 @@ from app.domain.crypto.exceptions.ticker_not_found_exception import (
 )
 from app.entrypoints.routes import RouteHandler
 from app.interfaces.api.v1.schemas.ticker_schema import TickerSchema
-from app.main import logger
+from app.logger import logger
 
 
 class GetTickerByIdHandler(RouteHandler):
     def __init__(self, query: None | GetTickerByIdQuery = None):
         self.__query = query or GetTickerByIdQueryFactory.create()
 
-    def handle(self, ticker_id) -> TickerSchema:
+    async def handle(self, ticker_id) -> TickerSchema:
         try:
             logger.info(f"Retrieving ticker with id '{ticker_id}'")
-            response = self.__query.execute(ticker_id)
+            response = await self.__query.execute(ticker_id)
 
             return TickerSchema.from_domain(response.ticker)
         except TickerNotFoundException:
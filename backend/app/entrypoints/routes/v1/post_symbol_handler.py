@@ -4,25 +4,37 @@ from app.application.create_symbol.create_symbol_command import CreateSymbolComm
 from app.dependency_injection_factories.application.create_symbol.create_symbol_command_factory import (
     CreateSymbolCommandFactory,
 )
+from app.dependency_injection_factories.infrastructure.crypto.caches.catalog_version_cache_factory import (
+    CatalogVersionCacheFactory,
+)
 from app.domain.crypto.exceptions.symbol_already_exists_exception import (
     SymbolAlreadyExistsException,
 )
 from app.entrypoints.routes import RouteHandler
+from app.infrastructure.crypto.caches.catalog_version_cache import CatalogVersionCache
 from app.interfaces.api.v1.schemas.symbol_create_schema import SymbolCreateSchema
 from app.interfaces.api.v1.schemas.symbol_schema import SymbolSchema
-from app.main import logger
+from app.logger import logger
 
 
 class PostSymbolHandler(RouteHandler):
-    def __init__(self, command: None | CreateSymbolCommand = None):
+    def __init__(
+        self,
+        command: None | CreateSymbolCommand = None,
+        catalog_version_cache: None | CatalogVersionCache = None,
+    ):
         self.__command = command or CreateSymbolCommandFactory.create()
+        self.__catalog_version_cache = (
+            catalog_version_cache or CatalogVersionCacheFactory.create()
+        )
 
-    def handle(self, symbol_schema: SymbolCreateSchema) -> SymbolSchema:
+    async def handle(self, symbol_schema: SymbolCreateSchema) -> SymbolSchema:
         try:
             logger.info(f"Creating symbol '{symbol_schema.symbol}'")
-            response = self.__command.execute(
+            response = await self.__command.execute(
                 SymbolCreateSchema.to_domain(symbol_schema)
             )
+            self.__catalog_version_cache.invalidate()
 
             return SymbolSchema.from_domain(response.created_symbol)
         except SymbolAlreadyExistsException:
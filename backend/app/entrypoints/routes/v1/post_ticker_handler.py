@@ -4,6 +4,9 @@ from app.application.create_ticker.create_ticker_command import CreateTickerComm
 from app.dependency_injection_factories.application.create_ticker.create_ticker_command_factory import (
     CreateTickerCommandFactory,
 )
+from app.dependency_injection_factories.infrastructure.crypto.caches.catalog_version_cache_factory import (
+    CatalogVersionCacheFactory,
+)
 from app.domain.crypto.exceptions.reference_to_non_existent_id_exception import (
     ReferenceToNonExistentIdException,
 )
@@ -11,24 +14,33 @@ from app.domain.crypto.exceptions.ticker_already_exists_exception import (
     TickerAlreadyExistsException,
 )
 from app.entrypoints.routes import RouteHandler
+from app.infrastructure.crypto.caches.catalog_version_cache import CatalogVersionCache
 from app.interfaces.api.v1.schemas.ticker_create_schema import TickerCreateSchema
 from app.interfaces.api.v1.schemas.ticker_schema import TickerSchema
-from app.main import logger
+from app.logger import logger
 
 
 class PostTickerHandler(RouteHandler):
-    def __init__(self, command: None | CreateTickerCommand = None):
+    def __init__(
+        self,
+        command: None | CreateTickerCommand = None,
+        catalog_version_cache: None | CatalogVersionCache = None,
+    ):
         self.__command = command or CreateTickerCommandFactory.create()
+        self.__catalog_version_cache = (
+            catalog_version_cache or CatalogVersionCacheFactory.create()
+        )
 
-    def handle(self, ticker_schema: TickerCreateSchema) -> TickerSchema:
+    async def handle(self, ticker_schema: TickerCreateSchema) -> TickerSchema:
         try:
             logger.info(
                 f"Creating ticker '{ticker_schema.ticker}' for exchange "
                 f"'{ticker_schema.exchange_id}' and symbol '{ticker_schema.symbol_id}'"
             )
-            response = self.__command.execute(
+            response = await self.__command.execute(
                 TickerCreateSchema.to_domain(ticker_schema)
             )
+            self.__catalog_version_cache.invalidate()
 
             return TickerSchema.from_domain(response.created_ticker)
         except TickerAlreadyExistsException:
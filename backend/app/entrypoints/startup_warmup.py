@@ -0,0 +1,56 @@
+import logging
+from time import perf_counter
+from typing import Any, Callable, Iterable
+
+from sqlalchemy import text
+from sqlalchemy.orm import configure_mappers
+
+from app.db import async_engine, engine
+
+
+class StartupWarmup:
+    def __init__(
+        self,
+        logger: logging.Logger,
+        handler_factories: Iterable[Callable[[], Any]],
+    ):
+        self.__logger = logger
+        self.__handler_factories = list(handler_factories)
+
+    def preload_handlers(self) -> None:
+        start = perf_counter()
+
+        for handler_factory in self.__handler_factories:
+            handler_factory()
+
+        self.__log_elapsed(f"Preloaded {len(self.__handler_factories)} handlers", start)
+
+    def configure_mappers(self) -> None:
+        start = perf_counter()
+        configure_mappers()
+        self.__log_elapsed("Configured database mappers", start)
+
+    def connect_database(self) -> None:
+        start = perf_counter()
+        try:
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        except Exception as e:
+            self.__logger.error(f"Failed to warm database connection: {e}")
+            return
+
+        self.__log_elapsed("Opened database connection", start)
+
+    async def connect_async_database(self) -> None:
+        start = perf_counter()
+        try:
+            async with async_engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+        except Exception as e:
+            self.__logger.error(f"Failed to warm async database connection: {e}")
+            return
+
+        self.__log_elapsed("Opened async database connection", start)
+
+    def __log_elapsed(self, message: str, start: float) -> None:
+        self.__logger.info(f"{message} in {(perf_counter() - start) * 1000:.1f} ms")
@@ -5,3 +5,9 @@ class TaskHandler(ABC):
     @abstractmethod
     def handle(self) -> None:
         pass
+
+
+class AsyncTaskHandler(ABC):
+    @abstractmethod
+    async def handle(self) -> None:
+        pass
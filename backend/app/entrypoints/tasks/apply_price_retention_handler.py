@@ -0,0 +1,36 @@
+from app.application.apply_price_retention.apply_price_retention_command import (
+    ApplyPriceRetentionCommand,
+)
+from app.dependency_injection_factories.application.apply_price_retention.apply_price_retention_command_factory import (
+    ApplyPriceRetentionCommandFactory,
+)
+from app.entrypoints.tasks import TaskHandler
+from app.tasks import task_logger
+
+
+class ApplyPriceRetentionHandler(TaskHandler):
+    def __init__(self, command: None | ApplyPriceRetentionCommand = None):
+        self.__command = command or ApplyPriceRetentionCommandFactory.create()
+
+    def handle(self) -> None:
+        try:
+            task_logger.info("Applying price retention policy...")
+            response = self.__command.execute()
+        except Exception as e:
+            task_logger.error(
+                f"An unexpected error happened while applying price retention: {e}"
+            )
+            return
+
+        for start_date in response.removed_partitions:
+            task_logger.info(f"Removed price partition starting at {start_date}")
+
+        for start_date in response.skipped_partitions:
+            task_logger.warning(
+                f"Kept expired price partition starting at {start_date} because it is not fully archived yet"
+            )
+
+        for interval, deleted_candles in response.deleted_candles.items():
+            task_logger.info(
+                f"Deleted {deleted_candles} expired {interval.value} price candles"
+            )
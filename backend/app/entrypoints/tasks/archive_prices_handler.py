@@ -0,0 +1,28 @@
+from app.application.archive_prices.archive_prices_command import (
+    ArchivePricesCommand,
+)
+from app.dependency_injection_factories.application.archive_prices.archive_prices_command_factory import (
+    ArchivePricesCommandFactory,
+)
+from app.entrypoints.tasks import TaskHandler
+from app.tasks import task_logger
+
+
+class ArchivePricesHandler(TaskHandler):
+    def __init__(self, command: None | ArchivePricesCommand = None):
+        self.__command = command or ArchivePricesCommandFactory.create()
+
+    def handle(self) -> None:
+        try:
+            task_logger.info("Archiving closed days of prices...")
+            response = self.__command.execute()
+        except Exception as e:
+            task_logger.error(
+                f"An unexpected error happened while archiving prices: {e}"
+            )
+            return
+
+        for ticker_id, archived_days in response.archived_days.items():
+            task_logger.info(
+                f"Archived {len(archived_days)} days of prices for ticker {ticker_id}"
+            )
@@ -0,0 +1,26 @@
+from app.application.create_price_partitions.create_price_partitions_command import (
+    CreatePricePartitionsCommand,
+)
+from app.dependency_injection_factories.application.create_price_partitions.create_price_partitions_command_factory import (
+    CreatePricePartitionsCommandFactory,
+)
+from app.entrypoints.tasks import TaskHandler
+from app.tasks import task_logger
+
+
+class CreatePricePartitionsHandler(TaskHandler):
+    def __init__(self, command: None | CreatePricePartitionsCommand = None):
+        self.__command = command or CreatePricePartitionsCommandFactory.create()
+
+    def handle(self) -> None:
+        try:
+            task_logger.info("Creating upcoming price partitions...")
+            response = self.__command.execute()
+        except Exception as e:
+            task_logger.error(
+                f"An unexpected error happened while creating price partitions: {e}"
+            )
+            return
+
+        for start_date in response.created_partitions:
+            task_logger.info(f"Created price partition starting at {start_date}")
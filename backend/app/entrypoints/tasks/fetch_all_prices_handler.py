@@ -0,0 +1,40 @@
+from httpx import ConnectTimeout
+
+from app.application.update_all_prices_from_remote.update_all_prices_from_remote_command import (
+    UpdateAllPricesFromRemoteCommand,
+)
+from app.dependency_injection_factories.application.update_all_prices_from_remote.update_all_prices_from_remote_command_factory import (
+    UpdateAllPricesFromRemoteCommandFactory,
+)
+from app.entrypoints.tasks import AsyncTaskHandler
+from app.tasks import task_logger
+
+
+class FetchAllPricesHandler(AsyncTaskHandler):
+    def __init__(self, command: None | UpdateAllPricesFromRemoteCommand = None):
+        self.__command = command or UpdateAllPricesFromRemoteCommandFactory.create()
+
+    async def handle(self) -> None:
+        try:
+            task_logger.info("Fetching prices from all exchanges...")
+            response = await self.__command.execute()
+        except Exception as e:
+            task_logger.error(
+                f"An unexpected error happened while fetching exchange prices: {e}"
+            )
+            return
+
+        for exchange_name in response.missing_exchanges:
+            task_logger.error(f"{exchange_name} is not a registered exchange")
+
+        for exchange_name, error in response.failed_exchanges.items():
+            if isinstance(error, ConnectTimeout):
+                task_logger.error(
+                    f"The connection to {exchange_name} API has timed out"
+                )
+            else:
+                task_logger.error(
+                    f"An unexpected error happened while fetching {exchange_name} prices: {error}"
+                )
+
+        task_logger.info(f"Stored {response.saved_prices} prices")
@@ -0,0 +1,388 @@
+from dataclasses import replace
+from datetime import datetime
+from itertools import chain, groupby, islice
+from typing import Iterator
+
+from app.domain.crypto.models.candle import Candle
+from app.domain.crypto.models.candle_interval import CandleInterval
+from app.domain.crypto.models.price import Price
+from app.domain.crypto.models.price_columns import PriceColumns
+from app.domain.crypto.models.price_cursor import PriceCursor
+from app.domain.crypto.models.utc_datetime import to_naive_utc
+from app.domain.crypto.repositories.price_archive_repository import (
+    PriceArchiveRepository,
+)
+from app.domain.crypto.repositories.price_repository import PriceRepository
+
+
+class ArchivedPriceRepository(PriceRepository):
+    def __init__(
+        self,
+        price_repository: PriceRepository,
+        price_archive_repository: PriceArchiveRepository,
+    ):
+        self.__price_repository = price_repository
+        self.__price_archive_repository = price_archive_repository
+
+    def bulk_save(self, prices: list[Price]) -> None:
+        self.__price_repository.bulk_save(prices)
+
+    def get_all_or_fail_by_ticker_id(
+        self,
+        ticker_id: int,
+        start_date: None | datetime,
+        end_date: None | datetime,
+        include_end=True,
+        check_ticker=True,
+    ) -> list[Price]:
+        start_date = to_naive_utc(start_date)
+        end_date = to_naive_utc(end_date)
+        archive_end = self.__get_archive_end(ticker_id, start_date)
+
+        if archive_end is None:
+            return self.__price_repository.get_all_or_fail_by_ticker_id(
+                ticker_id, start_date, end_date, include_end, check_ticker
+            )
+
+        recent_prices = self.__price_repository.get_all_or_fail_by_ticker_id(
+            ticker_id, archive_end, end_date, include_end, check_ticker
+        )
+
+        return [
+            *self.__stream_archived(
+                ticker_id, start_date, end_date, include_end, archive_end
+            ),
+            *recent_prices,
+        ]
+
+    def stream_all_or_fail_by_ticker_id(
+        self,
+        ticker_id: int,
+        start_date: None | datetime,
+        end_date: None | datetime,
+        after: None | PriceCursor = None,
+        limit: None | int = None,
+    ) -> Iterator[Price]:
+        start_date = to_naive_utc(start_date)
+        end_date = to_naive_utc(end_date)
+        after = self.__to_naive_utc_cursor(after)
+        archive_end = self.__get_archive_end(ticker_id, start_date)
+
+        if archive_end is None or (
+            after is not None and after.timestamp >= archive_end
+        ):
+            return self.__price_repository.stream_all_or_fail_by_ticker_id(
+                ticker_id, start_date, end_date, after, limit
+            )
+
+        recent_prices = self.__price_repository.stream_all_or_fail_by_ticker_id(
+            ticker_id, archive_end, end_date, None, limit
+        )
+        archived_prices = self.__stream_archived(
+            ticker_id, start_date, end_date, True, archive_end
+        )
+
+        if after is not None:
+            archived_prices = (
+                price
+                for price in archived_prices
+                if (price.timestamp, price.id) > (after.timestamp, after.id)
+            )
+
+        return islice(chain(archived_prices, recent_prices), limit)
+
+    def stream_all_or_fail_by_ticker_ids(
+        self,
+        ticker_ids: list[int],
+        start_date: None | datetime,
+        end_date: None | datetime,
+    ) -> Iterator[Price]:
+        start_date = to_naive_utc(start_date)
+        end_date = to_naive_utc(end_date)
+        archive_ends = {
+            ticker_id: archive_end
+            for ticker_id in ticker_ids
+            if (archive_end := self.__get_archive_end(ticker_id, start_date))
+            is not None
+        }
+
+        if not archive_ends:
+            return self.__price_repository.stream_all_or_fail_by_ticker_ids(
+                ticker_ids, start_date, end_date
+            )
+
+        recent_prices = self.__price_repository.stream_all_or_fail_by_ticker_ids(
+            ticker_ids,
+            (
+                start_date
+                if len(archive_ends) < len(ticker_ids)
+                else min(archive_ends.values())
+            ),
+            end_date,
+        )
+
+        return self.__merge_archived(start_date, end_date, archive_ends, recent_prices)
+
+    def stream_columns_or_fail_by_ticker_id(
+        self,
+        ticker_id: int,
+        start_date: None | datetime,
+        end_date: None | datetime,
+        after: None | PriceCursor = None,
+        limit: None | int = None,
+    ) -> Iterator[PriceColumns]:
+        start_date = to_naive_utc(start_date)
+        end_date = to_naive_utc(end_date)
+        after = self.__to_naive_utc_cursor(after)
+        archive_end = self.__get_archive_end(ticker_id, start_date)
+
+        if archive_end is None or (
+            after is not None and after.timestamp >= archive_end
+        ):
+            return self.__price_repository.stream_columns_or_fail_by_ticker_id(
+                ticker_id, start_date, end_date, after, limit
+            )
+
+        recent_price_columns = (
+            self.__price_repository.stream_columns_or_fail_by_ticker_id(
+                ticker_id, archive_end, end_date, None, limit
+            )
+        )
+        archived_price_columns = (
+            self.__price_archive_repository.stream_columns_by_ticker_id(
+                ticker_id,
+                start_date,
+                *self.__clip_end(end_date, True, archive_end),
+            )
+        )
+
+        if after is not None:
+            archived_price_columns = self.__skip_columns_until(
+                archived_price_columns, after
+            )
+
+        return self.__limit_columns(
+            chain(archived_price_columns, recent_price_columns), limit
+        )
+
+    def get_timestamp_range_by_ticker_id(
+        self,
+        ticker_id: int,
+        start_date: None | datetime,
+        end_date: None | datetime,
+    ) -> None | tuple[datetime, datetime]:
+        start_date = to_naive_utc(start_date)
+        end_date = to_naive_utc(end_date)
+        archive_end = self.__get_archive_end(ticker_id, start_date)
+
+        if archive_end is None:
+            return self.__price_repository.get_timestamp_range_by_ticker_id(
+                ticker_id, start_date, end_date
+            )
+
+        timestamp_ranges = [
+            timestamp_range
+            for timestamp_range in (
+                self.__price_archive_repository.get_timestamp_range_by_ticker_id(
+                    ticker_id, start_date, *self.__clip_end(end_date, True, archive_end)
+                ),
+                self.__price_repository.get_timestamp_range_by_ticker_id(
+                    ticker_id, archive_end, end_date
+                ),
+            )
+            if timestamp_range is not None
+        ]
+
+        if not timestamp_ranges:
+            return None
+
+        return timestamp_ranges[0][0], timestamp_ranges[-1][1]
+
+    def get_timestamp_range_by_ticker_ids(
+        self,
+        ticker_ids: list[int],
+        start_date: None | datetime,
+        end_date: None | datetime,
+    ) -> None | tuple[datetime, datetime]:
+        start_date = to_naive_utc(start_date)
+        end_date = to_naive_utc(end_date)
+
+        timestamp_ranges = [
+            self.__price_repository.get_timestamp_range_by_ticker_ids(
+                ticker_ids, start_date, end_date
+            )
+        ]
+        for ticker_id in ticker_ids:
+            archive_end = self.__get_archive_end(ticker_id, start_date)
+
+            if archive_end is not None:
+                timestamp_ranges.append(
+                    self.__price_archive_repository.get_timestamp_range_by_ticker_id(
+                        ticker_id,
+                        start_date,
+                        *self.__clip_end(end_date, True, archive_end),
+                    )
+                )
+
+        timestamp_ranges = [
+            timestamp_range
+            for timestamp_range in timestamp_ranges
+            if timestamp_range is not None
+        ]
+
+        if not timestamp_ranges:
+            return None
+
+        return (
+            min(timestamp_range[0] for timestamp_range in timestamp_ranges),
+            max(timestamp_range[1] for timestamp_range in timestamp_ranges),
+        )
+
+    def get_candles_or_fail_by_ticker_id(
+        self,
+        ticker_id: int,
+        start_date: None | datetime,
+        end_date: None | datetime,
+        interval: CandleInterval,
+    ) -> list[Candle]:
+        return self.__price_repository.get_candles_or_fail_by_ticker_id(
+            ticker_id, start_date, end_date, interval
+        )
+
+    def get_candles_or_fail_by_ticker_ids(
+        self,
+        ticker_ids: list[int],
+        start_date: None | datetime,
+        end_date: None | datetime,
+        interval: CandleInterval,
+    ) -> dict[int, list[Candle]]:
+        return self.__price_repository.get_candles_or_fail_by_ticker_ids(
+            ticker_ids, start_date, end_date, interval
+        )
+
+    def delete_candles_before(
+        self, interval: CandleInterval, end_date: datetime
+    ) -> int:
+        return self.__price_repository.delete_candles_before(interval, end_date)
+
+    def __get_archive_end(
+        self, ticker_id: int, start_date: None | datetime
+    ) -> None | datetime:
+        archive_end = self.__price_archive_repository.get_archive_end_by_ticker_id(
+            ticker_id
+        )
+
+        if archive_end is None or (
+            start_date is not None and start_date >= archive_end
+        ):
+            return None
+
+        return archive_end
+
+    def __stream_archived(
+        self,
+        ticker_id: int,
+        start_date: None | datetime,
+        end_date: None | datetime,
+        include_end: bool,
+        archive_end: datetime,
+    ) -> Iterator[Price]:
+        return self.__price_archive_repository.stream_all_by_ticker_id(
+            ticker_id, start_date, *self.__clip_end(end_date, include_end, archive_end)
+        )
+
+    def __merge_archived(
+        self,
+        start_date: None | datetime,
+        end_date: None | datetime,
+        archive_ends: dict[int, datetime],
+        recent_prices: Iterator[Price],
+    ) -> Iterator[Price]:
+        archived_ticker_ids = iter(sorted(archive_ends))
+        archived_ticker_id = next(archived_ticker_ids, None)
+
+        for ticker_id, prices in groupby(recent_prices, lambda price: price.ticker_id):
+            while archived_ticker_id is not None and archived_ticker_id <= ticker_id:
+                yield from self.__stream_archived(
+                    archived_ticker_id,
+                    start_date,
+                    end_date,
+                    True,
+                    archive_ends[archived_ticker_id],
+                )
+                archived_ticker_id = next(archived_ticker_ids, None)
+
+            archive_end = archive_ends.get(ticker_id)
+            yield from (
+                prices
+                if archive_end is None
+                else (price for price in prices if price.timestamp >= archive_end)
+            )
+
+        while archived_ticker_id is not None:
+            yield from self.__stream_archived(
+                archived_ticker_id,
+                start_date,
+                end_date,
+                True,
+                archive_ends[archived_ticker_id],
+            )
+            archived_ticker_id = next(archived_ticker_ids, None)
+
+    def __skip_columns_until(
+        self, price_columns_batches: Iterator[PriceColumns], after: PriceCursor
+    ) -> Iterator[PriceColumns]:
+        for price_columns in price_columns_batches:
+            start = len(price_columns.ids)
+
+            for index, (timestamp, price_id) in enumerate(
+                zip(price_columns.timestamps, price_columns.ids)
+            ):
+                if (timestamp, price_id) > (after.timestamp, after.id):
+                    start = index
+                    break
+
+            yield self.__slice_columns(price_columns, start, None)
+
+    def __limit_columns(
+        self, price_columns_batches: Iterator[PriceColumns], limit: None | int
+    ) -> Iterator[PriceColumns]:
+        remaining = limit
+
+        for price_columns in price_columns_batches:
+            if remaining is not None:
+                if remaining <= 0:
+                    return
+
+                price_columns = self.__slice_columns(price_columns, 0, remaining)
+                remaining -= len(price_columns.ids)
+
+            if price_columns.ids:
+                yield price_columns
+
+    @staticmethod
+    def __slice_columns(
+        price_columns: PriceColumns, start: int, stop: None | int
+    ) -> PriceColumns:
+        return PriceColumns(
+            ticker_id=price_columns.ticker_id,
+            ids=price_columns.ids[start:stop],
+            prices=price_columns.prices[start:stop],
+            timestamps=price_columns.timestamps[start:stop],
+        )
+
+    @staticmethod
+    def __clip_end(
+        end_date: None | datetime, include_end: bool, archive_end: datetime
+    ) -> tuple[datetime, bool]:
+        if end_date is not None and end_date < archive_end:
+            return end_date, include_end
+
+        return archive_end, False
+
+    @staticmethod
+    def __to_naive_utc_cursor(cursor: None | PriceCursor) -> None | PriceCursor:
+        if cursor is None:
+            return None
+
+        return replace(cursor, timestamp=to_naive_utc(cursor.timestamp))
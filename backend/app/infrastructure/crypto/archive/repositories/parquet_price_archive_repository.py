@@ -0,0 +1,203 @@
+import os
+from datetime import date, datetime, timedelta
+from typing import Iterator
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from app.domain.crypto.models.price import Price
+from app.domain.crypto.models.price_columns import PriceColumns
+from app.domain.crypto.models.utc_datetime import to_naive_utc
+from app.domain.crypto.repositories.price_archive_repository import (
+    PriceArchiveRepository,
+)
+from app.infrastructure.crypto.archive.translators.arrow_price_translator import (
+    ArrowPriceTranslator,
+)
+
+
+class ParquetPriceArchiveRepository(PriceArchiveRepository):
+    __TICKER_DIRECTORY_FORMAT = "ticker_id={}"
+    __DAY_DIRECTORY_FORMAT = "date=%Y-%m-%d"
+    __FILE_NAME = "prices.parquet"
+
+    def __init__(
+        self,
+        archive_path: str,
+        compression: str,
+        arrow_price_translator: ArrowPriceTranslator,
+    ):
+        self.__archive_path = archive_path
+        self.__compression = compression
+        self.__arrow_price_translator = arrow_price_translator
+
+    def save(self, ticker_id: int, day: date, prices: list[Price]) -> None:
+        file_path = self.__get_file_path(ticker_id, day)
+        temporary_file_path = f"{file_path}.tmp"
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+        pq.write_table(
+            self.__arrow_price_translator.bulk_translate_to_table(
+                sorted(prices, key=lambda price: (price.timestamp, price.id))
+            ),
+            temporary_file_path,
+            compression=self.__compression,
+        )
+        os.replace(temporary_file_path, file_path)
+
+    def get_archive_end_by_ticker_id(self, ticker_id: int) -> None | datetime:
+        archived_days = self.__get_archived_days(ticker_id)
+
+        if not archived_days:
+            return None
+
+        return datetime.combine(
+            archived_days[-1] + timedelta(days=1), datetime.min.time()
+        )
+
+    def stream_all_by_ticker_id(
+        self,
+        ticker_id: int,
+        start_date: None | datetime,
+        end_date: None | datetime,
+        include_end=True,
+    ) -> Iterator[Price]:
+        start_date = to_naive_utc(start_date)
+        end_date = to_naive_utc(end_date)
+
+        for day in self.__get_archived_days(ticker_id, start_date, end_date):
+            yield from self.__arrow_price_translator.bulk_translate_to_domain_model(
+                ticker_id,
+                self.__read_day(ticker_id, day, start_date, end_date, include_end),
+            )
+
+    def stream_columns_by_ticker_id(
+        self,
+        ticker_id: int,
+        start_date: None | datetime,
+        end_date: None | datetime,
+        include_end=True,
+    ) -> Iterator[PriceColumns]:
+        start_date = to_naive_utc(start_date)
+        end_date = to_naive_utc(end_date)
+
+        for day in self.__get_archived_days(ticker_id, start_date, end_date):
+            price_table = self.__read_day(
+                ticker_id, day, start_date, end_date, include_end
+            )
+
+            if price_table.num_rows:
+                yield self.__arrow_price_translator.translate_to_domain_columns(
+                    ticker_id, price_table
+                )
+
+    def get_timestamp_range_by_ticker_id(
+        self,
+        ticker_id: int,
+        start_date: None | datetime,
+        end_date: None | datetime,
+        include_end=True,
+    ) -> None | tuple[datetime, datetime]:
+        start_date = to_naive_utc(start_date)
+        end_date = to_naive_utc(end_date)
+        archived_days = self.__get_archived_days(ticker_id, start_date, end_date)
+
+        first_timestamp = self.__find_timestamp(
+            ticker_id, archived_days, start_date, end_date, include_end, pc.min
+        )
+
+        if first_timestamp is None:
+            return None
+
+        last_timestamp = self.__find_timestamp(
+            ticker_id, archived_days[::-1], start_date, end_date, include_end, pc.max
+        )
+
+        return first_timestamp, last_timestamp
+
+    def __find_timestamp(
+        self,
+        ticker_id: int,
+        archived_days: list[date],
+        start_date: None | datetime,
+        end_date: None | datetime,
+        include_end: bool,
+        aggregate,
+    ) -> None | datetime:
+        for day in archived_days:
+            price_table = self.__read_day(
+                ticker_id, day, start_date, end_date, include_end, ["timestamp"]
+            )
+
+            if price_table.num_rows:
+                return aggregate(price_table.column("timestamp")).as_py()
+
+        return None
+
+    def __read_day(
+        self,
+        ticker_id: int,
+        day: date,
+        start_date: None | datetime,
+        end_date: None | datetime,
+        include_end: bool,
+        columns: None | list[str] = None,
+    ) -> pa.Table:
+        price_table = pq.read_table(
+            self.__get_file_path(ticker_id, day), columns=columns, memory_map=True
+        )
+        timestamp = pc.field("timestamp")
+
+        if start_date is not None:
+            price_table = price_table.filter(timestamp >= start_date)
+
+        if end_date is not None:
+            price_table = price_table.filter(
+                timestamp <= end_date if include_end else timestamp < end_date
+            )
+
+        return price_table
+
+    def __get_archived_days(
+        self,
+        ticker_id: int,
+        start_date: None | datetime = None,
+        end_date: None | datetime = None,
+    ) -> list[date]:
+        ticker_path = os.path.join(
+            self.__archive_path, self.__TICKER_DIRECTORY_FORMAT.format(ticker_id)
+        )
+
+        try:
+            directory_names = os.listdir(ticker_path)
+        except FileNotFoundError:
+            return []
+
+        archived_days: list[date] = []
+        for directory_name in directory_names:
+            try:
+                day = datetime.strptime(
+                    directory_name, self.__DAY_DIRECTORY_FORMAT
+                ).date()
+            except ValueError:
+                continue
+
+            if start_date is not None and day < start_date.date():
+                continue
+
+            if end_date is not None and day > end_date.date():
+                continue
+
+            if os.path.isfile(self.__get_file_path(ticker_id, day)):
+                archived_days.append(day)
+
+        return sorted(archived_days)
+
+    def __get_file_path(self, ticker_id: int, day: date) -> str:
+        return os.path.join(
+            self.__archive_path,
+            self.__TICKER_DIRECTORY_FORMAT.format(ticker_id),
+            day.strftime(self.__DAY_DIRECTORY_FORMAT),
+            self.__FILE_NAME,
+        )
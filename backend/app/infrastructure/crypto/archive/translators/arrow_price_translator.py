@@ -0,0 +1,55 @@
+import pyarrow as pa
+
+from app.domain.crypto.models.price import Price
+from app.domain.crypto.models.price_columns import PriceColumns
+
+
+class ArrowPriceTranslator:
+    __SCHEMA = pa.schema(
+        [
+            ("id", pa.int64()),
+            ("price", pa.float64()),
+            ("timestamp", pa.timestamp("us")),
+        ]
+    )
+
+    @property
+    def schema(self) -> pa.Schema:
+        return self.__SCHEMA
+
+    def bulk_translate_to_table(self, domain_prices: list[Price]) -> pa.Table:
+        return pa.table(
+            {
+                "id": [domain_price.id for domain_price in domain_prices],
+                "price": [domain_price.price for domain_price in domain_prices],
+                "timestamp": [domain_price.timestamp for domain_price in domain_prices],
+            },
+            schema=self.__SCHEMA,
+        )
+
+    def bulk_translate_to_domain_model(
+        self, ticker_id: int, price_table: pa.Table
+    ) -> list[Price]:
+        return [
+            Price(
+                id=price_id,
+                ticker_id=ticker_id,
+                price=price,
+                timestamp=timestamp,
+            )
+            for price_id, price, timestamp in zip(
+                price_table.column("id").to_pylist(),
+                price_table.column("price").to_pylist(),
+                price_table.column("timestamp").to_pylist(),
+            )
+        ]
+
+    def translate_to_domain_columns(
+        self, ticker_id: int, price_table: pa.Table
+    ) -> PriceColumns:
+        return PriceColumns(
+            ticker_id=ticker_id,
+            ids=price_table.column("id").to_pylist(),
+            prices=price_table.column("price").to_pylist(),
+            timestamps=price_table.column("timestamp").to_pylist(),
+        )
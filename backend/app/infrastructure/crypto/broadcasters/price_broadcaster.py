@@ -0,0 +1,113 @@
+import asyncio
+from itertools import groupby
+
+from app.domain.crypto.exceptions.price_subscription_overflow_exception import (
+    PriceSubscriptionOverflowException,
+)
+from app.domain.crypto.models.price import Price
+from app.domain.crypto.repositories.async_price_repository import (
+    AsyncPriceRepository,
+)
+
+
+class PriceBroadcaster:
+    def __init__(
+        self,
+        price_repository: AsyncPriceRepository,
+        interval: float,
+        max_pending_batches: int,
+        overlap: int,
+    ):
+        self.__price_repository = price_repository
+        self.__interval = interval
+        self.__max_pending_batches = max_pending_batches
+        self.__overlap = overlap
+        self.__subscriptions: dict[int, set[asyncio.Queue]] = {}
+        self.__poller: None | asyncio.Task = None
+
+    def subscribe(self, ticker_id: int) -> asyncio.Queue[list[Price] | Exception]:
+        subscription: asyncio.Queue[list[Price] | Exception] = asyncio.Queue(
+            self.__max_pending_batches + 1
+        )
+        self.__subscriptions.setdefault(ticker_id, set()).add(subscription)
+
+        if self.__poller is None or self.__poller.done():
+            self.__poller = asyncio.create_task(self.__poll())
+
+        return subscription
+
+    def unsubscribe(
+        self, ticker_id: int, subscription: asyncio.Queue[list[Price] | Exception]
+    ) -> None:
+        subscriptions = self.__subscriptions.get(ticker_id)
+        if subscriptions is None:
+            return
+
+        subscriptions.discard(subscription)
+        if subscriptions:
+            return
+
+        del self.__subscriptions[ticker_id]
+        if not self.__subscriptions and self.__poller is not None:
+            self.__poller.cancel()
+            self.__poller = None
+
+    def subscribers(self, ticker_id: int) -> int:
+        return len(self.__subscriptions.get(ticker_id, ()))
+
+    async def __poll(self) -> None:
+        try:
+            last_id = await self.__price_repository.get_last_id()
+            published_ids: set[int] = set()
+
+            while True:
+                await asyncio.sleep(self.__interval)
+
+                # Ids are taken when a price is inserted but become visible when
+                # its transaction commits, so the last ids are read again and
+                # only the ones not published yet are sent.
+                after_id = None if last_id is None else last_id - self.__overlap
+                prices = [
+                    price
+                    for price in await self.__price_repository.get_all_by_ticker_ids_after_id(
+                        sorted(self.__subscriptions), after_id
+                    )
+                    if price.id not in published_ids
+                ]
+
+                if not prices:
+                    continue
+
+                last_id = max(last_id or 0, max(price.id for price in prices))
+                published_ids = {
+                    price_id
+                    for price_id in published_ids.union(price.id for price in prices)
+                    if price_id > last_id - self.__overlap
+                }
+
+                for ticker_id, ticker_prices in groupby(
+                    sorted(
+                        prices,
+                        key=lambda price: (price.ticker_id, price.timestamp, price.id),
+                    ),
+                    lambda price: price.ticker_id,
+                ):
+                    self.__publish(ticker_id, list(ticker_prices))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            for ticker_id in list(self.__subscriptions):
+                self.__publish(ticker_id, e)
+
+    def __publish(self, ticker_id: int, message: list[Price] | Exception) -> None:
+        for subscription in list(self.__subscriptions.get(ticker_id, ())):
+            if subscription.qsize() < self.__max_pending_batches:
+                subscription.put_nowait(message)
+                continue
+
+            self.unsubscribe(ticker_id, subscription)
+            subscription.put_nowait(
+                PriceSubscriptionOverflowException(
+                    ticker_id, self.__max_pending_batches
+                )
+            )
@@ -0,0 +1,23 @@
+import threading
+import time
+
+
+class CatalogVersionCache:
+    def __init__(self, ttl: float):
+        self.__ttl = ttl
+        self.__lock = threading.Lock()
+        self.__versions: dict[str, tuple[str, float]] = {}
+
+    def get(self, key: str) -> None | str:
+        with self.__lock:
+            version, expires_at = self.__versions.get(key, (None, 0.0))
+
+            return version if expires_at > time.monotonic() else None
+
+    def set(self, key: str, version: str) -> None:
+        with self.__lock:
+            self.__versions[key] = (version, time.monotonic() + self.__ttl)
+
+    def invalidate(self) -> None:
+        with self.__lock:
+            self.__versions.clear()
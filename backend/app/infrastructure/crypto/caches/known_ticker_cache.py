@@ -0,0 +1,24 @@
+import threading
+from typing import Iterable
+
+
+class KnownTickerCache:
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__ticker_ids: None | frozenset[int] = None
+
+    def contains_all(self, ticker_ids: Iterable[int]) -> bool:
+        with self.__lock:
+            return self.__ticker_ids is not None and self.__ticker_ids.issuperset(
+                ticker_ids
+            )
+
+    def set(self, ticker_ids: Iterable[int]) -> frozenset[int]:
+        with self.__lock:
+            self.__ticker_ids = frozenset(ticker_ids)
+
+            return self.__ticker_ids
+
+    def invalidate(self) -> None:
+        with self.__lock:
+            self.__ticker_ids = None
@@ -0,0 +1,131 @@
+import asyncio
+
+from app.domain.crypto.models.price import Price
+from app.domain.crypto.repositories.async_latest_price_repository import (
+    AsyncLatestPriceRepository,
+)
+from app.domain.crypto.repositories.async_price_repository import (
+    AsyncPriceRepository,
+)
+from app.domain.crypto.repositories.async_ticker_repository import (
+    AsyncTickerRepository,
+)
+from app.logger import logger
+
+
+class LatestPriceCache(AsyncLatestPriceRepository):
+    def __init__(
+        self,
+        price_repository: AsyncPriceRepository,
+        ticker_repository: AsyncTickerRepository,
+        interval: float,
+        overlap: int,
+    ):
+        self.__price_repository = price_repository
+        self.__ticker_repository = ticker_repository
+        self.__interval = interval
+        self.__overlap = overlap
+        self.__prices: dict[int, Price] = {}
+        self.__exchange_ids: dict[int, int] = {}
+        self.__last_id: None | int = None
+        self.__warm = False
+        self.__lock = asyncio.Lock()
+        self.__refresher: None | asyncio.Task = None
+
+    async def get_all(
+        self,
+        ticker_ids: None | list[int] = None,
+        exchange_ids: None | list[int] = None,
+    ) -> list[Price]:
+        if not self.__warm:
+            await self.warm()
+        elif self.__refresher is None or self.__refresher.done():
+            await self.refresh()
+
+        prices = self.__prices.values()
+
+        if ticker_ids is not None:
+            prices = [
+                self.__prices[ticker_id]
+                for ticker_id in set(ticker_ids)
+                if ticker_id in self.__prices
+            ]
+
+        if exchange_ids is not None:
+            prices = [
+                price
+                for price in prices
+                if self.__exchange_ids.get(price.ticker_id) in exchange_ids
+            ]
+
+        return sorted(prices, key=lambda price: price.ticker_id)
+
+    async def warm(self) -> None:
+        async with self.__lock:
+            if self.__warm:
+                return
+
+            await self.__load_exchange_ids()
+            self.__update(await self.__price_repository.get_all_latest())
+            self.__warm = True
+
+    async def refresh(self) -> None:
+        async with self.__lock:
+            prices = await self.__price_repository.get_all_latest(
+                self.__refresh_after_id()
+            )
+
+            if any(price.ticker_id not in self.__exchange_ids for price in prices):
+                await self.__load_exchange_ids()
+
+            self.__update(prices)
+
+    def start(self) -> None:
+        if self.__refresher is None or self.__refresher.done():
+            self.__refresher = asyncio.create_task(self.__refresh_periodically())
+
+    def stop(self) -> None:
+        if self.__refresher is not None:
+            self.__refresher.cancel()
+            self.__refresher = None
+
+    async def __refresh_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.__interval)
+
+            try:
+                if self.__warm:
+                    await self.refresh()
+                else:
+                    await self.warm()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to refresh latest prices cache: {e}")
+
+    def __refresh_after_id(self) -> None | int:
+        # Ids are taken when a price is inserted but become visible when its
+        # transaction commits, so re-read the last ids to pick up late commits.
+        if self.__last_id is None:
+            return None
+
+        return max(self.__last_id - self.__overlap, 0)
+
+    async def __load_exchange_ids(self) -> None:
+        self.__exchange_ids = {
+            ticker.id: ticker.exchange_id
+            for ticker in await self.__ticker_repository.get_all()
+        }
+
+    def __update(self, prices: list[Price]) -> None:
+        for price in prices:
+            cached_price = self.__prices.get(price.ticker_id)
+
+            if cached_price is None or (price.timestamp, price.id) >= (
+                cached_price.timestamp,
+                cached_price.id,
+            ):
+                self.__prices[price.ticker_id] = price
+
+            if self.__last_id is None or price.id > self.__last_id:
+                self.__last_id = price.id
@@ -0,0 +1,167 @@
+from datetime import datetime
+
+import numpy as np
+
+from app.domain.crypto.models.price import Price
+from app.domain.crypto.models.utc_datetime import to_naive_utc
+
+
+class RecentPriceBuffer:
+    def __init__(self, ticker_id: int, capacity: int, covered_from: datetime):
+        self.__ticker_id = ticker_id
+        self.__capacity = capacity
+        self.__ids = np.zeros(capacity, dtype=np.int64)
+        self.__prices = np.zeros(capacity, dtype=np.float64)
+        self.__timestamps = np.zeros(capacity, dtype="datetime64[us]")
+        self.__start = 0
+        self.__size = 0
+        self.__covered_from = self.__to_datetime64(covered_from)
+        self.__covered_until = self.__covered_from
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def covers_start(self, start_date: datetime) -> bool:
+        return self.__to_datetime64(start_date) >= self.__covered_from
+
+    def covers(
+        self, start_date: datetime, end_date: None | datetime, include_end=True
+    ) -> bool:
+        if end_date is None or not self.covers_start(start_date):
+            return False
+
+        end = self.__to_datetime64(end_date)
+
+        return end < self.__covered_until or (
+            not include_end and end == self.__covered_until
+        )
+
+    @property
+    def covered_from(self) -> datetime:
+        return self.__covered_from.item()
+
+    @property
+    def covered_until(self) -> datetime:
+        return self.__covered_until.item()
+
+    @property
+    def version(self) -> tuple[int, None | int]:
+        if self.__size == 0:
+            return 0, None
+
+        return self.__size, max(
+            int(self.__ids[low:high].max()) for low, high in self.__segments()
+        )
+
+    def extend(
+        self, prices: list[Price], covered_until: datetime, covered_from: datetime
+    ) -> list[Price]:
+        until = self.__to_datetime64(covered_until)
+        timestamps = np.array(
+            [self.__to_datetime64(price.timestamp) for price in prices],
+            dtype="datetime64[us]",
+        )
+        settled = int(np.searchsorted(timestamps, until, side="left"))
+        unsettled_prices = prices[settled:]
+        prices = prices[:settled]
+        timestamps = timestamps[:settled]
+
+        count = len(prices)
+        overflow = self.__size + count - self.__capacity
+
+        if overflow > 0:
+            if overflow <= self.__size:
+                evicted = self.__timestamps[
+                    (self.__start + overflow - 1) % self.__capacity
+                ]
+            else:
+                evicted = timestamps[overflow - self.__size - 1]
+            self.__covered_from = max(
+                self.__covered_from, evicted + np.timedelta64(1, "us")
+            )
+
+        skipped = max(0, count - self.__capacity)
+        if skipped < count:
+            positions = (
+                self.__start + self.__size + np.arange(skipped, count, dtype=np.int64)
+            ) % self.__capacity
+            self.__ids[positions] = [price.id for price in prices[skipped:]]
+            self.__prices[positions] = [price.price for price in prices[skipped:]]
+            self.__timestamps[positions] = timestamps[skipped:]
+
+        self.__start = (self.__start + max(0, overflow)) % self.__capacity
+        self.__size = min(self.__size + count, self.__capacity)
+        self.__covered_until = max(self.__covered_until, until)
+
+        self.__evict_before(self.__to_datetime64(covered_from))
+
+        return unsettled_prices
+
+    def get_all(
+        self,
+        start_date: None | datetime,
+        end_date: None | datetime,
+        include_end=True,
+    ) -> list[Price]:
+        start = None if start_date is None else self.__to_datetime64(start_date)
+        end = None if end_date is None else self.__to_datetime64(end_date)
+
+        prices = []
+        for low, high in self.__segments():
+            timestamps = self.__timestamps[low:high]
+            left = low
+            right = high
+
+            if start is not None:
+                left += int(np.searchsorted(timestamps, start, side="left"))
+            if end is not None:
+                right = low + int(
+                    np.searchsorted(
+                        timestamps, end, side="right" if include_end else "left"
+                    )
+                )
+
+            prices.extend(
+                Price(
+                    ticker_id=self.__ticker_id,
+                    price=price,
+                    id=price_id,
+                    timestamp=timestamp,
+                )
+                for price_id, price, timestamp in zip(
+                    self.__ids[left:right].tolist(),
+                    self.__prices[left:right].tolist(),
+                    self.__timestamps[left:right].tolist(),
+                )
+            )
+
+        return prices
+
+    def __evict_before(self, cutoff: np.datetime64) -> None:
+        if cutoff <= self.__covered_from:
+            return
+
+        evicted = 0
+        for low, high in self.__segments():
+            position = int(
+                np.searchsorted(self.__timestamps[low:high], cutoff, side="left")
+            )
+            evicted += position
+            if position < high - low:
+                break
+
+        self.__start = (self.__start + evicted) % self.__capacity
+        self.__size -= evicted
+        self.__covered_from = cutoff
+
+    def __segments(self) -> list[tuple[int, int]]:
+        end = self.__start + self.__size
+
+        if end <= self.__capacity:
+            return [(self.__start, end)]
+
+        return [(self.__start, self.__capacity), (0, end - self.__capacity)]
+
+    @staticmethod
+    def __to_datetime64(instant: datetime) -> np.datetime64:
+        return np.datetime64(to_naive_utc(instant), "us")
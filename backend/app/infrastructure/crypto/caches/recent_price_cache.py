@@ -0,0 +1,131 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from app.domain.crypto.models.price import Price
+from app.domain.crypto.models.utc_datetime import to_naive_utc
+from app.domain.crypto.repositories.async_price_repository import (
+    AsyncPriceRepository,
+)
+from app.infrastructure.crypto.caches.recent_price_buffer import RecentPriceBuffer
+
+
+class RecentPriceCache(AsyncPriceRepository):
+    def __init__(
+        self,
+        price_repository: AsyncPriceRepository,
+        window: timedelta,
+        capacity: int,
+        settle_delay: timedelta,
+    ):
+        self.__price_repository = price_repository
+        self.__window = window
+        self.__capacity = capacity
+        self.__settle_delay = settle_delay
+        self.__buffers: dict[int, RecentPriceBuffer] = {}
+        self.__locks: dict[int, asyncio.Lock] = {}
+
+    async def bulk_save(self, prices: list[Price]) -> None:
+        await self.__price_repository.bulk_save(prices)
+
+    async def get_all_or_fail_by_ticker_id(
+        self,
+        ticker_id: int,
+        start_date: None | datetime,
+        end_date: None | datetime,
+        include_end=True,
+        check_ticker=True,
+    ) -> list[Price]:
+        instant = datetime.now(timezone.utc).replace(tzinfo=None)
+        covered_from = instant - self.__window
+
+        if start_date is None or to_naive_utc(start_date) < covered_from:
+            return await self.__price_repository.get_all_or_fail_by_ticker_id(
+                ticker_id, start_date, end_date, include_end, check_ticker
+            )
+
+        async with self.__locks.setdefault(ticker_id, asyncio.Lock()):
+            buffer = self.__buffers.get(ticker_id)
+
+            if buffer is None or not await self.__is_current(
+                ticker_id, buffer, covered_from
+            ):
+                buffer = RecentPriceBuffer(ticker_id, self.__capacity, covered_from)
+                fetch_start_date = covered_from
+            elif buffer.covers(start_date, end_date, include_end):
+                return buffer.get_all(start_date, end_date, include_end)
+            elif not buffer.covers_start(start_date):
+                return await self.__price_repository.get_all_or_fail_by_ticker_id(
+                    ticker_id, start_date, end_date, include_end, False
+                )
+            else:
+                fetch_start_date = buffer.covered_until
+                check_ticker = False
+
+            unsettled_prices = buffer.extend(
+                await self.__price_repository.get_all_or_fail_by_ticker_id(
+                    ticker_id, fetch_start_date, None, True, check_ticker
+                ),
+                instant - self.__settle_delay,
+                covered_from,
+            )
+            self.__buffers[ticker_id] = buffer
+
+            if not buffer.covers_start(start_date):
+                return await self.__price_repository.get_all_or_fail_by_ticker_id(
+                    ticker_id, start_date, end_date, include_end, False
+                )
+
+            return buffer.get_all(start_date, end_date, include_end) + [
+                price
+                for price in unsettled_prices
+                if self.__is_in_range(price, start_date, end_date, include_end)
+            ]
+
+    async def get_version_by_ticker_id(
+        self, ticker_id: int, start_date: datetime, end_date: datetime
+    ) -> tuple[int, None | int]:
+        return await self.__price_repository.get_version_by_ticker_id(
+            ticker_id, start_date, end_date
+        )
+
+    async def get_all_latest(self, after_id: None | int = None) -> list[Price]:
+        return await self.__price_repository.get_all_latest(after_id)
+
+    async def get_all_by_ticker_ids_after_id(
+        self, ticker_ids: list[int], after_id: None | int
+    ) -> list[Price]:
+        return await self.__price_repository.get_all_by_ticker_ids_after_id(
+            ticker_ids, after_id
+        )
+
+    async def get_last_id(self) -> None | int:
+        return await self.__price_repository.get_last_id()
+
+    async def __is_current(
+        self, ticker_id: int, buffer: RecentPriceBuffer, covered_from: datetime
+    ) -> bool:
+        if buffer.covered_until < covered_from:
+            return False
+
+        return buffer.version == await self.__price_repository.get_version_by_ticker_id(
+            ticker_id, buffer.covered_from, buffer.covered_until
+        )
+
+    @staticmethod
+    def __is_in_range(
+        price: Price,
+        start_date: datetime,
+        end_date: None | datetime,
+        include_end: bool,
+    ) -> bool:
+        timestamp = to_naive_utc(price.timestamp)
+
+        if timestamp < to_naive_utc(start_date):
+            return False
+
+        if end_date is None:
+            return True
+
+        end_date = to_naive_utc(end_date)
+
+        return timestamp <= end_date if include_end else timestamp < end_date
@@ -0,0 +1 @@
+from .time_bucket import TimeBucket
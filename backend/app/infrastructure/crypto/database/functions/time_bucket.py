@@ -0,0 +1,30 @@
+from sqlalchemy import DateTime
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+
+class TimeBucket(FunctionElement):
+    type = DateTime()
+    name = "time_bucket"
+    inherit_cache = True
+
+
+@compiles(TimeBucket, "postgresql")
+def compile_time_bucket_postgresql(element: TimeBucket, compiler, **kw) -> str:
+    timestamp, seconds = list(element.clauses)
+
+    return "date_bin(make_interval(secs => {}), {}, TIMESTAMP '1970-01-01')".format(
+        compiler.process(seconds, **kw), compiler.process(timestamp, **kw)
+    )
+
+
+@compiles(TimeBucket, "sqlite")
+def compile_time_bucket_sqlite(element: TimeBucket, compiler, **kw) -> str:
+    timestamp, seconds = list(element.clauses)
+    processed_seconds = compiler.process(seconds, **kw)
+
+    return (
+        "datetime((CAST(strftime('%s', {}) AS INTEGER) / {}) * {}, 'unixepoch')".format(
+            compiler.process(timestamp, **kw), processed_seconds, processed_seconds
+        )
+    )
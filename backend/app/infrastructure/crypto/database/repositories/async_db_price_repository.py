@@ -0,0 +1,191 @@
+from datetime import datetime
+
+from sqlalchemy import func, select, insert, Select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+
+from app.db import get_async_session
+from app.domain.crypto.exceptions.ticker_not_found_exception import (
+    TickerNotFoundException,
+)
+from app.domain.crypto.models.candle_interval import ROLLUP_CANDLE_INTERVALS
+from app.domain.crypto.models.price import Price
+from app.domain.crypto.repositories.async_price_repository import (
+    AsyncPriceRepository,
+)
+from app.infrastructure.crypto.caches.known_ticker_cache import KnownTickerCache
+from app.infrastructure.crypto.database.statements import (
+    build_latest_prices_select,
+    build_price_candle_upsert,
+)
+from app.infrastructure.crypto.database.table_models import (
+    PriceTableModel,
+    TickerTableModel,
+)
+from app.infrastructure.crypto.database.translators.db_candle_translator import (
+    DbCandleTranslator,
+)
+from app.infrastructure.crypto.database.translators.db_price_translator import (
+    DbPriceTranslator,
+)
+from app.infrastructure.exchange.caches.exchange_catalog_cache import (
+    ExchangeCatalogCache,
+)
+
+
+class AsyncDbPriceRepository(AsyncPriceRepository):
+    def __init__(
+        self,
+        db_price_translator: DbPriceTranslator,
+        db_candle_translator: DbCandleTranslator,
+        known_ticker_cache: KnownTickerCache,
+        exchange_catalog_cache: ExchangeCatalogCache,
+    ):
+        self.__db_price_translator = db_price_translator
+        self.__db_candle_translator = db_candle_translator
+        self.__known_ticker_cache = known_ticker_cache
+        self.__exchange_catalog_cache = exchange_catalog_cache
+
+    async def bulk_save(self, prices: list[Price]) -> None:
+        if not prices:
+            return
+
+        try:
+            async with get_async_session() as session:
+                await session.execute(
+                    insert(PriceTableModel.__table__),
+                    self.__db_price_translator.bulk_translate_to_table_rows(prices),
+                )
+                await session.execute(
+                    build_price_candle_upsert(session.get_bind().dialect.name),
+                    self.__db_candle_translator.bulk_translate_prices_to_table_rows(
+                        prices, ROLLUP_CANDLE_INTERVALS
+                    ),
+                )
+        except IntegrityError:
+            self.__exchange_catalog_cache.invalidate()
+            self.__known_ticker_cache.invalidate()
+            raise
+
+    async def get_all_or_fail_by_ticker_id(
+        self,
+        ticker_id: int,
+        start_date: None | datetime,
+        end_date: None | datetime,
+        include_end=True,
+        check_ticker=True,
+    ) -> list[Price]:
+        async with get_async_session() as session:
+            if check_ticker:
+                await self.__check_ticker_exists(session, ticker_id)
+
+            query_result = await session.execute(
+                self.__build_range_statement(
+                    ticker_id, start_date, end_date, include_end
+                ).order_by(PriceTableModel.timestamp.asc())
+            )
+
+            price_table_rows = query_result.all()
+
+        return self.__db_price_translator.bulk_translate_table_rows_to_domain_model(
+            price_table_rows
+        )
+
+    async def get_version_by_ticker_id(
+        self, ticker_id: int, start_date: datetime, end_date: datetime
+    ) -> tuple[int, None | int]:
+        async with get_async_session() as session:
+            query_result = await session.execute(
+                select(
+                    func.count(PriceTableModel.id), func.max(PriceTableModel.id)
+                ).where(
+                    PriceTableModel.ticker_id == ticker_id,
+                    PriceTableModel.timestamp >= start_date,
+                    PriceTableModel.timestamp < end_date,
+                )
+            )
+
+            price_count, max_price_id = query_result.one()
+
+        return price_count, max_price_id
+
+    async def get_all_latest(self, after_id: None | int = None) -> list[Price]:
+        async with get_async_session() as session:
+            query_result = await session.execute(
+                build_latest_prices_select(session.get_bind().dialect.name, after_id)
+            )
+
+            price_table_models = query_result.scalars().all()
+
+        return self.__db_price_translator.bulk_translate_to_domain_model(
+            price_table_models
+        )
+
+    async def get_all_by_ticker_ids_after_id(
+        self, ticker_ids: list[int], after_id: None | int
+    ) -> list[Price]:
+        statement = select(
+            PriceTableModel.id,
+            PriceTableModel.ticker_id,
+            PriceTableModel.price,
+            PriceTableModel.timestamp,
+        ).where(PriceTableModel.ticker_id.in_(ticker_ids))
+
+        if after_id is not None:
+            statement = statement.where(PriceTableModel.id > after_id)
+
+        async with get_async_session() as session:
+            query_result = await session.execute(
+                statement.order_by(PriceTableModel.id.asc())
+            )
+
+            price_table_rows = query_result.all()
+
+        return self.__db_price_translator.bulk_translate_table_rows_to_domain_model(
+            price_table_rows
+        )
+
+    async def get_last_id(self) -> None | int:
+        async with get_async_session() as session:
+            query_result = await session.execute(select(func.max(PriceTableModel.id)))
+
+            return query_result.scalar_one()
+
+    async def __check_ticker_exists(
+        self, session: AsyncSession, ticker_id: int
+    ) -> None:
+        if self.__known_ticker_cache.contains_all([ticker_id]):
+            return
+
+        ticker_check_query_result = await session.execute(select(TickerTableModel.id))
+        known_ticker_ids = self.__known_ticker_cache.set(
+            ticker_check_query_result.scalars().all()
+        )
+
+        if ticker_id not in known_ticker_ids:
+            raise TickerNotFoundException(ticker_id)
+
+    @staticmethod
+    def __build_range_statement(
+        ticker_id: int,
+        start_date: None | datetime,
+        end_date: None | datetime,
+        include_end: bool,
+    ) -> Select:
+        statement = select(
+            PriceTableModel.id,
+            PriceTableModel.ticker_id,
+            PriceTableModel.price,
+            PriceTableModel.timestamp,
+        ).where(PriceTableModel.ticker_id == ticker_id)
+
+        if start_date is not None:
+            statement = statement.where(PriceTableModel.timestamp >= start_date)
+
+        if end_date is not None:
+            if include_end:
+                statement = statement.where(PriceTableModel.timestamp <= end_date)
+            else:
+                statement = statement.where(PriceTableModel.timestamp < end_date)
+
+        return statement
@@ -0,0 +1,114 @@
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
+
+from app.db import get_async_session
+from app.domain.crypto.exceptions.reference_to_non_existent_id_exception import (
+    ReferenceToNonExistentIdException,
+)
+from app.domain.crypto.exceptions.ticker_already_exists_exception import (
+    TickerAlreadyExistsException,
+)
+from app.domain.crypto.exceptions.ticker_not_found_exception import (
+    TickerNotFoundException,
+)
+from app.domain.crypto.models.ticker import Ticker
+from app.domain.crypto.repositories.async_ticker_repository import (
+    AsyncTickerRepository,
+)
+from app.domain.exchange.exceptions.exchange_not_found_exception import (
+    ExchangeNotFoundException,
+)
+from app.infrastructure.crypto.caches.known_ticker_cache import KnownTickerCache
+from app.infrastructure.crypto.database.table_models import TickerTableModel
+from app.infrastructure.crypto.database.translators.db_ticker_translator import (
+    DbTickerTranslator,
+)
+from app.infrastructure.exchange.caches.exchange_catalog_cache import (
+    ExchangeCatalogCache,
+)
+from app.infrastructure.exchange.database.table_models import ExchangeTableModel
+
+
+class AsyncDbTickerRepository(AsyncTickerRepository):
+    def __init__(
+        self,
+        db_ticker_translator: DbTickerTranslator,
+        exchange_catalog_cache: ExchangeCatalogCache,
+        known_ticker_cache: KnownTickerCache,
+    ):
+        self.__db_ticker_translator = db_ticker_translator
+        self.__exchange_catalog_cache = exchange_catalog_cache
+        self.__known_ticker_cache = known_ticker_cache
+
+    async def get_all(self) -> list[Ticker]:
+        async with get_async_session() as session:
+            query_result = await session.execute(select(TickerTableModel))
+
+            ticker_table_models = query_result.scalars().all()
+
+        return self.__db_ticker_translator.bulk_translate_to_domain_model(
+            ticker_table_models
+        )
+
+    async def get_all_or_fail_by_exchange_id(self, exchange_id: int) -> list[Ticker]:
+        async with get_async_session() as session:
+            query_result = await session.execute(
+                select(ExchangeTableModel)
+                .where(ExchangeTableModel.id == exchange_id)
+                .options(selectinload(ExchangeTableModel.tickers))
+            )
+            exchange_table_model = query_result.scalar_one_or_none()
+
+            if exchange_table_model is None:
+                raise ExchangeNotFoundException("id", exchange_id)
+
+            ticker_table_models = exchange_table_model.tickers
+
+        return self.__db_ticker_translator.bulk_translate_to_domain_model(
+            ticker_table_models
+        )
+
+    async def get_or_fail_by_id(self, ticker_id: int) -> Ticker:
+        async with get_async_session() as session:
+            query_result = await session.execute(
+                select(TickerTableModel).where(TickerTableModel.id == ticker_id)
+            )
+            ticker_table_model = query_result.scalar_one_or_none()
+
+            if ticker_table_model is None:
+                raise TickerNotFoundException(ticker_id)
+
+        return self.__db_ticker_translator.translate_to_domain_model(ticker_table_model)
+
+    async def insert(self, ticker: Ticker) -> Ticker:
+        try:
+            async with get_async_session() as session:
+                ticker_table_model = (
+                    self.__db_ticker_translator.translate_to_table_model(ticker)
+                )
+
+                session.add(ticker_table_model)
+
+            self.__exchange_catalog_cache.invalidate()
+            self.__known_ticker_cache.invalidate()
+
+            return self.__db_ticker_translator.translate_to_domain_model(
+                ticker_table_model
+            )
+
+        except IntegrityError as e:
+            msg = str(e.orig)
+            if "unique_exchange_ticker" in msg or "UNIQUE" in msg:
+                raise TickerAlreadyExistsException(ticker.ticker, ticker.exchange_id)
+            else:
+                attr: str
+                attr_id: int
+                if "exchange_id" in msg:
+                    attr = "exchange_id"
+                    attr_id = ticker.exchange_id
+                else:
+                    attr = "symbol_id"
+                    attr_id = ticker.symbol_id
+
+                raise ReferenceToNonExistentIdException(attr, attr_id)
@@ -0,0 +1,104 @@
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
+
+from app.db import get_session
+from app.domain.crypto.repositories.price_partition_repository import (
+    PricePartitionRepository,
+)
+
+
+class DbPricePartitionRepository(PricePartitionRepository):
+    __PARTITIONED_DIALECT = "postgresql"
+    __PARTITION_NAME_FORMAT = "prices_p%Y%m%d"
+
+    def create_partition(self, start_date: datetime, end_date: datetime) -> bool:
+        partition_name = start_date.strftime(self.__PARTITION_NAME_FORMAT)
+
+        with get_session() as session:
+            if session.get_bind().dialect.name != self.__PARTITIONED_DIALECT:
+                return False
+
+            partition_exists = session.execute(
+                text("SELECT to_regclass(:partition_name) IS NOT NULL"),
+                {"partition_name": partition_name},
+            ).scalar_one()
+
+            if partition_exists:
+                return False
+
+            try:
+                with session.begin_nested():
+                    session.execute(
+                        text(
+                            f"CREATE TABLE {partition_name} "
+                            "(LIKE prices INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+                        )
+                    )
+                    session.execute(
+                        text(
+                            "WITH moved_prices AS ("
+                            "DELETE FROM prices_default "
+                            "WHERE timestamp >= :start_date AND timestamp < :end_date "
+                            "RETURNING id, ticker_id, price, timestamp) "
+                            f"INSERT INTO {partition_name} (id, ticker_id, price, timestamp) "
+                            "SELECT id, ticker_id, price, timestamp FROM moved_prices"
+                        ),
+                        {"start_date": start_date, "end_date": end_date},
+                    )
+                    session.execute(
+                        text(
+                            f"ALTER TABLE prices ATTACH PARTITION {partition_name} "
+                            f"FOR VALUES FROM ('{start_date.isoformat()}') "
+                            f"TO ('{end_date.isoformat()}')"
+                        )
+                    )
+            except ProgrammingError:
+                return False
+
+        return True
+
+    def get_partition_start_dates(self) -> list[datetime]:
+        with get_session() as session:
+            if session.get_bind().dialect.name != self.__PARTITIONED_DIALECT:
+                return []
+
+            partition_names = session.execute(
+                text(
+                    "SELECT child.relname FROM pg_inherits "
+                    "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                    "WHERE pg_inherits.inhparent = 'prices'::regclass"
+                )
+            ).scalars()
+
+            start_dates: list[datetime] = []
+            for partition_name in partition_names:
+                try:
+                    start_dates.append(
+                        datetime.strptime(partition_name, self.__PARTITION_NAME_FORMAT)
+                    )
+                except ValueError:
+                    continue
+
+        return sorted(start_dates)
+
+    def remove_partition(self, start_date: datetime, drop: bool) -> bool:
+        partition_name = start_date.strftime(self.__PARTITION_NAME_FORMAT)
+
+        with get_session() as session:
+            if session.get_bind().dialect.name != self.__PARTITIONED_DIALECT:
+                return False
+
+            try:
+                with session.begin_nested():
+                    session.execute(
+                        text(f"ALTER TABLE prices DETACH PARTITION {partition_name}")
+                    )
+
+                    if drop:
+                        session.execute(text(f"DROP TABLE {partition_name}"))
+            except ProgrammingError:
+                return False
+
+        return True
@@ -1,31 +1,85 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Iterator
 
-from sqlalchemy import select
+from sqlalchemy import (
+    select,
+    insert,
+    delete,
+    tuple_,
+    Select,
+    Subquery,
+    ColumnElement,
+    func,
+)
+from sqlalchemy.exc import IntegrityError
 
 from app.db import get_session
 from app.domain.crypto.exceptions.ticker_not_found_exception import (
     TickerNotFoundException,
 )
+from app.domain.crypto.models.candle import Candle
+from app.domain.crypto.models.candle_interval import (
+    CandleInterval,
+    ROLLUP_CANDLE_INTERVALS,
+)
 from app.domain.crypto.models.price import Price
+from app.domain.crypto.models.price_columns import PriceColumns
+from app.domain.crypto.models.price_cursor import PriceCursor
 from app.domain.crypto.repositories.price_repository import PriceRepository
+from app.infrastructure.crypto.caches.known_ticker_cache import KnownTickerCache
+from app.infrastructure.crypto.database.functions import TimeBucket
+from app.infrastructure.crypto.database.statements import build_price_candle_upsert
 from app.infrastructure.crypto.database.table_models import (
+    PriceCandleTableModel,
     PriceTableModel,
     TickerTableModel,
 )
+from app.infrastructure.crypto.database.translators.db_candle_translator import (
+    DbCandleTranslator,
+)
 from app.infrastructure.crypto.database.translators.db_price_translator import (
     DbPriceTranslator,
 )
+from app.infrastructure.exchange.caches.exchange_catalog_cache import (
+    ExchangeCatalogCache,
+)
 
 
 class DbPriceRepository(PriceRepository):
-    def __init__(self, db_price_translator: DbPriceTranslator):
+    __STREAM_BATCH_SIZE = 1000
+
+    def __init__(
+        self,
+        db_price_translator: DbPriceTranslator,
+        db_candle_translator: DbCandleTranslator,
+        known_ticker_cache: KnownTickerCache,
+        exchange_catalog_cache: ExchangeCatalogCache,
+    ):
         self.__db_price_translator = db_price_translator
+        self.__db_candle_translator = db_candle_translator
+        self.__known_ticker_cache = known_ticker_cache
+        self.__exchange_catalog_cache = exchange_catalog_cache
 
     def bulk_save(self, prices: list[Price]) -> None:
-        with get_session() as session:
-            session.add_all(
-                self.__db_price_translator.bulk_translate_to_table_model(prices)
-            )
+        if not prices:
+            return
+
+        try:
+            with get_session() as session:
+                session.execute(
+                    insert(PriceTableModel.__table__),
+                    self.__db_price_translator.bulk_translate_to_table_rows(prices),
+                )
+                session.execute(
+                    build_price_candle_upsert(session.get_bind().dialect.name),
+                    self.__db_candle_translator.bulk_translate_prices_to_table_rows(
+                        prices, ROLLUP_CANDLE_INTERVALS
+                    ),
+                )
+        except IntegrityError:
+            self.__exchange_catalog_cache.invalidate()
+            self.__known_ticker_cache.invalidate()
+            raise
 
     def get_all_or_fail_by_ticker_id(
         self,
@@ -35,33 +89,366 @@ class DbPriceRepository(PriceRepository):
         include_end=True,
         check_ticker=True,
     ) -> list[Price]:
+        if check_ticker:
+            self.__check_ticker_exists(ticker_id)
+
+        with get_session() as session:
+            statement = self.__build_range_statement(
+                PriceTableModel.ticker_id == ticker_id,
+                start_date,
+                end_date,
+                include_end,
+            )
+
+            query_result = session.execute(
+                statement.order_by(PriceTableModel.timestamp.asc())
+            )
+
+            price_table_rows = query_result.all()
+
+        return self.__db_price_translator.bulk_translate_table_rows_to_domain_model(
+            price_table_rows
+        )
+
+    def stream_all_or_fail_by_ticker_id(
+        self,
+        ticker_id: int,
+        start_date: None | datetime,
+        end_date: None | datetime,
+        after: None | PriceCursor = None,
+        limit: None | int = None,
+    ) -> Iterator[Price]:
+        self.__check_ticker_exists(ticker_id)
+
+        return self.__stream(
+            self.__build_stream_statement(ticker_id, start_date, end_date, after, limit)
+        )
+
+    def stream_all_or_fail_by_ticker_ids(
+        self,
+        ticker_ids: list[int],
+        start_date: None | datetime,
+        end_date: None | datetime,
+    ) -> Iterator[Price]:
+        self.__check_tickers_exist(ticker_ids)
+
+        return self.__stream(
+            self.__build_range_statement(
+                PriceTableModel.ticker_id.in_(ticker_ids), start_date, end_date
+            ).order_by(
+                PriceTableModel.ticker_id.asc(),
+                PriceTableModel.timestamp.asc(),
+                PriceTableModel.id.asc(),
+            )
+        )
+
+    def stream_columns_or_fail_by_ticker_id(
+        self,
+        ticker_id: int,
+        start_date: None | datetime,
+        end_date: None | datetime,
+        after: None | PriceCursor = None,
+        limit: None | int = None,
+    ) -> Iterator[PriceColumns]:
+        self.__check_ticker_exists(ticker_id)
+
+        statement = self.__build_stream_statement(
+            ticker_id, start_date, end_date, after, limit
+        ).with_only_columns(
+            PriceTableModel.id, PriceTableModel.price, PriceTableModel.timestamp
+        )
+
+        return self.__stream_columns(ticker_id, statement)
+
+    def get_timestamp_range_by_ticker_id(
+        self,
+        ticker_id: int,
+        start_date: None | datetime,
+        end_date: None | datetime,
+    ) -> None | tuple[datetime, datetime]:
+        return self.__get_timestamp_range(
+            PriceTableModel.ticker_id == ticker_id, start_date, end_date
+        )
+
+    def get_timestamp_range_by_ticker_ids(
+        self,
+        ticker_ids: list[int],
+        start_date: None | datetime,
+        end_date: None | datetime,
+    ) -> None | tuple[datetime, datetime]:
+        return self.__get_timestamp_range(
+            PriceTableModel.ticker_id.in_(ticker_ids), start_date, end_date
+        )
+
+    def get_candles_or_fail_by_ticker_id(
+        self,
+        ticker_id: int,
+        start_date: None | datetime,
+        end_date: None | datetime,
+        interval: CandleInterval,
+    ) -> list[Candle]:
+        self.__check_ticker_exists(ticker_id)
+
+        with get_session() as session:
+            candle_rows = session.execute(
+                self.__build_candles_statement(
+                    PriceCandleTableModel.ticker_id == ticker_id,
+                    start_date,
+                    end_date,
+                    interval,
+                )
+            ).all()
+
+        return self.__db_candle_translator.bulk_translate_to_domain_model(
+            ticker_id, candle_rows
+        )
+
+    def get_candles_or_fail_by_ticker_ids(
+        self,
+        ticker_ids: list[int],
+        start_date: None | datetime,
+        end_date: None | datetime,
+        interval: CandleInterval,
+    ) -> dict[int, list[Candle]]:
+        self.__check_tickers_exist(ticker_ids)
+
         with get_session() as session:
-            if check_ticker:
-                ticker_check_query_result = session.execute(
-                    select(TickerTableModel).where(TickerTableModel.id == ticker_id)
+            candle_rows = session.execute(
+                self.__build_candles_statement(
+                    PriceCandleTableModel.ticker_id.in_(ticker_ids),
+                    start_date,
+                    end_date,
+                    interval,
                 )
-                if ticker_check_query_result.scalar_one_or_none() is None:
-                    raise TickerNotFoundException(ticker_id)
+            ).all()
 
-            statement = select(PriceTableModel).where(
-                PriceTableModel.ticker_id == ticker_id
+        candles_by_ticker_id: dict[int, list[Candle]] = {
+            ticker_id: [] for ticker_id in ticker_ids
+        }
+        for candle_row in candle_rows:
+            candles_by_ticker_id[candle_row.ticker_id].append(
+                self.__db_candle_translator.translate_to_domain_model(
+                    candle_row.ticker_id, candle_row
+                )
             )
 
-            if start_date is not None:
-                statement = statement.where(PriceTableModel.timestamp >= start_date)
+        return candles_by_ticker_id
 
-            if end_date is not None:
-                if include_end:
-                    statement = statement.where(PriceTableModel.timestamp <= end_date)
-                else:
-                    statement = statement.where(PriceTableModel.timestamp < end_date)
+    def delete_candles_before(
+        self, interval: CandleInterval, end_date: datetime
+    ) -> int:
+        with get_session() as session:
+            query_result = session.execute(
+                delete(PriceCandleTableModel).where(
+                    PriceCandleTableModel.interval == interval.value,
+                    PriceCandleTableModel.timestamp < interval.floor(end_date),
+                )
+            )
 
+        return query_result.rowcount
+
+    def __stream(self, statement: Select) -> Iterator[Price]:
+        with get_session() as session:
             query_result = session.execute(
-                statement.order_by(PriceTableModel.timestamp.asc())
+                statement.execution_options(yield_per=self.__STREAM_BATCH_SIZE)
+            )
+
+            for price_table_row in query_result:
+                yield self.__db_price_translator.translate_table_row_to_domain_model(
+                    price_table_row
+                )
+
+    def __stream_columns(
+        self, ticker_id: int, statement: Select
+    ) -> Iterator[PriceColumns]:
+        with get_session() as session:
+            query_result = session.execute(
+                statement.execution_options(yield_per=self.__STREAM_BATCH_SIZE)
             )
 
-            price_table_models = query_result.scalars().all()
+            for price_rows in query_result.partitions():
+                ids, prices, timestamps = zip(*price_rows)
 
-        return self.__db_price_translator.bulk_translate_to_domain_model(
-            price_table_models
+                yield PriceColumns(
+                    ticker_id=ticker_id,
+                    ids=list(ids),
+                    prices=list(prices),
+                    timestamps=list(timestamps),
+                )
+
+    def __get_timestamp_range(
+        self,
+        ticker_condition: ColumnElement[bool],
+        start_date: None | datetime,
+        end_date: None | datetime,
+    ) -> None | tuple[datetime, datetime]:
+        with get_session() as session:
+            query_result = session.execute(
+                self.__build_range_statement(
+                    ticker_condition, start_date, end_date
+                ).with_only_columns(
+                    func.min(PriceTableModel.timestamp),
+                    func.max(PriceTableModel.timestamp),
+                )
+            )
+
+            first_timestamp, last_timestamp = query_result.one()
+
+        if first_timestamp is None:
+            return None
+
+        return first_timestamp, last_timestamp
+
+    def __check_ticker_exists(self, ticker_id: int) -> None:
+        self.__check_tickers_exist([ticker_id])
+
+    def __check_tickers_exist(self, ticker_ids: list[int]) -> None:
+        if self.__known_ticker_cache.contains_all(ticker_ids):
+            return
+
+        with get_session() as session:
+            ticker_check_query_result = session.execute(select(TickerTableModel.id))
+            known_ticker_ids = self.__known_ticker_cache.set(
+                ticker_check_query_result.scalars().all()
+            )
+
+        for ticker_id in ticker_ids:
+            if ticker_id not in known_ticker_ids:
+                raise TickerNotFoundException(ticker_id)
+
+    def __build_candles_statement(
+        self,
+        ticker_condition: ColumnElement[bool],
+        start_date: None | datetime,
+        end_date: None | datetime,
+        interval: CandleInterval,
+    ) -> Select:
+        rollup_interval = interval.rollup
+        statement = select(
+            PriceCandleTableModel.ticker_id,
+            PriceCandleTableModel.timestamp,
+            PriceCandleTableModel.open,
+            PriceCandleTableModel.high,
+            PriceCandleTableModel.low,
+            PriceCandleTableModel.close,
+            PriceCandleTableModel.count,
+        ).where(
+            ticker_condition,
+            PriceCandleTableModel.interval == rollup_interval.value,
+        )
+
+        # Whole candles of the requested interval are returned, so the first and
+        # last ones cover the prices before start_date and after end_date too.
+        if start_date is not None:
+            statement = statement.where(
+                PriceCandleTableModel.timestamp >= interval.floor(start_date)
+            )
+
+        if end_date is not None:
+            statement = statement.where(
+                PriceCandleTableModel.timestamp
+                < interval.floor(end_date) + timedelta(seconds=interval.seconds)
+            )
+
+        if rollup_interval is interval:
+            return statement.order_by(
+                PriceCandleTableModel.ticker_id.asc(),
+                PriceCandleTableModel.timestamp.asc(),
+            )
+
+        return self.__build_rollup_aggregation_statement(statement.subquery(), interval)
+
+    @staticmethod
+    def __build_rollup_aggregation_statement(
+        rollup_candles: Subquery, interval: CandleInterval
+    ) -> Select:
+        bucket = TimeBucket(rollup_candles.c.timestamp, interval.seconds)
+        bucket_partition = (rollup_candles.c.ticker_id, bucket)
+        bucket_ordering = rollup_candles.c.timestamp.asc()
+
+        bucketed_candles = select(
+            rollup_candles.c.ticker_id,
+            bucket.label("bucket"),
+            rollup_candles.c.high,
+            rollup_candles.c.low,
+            rollup_candles.c.count,
+            func.first_value(rollup_candles.c.open)
+            .over(partition_by=bucket_partition, order_by=bucket_ordering)
+            .label("open"),
+            func.last_value(rollup_candles.c.close)
+            .over(
+                partition_by=bucket_partition,
+                order_by=bucket_ordering,
+                rows=(None, None),
+            )
+            .label("close"),
+        ).subquery()
+
+        return (
+            select(
+                bucketed_candles.c.ticker_id,
+                bucketed_candles.c.bucket.label("timestamp"),
+                func.min(bucketed_candles.c.open).label("open"),
+                func.max(bucketed_candles.c.high).label("high"),
+                func.min(bucketed_candles.c.low).label("low"),
+                func.min(bucketed_candles.c.close).label("close"),
+                func.sum(bucketed_candles.c.count).label("count"),
+            )
+            .group_by(bucketed_candles.c.ticker_id, bucketed_candles.c.bucket)
+            .order_by(
+                bucketed_candles.c.ticker_id.asc(), bucketed_candles.c.bucket.asc()
+            )
+        )
+
+    def __build_stream_statement(
+        self,
+        ticker_id: int,
+        start_date: None | datetime,
+        end_date: None | datetime,
+        after: None | PriceCursor,
+        limit: None | int,
+    ) -> Select:
+        statement = self.__build_range_statement(
+            PriceTableModel.ticker_id == ticker_id, start_date, end_date
         )
+
+        if after is not None:
+            statement = statement.where(
+                PriceTableModel.timestamp >= after.timestamp,
+                tuple_(PriceTableModel.timestamp, PriceTableModel.id)
+                > tuple_(after.timestamp, after.id),
+            )
+
+        statement = statement.order_by(
+            PriceTableModel.timestamp.asc(), PriceTableModel.id.asc()
+        )
+
+        if limit is not None:
+            statement = statement.limit(limit)
+
+        return statement
+
+    @staticmethod
+    def __build_range_statement(
+        ticker_condition: ColumnElement[bool],
+        start_date: None | datetime,
+        end_date: None | datetime,
+        include_end=True,
+    ) -> Select:
+        statement = select(
+            PriceTableModel.id,
+            PriceTableModel.ticker_id,
+            PriceTableModel.price,
+            PriceTableModel.timestamp,
+        ).where(ticker_condition)
+
+        if start_date is not None:
+            statement = statement.where(PriceTableModel.timestamp >= start_date)
+
+        if end_date is not None:
+            if include_end:
+                statement = statement.where(PriceTableModel.timestamp <= end_date)
+            else:
+                statement = statement.where(PriceTableModel.timestamp < end_date)
+
+        return statement
@@ -16,16 +16,37 @@ from app.domain.crypto.repositories.ticker_repository import TickerRepository
 from app.domain.exchange.exceptions.exchange_not_found_exception import (
     ExchangeNotFoundException,
 )
+from app.infrastructure.crypto.caches.known_ticker_cache import KnownTickerCache
 from app.infrastructure.crypto.database.table_models import TickerTableModel
 from app.infrastructure.crypto.database.translators.db_ticker_translator import (
     DbTickerTranslator,
 )
+from app.infrastructure.exchange.caches.exchange_catalog_cache import (
+    ExchangeCatalogCache,
+)
 from app.infrastructure.exchange.database.table_models import ExchangeTableModel
 
 
 class DbTickerRepository(TickerRepository):
-    def __init__(self, db_ticker_translator: DbTickerTranslator):
+    def __init__(
+        self,
+        db_ticker_translator: DbTickerTranslator,
+        exchange_catalog_cache: ExchangeCatalogCache,
+        known_ticker_cache: KnownTickerCache,
+    ):
         self.__db_ticker_translator = db_ticker_translator
+        self.__exchange_catalog_cache = exchange_catalog_cache
+        self.__known_ticker_cache = known_ticker_cache
+
+    def get_all(self) -> list[Ticker]:
+        with get_session() as session:
+            query_result = session.execute(select(TickerTableModel))
+
+            ticker_table_models = query_result.scalars().all()
+
+        return self.__db_ticker_translator.bulk_translate_to_domain_model(
+            ticker_table_models
+        )
 
     def get_all_or_fail_by_exchange_id(self, exchange_id: int) -> list[Ticker]:
         with get_session() as session:
@@ -64,6 +85,9 @@ class DbTickerRepository(TickerRepository):
 
                 session.add(symbol_table_model)
 
+            self.__exchange_catalog_cache.invalidate()
+            self.__known_ticker_cache.invalidate()
+
             return self.__db_ticker_translator.translate_to_domain_model(
                 symbol_table_model
             )
@@ -0,0 +1,2 @@
+from .latest_prices_select import build_latest_prices_select
+from .price_candle_upsert import build_price_candle_upsert
@@ -0,0 +1,34 @@
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import aliased
+
+from app.infrastructure.crypto.database.table_models import PriceTableModel
+
+
+def build_latest_prices_select(dialect_name: str, after_id: None | int) -> Select:
+    statement = select(PriceTableModel)
+
+    if after_id is not None:
+        statement = statement.where(PriceTableModel.id > after_id)
+
+    if dialect_name == "postgresql":
+        return statement.distinct(PriceTableModel.ticker_id).order_by(
+            PriceTableModel.ticker_id.asc(),
+            PriceTableModel.timestamp.desc(),
+            PriceTableModel.id.desc(),
+        )
+
+    ranked_prices = statement.add_columns(
+        func.row_number()
+        .over(
+            partition_by=PriceTableModel.ticker_id,
+            order_by=(PriceTableModel.timestamp.desc(), PriceTableModel.id.desc()),
+        )
+        .label("rank")
+    ).subquery()
+    latest_price = aliased(PriceTableModel, ranked_prices)
+
+    return (
+        select(latest_price)
+        .where(ranked_prices.c.rank == 1)
+        .order_by(latest_price.ticker_id.asc())
+    )
@@ -0,0 +1,37 @@
+from sqlalchemy import Insert, case, func
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.infrastructure.crypto.database.table_models import PriceCandleTableModel
+
+
+def build_price_candle_upsert(dialect_name: str) -> Insert:
+    if dialect_name == "postgresql":
+        statement = postgresql.insert(PriceCandleTableModel.__table__)
+        greatest, least = func.greatest, func.least
+    else:
+        statement = sqlite.insert(PriceCandleTableModel.__table__)
+        greatest, least = func.max, func.min
+
+    current = PriceCandleTableModel.__table__.c
+    excluded = statement.excluded
+
+    return statement.on_conflict_do_update(
+        index_elements=[current.ticker_id, current.interval, current.timestamp],
+        set_={
+            "open": case(
+                (excluded.open_timestamp < current.open_timestamp, excluded.open),
+                else_=current.open,
+            ),
+            "high": greatest(current.high, excluded.high),
+            "low": least(current.low, excluded.low),
+            "close": case(
+                (excluded.close_timestamp >= current.close_timestamp, excluded.close),
+                else_=current.close,
+            ),
+            "count": current.count + excluded.count,
+            "open_timestamp": least(current.open_timestamp, excluded.open_timestamp),
+            "close_timestamp": greatest(
+                current.close_timestamp, excluded.close_timestamp
+            ),
+        },
+    )
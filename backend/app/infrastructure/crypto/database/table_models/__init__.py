@@ -1,3 +1,4 @@
 from .ticker_table_model import TickerTableModel
 from .symbol_table_model import SymbolTableModel
 from .price_table_model import PriceTableModel
+from .price_candle_table_model import PriceCandleTableModel
@@ -0,0 +1,30 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    ForeignKey,
+    Float,
+    DateTime,
+    String,
+    PrimaryKeyConstraint,
+)
+
+from app.db import Base
+
+
+class PriceCandleTableModel(Base):
+    __tablename__ = "price_candles"
+
+    ticker_id = Column(
+        Integer, ForeignKey("tickers.id", ondelete="cascade"), nullable=False
+    )
+    interval = Column(String, nullable=False)
+    timestamp = Column(DateTime, nullable=False)
+    open = Column(Float, nullable=False)
+    high = Column(Float, nullable=False)
+    low = Column(Float, nullable=False)
+    close = Column(Float, nullable=False)
+    count = Column(Integer, nullable=False)
+    open_timestamp = Column(DateTime, nullable=False)
+    close_timestamp = Column(DateTime, nullable=False)
+
+    __table_args__ = (PrimaryKeyConstraint("ticker_id", "interval", "timestamp"),)
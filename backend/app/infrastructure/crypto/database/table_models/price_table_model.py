@@ -1,5 +1,15 @@
 from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, ForeignKey, Float, DateTime, Index
+from sqlalchemy import (
+    Column,
+    Integer,
+    ForeignKey,
+    Float,
+    DateTime,
+    Index,
+    PrimaryKeyConstraint,
+    Sequence,
+)
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import relationship
 
 from app.db import Base
@@ -8,17 +18,37 @@ from app.db import Base
 class PriceTableModel(Base):
     __tablename__ = "prices"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(Integer, Sequence("prices_id_seq"), primary_key=True)
     ticker_id = Column(
         Integer, ForeignKey("tickers.id", ondelete="cascade"), nullable=False
     )
     price = Column(Float, nullable=False)
     timestamp = Column(
-        DateTime, nullable=False, default=lambda: datetime.now(timezone.utc)
+        DateTime,
+        primary_key=True,
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
     )
 
     ticker = relationship("TickerTableModel", back_populates="prices")
 
     __table_args__ = (
-        Index("prices_index_ticker_id_timestamp", "ticker_id", "timestamp"),
+        Index(
+            "prices_index_ticker_id_timestamp",
+            "ticker_id",
+            "timestamp",
+            postgresql_include=["price", "id"],
+        ),
+    )
+
+
+@compiles(PrimaryKeyConstraint, "sqlite")
+def compile_primary_key_sqlite(element: PrimaryKeyConstraint, compiler, **kw) -> str:
+    # Prices are only partitioned on PostgreSQL, so SQLite keeps ``id`` as the
+    # rowid alias the initial schema created instead of the (id, timestamp) key.
+    if element.table is not PriceTableModel.__table__:
+        return compiler.visit_primary_key_constraint(element, **kw)
+
+    return "PRIMARY KEY ({})".format(
+        compiler.preparer.format_column(PriceTableModel.__table__.c.id)
     )
@@ -0,0 +1,71 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Row
+
+from app.domain.crypto.models.candle import Candle
+from app.domain.crypto.models.candle_interval import CandleInterval
+from app.domain.crypto.models.price import Price
+from app.domain.crypto.models.utc_datetime import to_naive_utc
+
+
+class DbCandleTranslator:
+    def bulk_translate_to_domain_model(
+        self, ticker_id: int, candle_rows: list[Row]
+    ) -> list[Candle]:
+        return [
+            self.translate_to_domain_model(ticker_id, candle_row)
+            for candle_row in candle_rows
+        ]
+
+    def translate_to_domain_model(self, ticker_id: int, candle_row: Row) -> Candle:
+        return Candle(
+            ticker_id=ticker_id,
+            timestamp=candle_row.timestamp,
+            open=candle_row.open,
+            high=candle_row.high,
+            low=candle_row.low,
+            close=candle_row.close,
+            count=candle_row.count,
+        )
+
+    def bulk_translate_prices_to_table_rows(
+        self, prices: list[Price], intervals: tuple[CandleInterval, ...]
+    ) -> list[dict[str, Any]]:
+        candle_rows: dict[tuple[int, str, datetime], dict[str, Any]] = {}
+
+        for price in prices:
+            timestamp = to_naive_utc(price.timestamp)
+
+            for interval in intervals:
+                bucket = interval.floor(timestamp)
+                candle_row = candle_rows.get((price.ticker_id, interval.value, bucket))
+
+                if candle_row is None:
+                    candle_rows[(price.ticker_id, interval.value, bucket)] = {
+                        "ticker_id": price.ticker_id,
+                        "interval": interval.value,
+                        "timestamp": bucket,
+                        "open": price.price,
+                        "high": price.price,
+                        "low": price.price,
+                        "close": price.price,
+                        "count": 1,
+                        "open_timestamp": timestamp,
+                        "close_timestamp": timestamp,
+                    }
+                    continue
+
+                candle_row["high"] = max(candle_row["high"], price.price)
+                candle_row["low"] = min(candle_row["low"], price.price)
+                candle_row["count"] += 1
+
+                if timestamp < candle_row["open_timestamp"]:
+                    candle_row["open"] = price.price
+                    candle_row["open_timestamp"] = timestamp
+
+                if timestamp >= candle_row["close_timestamp"]:
+                    candle_row["close"] = price.price
+                    candle_row["close_timestamp"] = timestamp
+
+        return list(candle_rows.values())
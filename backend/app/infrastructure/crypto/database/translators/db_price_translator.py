@@ -1,3 +1,7 @@
+from typing import Any, Sequence
+
+from sqlalchemy import Row
+
 from app.domain.crypto.models.price import Price
 from app.infrastructure.crypto.database.table_models import PriceTableModel
 
@@ -23,6 +27,22 @@ class DbPriceTranslator:
 
         return price_table_model
 
+    def bulk_translate_to_table_rows(
+        self, domain_prices: list[Price]
+    ) -> list[dict[str, Any]]:
+        return [
+            self.translate_to_table_row(domain_price) for domain_price in domain_prices
+        ]
+
+    def translate_to_table_row(self, domain_price: Price) -> dict[str, Any]:
+        # Rows are only used for bulk inserts, which leave the id to the
+        # sequence so every row of an executemany has the same columns.
+        return {
+            "ticker_id": domain_price.ticker_id,
+            "price": domain_price.price,
+            "timestamp": domain_price.timestamp,
+        }
+
     def bulk_translate_to_domain_model(
         self, price_table_models: list[PriceTableModel]
     ) -> list[Price]:
@@ -38,3 +58,16 @@ class DbPriceTranslator:
             ticker_id=price_table_model.ticker_id,
             timestamp=price_table_model.timestamp,
         )
+
+    def bulk_translate_table_rows_to_domain_model(
+        self, price_table_rows: Sequence[Row]
+    ) -> list[Price]:
+        return [
+            self.translate_table_row_to_domain_model(price_table_row)
+            for price_table_row in price_table_rows
+        ]
+
+    def translate_table_row_to_domain_model(self, price_table_row: Row) -> Price:
+        price_id, ticker_id, price, timestamp = price_table_row
+
+        return Price(id=price_id, price=price, ticker_id=ticker_id, timestamp=timestamp)
@@ -0,0 +1,77 @@
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass
+
+from sqlalchemy import Pool, QueuePool
+
+from app.logger import logger
+
+
+@dataclass(frozen=True)
+class PoolMetricsSnapshot:
+    name: str
+    pool_size: None | int
+    checked_out: None | int
+    overflow: None | int
+    checkouts: int
+    timeouts: int
+    checkout_latency_buckets: dict[str, int]
+    checkout_latency_sum: float
+
+
+class PoolMetrics:
+    __LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+    def __init__(self, slow_checkout_seconds: float):
+        self.__slow_checkout_seconds = slow_checkout_seconds
+        self.__lock = threading.Lock()
+        self.__checkouts = 0
+        self.__timeouts = 0
+        self.__latency_sum = 0.0
+        self.__latency_counts = [0] * (len(self.__LATENCY_BUCKETS) + 1)
+
+    def record_checkout(self, seconds: float, pool: Pool) -> None:
+        bucket = bisect_left(self.__LATENCY_BUCKETS, seconds)
+
+        with self.__lock:
+            self.__checkouts += 1
+            self.__latency_sum += seconds
+            self.__latency_counts[bucket] += 1
+
+        if seconds >= self.__slow_checkout_seconds:
+            logger.warning(
+                f"Database connection checkout took {seconds:.3f}s: {pool.status()}"
+            )
+
+    def record_timeout(self, pool: Pool) -> None:
+        with self.__lock:
+            self.__timeouts += 1
+
+        logger.error(f"Database connection checkout timed out: {pool.status()}")
+
+    def snapshot(self, name: str, pool: Pool) -> PoolMetricsSnapshot:
+        with self.__lock:
+            checkouts = self.__checkouts
+            timeouts = self.__timeouts
+            latency_sum = self.__latency_sum
+            latency_counts = list(self.__latency_counts)
+
+        latency_buckets: dict[str, int] = {}
+        cumulative_count = 0
+        for upper_bound, count in zip(self.__LATENCY_BUCKETS, latency_counts):
+            cumulative_count += count
+            latency_buckets[str(upper_bound)] = cumulative_count
+        latency_buckets["+Inf"] = checkouts
+
+        is_queue_pool = isinstance(pool, QueuePool)
+
+        return PoolMetricsSnapshot(
+            name=name,
+            pool_size=pool.size() if is_queue_pool else None,
+            checked_out=pool.checkedout() if is_queue_pool else None,
+            overflow=pool.overflow() if is_queue_pool else None,
+            checkouts=checkouts,
+            timeouts=timeouts,
+            checkout_latency_buckets=latency_buckets,
+            checkout_latency_sum=latency_sum,
+        )
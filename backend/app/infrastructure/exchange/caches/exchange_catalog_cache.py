@@ -0,0 +1,86 @@
+import threading
+import time
+from dataclasses import replace
+from typing import Hashable
+
+from app.domain.exchange.models.exchange import Exchange
+
+
+class ExchangeCatalogCache:
+    def __init__(self, ttl: float):
+        self.__ttl = ttl
+        self.__lock = threading.Lock()
+        self.__entries: dict[
+            Hashable, tuple[float, Hashable, Exchange | list[Exchange]]
+        ] = {}
+
+    def get(self, key: Hashable) -> None | Exchange | list[Exchange]:
+        with self.__lock:
+            entry = self.__entries.get(key)
+
+            if entry is None:
+                return None
+
+            expires_at, _, value = entry
+
+            if expires_at <= time.monotonic():
+                return None
+
+        return self.__copy(value)
+
+    def revalidate(
+        self, key: Hashable, catalog_version: Hashable
+    ) -> None | Exchange | list[Exchange]:
+        with self.__lock:
+            entry = self.__entries.get(key)
+
+            if entry is None:
+                return None
+
+            _, cached_catalog_version, value = entry
+
+            if cached_catalog_version != catalog_version:
+                del self.__entries[key]
+                return None
+
+            self.__entries[key] = (
+                time.monotonic() + self.__ttl,
+                cached_catalog_version,
+                value,
+            )
+
+        return self.__copy(value)
+
+    def set(
+        self,
+        key: Hashable,
+        catalog_version: Hashable,
+        value: Exchange | list[Exchange],
+    ) -> None:
+        if self.__ttl <= 0:
+            return
+
+        with self.__lock:
+            self.__entries[key] = (
+                time.monotonic() + self.__ttl,
+                catalog_version,
+                self.__copy(value),
+            )
+
+    def invalidate(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+
+    @staticmethod
+    def __copy(value: Exchange | list[Exchange]) -> Exchange | list[Exchange]:
+        if isinstance(value, list):
+            return [ExchangeCatalogCache.__copy(exchange) for exchange in value]
+
+        return replace(
+            value,
+            tickers=(
+                None
+                if value.tickers is None
+                else [replace(ticker) for ticker in value.tickers]
+            ),
+        )
@@ -10,8 +10,9 @@ from app.domain.exchange.clients.exchange_client import ExchangeClient
 class BinanceClient(ExchangeClient):
     __BINANCE_API_PRICE_PATH = "/api/v3/ticker/price"
 
-    def __init__(self, api_base_url: str):
+    def __init__(self, api_base_url: str, http_client: httpx.Client):
         self.__binance_api_url = api_base_url + self.__BINANCE_API_PRICE_PATH
+        self.__http_client = http_client
 
     def fetch_price_for_tickers(self, tickers: list[Ticker]) -> list[Price]:
         if not tickers:
@@ -20,15 +21,14 @@ class BinanceClient(ExchangeClient):
         ticker_map = self._map_tickers_by_symbol(tickers)
         prices: list[Price] = []
 
-        with httpx.Client() as client:
-            response = client.get(
-                self.__binance_api_url, params=self.__get_params_from_tickers(tickers)
-            )
+        response = self.__http_client.get(
+            self.__binance_api_url, params=self.__get_params_from_tickers(tickers)
+        )
 
-            if response.status_code == 200:
-                for item in response.json():
-                    price = self.__map_json_to_price(item, ticker_map)
-                    prices.append(price)
+        if response.status_code == 200:
+            for item in response.json():
+                price = self.__map_json_to_price(item, ticker_map)
+                prices.append(price)
 
         return prices
 
@@ -10,8 +10,9 @@ from app.domain.exchange.clients.exchange_client import ExchangeClient
 class KrakenClient(ExchangeClient):
     __KRAKEN_API_PRICE_PATH = "/0/public/Ticker"
 
-    def __init__(self, api_base_url: str):
+    def __init__(self, api_base_url: str, http_client: httpx.Client):
         self.__kraken_api_url = api_base_url + self.__KRAKEN_API_PRICE_PATH
+        self.__http_client = http_client
 
     def fetch_price_for_tickers(self, tickers: list[Ticker]) -> list[Price]:
         if not tickers:
@@ -20,21 +21,20 @@ class KrakenClient(ExchangeClient):
         ticker_map = self._map_tickers_by_symbol(tickers)
         prices: list[Price] = []
 
-        with httpx.Client() as client:
-            response = client.get(
-                self.__kraken_api_url, params=self.__get_params_from_tickers(tickers)
-            )
-
-            if response.status_code == 200:
-                response_dict: dict[str, Any] = response.json()
-                result_ticker_info = response_dict.get("result", {})
-                for ticker in result_ticker_info:
-                    prices.append(
-                        Price(
-                            ticker_id=ticker_map[ticker].id,
-                            price=float(result_ticker_info[ticker]["a"][0]),
-                        )
+        response = self.__http_client.get(
+            self.__kraken_api_url, params=self.__get_params_from_tickers(tickers)
+        )
+
+        if response.status_code == 200:
+            response_dict: dict[str, Any] = response.json()
+            result_ticker_info = response_dict.get("result", {})
+            for ticker in result_ticker_info:
+                prices.append(
+                    Price(
+                        ticker_id=ticker_map[ticker].id,
+                        price=float(result_ticker_info[ticker]["a"][0]),
                     )
+                )
 
         return prices
 
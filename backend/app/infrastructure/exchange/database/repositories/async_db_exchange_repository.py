@@ -0,0 +1,90 @@
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from app.db import get_async_session
+from app.domain.exchange.exceptions.exchange_not_found_exception import (
+    ExchangeNotFoundException,
+)
+from app.domain.exchange.models.exchange import Exchange
+from app.domain.exchange.repositories.async_exchange_repository import (
+    AsyncExchangeRepository,
+)
+from app.infrastructure.exchange.caches.exchange_catalog_cache import (
+    ExchangeCatalogCache,
+)
+from app.infrastructure.exchange.database.statements import (
+    build_catalog_version_select,
+)
+from app.infrastructure.exchange.database.table_models import ExchangeTableModel
+from app.infrastructure.exchange.database.translators.db_exchange_translator import (
+    DbExchangeTranslator,
+)
+
+
+class AsyncDbExchangeRepository(AsyncExchangeRepository):
+    __EXCHANGE_CATALOG_CACHE_KEY = "all"
+
+    def __init__(
+        self,
+        db_exchange_translator: DbExchangeTranslator,
+        exchange_catalog_cache: ExchangeCatalogCache,
+    ):
+        self.__db_exchange_translator = db_exchange_translator
+        self.__exchange_catalog_cache = exchange_catalog_cache
+
+    async def get_all(self, fetch_tickers=False) -> list[Exchange]:
+        if fetch_tickers:
+            cached_exchanges = self.__exchange_catalog_cache.get(
+                self.__EXCHANGE_CATALOG_CACHE_KEY
+            )
+
+            if cached_exchanges is not None:
+                return cached_exchanges
+
+        async with get_async_session() as session:
+            if fetch_tickers:
+                catalog_version = tuple(
+                    (await session.execute(build_catalog_version_select())).one()
+                )
+                cached_exchanges = self.__exchange_catalog_cache.revalidate(
+                    self.__EXCHANGE_CATALOG_CACHE_KEY, catalog_version
+                )
+
+                if cached_exchanges is not None:
+                    return cached_exchanges
+
+            statement = select(ExchangeTableModel)
+
+            if fetch_tickers:
+                statement = statement.options(selectinload(ExchangeTableModel.tickers))
+
+            query_result = await session.execute(statement)
+
+            exchange_table_models = query_result.scalars().all()
+
+        exchanges = self.__db_exchange_translator.bulk_translate_to_domain_model(
+            exchange_table_models, fetch_tickers
+        )
+
+        if fetch_tickers:
+            self.__exchange_catalog_cache.set(
+                self.__EXCHANGE_CATALOG_CACHE_KEY, catalog_version, exchanges
+            )
+
+        return exchanges
+
+    async def get_or_fail_by_id(self, exchange_id: int) -> Exchange:
+        async with get_async_session() as session:
+            query_result = await session.execute(
+                select(ExchangeTableModel).where(ExchangeTableModel.id == exchange_id)
+            )
+            exchange_table_model: ExchangeTableModel | None = (
+                query_result.scalar_one_or_none()
+            )
+
+            if exchange_table_model is None:
+                raise ExchangeNotFoundException("id", exchange_id)
+
+        return self.__db_exchange_translator.translate_to_domain_model(
+            exchange_table_model
+        )
@@ -7,6 +7,12 @@ from app.domain.exchange.exceptions.exchange_not_found_exception import (
 )
 from app.domain.exchange.models.exchange import Exchange
 from app.domain.exchange.repositories.exchange_repository import ExchangeRepository
+from app.infrastructure.exchange.caches.exchange_catalog_cache import (
+    ExchangeCatalogCache,
+)
+from app.infrastructure.exchange.database.statements import (
+    build_catalog_version_select,
+)
 from app.infrastructure.exchange.database.table_models import ExchangeTableModel
 from app.infrastructure.exchange.database.translators.db_exchange_translator import (
     DbExchangeTranslator,
@@ -14,11 +20,33 @@ from app.infrastructure.exchange.database.translators.db_exchange_translator imp
 
 
 class DbExchangeRepository(ExchangeRepository):
-    def __init__(self, db_exchange_translator: DbExchangeTranslator):
+    def __init__(
+        self,
+        db_exchange_translator: DbExchangeTranslator,
+        exchange_catalog_cache: ExchangeCatalogCache,
+    ):
         self.__db_exchange_translator = db_exchange_translator
+        self.__exchange_catalog_cache = exchange_catalog_cache
 
     def get_or_fail_by_name(self, exchange_name: str, fetch_tickers: bool) -> Exchange:
+        if fetch_tickers:
+            cached_exchange = self.__exchange_catalog_cache.get(exchange_name)
+
+            if cached_exchange is not None:
+                return cached_exchange
+
         with get_session() as session:
+            if fetch_tickers:
+                catalog_version = tuple(
+                    session.execute(build_catalog_version_select()).one()
+                )
+                cached_exchange = self.__exchange_catalog_cache.revalidate(
+                    exchange_name, catalog_version
+                )
+
+                if cached_exchange is not None:
+                    return cached_exchange
+
             statement = select(ExchangeTableModel).where(
                 ExchangeTableModel.name == exchange_name
             )
@@ -34,10 +62,15 @@ class DbExchangeRepository(ExchangeRepository):
             if exchange_table_model is None:
                 raise ExchangeNotFoundException("name", exchange_name)
 
-        return self.__db_exchange_translator.translate_to_domain_model(
+        exchange = self.__db_exchange_translator.translate_to_domain_model(
             exchange_table_model, fetch_tickers
         )
 
+        if fetch_tickers:
+            self.__exchange_catalog_cache.set(exchange_name, catalog_version, exchange)
+
+        return exchange
+
     def get_all(self) -> list[Exchange]:
         with get_session() as session:
             query_result = session.execute(select(ExchangeTableModel))
@@ -0,0 +1 @@
+from .catalog_version_select import build_catalog_version_select
@@ -0,0 +1,7 @@
+from sqlalchemy import Select, func, select
+
+from app.infrastructure.crypto.database.table_models import TickerTableModel
+
+
+def build_catalog_version_select() -> Select:
+    return select(func.count(TickerTableModel.id), func.max(TickerTableModel.id))
@@ -27,9 +27,9 @@ class DbExchangeTranslator:
         return domain_exchange
 
     def bulk_translate_to_domain_model(
-        self, exchange_table_models: list[ExchangeTableModel]
+        self, exchange_table_models: list[ExchangeTableModel], with_tickers=False
     ) -> list[Exchange]:
         return [
-            self.translate_to_domain_model(exchange_table_model)
+            self.translate_to_domain_model(exchange_table_model, with_tickers)
             for exchange_table_model in exchange_table_models
         ]
@@ -0,0 +1,120 @@
+from app.dependency_injection_factories.entrypoints.routes.v1.get_all_exchanges_handler_factory import (
+    GetAllExchangesHandlerFactory,
+)
+from app.dependency_injection_factories.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler_factory import (
+    GetAllPricesByTickerIdHandlerFactory,
+)
+from app.dependency_injection_factories.entrypoints.routes.v1.get_all_prices_by_ticker_ids_handler_factory import (
+    GetAllPricesByTickerIdsHandlerFactory,
+)
+from app.dependency_injection_factories.entrypoints.routes.v1.get_all_symbols_handler_factory import (
+    GetAllSymbolsHandlerFactory,
+)
+from app.dependency_injection_factories.entrypoints.routes.v1.get_all_tickers_by_exchange_id_handler_factory import (
+    GetAllTickersByExchangeIdHandlerFactory,
+)
+from app.dependency_injection_factories.entrypoints.routes.v1.get_database_pool_metrics_handler_factory import (
+    GetDatabasePoolMetricsHandlerFactory,
+)
+from app.dependency_injection_factories.entrypoints.routes.v1.get_exchange_by_id_handler_factory import (
+    GetExchangeByIdHandlerFactory,
+)
+from app.dependency_injection_factories.entrypoints.routes.v1.get_latest_prices_handler_factory import (
+    GetLatestPricesHandlerFactory,
+)
+from app.dependency_injection_factories.entrypoints.routes.v1.get_symbol_by_id_handler_factory import (
+    GetSymbolByIdHandlerFactory,
+)
+from app.dependency_injection_factories.entrypoints.routes.v1.get_ticker_by_id_handler_factory import (
+    GetTickerByIdHandlerFactory,
+)
+from app.dependency_injection_factories.entrypoints.routes.v1.post_symbol_handler_factory import (
+    PostSymbolHandlerFactory,
+)
+from app.dependency_injection_factories.entrypoints.routes.v1.post_ticker_handler_factory import (
+    PostTickerHandlerFactory,
+)
+from app.entrypoints.routes.v1.get_all_exchanges_handler import GetAllExchangesHandler
+from app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler import (
+    GetAllPricesByTickerIdHandler,
+)
+from app.entrypoints.routes.v1.get_all_prices_by_ticker_ids_handler import (
+    GetAllPricesByTickerIdsHandler,
+)
+from app.entrypoints.routes.v1.get_all_symbols_handler import GetAllSymbolsHandler
+from app.entrypoints.routes.v1.get_all_tickers_by_exchange_id_handler import (
+    GetAllTickersByExchangeIdHandler,
+)
+from app.entrypoints.routes.v1.get_database_pool_metrics_handler import (
+    GetDatabasePoolMetricsHandler,
+)
+from app.entrypoints.routes.v1.get_exchange_by_id_handler import GetExchangeByIdHandler
+from app.entrypoints.routes.v1.get_latest_prices_handler import GetLatestPricesHandler
+from app.entrypoints.routes.v1.get_symbol_by_id_handler import GetSymbolByIdHandler
+from app.entrypoints.routes.v1.get_ticker_by_id_handler import GetTickerByIdHandler
+from app.entrypoints.routes.v1.post_symbol_handler import PostSymbolHandler
+from app.entrypoints.routes.v1.post_ticker_handler import PostTickerHandler
+
+
+async def get_all_exchanges_handler() -> GetAllExchangesHandler:
+    return GetAllExchangesHandlerFactory.create()
+
+
+async def get_all_prices_by_ticker_id_handler() -> GetAllPricesByTickerIdHandler:
+    return GetAllPricesByTickerIdHandlerFactory.create()
+
+
+async def get_all_prices_by_ticker_ids_handler() -> GetAllPricesByTickerIdsHandler:
+    return GetAllPricesByTickerIdsHandlerFactory.create()
+
+
+async def get_all_symbols_handler() -> GetAllSymbolsHandler:
+    return GetAllSymbolsHandlerFactory.create()
+
+
+async def get_all_tickers_by_exchange_id_handler() -> GetAllTickersByExchangeIdHandler:
+    return GetAllTickersByExchangeIdHandlerFactory.create()
+
+
+async def get_database_pool_metrics_handler() -> GetDatabasePoolMetricsHandler:
+    return GetDatabasePoolMetricsHandlerFactory.create()
+
+
+async def get_exchange_by_id_handler() -> GetExchangeByIdHandler:
+    return GetExchangeByIdHandlerFactory.create()
+
+
+async def get_latest_prices_handler() -> GetLatestPricesHandler:
+    return GetLatestPricesHandlerFactory.create()
+
+
+async def get_symbol_by_id_handler() -> GetSymbolByIdHandler:
+    return GetSymbolByIdHandlerFactory.create()
+
+
+async def get_ticker_by_id_handler() -> GetTickerByIdHandler:
+    return GetTickerByIdHandlerFactory.create()
+
+
+async def post_symbol_handler() -> PostSymbolHandler:
+    return PostSymbolHandlerFactory.create()
+
+
+async def post_ticker_handler() -> PostTickerHandler:
+    return PostTickerHandlerFactory.create()
+
+
+HANDLER_FACTORIES = [
+    GetAllExchangesHandlerFactory.create,
+    GetAllPricesByTickerIdHandlerFactory.create,
+    GetAllPricesByTickerIdsHandlerFactory.create,
+    GetAllSymbolsHandlerFactory.create,
+    GetAllTickersByExchangeIdHandlerFactory.create,
+    GetDatabasePoolMetricsHandlerFactory.create,
+    GetExchangeByIdHandlerFactory.create,
+    GetLatestPricesHandlerFactory.create,
+    GetSymbolByIdHandlerFactory.create,
+    GetTickerByIdHandlerFactory.create,
+    PostSymbolHandlerFactory.create,
+    PostTickerHandlerFactory.create,
+]
@@ -1,25 +1,73 @@
 from datetime import datetime
 
-from fastapi import APIRouter, status, WebSocket
+from fastapi import APIRouter, Depends, status, WebSocket, Query, Header
 from starlette.websockets import WebSocketDisconnect
 
+from app.domain.crypto.models.candle_interval import CandleInterval
+from app.entrypoints.routes.v1.get_all_exchanges_handler import GetAllExchangesHandler
+from app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler import (
+    GetAllPricesByTickerIdHandler,
+)
+from app.entrypoints.routes.v1.get_all_prices_by_ticker_ids_handler import (
+    GetAllPricesByTickerIdsHandler,
+)
+from app.entrypoints.routes.v1.get_all_symbols_handler import GetAllSymbolsHandler
+from app.entrypoints.routes.v1.get_all_tickers_by_exchange_id_handler import (
+    GetAllTickersByExchangeIdHandler,
+)
+from app.entrypoints.routes.v1.get_database_pool_metrics_handler import (
+    GetDatabasePoolMetricsHandler,
+)
+from app.entrypoints.routes.v1.get_exchange_by_id_handler import GetExchangeByIdHandler
+from app.entrypoints.routes.v1.get_latest_prices_handler import GetLatestPricesHandler
+from app.entrypoints.routes.v1.get_symbol_by_id_handler import GetSymbolByIdHandler
+from app.entrypoints.routes.v1.get_ticker_by_id_handler import GetTickerByIdHandler
+from app.entrypoints.routes.v1.post_symbol_handler import PostSymbolHandler
+from app.entrypoints.routes.v1.post_ticker_handler import PostTickerHandler
+from app.interfaces.api.v1.dependencies import (
+    get_all_exchanges_handler,
+    get_all_prices_by_ticker_id_handler,
+    get_all_prices_by_ticker_ids_handler,
+    get_all_symbols_handler,
+    get_all_tickers_by_exchange_id_handler,
+    get_database_pool_metrics_handler,
+    get_exchange_by_id_handler,
+    get_latest_prices_handler,
+    get_symbol_by_id_handler,
+    get_ticker_by_id_handler,
+    post_symbol_handler,
+    post_ticker_handler,
+)
+from app.interfaces.api.v1.schemas.candle_schema import CandleSchema
+from app.interfaces.api.v1.schemas.candle_series_schema import CandleSeriesSchema
+from app.interfaces.api.v1.schemas.database_pool_metrics_schema import (
+    DatabasePoolMetricsSchema,
+)
 from app.interfaces.api.v1.schemas.exchange_schema import ExchangeSchema
+from app.interfaces.api.v1.schemas.price_export_format import PriceExportFormat
+from app.interfaces.api.v1.schemas.price_frame_format import PriceFrameFormat
 from app.interfaces.api.v1.schemas.price_schema import PriceSchema
+from app.interfaces.api.v1.schemas.price_series_schema import PriceSeriesSchema
 from app.interfaces.api.v1.schemas.symbol_create_schema import SymbolCreateSchema
 from app.interfaces.api.v1.schemas.symbol_schema import SymbolSchema
 from app.interfaces.api.v1.schemas.ticker_create_schema import TickerCreateSchema
 from app.interfaces.api.v1.schemas.ticker_schema import TickerSchema
-from app.main import logger
+from app.logger import logger
+from app.settings import (
+    PRICES_PAGE_MAX_LIMIT,
+    PRICE_CANDLES_MAX_POINTS,
+    PRICES_BATCH_MAX_TICKERS,
+)
 
 router_v1 = APIRouter()
 
 
 @router_v1.get("/symbols", response_model=list[SymbolSchema], tags=["Symbols"])
-def get_all_symbols():
-    from app.entrypoints.routes.v1.get_all_symbols_handler import GetAllSymbolsHandler
-
-    handler = GetAllSymbolsHandler()
-    return handler.handle()
+async def get_all_symbols(
+    if_none_match: str | None = Header(default=None),
+    handler: GetAllSymbolsHandler = Depends(get_all_symbols_handler),
+):
+    return await handler.handle(if_none_match)
 
 
 @router_v1.get(
@@ -35,11 +83,10 @@ def get_all_symbols():
     },
     tags=["Symbols"],
 )
-def get_symbol_by_id(symbol_id: int):
-    from app.entrypoints.routes.v1.get_symbol_by_id_handler import GetSymbolByIdHandler
-
-    handler = GetSymbolByIdHandler()
-    return handler.handle(symbol_id)
+async def get_symbol_by_id(
+    symbol_id: int, handler: GetSymbolByIdHandler = Depends(get_symbol_by_id_handler)
+):
+    return await handler.handle(symbol_id)
 
 
 @router_v1.post(
@@ -58,21 +105,19 @@ def get_symbol_by_id(symbol_id: int):
     },
     tags=["Symbols"],
 )
-def post_symbol(symbol: SymbolCreateSchema):
-    from app.entrypoints.routes.v1.post_symbol_handler import PostSymbolHandler
-
-    handler = PostSymbolHandler()
-    return handler.handle(symbol)
+async def post_symbol(
+    symbol: SymbolCreateSchema,
+    handler: PostSymbolHandler = Depends(post_symbol_handler),
+):
+    return await handler.handle(symbol)
 
 
 @router_v1.get("/exchanges", response_model=list[ExchangeSchema], tags=["Exchanges"])
-def get_all_exchanges():
-    from app.entrypoints.routes.v1.get_all_exchanges_handler import (
-        GetAllExchangesHandler,
-    )
-
-    handler = GetAllExchangesHandler()
-    return handler.handle()
+async def get_all_exchanges(
+    if_none_match: str | None = Header(default=None),
+    handler: GetAllExchangesHandler = Depends(get_all_exchanges_handler),
+):
+    return await handler.handle(if_none_match)
 
 
 @router_v1.get(
@@ -88,13 +133,11 @@ def get_all_exchanges():
     },
     tags=["Exchanges"],
 )
-def get_exchange_by_id(exchange_id: int):
-    from app.entrypoints.routes.v1.get_exchange_by_id_handler import (
-        GetExchangeByIdHandler,
-    )
-
-    handler = GetExchangeByIdHandler()
-    return handler.handle(exchange_id)
+async def get_exchange_by_id(
+    exchange_id: int,
+    handler: GetExchangeByIdHandler = Depends(get_exchange_by_id_handler),
+):
+    return await handler.handle(exchange_id)
 
 
 @router_v1.get(
@@ -110,13 +153,14 @@ def get_exchange_by_id(exchange_id: int):
     },
     tags=["Tickers"],
 )
-def get_all_tickers_by_exchange_id(exchange_id: int):
-    from app.entrypoints.routes.v1.get_all_tickers_by_exchange_id_handler import (
-        GetAllTickersByExchangeIdHandler,
-    )
-
-    handler = GetAllTickersByExchangeIdHandler()
-    return handler.handle(exchange_id)
+async def get_all_tickers_by_exchange_id(
+    exchange_id: int,
+    if_none_match: str | None = Header(default=None),
+    handler: GetAllTickersByExchangeIdHandler = Depends(
+        get_all_tickers_by_exchange_id_handler
+    ),
+):
+    return await handler.handle(exchange_id, if_none_match)
 
 
 @router_v1.get(
@@ -132,11 +176,11 @@ def get_all_tickers_by_exchange_id(exchange_id: int):
     },
     tags=["Tickers"],
 )
-def get_ticker_by_id(ticker_id: int):
-    from app.entrypoints.routes.v1.get_ticker_by_id_handler import GetTickerByIdHandler
-
-    handler = GetTickerByIdHandler()
-    return handler.handle(ticker_id)
+async def get_ticker_by_id(
+    ticker_id: int,
+    handler: GetTickerByIdHandler = Depends(get_ticker_by_id_handler),
+):
+    return await handler.handle(ticker_id)
 
 
 @router_v1.post(
@@ -165,17 +209,90 @@ def get_ticker_by_id(ticker_id: int):
     },
     tags=["Tickers"],
 )
-def post_ticker(symbol: TickerCreateSchema):
-    from app.entrypoints.routes.v1.post_ticker_handler import PostTickerHandler
-
-    handler = PostTickerHandler()
-    return handler.handle(symbol)
+async def post_ticker(
+    symbol: TickerCreateSchema,
+    handler: PostTickerHandler = Depends(post_ticker_handler),
+):
+    return await handler.handle(symbol)
 
 
 @router_v1.get(
     "/tickers/{ticker_id}/prices",
-    response_model=list[PriceSchema],
+    response_model=list[PriceSchema] | list[CandleSchema],
+    responses={
+        200: {
+            "description": "Prices ordered by timestamp. When paginating, the cursor "
+            "of the next page is returned in the 'X-Next-Cursor' header. When a "
+            "bucket is requested, candles are returned instead and the bucket used "
+            "is returned in the 'X-Candle-Interval' header; candles are whole "
+            "aligned buckets, so the first and last ones may include prices "
+            "outside the requested range. Prices can also be "
+            "exported as NDJSON, CSV or an Apache Arrow IPC stream with the "
+            "'format' parameter or the 'Accept' header",
+            "content": {
+                PriceExportFormat.NDJSON.media_type: {},
+                PriceExportFormat.CSV.media_type: {},
+                PriceExportFormat.ARROW.media_type: {},
+            },
+        },
+        400: {
+            "description": "Bad request",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "start_date must be before end_date"}
+                }
+            },
+        },
+        404: {
+            "description": "Ticker not found",
+            "content": {
+                "application/json": {"example": {"detail": "Ticker not found"}}
+            },
+        },
+    },
+    tags=["Prices"],
+)
+async def get_all_prices_by_ticker_id(
+    ticker_id: int,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+    limit: int | None = Query(default=None, gt=0, le=PRICES_PAGE_MAX_LIMIT),
+    cursor: str | None = None,
+    bucket: CandleInterval | None = None,
+    points: int | None = Query(default=None, gt=0, le=PRICE_CANDLES_MAX_POINTS),
+    format: PriceExportFormat | None = None,
+    accept: str | None = Header(default=None),
+    if_none_match: str | None = Header(default=None),
+    handler: GetAllPricesByTickerIdHandler = Depends(
+        get_all_prices_by_ticker_id_handler
+    ),
+):
+    return await handler.handle(
+        ticker_id,
+        start_date,
+        end_date,
+        limit,
+        cursor,
+        bucket,
+        points,
+        format,
+        accept,
+        if_none_match,
+    )
+
+
+@router_v1.get(
+    "/prices",
+    response_model=list[PriceSeriesSchema] | list[CandleSeriesSchema],
     responses={
+        200: {
+            "description": "Prices of every requested ticker ordered by timestamp, "
+            "grouped by ticker in ascending ticker id order. When a bucket is "
+            "requested, candles are returned instead and the bucket used is "
+            "returned in the 'X-Candle-Interval' header; candles are whole aligned "
+            "buckets, so the first and last ones may include prices outside the "
+            "requested range",
+        },
         400: {
             "description": "Bad request",
             "content": {
@@ -193,35 +310,71 @@ def post_ticker(symbol: TickerCreateSchema):
     },
     tags=["Prices"],
 )
-def get_all_prices_by_ticker_id(
-    ticker_id: int, start_date: datetime | None = None, end_date: datetime | None = None
+def get_all_prices_by_ticker_ids(
+    ticker_ids: list[int] = Query(min_length=1, max_length=PRICES_BATCH_MAX_TICKERS),
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+    bucket: CandleInterval | None = None,
+    points: int | None = Query(default=None, gt=0, le=PRICE_CANDLES_MAX_POINTS),
+    if_none_match: str | None = Header(default=None),
+    handler: GetAllPricesByTickerIdsHandler = Depends(
+        get_all_prices_by_ticker_ids_handler
+    ),
 ):
-    from app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler import (
-        GetAllPricesByTickerIdHandler,
+    return handler.handle(
+        ticker_ids, start_date, end_date, bucket, points, if_none_match
     )
 
-    handler = GetAllPricesByTickerIdHandler()
-    return handler.handle(ticker_id, start_date, end_date)
+
+@router_v1.get(
+    "/prices/latest",
+    response_model=list[PriceSchema],
+    responses={
+        200: {
+            "description": "Latest known price of every ticker, optionally filtered "
+            "by ticker or exchange, ordered by ticker id. Served from an in-memory "
+            "cache refreshed in the background",
+        },
+    },
+    tags=["Prices"],
+)
+async def get_latest_prices(
+    ticker_ids: list[int] | None = Query(default=None),
+    exchange_ids: list[int] | None = Query(default=None),
+    handler: GetLatestPricesHandler = Depends(get_latest_prices_handler),
+):
+    return await handler.handle(ticker_ids, exchange_ids)
 
 
 @router_v1.websocket(
     "/tickers/{ticker_id}/prices/ws",
 )
 async def get_all_prices_by_ticker_id_ws(
-    websocket: WebSocket, ticker_id: int, last_minutes: int = 10
+    websocket: WebSocket,
+    ticker_id: int,
+    last_minutes: int = 10,
+    frame: PriceFrameFormat = PriceFrameFormat.SINGLE,
+    handler: GetAllPricesByTickerIdHandler = Depends(
+        get_all_prices_by_ticker_id_handler
+    ),
 ):
-    from app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler import (
-        GetAllPricesByTickerIdHandler,
-    )
-
-    handler = GetAllPricesByTickerIdHandler()
-
     try:
         await websocket.accept()
-        await handler.handle_websocket(websocket, ticker_id, last_minutes)
+        await handler.handle_websocket(websocket, ticker_id, last_minutes, frame)
 
     except WebSocketDisconnect:
         logger.info(f"Websocket for ticker_id {ticker_id} disconnected")
     except Exception as e:
         logger.error(f"Websocket for ticker_id {ticker_id} failed: {e}")
         await websocket.close()
+
+
+@router_v1.get(
+    "/metrics/database",
+    response_model=list[DatabasePoolMetricsSchema],
+    tags=["Metrics"],
+)
+async def get_database_pool_metrics(
+    handler: GetDatabasePoolMetricsHandler = Depends(get_database_pool_metrics_handler),
+):
+    return handler.handle()
@@ -0,0 +1,51 @@
+from __future__ import annotations
+from datetime import datetime
+from typing import Any
+
+import orjson
+from pydantic import BaseModel
+
+from app.domain.crypto.models.candle import Candle
+
+
+class CandleSchema(BaseModel):
+    ticker_id: int
+    timestamp: datetime
+    open: float
+    high: float
+    low: float
+    close: float
+    count: int
+
+    @staticmethod
+    def from_domain(domain_candle: Candle) -> CandleSchema:
+        return CandleSchema(
+            ticker_id=domain_candle.ticker_id,
+            timestamp=domain_candle.timestamp,
+            open=domain_candle.open,
+            high=domain_candle.high,
+            low=domain_candle.low,
+            close=domain_candle.close,
+            count=domain_candle.count,
+        )
+
+    @staticmethod
+    def serialize(domain_candles: list[Candle]) -> list[dict[str, Any]]:
+        return [
+            {
+                "ticker_id": domain_candle.ticker_id,
+                "timestamp": domain_candle.timestamp,
+                "open": domain_candle.open,
+                "high": domain_candle.high,
+                "low": domain_candle.low,
+                "close": domain_candle.close,
+                "count": domain_candle.count,
+            }
+            for domain_candle in domain_candles
+        ]
+
+    @staticmethod
+    def dump_json(domain_candles: list[Candle]) -> bytes:
+        return orjson.dumps(
+            CandleSchema.serialize(domain_candles), option=orjson.OPT_UTC_Z
+        )
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import orjson
+from pydantic import BaseModel
+
+from app.domain.crypto.models.candle import Candle
+from app.interfaces.api.v1.schemas.candle_schema import CandleSchema
+
+
+class CandleSeriesSchema(BaseModel):
+    ticker_id: int
+    candles: list[CandleSchema]
+
+    @staticmethod
+    def from_domain(ticker_id: int, domain_candles: list[Candle]) -> CandleSeriesSchema:
+        return CandleSeriesSchema(
+            ticker_id=ticker_id,
+            candles=[
+                CandleSchema.from_domain(domain_candle)
+                for domain_candle in domain_candles
+            ],
+        )
+
+    @staticmethod
+    def dump_json(domain_candles: dict[int, list[Candle]]) -> bytes:
+        return orjson.dumps(
+            [
+                {"ticker_id": ticker_id, "candles": CandleSchema.serialize(candles)}
+                for ticker_id, candles in domain_candles.items()
+            ],
+            option=orjson.OPT_UTC_Z,
+        )
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+from app.infrastructure.database.pool_metrics import PoolMetricsSnapshot
+
+
+class DatabasePoolMetricsSchema(BaseModel):
+    name: str
+    pool_size: None | int
+    checked_out: None | int
+    overflow: None | int
+    checkouts: int
+    timeouts: int
+    checkout_latency_buckets: dict[str, int]
+    checkout_latency_sum: float
+
+    @staticmethod
+    def from_snapshot(snapshot: PoolMetricsSnapshot) -> DatabasePoolMetricsSchema:
+        return DatabasePoolMetricsSchema(
+            name=snapshot.name,
+            pool_size=snapshot.pool_size,
+            checked_out=snapshot.checked_out,
+            overflow=snapshot.overflow,
+            checkouts=snapshot.checkouts,
+            timeouts=snapshot.timeouts,
+            checkout_latency_buckets=snapshot.checkout_latency_buckets,
+            checkout_latency_sum=snapshot.checkout_latency_sum,
+        )
@@ -0,0 +1,37 @@
+from __future__ import annotations
+from datetime import datetime
+
+import orjson
+from pydantic import BaseModel
+
+from app.domain.crypto.models.price import Price
+
+
+class PriceColumnsSchema(BaseModel):
+    ticker_id: int
+    ids: list[int]
+    prices: list[float]
+    timestamps: list[datetime]
+
+    @staticmethod
+    def from_domain(ticker_id: int, domain_prices: list[Price]) -> PriceColumnsSchema:
+        return PriceColumnsSchema(
+            ticker_id=ticker_id,
+            ids=[domain_price.id for domain_price in domain_prices],
+            prices=[domain_price.price for domain_price in domain_prices],
+            timestamps=[domain_price.timestamp for domain_price in domain_prices],
+        )
+
+    @staticmethod
+    def dump_json(ticker_id: int, domain_prices: list[Price]) -> bytes:
+        return orjson.dumps(
+            {
+                "ticker_id": ticker_id,
+                "ids": [domain_price.id for domain_price in domain_prices],
+                "prices": [domain_price.price for domain_price in domain_prices],
+                "timestamps": [
+                    domain_price.timestamp for domain_price in domain_prices
+                ],
+            },
+            option=orjson.OPT_UTC_Z,
+        )
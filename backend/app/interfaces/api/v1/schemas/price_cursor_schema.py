@@ -0,0 +1,38 @@
+from __future__ import annotations
+import base64
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from app.domain.crypto.models.price import Price
+from app.domain.crypto.models.price_cursor import PriceCursor
+
+
+class PriceCursorSchema(BaseModel):
+    timestamp: datetime
+    id: int
+
+    @staticmethod
+    def from_domain(domain_price: Price) -> PriceCursorSchema:
+        return PriceCursorSchema(id=domain_price.id, timestamp=domain_price.timestamp)
+
+    @staticmethod
+    def to_domain(price_cursor_schema: PriceCursorSchema) -> PriceCursor:
+        return PriceCursor(
+            timestamp=price_cursor_schema.timestamp, id=price_cursor_schema.id
+        )
+
+    @staticmethod
+    def encode(price_cursor_schema: PriceCursorSchema) -> str:
+        return base64.urlsafe_b64encode(
+            price_cursor_schema.model_dump_json().encode()
+        ).decode()
+
+    @staticmethod
+    def decode(cursor: str) -> PriceCursorSchema:
+        try:
+            return PriceCursorSchema.model_validate_json(
+                base64.urlsafe_b64decode(cursor.encode())
+            )
+        except ValueError as e:
+            raise ValueError(f"Invalid cursor '{cursor}'") from e
@@ -0,0 +1,35 @@
+from __future__ import annotations
+from enum import Enum
+
+
+class PriceExportFormat(str, Enum):
+    JSON = "json"
+    NDJSON = "ndjson"
+    CSV = "csv"
+    ARROW = "arrow"
+
+    @property
+    def media_type(self) -> str:
+        return _PRICE_EXPORT_MEDIA_TYPES[self]
+
+    @staticmethod
+    def from_accept(accept: None | str) -> PriceExportFormat:
+        if accept is None:
+            return PriceExportFormat.JSON
+
+        for media_range in accept.split(","):
+            media_type = media_range.split(";")[0].strip().lower()
+
+            for export_format, export_media_type in _PRICE_EXPORT_MEDIA_TYPES.items():
+                if media_type == export_media_type:
+                    return export_format
+
+        return PriceExportFormat.JSON
+
+
+_PRICE_EXPORT_MEDIA_TYPES = {
+    PriceExportFormat.JSON: "application/json",
+    PriceExportFormat.NDJSON: "application/x-ndjson",
+    PriceExportFormat.CSV: "text/csv",
+    PriceExportFormat.ARROW: "application/vnd.apache.arrow.stream",
+}
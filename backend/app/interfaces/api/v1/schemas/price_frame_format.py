@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class PriceFrameFormat(str, Enum):
+    SINGLE = "single"
+    BATCH = "batch"
+    COLUMNAR = "columnar"
@@ -1,6 +1,8 @@
 from __future__ import annotations
 from datetime import datetime
+from typing import Any
 
+import orjson
 from pydantic import BaseModel
 
 from app.domain.crypto.models.price import Price
@@ -20,3 +22,21 @@ class PriceSchema(BaseModel):
             price=domain_price.price,
             timestamp=domain_price.timestamp,
         )
+
+    @staticmethod
+    def serialize(domain_prices: list[Price]) -> list[dict[str, Any]]:
+        return [
+            {
+                "id": domain_price.id,
+                "ticker_id": domain_price.ticker_id,
+                "price": domain_price.price,
+                "timestamp": domain_price.timestamp,
+            }
+            for domain_price in domain_prices
+        ]
+
+    @staticmethod
+    def dump_json(domain_prices: list[Price]) -> bytes:
+        return orjson.dumps(
+            PriceSchema.serialize(domain_prices), option=orjson.OPT_UTC_Z
+        )
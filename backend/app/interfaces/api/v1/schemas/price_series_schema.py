@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+from app.domain.crypto.models.price import Price
+from app.interfaces.api.v1.schemas.price_schema import PriceSchema
+
+
+class PriceSeriesSchema(BaseModel):
+    ticker_id: int
+    prices: list[PriceSchema]
+
+    @staticmethod
+    def from_domain(ticker_id: int, domain_prices: list[Price]) -> PriceSeriesSchema:
+        return PriceSeriesSchema(
+            ticker_id=ticker_id,
+            prices=[
+                PriceSchema.from_domain(domain_price) for domain_price in domain_prices
+            ],
+        )
@@ -1,17 +1,60 @@
-import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.openapi.utils import get_openapi
 from starlette.responses import RedirectResponse
 
+from app.logger import logger
+from app.settings import STARTUP_WARMUP
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 
-logger = logging.getLogger("ArgusCryptoLogger")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    from app.dependency_injection_factories.infrastructure.crypto.caches.latest_price_cache_factory import (
+        LatestPriceCacheFactory,
+    )
+
+    if STARTUP_WARMUP:
+        from app.entrypoints.startup_warmup import StartupWarmup
+        from app.interfaces.api.v1.dependencies import HANDLER_FACTORIES
+
+        startup_warmup = StartupWarmup(logger, HANDLER_FACTORIES)
+        startup_warmup.preload_handlers()
+        startup_warmup.configure_mappers()
+        await startup_warmup.connect_async_database()
+        startup_warmup.connect_database()
+
+    latest_price_cache = LatestPriceCacheFactory.create()
+    try:
+        await latest_price_cache.warm()
+    except Exception as e:
+        logger.error(f"Failed to warm latest prices cache: {e}")
+    latest_price_cache.start()
 
-app = FastAPI(title="Argus Crypto API", version="1.0.0")
+    yield
+
+    latest_price_cache.stop()
+
+
+app = FastAPI(title="Argus Crypto API", version="1.0.0", lifespan=lifespan)
+
+
+from app.entrypoints.middlewares.compression_middleware import CompressionMiddleware
+from app.settings import (
+    COMPRESSION_BROTLI_LEVEL,
+    COMPRESSION_ENCODINGS,
+    COMPRESSION_GZIP_LEVEL,
+    COMPRESSION_MINIMUM_SIZE,
+    COMPRESSION_ZSTD_LEVEL,
+)
+
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=COMPRESSION_MINIMUM_SIZE,
+    encodings=COMPRESSION_ENCODINGS,
+    gzip_level=COMPRESSION_GZIP_LEVEL,
+    brotli_level=COMPRESSION_BROTLI_LEVEL,
+    zstd_level=COMPRESSION_ZSTD_LEVEL,
+)
 
 
 from app.interfaces.api.v1.routes import router_v1
@@ -51,6 +94,17 @@ def custom_openapi():
                         "title": "Last minutes of data",
                     },
                 },
+                {
+                    "name": "frame",
+                    "in": "query",
+                    "required": False,
+                    "schema": {
+                        "type": "string",
+                        "enum": ["single", "batch", "columnar"],
+                        "default": "single",
+                        "title": "Frame format",
+                    },
+                },
             ],
         }
     }
@@ -3,6 +3,17 @@ import os
 BINANCE_API_URL = os.getenv("BINANCE_API_BASE_URL", "https://api.binance.com")
 KRAKEN_API_URL = os.getenv("KRAKEN_API_BASE_URL", "https://api.kraken.com")
 
+EXCHANGE_HTTP_TIMEOUT = float(os.getenv("EXCHANGE_HTTP_TIMEOUT", 10.0))
+EXCHANGE_HTTP_CONNECT_TIMEOUT = float(os.getenv("EXCHANGE_HTTP_CONNECT_TIMEOUT", 5.0))
+EXCHANGE_HTTP_MAX_CONNECTIONS = int(os.getenv("EXCHANGE_HTTP_MAX_CONNECTIONS", 20))
+EXCHANGE_HTTP_MAX_KEEPALIVE_CONNECTIONS = int(
+    os.getenv("EXCHANGE_HTTP_MAX_KEEPALIVE_CONNECTIONS", 10)
+)
+EXCHANGE_HTTP_KEEPALIVE_EXPIRY = float(
+    os.getenv("EXCHANGE_HTTP_KEEPALIVE_EXPIRY", 30.0)
+)
+EXCHANGE_HTTP2 = os.getenv("EXCHANGE_HTTP2", "true").lower() == "true"
+
 CELERY_BROKER_USER = os.getenv("CELERY_BROKER_USER", "celery")
 CELERY_BROKER_PASSWORD = os.getenv("CELERY_BROKER_PASSWORD", "celery")
 CELERY_BROKER_HOST = os.getenv("CELERY_BROKER_HOST", "rabbitmq")
@@ -12,11 +23,73 @@ CELERY_BROKER_URL = f"amqp://{CELERY_BROKER_USER}:{CELERY_BROKER_PASSWORD}@{CELE
 
 CELERY_BACKEND_URL = os.getenv("CELERY_BACKEND_URL", "rpc://")
 
-BINANCE_INTERVAL = min(float(os.getenv("BINANCE_INTERVAL", 10.0)), 10.0)
-KRAKEN_INTERVAL = min(float(os.getenv("KRAKEN_INTERVAL", 10.0)), 10.0)
+EXCHANGES_INTERVAL = min(float(os.getenv("EXCHANGES_INTERVAL", 10.0)), 10.0)
+EXCHANGE_CATALOG_TTL = float(os.getenv("EXCHANGE_CATALOG_TTL", 60.0))
+PRICES_PARTITION_INTERVAL = os.getenv("PRICES_PARTITION_INTERVAL", "month").lower()
+PRICES_PARTITION_PREMAKE = int(os.getenv("PRICES_PARTITION_PREMAKE", 3))
+PRICES_PARTITION_CHECK_INTERVAL = float(
+    os.getenv("PRICES_PARTITION_CHECK_INTERVAL", 3600.0)
+)
+PRICES_RETENTION_DAYS = int(os.getenv("PRICES_RETENTION_DAYS", 30))
+PRICES_RETENTION_DROP_PARTITIONS = (
+    os.getenv("PRICES_RETENTION_DROP_PARTITIONS", "true").lower() == "true"
+)
+PRICE_CANDLES_MINUTE_RETENTION_DAYS = int(
+    os.getenv("PRICE_CANDLES_MINUTE_RETENTION_DAYS", 90)
+)
+PRICE_CANDLES_HOUR_RETENTION_DAYS = int(
+    os.getenv("PRICE_CANDLES_HOUR_RETENTION_DAYS", 730)
+)
+PRICE_CANDLES_DAY_RETENTION_DAYS = int(os.getenv("PRICE_CANDLES_DAY_RETENTION_DAYS", 0))
+PRICES_RETENTION_CHECK_INTERVAL = float(
+    os.getenv("PRICES_RETENTION_CHECK_INTERVAL", 3600.0)
+)
+PRICES_ARCHIVE_PATH = os.getenv("PRICES_ARCHIVE_PATH", "/data/prices_archive")
+PRICES_ARCHIVE_COMPRESSION = os.getenv("PRICES_ARCHIVE_COMPRESSION", "zstd").lower()
+PRICES_ARCHIVE_MAX_DAYS = int(os.getenv("PRICES_ARCHIVE_MAX_DAYS", 31))
+PRICES_ARCHIVE_INTERVAL = float(os.getenv("PRICES_ARCHIVE_INTERVAL", 3600.0))
 
 DATABASE_URL = os.getenv(
     "DATABASE_URL", "postgresql://database:database@db:5432/database"
 )
+ASYNC_DATABASE_URL = os.getenv(
+    "ASYNC_DATABASE_URL",
+    DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1),
+)
+DATABASE_POOL_SIZE = int(os.getenv("DATABASE_POOL_SIZE", 5))
+DATABASE_MAX_OVERFLOW = int(os.getenv("DATABASE_MAX_OVERFLOW", 10))
+DATABASE_POOL_TIMEOUT = float(os.getenv("DATABASE_POOL_TIMEOUT", 30.0))
+DATABASE_POOL_RECYCLE = int(os.getenv("DATABASE_POOL_RECYCLE", 1800))
+DATABASE_POOL_PRE_PING = os.getenv("DATABASE_POOL_PRE_PING", "true").lower() == "true"
+DATABASE_STATEMENT_TIMEOUT = int(os.getenv("DATABASE_STATEMENT_TIMEOUT", 0))
+DATABASE_SLOW_CHECKOUT = float(os.getenv("DATABASE_SLOW_CHECKOUT", 1.0))
 
 PRICE_WEBSOCKET_INTERVAL = float(os.getenv("PRICE_WEBSOCKET_INTERVAL", 0.25))
+PRICE_WEBSOCKET_MAX_PENDING_BATCHES = int(
+    os.getenv("PRICE_WEBSOCKET_MAX_PENDING_BATCHES", 100)
+)
+PRICE_WEBSOCKET_OVERLAP = int(os.getenv("PRICE_WEBSOCKET_OVERLAP", 1000))
+LATEST_PRICES_REFRESH_INTERVAL = float(os.getenv("LATEST_PRICES_REFRESH_INTERVAL", 1.0))
+LATEST_PRICES_REFRESH_OVERLAP = int(os.getenv("LATEST_PRICES_REFRESH_OVERLAP", 1000))
+PRICES_BUFFER_WINDOW_MINUTES = int(os.getenv("PRICES_BUFFER_WINDOW_MINUTES", 60))
+PRICES_BUFFER_CAPACITY = int(os.getenv("PRICES_BUFFER_CAPACITY", 10000))
+PRICES_BUFFER_SETTLE_DELAY = float(os.getenv("PRICES_BUFFER_SETTLE_DELAY", 15.0))
+
+PRICES_PAGE_MAX_LIMIT = int(os.getenv("PRICES_PAGE_MAX_LIMIT", 10000))
+PRICE_CANDLES_AUTO_POINTS = int(os.getenv("PRICE_CANDLES_AUTO_POINTS", 1000))
+PRICE_CANDLES_MAX_POINTS = int(os.getenv("PRICE_CANDLES_MAX_POINTS", 10000))
+PRICES_BATCH_MAX_TICKERS = int(os.getenv("PRICES_BATCH_MAX_TICKERS", 50))
+PRICES_CLOSED_RANGE_MAX_AGE = int(os.getenv("PRICES_CLOSED_RANGE_MAX_AGE", 86400))
+CATALOG_VERSION_TTL = float(os.getenv("CATALOG_VERSION_TTL", 30.0))
+
+COMPRESSION_MINIMUM_SIZE = int(os.getenv("COMPRESSION_MINIMUM_SIZE", 1024))
+COMPRESSION_ENCODINGS = [
+    encoding.strip().lower()
+    for encoding in os.getenv("COMPRESSION_ENCODINGS", "zstd,gzip,br").split(",")
+    if encoding.strip()
+]
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", 6))
+COMPRESSION_BROTLI_LEVEL = int(os.getenv("COMPRESSION_BROTLI_LEVEL", 4))
+COMPRESSION_ZSTD_LEVEL = int(os.getenv("COMPRESSION_ZSTD_LEVEL", 1))
+
+STARTUP_WARMUP = os.getenv("STARTUP_WARMUP", "true").lower() == "true"
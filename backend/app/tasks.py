@@ -1,11 +1,18 @@
+import asyncio
+from typing import Any, Coroutine
+
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
 from celery.utils.log import get_task_logger
 
 from app.settings import (
     CELERY_BROKER_URL,
     CELERY_BACKEND_URL,
-    BINANCE_INTERVAL,
-    KRAKEN_INTERVAL,
+    EXCHANGES_INTERVAL,
+    PRICES_ARCHIVE_INTERVAL,
+    PRICES_PARTITION_CHECK_INTERVAL,
+    PRICES_RETENTION_CHECK_INTERVAL,
+    STARTUP_WARMUP,
 )
 
 celery_app = Celery(
@@ -17,34 +24,143 @@ celery_app = Celery(
 celery_app.conf.timezone = "UTC"
 
 celery_app.conf.beat_schedule = {
-    "fetch-binance-prices": {
-        "task": "app.tasks.fetch_and_store_binance_cripto_prices",
-        "schedule": BINANCE_INTERVAL,
+    "fetch-exchanges-prices": {
+        "task": "app.tasks.fetch_and_store_all_cripto_prices",
+        "schedule": EXCHANGES_INTERVAL,
+    },
+    "create-price-partitions": {
+        "task": "app.tasks.create_price_partitions",
+        "schedule": PRICES_PARTITION_CHECK_INTERVAL,
+    },
+    "apply-price-retention": {
+        "task": "app.tasks.apply_price_retention",
+        "schedule": PRICES_RETENTION_CHECK_INTERVAL,
     },
-    "fetch-kraken-prices": {
-        "task": "app.tasks.fetch_and_store_kraken_cripto_prices",
-        "schedule": KRAKEN_INTERVAL,
+    "archive-prices": {
+        "task": "app.tasks.archive_prices",
+        "schedule": PRICES_ARCHIVE_INTERVAL,
     },
 }
 
 task_logger = get_task_logger(__name__)
 
+worker_event_loop: None | asyncio.AbstractEventLoop = None
+
+
+def run_in_worker_event_loop(coroutine: Coroutine[Any, Any, Any]) -> Any:
+    global worker_event_loop
+
+    if worker_event_loop is None or worker_event_loop.is_closed():
+        worker_event_loop = asyncio.new_event_loop()
+
+    return worker_event_loop.run_until_complete(coroutine)
+
+
+@worker_process_init.connect
+def warm_worker(**kwargs) -> None:
+    if not STARTUP_WARMUP:
+        return
+
+    from app.dependency_injection_factories.entrypoints.tasks.apply_price_retention_handler_factory import (
+        ApplyPriceRetentionHandlerFactory,
+    )
+    from app.dependency_injection_factories.entrypoints.tasks.archive_prices_handler_factory import (
+        ArchivePricesHandlerFactory,
+    )
+    from app.dependency_injection_factories.entrypoints.tasks.create_price_partitions_handler_factory import (
+        CreatePricePartitionsHandlerFactory,
+    )
+    from app.dependency_injection_factories.entrypoints.tasks.fetch_all_prices_handler_factory import (
+        FetchAllPricesHandlerFactory,
+    )
+    from app.entrypoints.startup_warmup import StartupWarmup
+
+    startup_warmup = StartupWarmup(
+        task_logger,
+        [
+            FetchAllPricesHandlerFactory.create,
+            CreatePricePartitionsHandlerFactory.create,
+            ApplyPriceRetentionHandlerFactory.create,
+            ArchivePricesHandlerFactory.create,
+        ],
+    )
+    startup_warmup.preload_handlers()
+    startup_warmup.configure_mappers()
+    startup_warmup.connect_database()
+    run_in_worker_event_loop(startup_warmup.connect_async_database())
+
+
+@worker_process_shutdown.connect
+def close_worker_http_clients(**kwargs) -> None:
+    from app.dependency_injection_factories.infrastructure.exchange.clients.async_http_client_factory import (
+        AsyncHttpClientFactory,
+    )
+    from app.dependency_injection_factories.infrastructure.exchange.clients.http_client_factory import (
+        HttpClientFactory,
+    )
+
+    HttpClientFactory.close()
+
+    if worker_event_loop is not None and not worker_event_loop.is_closed():
+        worker_event_loop.run_until_complete(AsyncHttpClientFactory.close())
+        worker_event_loop.close()
+
+
+@celery_app.task
+def fetch_and_store_all_cripto_prices():
+    from app.dependency_injection_factories.entrypoints.tasks.fetch_all_prices_handler_factory import (
+        FetchAllPricesHandlerFactory,
+    )
+
+    task_handler = FetchAllPricesHandlerFactory.create()
+    run_in_worker_event_loop(task_handler.handle())
+
 
 @celery_app.task
 def fetch_and_store_binance_cripto_prices():
-    from app.entrypoints.tasks.fetch_binance_prices_handler import (
-        FetchBinancePricesHandler,
+    from app.dependency_injection_factories.entrypoints.tasks.fetch_binance_prices_handler_factory import (
+        FetchBinancePricesHandlerFactory,
     )
 
-    task_handler = FetchBinancePricesHandler()
+    task_handler = FetchBinancePricesHandlerFactory.create()
     task_handler.handle()
 
 
 @celery_app.task
 def fetch_and_store_kraken_cripto_prices():
-    from app.entrypoints.tasks.fetch_kraken_prices_handler import (
-        FetchKrakenPricesHandler,
+    from app.dependency_injection_factories.entrypoints.tasks.fetch_kraken_prices_handler_factory import (
+        FetchKrakenPricesHandlerFactory,
+    )
+
+    task_handler = FetchKrakenPricesHandlerFactory.create()
+    task_handler.handle()
+
+
+@celery_app.task
+def create_price_partitions():
+    from app.dependency_injection_factories.entrypoints.tasks.create_price_partitions_handler_factory import (
+        CreatePricePartitionsHandlerFactory,
+    )
+
+    task_handler = CreatePricePartitionsHandlerFactory.create()
+    task_handler.handle()
+
+
+@celery_app.task
+def apply_price_retention():
+    from app.dependency_injection_factories.entrypoints.tasks.apply_price_retention_handler_factory import (
+        ApplyPriceRetentionHandlerFactory,
+    )
+
+    task_handler = ApplyPriceRetentionHandlerFactory.create()
+    task_handler.handle()
+
+
+@celery_app.task
+def archive_prices():
+    from app.dependency_injection_factories.entrypoints.tasks.archive_prices_handler_factory import (
+        ArchivePricesHandlerFactory,
     )
 
-    task_handler = FetchKrakenPricesHandler()
+    task_handler = ArchivePricesHandlerFactory.create()
     task_handler.handle()
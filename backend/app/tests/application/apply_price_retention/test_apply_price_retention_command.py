@@ -0,0 +1,161 @@
+from datetime import datetime, timedelta
+from unittest import TestCase
+from unittest.mock import Mock, call
+
+from app.application.apply_price_retention.apply_price_retention_command import (
+    ApplyPriceRetentionCommand,
+)
+from app.domain.crypto.models.candle_interval import CandleInterval
+from app.domain.crypto.models.price_partition_interval import (
+    PricePartitionInterval,
+)
+from app.domain.crypto.models.ticker import Ticker
+from app.domain.crypto.repositories.price_archive_repository import (
+    PriceArchiveRepository,
+)
+from app.domain.crypto.repositories.price_partition_repository import (
+    PricePartitionRepository,
+)
+from app.domain.crypto.repositories.price_repository import PriceRepository
+from app.domain.crypto.repositories.ticker_repository import TickerRepository
+
+
+class TestApplyPriceRetentionCommand(TestCase):
+    def setUp(self) -> None:
+        self.price_partition_repository = Mock(spec=PricePartitionRepository)
+        self.price_repository = Mock(spec=PriceRepository)
+        self.ticker_repository = Mock(spec=TickerRepository)
+        self.price_archive_repository = Mock(spec=PriceArchiveRepository)
+        self.ticker_repository.get_all.return_value = [
+            Ticker(id=1, symbol_id=1, exchange_id=1, ticker="BTCUSDT"),
+            Ticker(id=2, symbol_id=2, exchange_id=1, ticker="ETHUSDT"),
+        ]
+        self.price_archive_repository.get_archive_end_by_ticker_id.return_value = (
+            datetime(2025, 11, 2)
+        )
+        self.price_repository.get_timestamp_range_by_ticker_id.side_effect = (
+            lambda ticker_id, start_date, end_date: (start_date, end_date)
+        )
+        self.price_partition_repository.get_partition_start_dates.return_value = [
+            datetime(2025, 9, 1),
+            datetime(2025, 10, 1),
+            datetime(2025, 11, 1),
+            datetime(2025, 12, 1),
+        ]
+
+    def test_execute(self) -> None:
+        self.price_partition_repository.remove_partition.side_effect = [True, False]
+        self.price_repository.delete_candles_before.side_effect = [120, 4]
+        command = ApplyPriceRetentionCommand(
+            self.price_partition_repository,
+            self.price_repository,
+            self.ticker_repository,
+            self.price_archive_repository,
+            PricePartitionInterval.MONTH,
+            30,
+            {
+                CandleInterval.ONE_MINUTE: 90,
+                CandleInterval.ONE_HOUR: 365,
+                CandleInterval.ONE_DAY: 0,
+            },
+            True,
+        )
+
+        result = command.execute(datetime(2025, 12, 1, 12, 0))
+
+        self.assertEqual(result.removed_partitions, [datetime(2025, 9, 1)])
+        self.assertEqual(result.skipped_partitions, [])
+        self.assertEqual(
+            result.deleted_candles,
+            {CandleInterval.ONE_MINUTE: 120, CandleInterval.ONE_HOUR: 4},
+        )
+        self.price_partition_repository.remove_partition.assert_has_calls(
+            [
+                call(datetime(2025, 9, 1), True),
+                call(datetime(2025, 10, 1), True),
+            ]
+        )
+        self.assertEqual(self.price_partition_repository.remove_partition.call_count, 2)
+        self.price_repository.delete_candles_before.assert_has_calls(
+            [
+                call(CandleInterval.ONE_MINUTE, datetime(2025, 9, 2, 12, 0)),
+                call(CandleInterval.ONE_HOUR, datetime(2024, 12, 1, 12, 0)),
+            ]
+        )
+
+    def test_execute_detaching_partitions(self) -> None:
+        self.price_partition_repository.remove_partition.return_value = True
+        command = ApplyPriceRetentionCommand(
+            self.price_partition_repository,
+            self.price_repository,
+            self.ticker_repository,
+            self.price_archive_repository,
+            PricePartitionInterval.MONTH,
+            1,
+            {},
+            False,
+        )
+
+        result = command.execute(datetime(2025, 11, 2))
+
+        self.assertEqual(
+            result.removed_partitions, [datetime(2025, 9, 1), datetime(2025, 10, 1)]
+        )
+        self.price_partition_repository.remove_partition.assert_has_calls(
+            [
+                call(datetime(2025, 9, 1), False),
+                call(datetime(2025, 10, 1), False),
+            ]
+        )
+        self.price_repository.delete_candles_before.assert_not_called()
+
+    def test_execute_without_prices_retention(self) -> None:
+        command = ApplyPriceRetentionCommand(
+            self.price_partition_repository,
+            self.price_repository,
+            self.ticker_repository,
+            self.price_archive_repository,
+            PricePartitionInterval.MONTH,
+            0,
+            {CandleInterval.ONE_MINUTE: 0},
+            True,
+        )
+
+        result = command.execute()
+
+        self.assertEqual(result.removed_partitions, [])
+        self.assertEqual(result.deleted_candles, {})
+        self.price_partition_repository.get_partition_start_dates.assert_not_called()
+        self.price_repository.delete_candles_before.assert_not_called()
+
+    def test_execute_skipping_partitions_not_archived(self) -> None:
+        self.price_partition_repository.remove_partition.return_value = True
+        self.price_archive_repository.get_archive_end_by_ticker_id.side_effect = [
+            datetime(2025, 11, 2),
+            datetime(2025, 9, 15),
+        ]
+        self.price_repository.get_timestamp_range_by_ticker_id.side_effect = (
+            lambda ticker_id, start_date, end_date: (
+                None
+                if start_date == datetime(2025, 10, 1) and ticker_id == 2
+                else (start_date, end_date - timedelta(seconds=1))
+            )
+        )
+        command = ApplyPriceRetentionCommand(
+            self.price_partition_repository,
+            self.price_repository,
+            self.ticker_repository,
+            self.price_archive_repository,
+            PricePartitionInterval.MONTH,
+            1,
+            {},
+            True,
+        )
+
+        result = command.execute(datetime(2025, 11, 2))
+
+        self.assertEqual(result.removed_partitions, [datetime(2025, 10, 1)])
+        self.assertEqual(result.skipped_partitions, [datetime(2025, 9, 1)])
+        self.price_partition_repository.remove_partition.assert_called_once_with(
+            datetime(2025, 10, 1), True
+        )
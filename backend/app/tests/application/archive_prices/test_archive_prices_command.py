@@ -0,0 +1,161 @@
+from datetime import date, datetime
+from unittest import TestCase
+from unittest.mock import Mock, call
+
+from app.application.archive_prices.archive_prices_command import (
+    ArchivePricesCommand,
+)
+from app.domain.crypto.models.price import Price
+from app.domain.crypto.models.ticker import Ticker
+from app.domain.crypto.repositories.price_archive_repository import (
+    PriceArchiveRepository,
+)
+from app.domain.crypto.repositories.price_repository import PriceRepository
+from app.domain.crypto.repositories.ticker_repository import TickerRepository
+
+
+class TestArchivePricesCommand(TestCase):
+    def setUp(self) -> None:
+        self.ticker_repository = Mock(spec=TickerRepository)
+        self.price_repository = Mock(spec=PriceRepository)
+        self.price_archive_repository = Mock(spec=PriceArchiveRepository)
+        self.ticker_repository.get_all.return_value = [
+            Ticker(id=1, ticker="BTCUSDT", symbol_id=1, exchange_id=1),
+            Ticker(id=2, ticker="BTCEUR", symbol_id=1, exchange_id=1),
+        ]
+        self.prices = [
+            Price(id=1, ticker_id=1, price=10.0, timestamp=datetime(2020, 1, 1, 10))
+        ]
+
+        self.command = ArchivePricesCommand(
+            self.ticker_repository,
+            self.price_repository,
+            self.price_archive_repository,
+            2,
+        )
+
+    def test_execute(self) -> None:
+        self.price_archive_repository.get_archive_end_by_ticker_id.side_effect = [
+            None,
+            datetime(2020, 1, 3),
+        ]
+        self.price_repository.get_timestamp_range_by_ticker_id.side_effect = [
+            (datetime(2020, 1, 1, 10), datetime(2020, 1, 3, 10)),
+            (datetime(2020, 1, 3, 10), datetime(2020, 1, 3, 10)),
+        ]
+        self.price_repository.get_all_or_fail_by_ticker_id.side_effect = [
+            self.prices,
+            [],
+        ]
+
+        result = self.command.execute(datetime(2020, 1, 3, 12))
+
+        self.assertEqual(result.archived_days, {1: [date(2020, 1, 1)]})
+        self.price_repository.get_all_or_fail_by_ticker_id.assert_has_calls(
+            [
+                call(
+                    1,
+                    datetime(2020, 1, 1),
+                    datetime(2020, 1, 2),
+                    include_end=False,
+                    check_ticker=False,
+                ),
+                call(
+                    1,
+                    datetime(2020, 1, 2),
+                    datetime(2020, 1, 3),
+                    include_end=False,
+                    check_ticker=False,
+                ),
+            ]
+        )
+        self.assertEqual(
+            self.price_repository.get_all_or_fail_by_ticker_id.call_count, 2
+        )
+        self.price_archive_repository.save.assert_called_once_with(
+            1, date(2020, 1, 1), self.prices
+        )
+        self.price_repository.get_timestamp_range_by_ticker_id.assert_called_with(
+            1, datetime(2020, 1, 3), None
+        )
+
+    def test_execute_limits_days_per_run(self) -> None:
+        self.price_archive_repository.get_archive_end_by_ticker_id.side_effect = [
+            datetime(2020, 1, 1),
+            None,
+        ]
+        self.price_repository.get_timestamp_range_by_ticker_id.return_value = None
+        self.price_repository.get_all_or_fail_by_ticker_id.return_value = self.prices
+
+        result = self.command.execute(datetime(2020, 2, 1))
+
+        self.assertEqual(
+            result.archived_days, {1: [date(2020, 1, 1), date(2020, 1, 2)]}
+        )
+        self.assertEqual(self.price_archive_repository.save.call_count, 2)
+
+    def test_execute_skips_gaps_longer_than_a_run(self) -> None:
+        self.price_archive_repository.get_archive_end_by_ticker_id.side_effect = [
+            datetime(2026, 1, 2),
+            None,
+        ]
+        self.price_repository.get_timestamp_range_by_ticker_id.side_effect = [
+            (datetime(2026, 3, 10, 8), datetime(2026, 3, 11, 8)),
+            None,
+        ]
+        self.price_repository.get_all_or_fail_by_ticker_id.side_effect = [
+            [],
+            self.prices,
+            self.prices,
+        ]
+
+        result = self.command.execute(datetime(2026, 3, 20))
+
+        self.assertEqual(
+            result.archived_days, {1: [date(2026, 3, 10), date(2026, 3, 11)]}
+        )
+        self.price_repository.get_timestamp_range_by_ticker_id.assert_has_calls(
+            [call(1, datetime(2026, 1, 3), None), call(2, None, None)]
+        )
+        self.assertEqual(
+            [
+                call(
+                    1,
+                    datetime(2026, 1, 2),
+                    datetime(2026, 1, 3),
+                    include_end=False,
+                    check_ticker=False,
+                ),
+                call(
+                    1,
+                    datetime(2026, 3, 10),
+                    datetime(2026, 3, 11),
+                    include_end=False,
+                    check_ticker=False,
+                ),
+                call(
+                    1,
+                    datetime(2026, 3, 11),
+                    datetime(2026, 3, 12),
+                    include_end=False,
+                    check_ticker=False,
+                ),
+            ],
+            self.price_repository.get_all_or_fail_by_ticker_id.call_args_list,
+        )
+
+    def test_execute_stops_without_later_prices(self) -> None:
+        self.price_archive_repository.get_archive_end_by_ticker_id.side_effect = [
+            datetime(2020, 1, 1),
+            datetime(2020, 2, 1),
+        ]
+        self.price_repository.get_timestamp_range_by_ticker_id.return_value = None
+        self.price_repository.get_all_or_fail_by_ticker_id.return_value = []
+
+        result = self.command.execute(datetime(2020, 2, 1))
+
+        self.assertEqual(result.archived_days, {})
+        self.assertEqual(
+            self.price_repository.get_all_or_fail_by_ticker_id.call_count, 1
+        )
+        self.price_archive_repository.save.assert_not_called()
@@ -0,0 +1,70 @@
+from datetime import datetime
+from unittest import TestCase
+from unittest.mock import Mock, call
+
+from app.application.create_price_partitions.create_price_partitions_command import (
+    CreatePricePartitionsCommand,
+)
+from app.domain.crypto.models.price_partition_interval import (
+    PricePartitionInterval,
+)
+from app.domain.crypto.repositories.price_partition_repository import (
+    PricePartitionRepository,
+)
+
+
+class TestCreatePricePartitionsCommand(TestCase):
+    def setUp(self) -> None:
+        self.price_partition_repository = Mock(spec=PricePartitionRepository)
+
+    def test_execute_monthly(self) -> None:
+        self.price_partition_repository.create_partition.side_effect = [
+            False,
+            True,
+            True,
+        ]
+        command = CreatePricePartitionsCommand(
+            self.price_partition_repository, PricePartitionInterval.MONTH, 2
+        )
+
+        result = command.execute(datetime(2025, 11, 15, 10, 30))
+
+        self.assertEqual(
+            result.created_partitions, [datetime(2025, 12, 1), datetime(2026, 1, 1)]
+        )
+        self.price_partition_repository.create_partition.assert_has_calls(
+            [
+                call(datetime(2025, 11, 1), datetime(2025, 12, 1)),
+                call(datetime(2025, 12, 1), datetime(2026, 1, 1)),
+                call(datetime(2026, 1, 1), datetime(2026, 2, 1)),
+            ]
+        )
+
+    def test_execute_daily(self) -> None:
+        self.price_partition_repository.create_partition.return_value = True
+        command = CreatePricePartitionsCommand(
+            self.price_partition_repository, PricePartitionInterval.DAY, 1
+        )
+
+        result = command.execute(datetime(2025, 12, 31, 23, 59))
+
+        self.assertEqual(
+            result.created_partitions, [datetime(2025, 12, 31), datetime(2026, 1, 1)]
+        )
+        self.price_partition_repository.create_partition.assert_has_calls(
+            [
+                call(datetime(2025, 12, 31), datetime(2026, 1, 1)),
+                call(datetime(2026, 1, 1), datetime(2026, 1, 2)),
+            ]
+        )
+
+    def test_execute_without_instant(self) -> None:
+        self.price_partition_repository.create_partition.return_value = False
+        command = CreatePricePartitionsCommand(
+            self.price_partition_repository, PricePartitionInterval.MONTH, 0
+        )
+
+        result = command.execute()
+
+        self.assertEqual(result.created_partitions, [])
+        self.price_partition_repository.create_partition.assert_called_once()
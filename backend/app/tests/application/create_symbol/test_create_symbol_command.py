@@ -1,4 +1,4 @@
-from unittest import TestCase
+from unittest import IsolatedAsyncioTestCase
 from unittest.mock import Mock
 
 from app.application.create_symbol.create_symbol_command import CreateSymbolCommand
@@ -6,21 +6,23 @@ from app.application.create_symbol.create_symbol_command_response import (
     CreateSymbolCommandResponse,
 )
 from app.domain.crypto.models.symbol import Symbol
-from app.domain.crypto.repositories.symbol_repository import SymbolRepository
+from app.domain.crypto.repositories.async_symbol_repository import (
+    AsyncSymbolRepository,
+)
 
 
-class TestCreateSymbolCommand(TestCase):
+class TestCreateSymbolCommand(IsolatedAsyncioTestCase):
     def setUp(self) -> None:
-        self.symbol_repository = Mock(spec=SymbolRepository)
+        self.symbol_repository = Mock(spec=AsyncSymbolRepository)
 
         self.command = CreateSymbolCommand(self.symbol_repository)
 
-    def test_execute(self) -> None:
+    async def test_execute(self) -> None:
         symbol = Symbol(name="Ethereum", symbol="ETH")
         created_symbol = Symbol(id=2, name="Ethereum", symbol="ETH")
         self.symbol_repository.insert.return_value = created_symbol
 
-        result = self.command.execute(symbol)
+        result = await self.command.execute(symbol)
 
         self.assertEqual(
             CreateSymbolCommandResponse(created_symbol=created_symbol), result
@@ -1,4 +1,4 @@
-from unittest import TestCase
+from unittest import IsolatedAsyncioTestCase
 from unittest.mock import Mock
 
 from app.application.create_ticker.create_ticker_command import CreateTickerCommand
@@ -6,21 +6,23 @@ from app.application.create_ticker.create_ticker_command_response import (
     CreateTickerCommandResponse,
 )
 from app.domain.crypto.models.ticker import Ticker
-from app.domain.crypto.repositories.ticker_repository import TickerRepository
+from app.domain.crypto.repositories.async_ticker_repository import (
+    AsyncTickerRepository,
+)
 
 
-class TestCreateTickerCommand(TestCase):
+class TestCreateTickerCommand(IsolatedAsyncioTestCase):
     def setUp(self) -> None:
-        self.ticker_repository = Mock(spec=TickerRepository)
+        self.ticker_repository = Mock(spec=AsyncTickerRepository)
 
         self.command = CreateTickerCommand(self.ticker_repository)
 
-    def test_execute(self) -> None:
+    async def test_execute(self) -> None:
         ticker = Ticker(ticker="ETHEUR", symbol_id=1, exchange_id=1)
         created_ticker = Ticker(id=1, ticker="ETHEUR", symbol_id=1, exchange_id=1)
         self.ticker_repository.insert.return_value = created_ticker
 
-        result = self.command.execute(ticker)
+        result = await self.command.execute(ticker)
 
         self.assertEqual(
             CreateTickerCommandResponse(created_ticker=created_ticker), result
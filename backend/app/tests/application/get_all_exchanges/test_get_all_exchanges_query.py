@@ -1,4 +1,4 @@
-from unittest import TestCase
+from unittest import IsolatedAsyncioTestCase
 from unittest.mock import Mock
 
 from app.application.get_all_exchanges.get_all_exchanges_query import (
@@ -8,20 +8,22 @@ from app.application.get_all_exchanges.get_all_exchanges_query_response import (
     GetAllExchangesQueryResponse,
 )
 from app.domain.exchange.models.exchange import Exchange
-from app.domain.exchange.repositories.exchange_repository import ExchangeRepository
+from app.domain.exchange.repositories.async_exchange_repository import (
+    AsyncExchangeRepository,
+)
 
 
-class TestGetAllExchangesQuery(TestCase):
+class TestGetAllExchangesQuery(IsolatedAsyncioTestCase):
     def setUp(self) -> None:
-        self.exchange_repository = Mock(spec=ExchangeRepository)
+        self.exchange_repository = Mock(spec=AsyncExchangeRepository)
 
         self.query = GetAllExchangesQuery(self.exchange_repository)
 
-    def test_execute(self) -> None:
+    async def test_execute(self) -> None:
         exchanges = [Exchange(id=1, name="Binance"), Exchange(id=2, name="Kraken")]
         self.exchange_repository.get_all.return_value = exchanges
 
-        result = self.query.execute()
+        result = await self.query.execute()
 
         self.assertEqual(result, GetAllExchangesQueryResponse(exchanges=exchanges))
         self.exchange_repository.get_all.assert_called_once()
@@ -0,0 +1,37 @@
+from datetime import datetime
+from unittest import TestCase
+from unittest.mock import Mock
+
+from app.application.get_all_prices_by_ticker_ids.get_all_prices_by_ticker_ids_query import (
+    GetAllPricesByTickerIdsQuery,
+)
+from app.application.get_all_prices_by_ticker_ids.get_all_prices_by_ticker_ids_query_response import (
+    GetAllPricesByTickerIdsQueryResponse,
+)
+from app.domain.crypto.models.price import Price
+from app.domain.crypto.repositories.price_repository import PriceRepository
+
+
+class TestGetAllPricesByTickerIdsQuery(TestCase):
+    def setUp(self) -> None:
+        self.price_repository = Mock(spec=PriceRepository)
+
+        self.query = GetAllPricesByTickerIdsQuery(self.price_repository)
+
+    def test_execute(self):
+        start_date = datetime(2010, 1, 1)
+        end_date = datetime(2020, 1, 1)
+        prices = iter(
+            [Price(id=1, price=1.0, ticker_id=1, timestamp=datetime(2013, 1, 1))]
+        )
+        self.price_repository.stream_all_or_fail_by_ticker_ids.return_value = prices
+
+        response = self.query.execute([1, 2], start_date, end_date)
+
+        self.assertEqual(
+            GetAllPricesByTickerIdsQueryResponse(ticker_ids=[1, 2], prices=prices),
+            response,
+        )
+        self.price_repository.stream_all_or_fail_by_ticker_ids.assert_called_once_with(
+            [1, 2], start_date, end_date
+        )
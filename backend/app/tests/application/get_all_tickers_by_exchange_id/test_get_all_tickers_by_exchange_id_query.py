@@ -1,4 +1,4 @@
-from unittest import TestCase
+from unittest import IsolatedAsyncioTestCase
 from unittest.mock import Mock
 
 from app.application.get_all_tickers_by_exchange_id.get_all_tickers_by_exchange_id_query import (
@@ -8,23 +8,25 @@ from app.application.get_all_tickers_by_exchange_id.get_all_tickers_by_exchange_
     GetAllTickersByExchangeIdQueryResponse,
 )
 from app.domain.crypto.models.ticker import Ticker
-from app.domain.crypto.repositories.ticker_repository import TickerRepository
+from app.domain.crypto.repositories.async_ticker_repository import (
+    AsyncTickerRepository,
+)
 
 
-class TestGetAllTickersByExchangeIdQuery(TestCase):
+class TestGetAllTickersByExchangeIdQuery(IsolatedAsyncioTestCase):
     def setUp(self) -> None:
-        self.ticker_repository = Mock(spec=TickerRepository)
+        self.ticker_repository = Mock(spec=AsyncTickerRepository)
 
         self.query = GetAllTickersByExchangeIdQuery(self.ticker_repository)
 
-    def test_execute(self) -> None:
+    async def test_execute(self) -> None:
         tickers = [
             Ticker(id=1, symbol_id=1, exchange_id=1, ticker="BTCUSDT"),
             Ticker(id=2, symbol_id=1, exchange_id=1, ticker="BTCEUR"),
         ]
         self.ticker_repository.get_all_or_fail_by_exchange_id.return_value = tickers
 
-        result = self.query.execute(1)
+        result = await self.query.execute(1)
 
         self.assertEqual(
             GetAllTickersByExchangeIdQueryResponse(tickers=tickers), result
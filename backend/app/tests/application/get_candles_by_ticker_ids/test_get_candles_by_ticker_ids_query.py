@@ -0,0 +1,102 @@
+from datetime import datetime, timezone
+from unittest import TestCase
+from unittest.mock import Mock
+
+from app.application.get_candles_by_ticker_ids.get_candles_by_ticker_ids_query import (
+    GetCandlesByTickerIdsQuery,
+)
+from app.application.get_candles_by_ticker_ids.get_candles_by_ticker_ids_query_response import (
+    GetCandlesByTickerIdsQueryResponse,
+)
+from app.domain.crypto.models.candle import Candle
+from app.domain.crypto.models.candle_interval import CandleInterval
+from app.domain.crypto.repositories.price_repository import PriceRepository
+
+
+class TestGetCandlesByTickerIdsQuery(TestCase):
+    def setUp(self) -> None:
+        self.price_repository = Mock(spec=PriceRepository)
+        self.candles = {
+            1: [
+                Candle(
+                    ticker_id=1,
+                    timestamp=datetime(2020, 1, 1),
+                    open=1.0,
+                    high=2.0,
+                    low=0.5,
+                    close=1.5,
+                    count=3,
+                )
+            ],
+            2: [],
+        }
+        self.price_repository.get_candles_or_fail_by_ticker_ids.return_value = (
+            self.candles
+        )
+
+        self.query = GetCandlesByTickerIdsQuery(self.price_repository, 100)
+
+    def test_execute(self) -> None:
+        start_date = datetime(2020, 1, 1)
+        end_date = datetime(2020, 2, 1)
+
+        response = self.query.execute(
+            [1, 2], start_date, end_date, CandleInterval.FIVE_MINUTES
+        )
+
+        self.assertEqual(
+            GetCandlesByTickerIdsQueryResponse(
+                interval=CandleInterval.FIVE_MINUTES, candles=self.candles
+            ),
+            response,
+        )
+        self.price_repository.get_candles_or_fail_by_ticker_ids.assert_called_once_with(
+            [1, 2], start_date, end_date, CandleInterval.FIVE_MINUTES
+        )
+        self.price_repository.get_timestamp_range_by_ticker_ids.assert_not_called()
+
+    def test_execute_auto(self) -> None:
+        start_date = datetime(2020, 1, 1)
+        end_date = datetime(2020, 1, 2)
+
+        response = self.query.execute([1, 2], start_date, end_date, CandleInterval.AUTO)
+
+        self.assertEqual(CandleInterval.ONE_HOUR, response.interval)
+        self.price_repository.get_timestamp_range_by_ticker_ids.assert_not_called()
+
+    def test_execute_auto_open_range(self) -> None:
+        self.price_repository.get_timestamp_range_by_ticker_ids.return_value = (
+            datetime(2020, 1, 1),
+            datetime(2020, 1, 2),
+        )
+
+        response = self.query.execute([1, 2], None, None, CandleInterval.AUTO)
+
+        self.assertEqual(CandleInterval.ONE_HOUR, response.interval)
+        self.price_repository.get_timestamp_range_by_ticker_ids.assert_called_once_with(
+            [1, 2], None, None
+        )
+        self.price_repository.get_candles_or_fail_by_ticker_ids.assert_called_once_with(
+            [1, 2], None, None, CandleInterval.ONE_HOUR
+        )
+
+    def test_execute_auto_no_prices(self) -> None:
+        self.price_repository.get_timestamp_range_by_ticker_ids.return_value = None
+
+        response = self.query.execute([1, 2], None, None, CandleInterval.AUTO)
+
+        self.assertEqual(CandleInterval.ONE_MINUTE, response.interval)
+
+    def test_execute_auto_aware_start_date(self) -> None:
+        self.price_repository.get_timestamp_range_by_ticker_ids.return_value = (
+            datetime(2020, 1, 1),
+            datetime(2020, 1, 2),
+        )
+        start_date = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+        response = self.query.execute([1, 2], start_date, None, CandleInterval.AUTO)
+
+        self.assertEqual(CandleInterval.ONE_HOUR, response.interval)
+        self.price_repository.get_timestamp_range_by_ticker_ids.assert_called_once_with(
+            [1, 2], start_date, None
+        )
@@ -1,4 +1,4 @@
-from unittest import TestCase
+from unittest import IsolatedAsyncioTestCase
 from unittest.mock import Mock
 
 from app.application.get_exchange_by_id.get_exchange_by_id_query import (
@@ -8,20 +8,22 @@ from app.application.get_exchange_by_id.get_exchange_by_id_query_response import
     GetExchangeByIdQueryResponse,
 )
 from app.domain.exchange.models.exchange import Exchange
-from app.domain.exchange.repositories.exchange_repository import ExchangeRepository
+from app.domain.exchange.repositories.async_exchange_repository import (
+    AsyncExchangeRepository,
+)
 
 
-class TestGetExchangeByIdQuery(TestCase):
+class TestGetExchangeByIdQuery(IsolatedAsyncioTestCase):
     def setUp(self) -> None:
-        self.exchange_repository = Mock(spec=ExchangeRepository)
+        self.exchange_repository = Mock(spec=AsyncExchangeRepository)
 
         self.query = GetExchangeByIdQuery(self.exchange_repository)
 
-    def test_execute(self) -> None:
+    async def test_execute(self) -> None:
         exchange = Exchange(id=1, name="Binane")
         self.exchange_repository.get_or_fail_by_id.return_value = exchange
 
-        result = self.query.execute(1)
+        result = await self.query.execute(1)
 
         self.assertEqual(GetExchangeByIdQueryResponse(exchange=exchange), result)
         self.exchange_repository.get_or_fail_by_id.assert_called_with(1)
@@ -0,0 +1,30 @@
+from datetime import datetime
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import Mock
+
+from app.application.get_latest_prices.get_latest_prices_query import (
+    GetLatestPricesQuery,
+)
+from app.application.get_latest_prices.get_latest_prices_query_response import (
+    GetLatestPricesQueryResponse,
+)
+from app.domain.crypto.models.price import Price
+from app.domain.crypto.repositories.async_latest_price_repository import (
+    AsyncLatestPriceRepository,
+)
+
+
+class TestGetLatestPricesQuery(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.latest_price_repository = Mock(spec=AsyncLatestPriceRepository)
+
+        self.query = GetLatestPricesQuery(self.latest_price_repository)
+
+    async def test_execute(self) -> None:
+        prices = [Price(id=1, ticker_id=1, price=1.0, timestamp=datetime(2020, 1, 1))]
+        self.latest_price_repository.get_all.return_value = prices
+
+        result = await self.query.execute([1], [2])
+
+        self.assertEqual(GetLatestPricesQueryResponse(prices=prices), result)
+        self.latest_price_repository.get_all.assert_called_once_with([1], [2])
@@ -1,4 +1,4 @@
-from unittest import TestCase
+from unittest import IsolatedAsyncioTestCase
 from unittest.mock import Mock
 
 from app.application.get_symbol_by_id.get_symbol_by_id_query import GetSymbolByIdQuery
@@ -6,21 +6,23 @@ from app.application.get_symbol_by_id.get_symbol_by_id_query_response import (
     GetSymbolByIdQueryResponse,
 )
 from app.domain.crypto.models.symbol import Symbol
-from app.domain.crypto.repositories.symbol_repository import SymbolRepository
+from app.domain.crypto.repositories.async_symbol_repository import (
+    AsyncSymbolRepository,
+)
 
 
-class TestGetSymbolByIdQuery(TestCase):
+class TestGetSymbolByIdQuery(IsolatedAsyncioTestCase):
     def setUp(self) -> None:
-        self.symbol_repository = Mock(spec=SymbolRepository)
+        self.symbol_repository = Mock(spec=AsyncSymbolRepository)
 
         self.query = GetSymbolByIdQuery(self.symbol_repository)
 
-    def test_execute(self) -> None:
+    async def test_execute(self) -> None:
         symbol = Symbol(id=1, name="test", symbol="TST")
         self.symbol_repository.get_or_fail_by_id.return_value = symbol
         expected_response = GetSymbolByIdQueryResponse(symbol=symbol)
 
-        result = self.query.execute(1)
+        result = await self.query.execute(1)
 
         self.assertEqual(expected_response, result)
         self.symbol_repository.get_or_fail_by_id.assert_called_once_with(symbol.id)
@@ -1,4 +1,4 @@
-from unittest import TestCase
+from unittest import IsolatedAsyncioTestCase
 from unittest.mock import Mock
 
 from app.application.get_ticker_by_id.get_ticker_by_id_query import GetTickerByIdQuery
@@ -6,20 +6,22 @@ from app.application.get_ticker_by_id.get_ticker_by_id_query_response import (
     GetTickerByIdQueryResponse,
 )
 from app.domain.crypto.models.ticker import Ticker
-from app.domain.crypto.repositories.ticker_repository import TickerRepository
+from app.domain.crypto.repositories.async_ticker_repository import (
+    AsyncTickerRepository,
+)
 
 
-class TestGetTickerByIdQuery(TestCase):
+class TestGetTickerByIdQuery(IsolatedAsyncioTestCase):
     def setUp(self) -> None:
-        self.ticker_repository = Mock(spec=TickerRepository)
+        self.ticker_repository = Mock(spec=AsyncTickerRepository)
 
         self.query = GetTickerByIdQuery(self.ticker_repository)
 
-    def test_execute(self):
+    async def test_execute(self):
         ticker = Ticker(id=1, symbol_id=1, exchange_id=1, ticker="BTCUSDT")
         self.ticker_repository.get_or_fail_by_id.return_value = ticker
 
-        result = self.query.execute(1)
+        result = await self.query.execute(1)
 
         self.assertEqual(GetTickerByIdQueryResponse(ticker=ticker), result)
         self.ticker_repository.get_or_fail_by_id.assert_called_once_with(ticker.id)
@@ -0,0 +1,48 @@
+from datetime import datetime
+from unittest import TestCase
+from unittest.mock import Mock
+
+from app.application.stream_price_columns_by_ticker_id.stream_price_columns_by_ticker_id_query import (
+    StreamPriceColumnsByTickerIdQuery,
+)
+from app.application.stream_price_columns_by_ticker_id.stream_price_columns_by_ticker_id_query_response import (
+    StreamPriceColumnsByTickerIdQueryResponse,
+)
+from app.domain.crypto.models.price_columns import PriceColumns
+from app.domain.crypto.models.price_cursor import PriceCursor
+from app.domain.crypto.repositories.price_repository import PriceRepository
+
+
+class TestStreamPriceColumnsByTickerIdQuery(TestCase):
+    def setUp(self) -> None:
+        self.price_repository = Mock(spec=PriceRepository)
+
+        self.query = StreamPriceColumnsByTickerIdQuery(self.price_repository)
+
+    def test_execute(self):
+        start_date = datetime(2010, 1, 1)
+        end_date = datetime(2020, 1, 1)
+        after = PriceCursor(timestamp=datetime(2012, 1, 1), id=1)
+        price_columns = iter(
+            [
+                PriceColumns(
+                    ticker_id=1,
+                    ids=[2],
+                    prices=[2.0],
+                    timestamps=[datetime(2013, 1, 1)],
+                )
+            ]
+        )
+        self.price_repository.stream_columns_or_fail_by_ticker_id.return_value = (
+            price_columns
+        )
+
+        response = self.query.execute(1, start_date, end_date, after, 10)
+
+        self.assertEqual(
+            StreamPriceColumnsByTickerIdQueryResponse(price_columns=price_columns),
+            response,
+        )
+        self.price_repository.stream_columns_or_fail_by_ticker_id.assert_called_once_with(
+            1, start_date, end_date, after, 10
+        )
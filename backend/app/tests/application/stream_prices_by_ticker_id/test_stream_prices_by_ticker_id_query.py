@@ -0,0 +1,36 @@
+from datetime import datetime
+from unittest import TestCase
+from unittest.mock import Mock
+
+from app.application.stream_prices_by_ticker_id.stream_prices_by_ticker_id_query import (
+    StreamPricesByTickerIdQuery,
+)
+from app.application.stream_prices_by_ticker_id.stream_prices_by_ticker_id_query_response import (
+    StreamPricesByTickerIdQueryResponse,
+)
+from app.domain.crypto.models.price import Price
+from app.domain.crypto.models.price_cursor import PriceCursor
+from app.domain.crypto.repositories.price_repository import PriceRepository
+
+
+class TestStreamPricesByTickerIdQuery(TestCase):
+    def setUp(self) -> None:
+        self.price_repository = Mock(spec=PriceRepository)
+
+        self.query = StreamPricesByTickerIdQuery(self.price_repository)
+
+    def test_execute(self):
+        start_date = datetime(2010, 1, 1)
+        end_date = datetime(2020, 1, 1)
+        after = PriceCursor(timestamp=datetime(2012, 1, 1), id=1)
+        prices = iter(
+            [Price(id=2, price=2.0, ticker_id=1, timestamp=datetime(2013, 1, 1))]
+        )
+        self.price_repository.stream_all_or_fail_by_ticker_id.return_value = prices
+
+        response = self.query.execute(1, start_date, end_date, after, 10)
+
+        self.assertEqual(StreamPricesByTickerIdQueryResponse(prices=prices), response)
+        self.price_repository.stream_all_or_fail_by_ticker_id.assert_called_once_with(
+            1, start_date, end_date, after, 10
+        )
@@ -0,0 +1,108 @@
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import Mock, PropertyMock
+
+from httpx import ConnectTimeout
+
+from app.application.update_all_prices_from_remote.update_all_prices_from_remote_command import (
+    UpdateAllPricesFromRemoteCommand,
+)
+from app.domain.crypto.models.price import Price
+from app.domain.crypto.models.ticker import Ticker
+from app.domain.crypto.repositories.async_price_repository import (
+    AsyncPriceRepository,
+)
+from app.domain.exchange.clients.async_exchange_client import AsyncExchangeClient
+from app.domain.exchange.models.exchange import Exchange
+from app.domain.exchange.repositories.async_exchange_repository import (
+    AsyncExchangeRepository,
+)
+
+
+class TestUpdateAllPricesFromRemoteCommand(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.binance_tickers = [
+            Ticker(id=1, symbol_id=1, exchange_id=1, ticker="SOME"),
+            Ticker(id=2, symbol_id=2, exchange_id=1, ticker="OTHER"),
+        ]
+        self.kraken_tickers = [
+            Ticker(id=3, symbol_id=1, exchange_id=2, ticker="TICKER"),
+        ]
+        self.binance_client = self.__build_exchange_client("Binance")
+        self.kraken_client = self.__build_exchange_client("Kraken")
+        self.exchange_repository = Mock(spec=AsyncExchangeRepository)
+        self.price_repository = Mock(spec=AsyncPriceRepository)
+
+        self.command = UpdateAllPricesFromRemoteCommand(
+            [self.binance_client, self.kraken_client],
+            self.exchange_repository,
+            self.price_repository,
+        )
+
+    async def test_execute(self) -> None:
+        self.exchange_repository.get_all.return_value = [
+            Exchange(id=1, name="Binance", tickers=self.binance_tickers),
+            Exchange(id=2, name="Kraken", tickers=self.kraken_tickers),
+        ]
+        binance_prices = [
+            Price(price=0.0, ticker_id=1),
+            Price(price=10000.02, ticker_id=2),
+        ]
+        kraken_prices = [Price(price=3.5, ticker_id=3)]
+        self.binance_client.fetch_price_for_tickers.return_value = binance_prices
+        self.kraken_client.fetch_price_for_tickers.return_value = kraken_prices
+
+        result = await self.command.execute()
+
+        self.assertEqual(result.saved_prices, 3)
+        self.assertEqual(result.missing_exchanges, [])
+        self.assertEqual(result.failed_exchanges, {})
+        self.exchange_repository.get_all.assert_awaited_once_with(fetch_tickers=True)
+        self.binance_client.fetch_price_for_tickers.assert_awaited_once_with(
+            self.binance_tickers
+        )
+        self.kraken_client.fetch_price_for_tickers.assert_awaited_once_with(
+            self.kraken_tickers
+        )
+        self.price_repository.bulk_save.assert_awaited_once_with(
+            binance_prices + kraken_prices
+        )
+
+    async def test_execute_exchange_fails(self) -> None:
+        self.exchange_repository.get_all.return_value = [
+            Exchange(id=1, name="Binance", tickers=self.binance_tickers),
+            Exchange(id=2, name="Kraken", tickers=self.kraken_tickers),
+        ]
+        error = ConnectTimeout("timed out")
+        kraken_prices = [Price(price=3.5, ticker_id=3)]
+        self.binance_client.fetch_price_for_tickers.side_effect = error
+        self.kraken_client.fetch_price_for_tickers.return_value = kraken_prices
+
+        result = await self.command.execute()
+
+        self.assertEqual(result.saved_prices, 1)
+        self.assertEqual(result.missing_exchanges, [])
+        self.assertEqual(result.failed_exchanges, {"Binance": error})
+        self.price_repository.bulk_save.assert_awaited_once_with(kraken_prices)
+
+    async def test_execute_exchange_not_registered(self) -> None:
+        self.exchange_repository.get_all.return_value = [
+            Exchange(id=2, name="Kraken", tickers=self.kraken_tickers),
+            Exchange(id=3, name="Unknown", tickers=[]),
+        ]
+        kraken_prices = [Price(price=3.5, ticker_id=3)]
+        self.kraken_client.fetch_price_for_tickers.return_value = kraken_prices
+
+        result = await self.command.execute()
+
+        self.assertEqual(result.saved_prices, 1)
+        self.assertEqual(result.missing_exchanges, ["Binance"])
+        self.assertEqual(result.failed_exchanges, {})
+        self.binance_client.fetch_price_for_tickers.assert_not_called()
+        self.price_repository.bulk_save.assert_awaited_once_with(kraken_prices)
+
+    @staticmethod
+    def __build_exchange_client(exchange_name: str) -> Mock:
+        exchange_client = Mock(spec=AsyncExchangeClient)
+        type(exchange_client).exchange_name = PropertyMock(return_value=exchange_name)
+
+        return exchange_client
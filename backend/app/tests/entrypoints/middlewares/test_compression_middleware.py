@@ -0,0 +1,117 @@
+import gzip
+from unittest import TestCase
+
+import pyarrow as pa
+from starlette.applications import Starlette
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.entrypoints.middlewares.compression_middleware import CompressionMiddleware
+
+
+class TestCompressionMiddleware(TestCase):
+    def setUp(self) -> None:
+        self.body = b'{"id":1,"ticker_id":1,"price":10.5},' * 100
+
+        def full(request):
+            return Response(self.body, headers={"ETag": '"version"'})
+
+        def small(request):
+            return Response(b"[]", headers={"ETag": '"version"'})
+
+        def stream(request):
+            return StreamingResponse(iter([self.body, self.body]))
+
+        application = Starlette(
+            routes=[
+                Route("/full", full),
+                Route("/small", small),
+                Route("/stream", stream),
+            ]
+        )
+        application.add_middleware(
+            CompressionMiddleware,
+            minimum_size=500,
+            encodings=["zstd", "gzip", "br"],
+            gzip_level=6,
+            brotli_level=4,
+            zstd_level=1,
+        )
+        self.client = TestClient(application)
+
+    def __get_raw(self, path: str, accept_encoding: str) -> tuple[dict, bytes]:
+        with self.client.stream(
+            "GET", path, headers={"Accept-Encoding": accept_encoding}
+        ) as response:
+            return dict(response.headers), b"".join(response.iter_raw())
+
+    def test_zstd(self) -> None:
+        headers, content = self.__get_raw("/full", "gzip, zstd")
+
+        self.assertEqual("zstd", headers["content-encoding"])
+        self.assertEqual('W/"version"', headers["etag"])
+        self.assertEqual("Accept-Encoding", headers["vary"])
+        self.assertEqual(
+            self.body,
+            pa.input_stream(pa.py_buffer(content), compression="zstd").read(),
+        )
+
+    def test_brotli(self) -> None:
+        headers, content = self.__get_raw("/full", "br")
+
+        self.assertEqual("br", headers["content-encoding"])
+        self.assertEqual(
+            self.body,
+            pa.input_stream(pa.py_buffer(content), compression="brotli").read(),
+        )
+
+    def test_gzip(self) -> None:
+        headers, content = self.__get_raw("/full", "gzip, br;q=0.5")
+
+        self.assertEqual("gzip", headers["content-encoding"])
+        self.assertEqual(self.body, gzip.decompress(content))
+
+    def test_streaming(self) -> None:
+        for encoding, codec in (("zstd", "zstd"), ("br", "brotli")):
+            headers, content = self.__get_raw("/stream", encoding)
+
+            self.assertEqual(encoding, headers["content-encoding"])
+            self.assertNotIn("content-length", headers)
+            self.assertEqual(
+                self.body * 2,
+                pa.input_stream(pa.py_buffer(content), compression=codec).read(),
+            )
+
+    def test_small_body(self) -> None:
+        headers, content = self.__get_raw("/small", "zstd")
+
+        self.assertNotIn("content-encoding", headers)
+        self.assertEqual('"version"', headers["etag"])
+        self.assertEqual(b"[]", content)
+
+    def test_identity(self) -> None:
+        headers, content = self.__get_raw("/full", "identity")
+
+        self.assertNotIn("content-encoding", headers)
+        self.assertEqual(self.body, content)
+
+    def test_negotiate(self) -> None:
+        encodings = ["zstd", "gzip", "br"]
+
+        self.assertEqual(
+            "zstd",
+            CompressionMiddleware.negotiate("gzip, deflate, br, zstd", encodings),
+        )
+        self.assertEqual(
+            "br", CompressionMiddleware.negotiate("gzip;q=0.5, br", encodings)
+        )
+        self.assertEqual(
+            "gzip", CompressionMiddleware.negotiate("*;q=0.1, gzip;q=0.2", encodings)
+        )
+        self.assertEqual("zstd", CompressionMiddleware.negotiate("*", encodings))
+        self.assertIsNone(
+            CompressionMiddleware.negotiate("zstd;q=0, identity", encodings)
+        )
+        self.assertIsNone(CompressionMiddleware.negotiate("", encodings))
+        self.assertIsNone(CompressionMiddleware.negotiate("gzip;q=x", encodings))
@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+
+from app.entrypoints.routes.http_cache import HttpCache
+
+
+class TestHttpCache(TestCase):
+    def test_entity_tag(self) -> None:
+        result = HttpCache.entity_tag(b"content")
+
+        self.assertEqual(result, HttpCache.entity_tag(b"content"))
+        self.assertNotEqual(result, HttpCache.entity_tag(b"other"))
+        self.assertTrue(result.startswith('"') and result.endswith('"'))
+
+    def test_closed_range_entity_tag(self) -> None:
+        end_date = datetime(2020, 1, 1)
+
+        result = HttpCache.closed_range_entity_tag(end_date, 1, None)
+
+        self.assertEqual(result, HttpCache.closed_range_entity_tag(end_date, 1, None))
+        self.assertNotEqual(
+            result, HttpCache.closed_range_entity_tag(end_date, 2, None)
+        )
+        self.assertIsNotNone(
+            HttpCache.closed_range_entity_tag(
+                datetime(2020, 1, 1, tzinfo=timezone.utc), 1
+            )
+        )
+
+    def test_closed_range_entity_tag_open_range(self) -> None:
+        self.assertIsNone(HttpCache.closed_range_entity_tag(None, 1))
+        self.assertIsNone(
+            HttpCache.closed_range_entity_tag(datetime.now() + timedelta(days=1), 1)
+        )
+        self.assertIsNone(HttpCache.closed_range_entity_tag(datetime.now(), 1))
+
+    def test_matches(self) -> None:
+        self.assertTrue(HttpCache.matches('"a"', '"a"'))
+        self.assertTrue(HttpCache.matches('"b", W/"a"', '"a"'))
+        self.assertTrue(HttpCache.matches("*", '"a"'))
+        self.assertFalse(HttpCache.matches('"b"', '"a"'))
+        self.assertFalse(HttpCache.matches(None, '"a"'))
+
+    def test_json_response(self) -> None:
+        result = HttpCache.json_response(b"[]", '"a"', HttpCache.NO_CACHE, '"b"')
+
+        self.assertEqual(200, result.status_code)
+        self.assertEqual(b"[]", result.body)
+        self.assertEqual('"a"', result.headers["etag"])
+        self.assertEqual("no-cache", result.headers["cache-control"])
+        self.assertEqual("application/json", result.headers["content-type"])
+
+    def test_json_response_not_modified(self) -> None:
+        result = HttpCache.json_response(b"[]", '"a"', HttpCache.NO_CACHE, '"a"')
+
+        self.assertEqual(304, result.status_code)
+        self.assertEqual(b"", result.body)
+        self.assertEqual('"a"', result.headers["etag"])
@@ -1,4 +1,5 @@
-from unittest import TestCase
+import json
+from unittest import IsolatedAsyncioTestCase
 from unittest.mock import Mock, patch
 
 from fastapi import HTTPException
@@ -10,39 +11,62 @@ from app.application.get_all_exchanges.get_all_exchanges_query_response import (
     GetAllExchangesQueryResponse,
 )
 from app.domain.exchange.models.exchange import Exchange
+from app.entrypoints.routes.http_cache import HttpCache
 from app.entrypoints.routes.v1.get_all_exchanges_handler import GetAllExchangesHandler
+from app.infrastructure.crypto.caches.catalog_version_cache import CatalogVersionCache
 from app.interfaces.api.v1.schemas.exchange_schema import ExchangeSchema
 
 
-class TestGetAllExchangesHandler(TestCase):
+class TestGetAllExchangesHandler(IsolatedAsyncioTestCase):
     def setUp(self) -> None:
         self.get_all_exchanges_query = Mock(spec=GetAllExchangesQuery)
+        self.catalog_version_cache = Mock(spec=CatalogVersionCache)
+        self.catalog_version_cache.get.return_value = None
 
-        self.handler = GetAllExchangesHandler(self.get_all_exchanges_query)
+        self.handler = GetAllExchangesHandler(
+            self.get_all_exchanges_query, self.catalog_version_cache
+        )
 
     @patch("app.entrypoints.routes.v1.get_all_exchanges_handler.logger")
-    def test_handle(self, logger: Mock) -> None:
+    async def test_handle(self, logger: Mock) -> None:
         exchanges = [Exchange(id=1, name="Binance"), Exchange(id=2, name="Kraken")]
         self.get_all_exchanges_query.execute.return_value = (
             GetAllExchangesQueryResponse(exchanges=exchanges)
         )
 
-        result = self.handler.handle()
+        result = await self.handler.handle()
 
         self.assertEqual(
-            result,
-            [ExchangeSchema(id=1, name="Binance"), ExchangeSchema(id=2, name="Kraken")],
+            [
+                ExchangeSchema(id=1, name="Binance").model_dump(),
+                ExchangeSchema(id=2, name="Kraken").model_dump(),
+            ],
+            json.loads(result.body),
+        )
+        self.assertEqual(HttpCache.entity_tag(result.body), result.headers["etag"])
+        self.catalog_version_cache.set.assert_called_once_with(
+            "exchanges", result.headers["etag"]
         )
         self.get_all_exchanges_query.execute.assert_called_once()
         logger.info.assert_called_once_with("Getting all exchanges from database")
         logger.error.assert_not_called()
 
     @patch("app.entrypoints.routes.v1.get_all_exchanges_handler.logger")
-    def test_handle_unexpected_error(self, logger: Mock) -> None:
+    async def test_handle_not_modified(self, logger: Mock) -> None:
+        self.catalog_version_cache.get.return_value = '"version"'
+
+        result = await self.handler.handle('"version"')
+
+        self.assertEqual(304, result.status_code)
+        self.catalog_version_cache.get.assert_called_once_with("exchanges")
+        self.get_all_exchanges_query.execute.assert_not_called()
+
+    @patch("app.entrypoints.routes.v1.get_all_exchanges_handler.logger")
+    async def test_handle_unexpected_error(self, logger: Mock) -> None:
         self.get_all_exchanges_query.execute.side_effect = Exception()
 
         with self.assertRaises(HTTPException) as context:
-            self.handler.handle()
+            await self.handler.handle()
 
             self.assertEqual(context.exception.status_code, 500)
             self.assertEqual(context.exception.detail, "An unexpected error happened.")
@@ -1,8 +1,12 @@
-from datetime import datetime
-from unittest import TestCase
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from unittest import IsolatedAsyncioTestCase
 from unittest.mock import Mock, patch
 
+import pyarrow as pa
 from fastapi import HTTPException, WebSocket
+from fastapi.responses import StreamingResponse
 from starlette.websockets import WebSocketDisconnect
 
 from app.application.get_all_prices_by_ticker_id.get_all_prices_by_ticker_id_query import (
@@ -11,65 +15,486 @@ from app.application.get_all_prices_by_ticker_id.get_all_prices_by_ticker_id_que
 from app.application.get_all_prices_by_ticker_id.get_all_prices_by_ticker_id_query_response import (
     GetAllPricesByTickerIdQueryResponse,
 )
+from app.application.get_candles_by_ticker_id.get_candles_by_ticker_id_query import (
+    GetCandlesByTickerIdQuery,
+)
+from app.application.get_candles_by_ticker_id.get_candles_by_ticker_id_query_response import (
+    GetCandlesByTickerIdQueryResponse,
+)
+from app.application.stream_price_columns_by_ticker_id.stream_price_columns_by_ticker_id_query import (
+    StreamPriceColumnsByTickerIdQuery,
+)
+from app.application.stream_price_columns_by_ticker_id.stream_price_columns_by_ticker_id_query_response import (
+    StreamPriceColumnsByTickerIdQueryResponse,
+)
+from app.application.stream_prices_by_ticker_id.stream_prices_by_ticker_id_query import (
+    StreamPricesByTickerIdQuery,
+)
+from app.application.stream_prices_by_ticker_id.stream_prices_by_ticker_id_query_response import (
+    StreamPricesByTickerIdQueryResponse,
+)
+from app.domain.crypto.exceptions.price_subscription_overflow_exception import (
+    PriceSubscriptionOverflowException,
+)
 from app.domain.crypto.exceptions.ticker_not_found_exception import (
     TickerNotFoundException,
 )
+from app.domain.crypto.models.candle import Candle
+from app.domain.crypto.models.candle_interval import CandleInterval
 from app.domain.crypto.models.price import Price
+from app.domain.crypto.models.price_columns import PriceColumns
+from app.domain.crypto.models.price_cursor import PriceCursor
 from app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler import (
     GetAllPricesByTickerIdHandler,
 )
-from app.interfaces.api.v1.schemas.price_schema import PriceSchema
+from app.infrastructure.crypto.broadcasters.price_broadcaster import PriceBroadcaster
+from app.interfaces.api.v1.schemas.price_cursor_schema import PriceCursorSchema
+from app.interfaces.api.v1.schemas.price_export_format import PriceExportFormat
+from app.interfaces.api.v1.schemas.price_frame_format import PriceFrameFormat
 
 
-class TestGetAllPricesByTickerIdHandler(TestCase):
+class TestGetAllPricesByTickerIdHandler(IsolatedAsyncioTestCase):
     def setUp(self) -> None:
         self.get_all_prices_by_ticker_id_query = Mock(spec=GetAllPricesByTickerIdQuery)
+        self.stream_prices_by_ticker_id_query = Mock(spec=StreamPricesByTickerIdQuery)
+        self.get_candles_by_ticker_id_query = Mock(spec=GetCandlesByTickerIdQuery)
+        self.stream_price_columns_by_ticker_id_query = Mock(
+            spec=StreamPriceColumnsByTickerIdQuery
+        )
+        self.price_broadcaster = Mock(spec=PriceBroadcaster)
+        self.subscription = asyncio.Queue()
+        self.price_broadcaster.subscribe.return_value = self.subscription
         self.start_date = datetime(2013, 1, 1)
         self.end_date = datetime(2015, 1, 1)
+        self.prices = [
+            Price(id=1, price=2.0, ticker_id=1, timestamp=datetime(2013, 1, 1)),
+            Price(id=2, price=20.0, ticker_id=1, timestamp=datetime(2014, 1, 1)),
+            Price(id=3, price=200.0, ticker_id=1, timestamp=datetime(2015, 1, 1)),
+        ]
+        self.prices_json = [
+            {"id": 1, "ticker_id": 1, "price": 2.0, "timestamp": "2013-01-01T00:00:00"},
+            {
+                "id": 2,
+                "ticker_id": 1,
+                "price": 20.0,
+                "timestamp": "2014-01-01T00:00:00",
+            },
+            {
+                "id": 3,
+                "ticker_id": 1,
+                "price": 200.0,
+                "timestamp": "2015-01-01T00:00:00",
+            },
+        ]
 
         self.handler = GetAllPricesByTickerIdHandler(
-            self.get_all_prices_by_ticker_id_query, 0.001
+            self.get_all_prices_by_ticker_id_query,
+            self.price_broadcaster,
+            self.stream_prices_by_ticker_id_query,
+            self.get_candles_by_ticker_id_query,
+            self.stream_price_columns_by_ticker_id_query,
         )
+        self.price_columns = [
+            PriceColumns(
+                ticker_id=1,
+                ids=[1, 2],
+                prices=[2.0, 20.0],
+                timestamps=[datetime(2013, 1, 1), datetime(2014, 1, 1)],
+            ),
+            PriceColumns(
+                ticker_id=1,
+                ids=[3],
+                prices=[200.0],
+                timestamps=[datetime(2015, 1, 1)],
+            ),
+        ]
+
+    @staticmethod
+    async def __read_body(response: StreamingResponse) -> str:
+        return "".join([chunk async for chunk in response.body_iterator])
+
+    @staticmethod
+    async def __read_bytes(response: StreamingResponse) -> bytes:
+        return b"".join([chunk async for chunk in response.body_iterator])
 
     @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler.logger")
-    def test_handle(self, logger: Mock) -> None:
-        prices = [
-            Price(id=1, price=2.0, ticker_id=1, timestamp=datetime(2013, 1, 1)),
-            Price(id=2, price=20.0, ticker_id=1, timestamp=datetime(2014, 1, 1)),
-            Price(id=3, price=200.0, ticker_id=1, timestamp=datetime(2015, 1, 1)),
-        ]
+    async def test_handle(self, logger: Mock) -> None:
+        self.stream_prices_by_ticker_id_query.execute.return_value = (
+            StreamPricesByTickerIdQueryResponse(prices=iter(self.prices))
+        )
+
+        result = await self.handler.handle(1, self.start_date, self.end_date)
+
+        self.assertEqual(self.prices_json, json.loads(await self.__read_bytes(result)))
+        self.assertNotIn("x-next-cursor", result.headers)
+        self.assertIn("etag", result.headers)
+        self.assertIn("immutable", result.headers["cache-control"])
+        self.assertEqual("Accept", result.headers["vary"])
+        self.stream_prices_by_ticker_id_query.execute.assert_called_once_with(
+            1, self.start_date, self.end_date, None
+        )
+        self.get_all_prices_by_ticker_id_query.execute.assert_not_called()
+        logger.info.assert_called_once_with(
+            f"Getting prices for ticker '1' in date range [{self.start_date}, {self.end_date}]"
+        )
+        logger.error.assert_not_called()
+
+    @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler.logger")
+    async def test_handle_recent_window(self, logger: Mock) -> None:
+        start_date = datetime.now(timezone.utc) - timedelta(minutes=5)
         self.get_all_prices_by_ticker_id_query.execute.return_value = (
-            GetAllPricesByTickerIdQueryResponse(prices=prices)
+            GetAllPricesByTickerIdQueryResponse(prices=self.prices)
+        )
+
+        result = await self.handler.handle(1, start_date, None)
+
+        self.assertEqual(self.prices_json, json.loads(result.body))
+        self.assertEqual("Accept", result.headers["vary"])
+        self.get_all_prices_by_ticker_id_query.execute.assert_awaited_once_with(
+            1, start_date, None
+        )
+        self.stream_prices_by_ticker_id_query.execute.assert_not_called()
+        logger.error.assert_not_called()
+
+    @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler.logger")
+    async def test_handle_recent_window_paginated(self, logger: Mock) -> None:
+        start_date = datetime.now(timezone.utc) - timedelta(minutes=5)
+        self.stream_prices_by_ticker_id_query.execute.return_value = (
+            StreamPricesByTickerIdQueryResponse(prices=iter(self.prices))
+        )
+
+        await self.handler.handle(1, start_date, None, limit=10)
+
+        self.stream_prices_by_ticker_id_query.execute.assert_called_once_with(
+            1, start_date, None, None, 11
+        )
+        self.get_all_prices_by_ticker_id_query.execute.assert_not_called()
+
+    @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler.logger")
+    async def test_handle_recent_window_ticker_not_found(self, logger: Mock) -> None:
+        self.get_all_prices_by_ticker_id_query.execute.side_effect = (
+            TickerNotFoundException(1)
+        )
+
+        with self.assertRaises(HTTPException) as context:
+            await self.handler.handle(
+                1, datetime.now(timezone.utc) - timedelta(minutes=5), None
+            )
+
+        self.assertEqual(context.exception.status_code, 404)
+        logger.error.assert_called_once_with("Ticker with id '1' not found")
+
+    @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler.logger")
+    async def test_handle_not_modified(self, logger: Mock) -> None:
+        self.stream_prices_by_ticker_id_query.execute.return_value = (
+            StreamPricesByTickerIdQueryResponse(prices=iter(self.prices))
+        )
+        entity_tag = (
+            await self.handler.handle(1, self.start_date, self.end_date)
+        ).headers["etag"]
+
+        result = await self.handler.handle(
+            1, self.start_date, self.end_date, if_none_match=entity_tag
+        )
+        other_format_result = await self.handler.handle(
+            1,
+            self.start_date,
+            self.end_date,
+            export_format=PriceExportFormat.CSV,
+            if_none_match=entity_tag,
+        )
+
+        self.assertEqual(304, result.status_code)
+        self.assertEqual(entity_tag, result.headers["etag"])
+        self.assertEqual(200, other_format_result.status_code)
+        self.stream_prices_by_ticker_id_query.execute.assert_called_once()
+        logger.error.assert_not_called()
+
+    @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler.logger")
+    async def test_handle_open_range_without_entity_tag(self, logger: Mock) -> None:
+        self.stream_prices_by_ticker_id_query.execute.return_value = (
+            StreamPricesByTickerIdQueryResponse(prices=iter(self.prices))
+        )
+
+        result = await self.handler.handle(
+            1, self.start_date, datetime.now() + timedelta(days=1), if_none_match="*"
+        )
+
+        self.assertEqual(200, result.status_code)
+        self.assertNotIn("etag", result.headers)
+        self.assertNotIn("cache-control", result.headers)
+
+    @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler.logger")
+    async def test_handle_empty(self, logger: Mock) -> None:
+        self.stream_prices_by_ticker_id_query.execute.return_value = (
+            StreamPricesByTickerIdQueryResponse(prices=iter([]))
+        )
+
+        result = await self.handler.handle(1, self.start_date, self.end_date)
+
+        self.assertEqual([], json.loads(await self.__read_bytes(result)))
+        logger.error.assert_not_called()
+
+    @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler.logger")
+    async def test_handle_paginated(self, logger: Mock) -> None:
+        self.stream_prices_by_ticker_id_query.execute.return_value = (
+            StreamPricesByTickerIdQueryResponse(prices=iter(self.prices))
+        )
+
+        result = await self.handler.handle(1, self.start_date, self.end_date, 2)
+
+        self.assertEqual(
+            self.prices_json[:2], json.loads(await self.__read_bytes(result))
+        )
+        self.assertEqual(
+            PriceCursor(timestamp=datetime(2014, 1, 1), id=2),
+            PriceCursorSchema.to_domain(
+                PriceCursorSchema.decode(result.headers["x-next-cursor"])
+            ),
+        )
+        self.stream_prices_by_ticker_id_query.execute.assert_called_once_with(
+            1, self.start_date, self.end_date, None, 3
+        )
+        logger.error.assert_not_called()
+
+    @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler.logger")
+    async def test_handle_paginated_last_page(self, logger: Mock) -> None:
+        self.stream_prices_by_ticker_id_query.execute.return_value = (
+            StreamPricesByTickerIdQueryResponse(prices=iter(self.prices[2:]))
+        )
+        cursor = PriceCursorSchema.encode(PriceCursorSchema.from_domain(self.prices[1]))
+
+        result = await self.handler.handle(1, self.start_date, self.end_date, 2, cursor)
+
+        self.assertEqual(
+            self.prices_json[2:], json.loads(await self.__read_bytes(result))
+        )
+        self.assertNotIn("x-next-cursor", result.headers)
+        self.stream_prices_by_ticker_id_query.execute.assert_called_once_with(
+            1,
+            self.start_date,
+            self.end_date,
+            PriceCursor(timestamp=datetime(2014, 1, 1), id=2),
+            3,
         )
+        logger.error.assert_not_called()
+
+    @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler.logger")
+    async def test_handle_invalid_cursor(self, logger: Mock) -> None:
+        with self.assertRaises(HTTPException) as context:
+            await self.handler.handle(
+                1, self.start_date, self.end_date, 2, "not-a-cursor"
+            )
 
-        result = self.handler.handle(1, self.start_date, self.end_date)
+        self.assertEqual(context.exception.status_code, 400)
+        self.assertEqual(context.exception.detail, "Invalid cursor")
+        logger.error.assert_called_once_with(
+            "Invalid cursor 'not-a-cursor' for querying prices for ticker '1'"
+        )
+        self.stream_prices_by_ticker_id_query.execute.assert_not_called()
+
+    @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler.logger")
+    async def test_handle_bucket(self, logger: Mock) -> None:
+        self.get_candles_by_ticker_id_query.execute.return_value = (
+            GetCandlesByTickerIdQueryResponse(
+                interval=CandleInterval.ONE_DAY,
+                candles=[
+                    Candle(
+                        ticker_id=1,
+                        timestamp=datetime(2013, 1, 1),
+                        open=2.0,
+                        high=20.0,
+                        low=1.0,
+                        close=10.0,
+                        count=5,
+                    )
+                ],
+            )
+        )
+
+        result = await self.handler.handle(
+            1,
+            self.start_date,
+            self.end_date,
+            bucket=CandleInterval.AUTO,
+            points=100,
+        )
 
         self.assertEqual(
-            result,
             [
-                PriceSchema(
-                    id=1, price=2.0, ticker_id=1, timestamp=datetime(2013, 1, 1)
-                ),
-                PriceSchema(
-                    id=2, price=20.0, ticker_id=1, timestamp=datetime(2014, 1, 1)
-                ),
-                PriceSchema(
-                    id=3, price=200.0, ticker_id=1, timestamp=datetime(2015, 1, 1)
-                ),
+                {
+                    "ticker_id": 1,
+                    "timestamp": "2013-01-01T00:00:00",
+                    "open": 2.0,
+                    "high": 20.0,
+                    "low": 1.0,
+                    "close": 10.0,
+                    "count": 5,
+                }
             ],
+            json.loads(result.body),
         )
-        self.get_all_prices_by_ticker_id_query.execute.assert_called_once_with(
-            1, self.start_date, self.end_date
+        self.assertEqual("1d", result.headers["x-candle-interval"])
+        self.get_candles_by_ticker_id_query.execute.assert_called_once_with(
+            1, self.start_date, self.end_date, CandleInterval.AUTO, 100
         )
-        logger.info.assert_called_once_with(
-            f"Getting prices for ticker '1' in date range [{self.start_date}, {self.end_date}]"
+        self.stream_prices_by_ticker_id_query.execute.assert_not_called()
+        logger.error.assert_not_called()
+
+    @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler.logger")
+    async def test_handle_bucket_paginated(self, logger: Mock) -> None:
+        with self.assertRaises(HTTPException) as context:
+            await self.handler.handle(
+                1, self.start_date, self.end_date, 10, bucket=CandleInterval.ONE_HOUR
+            )
+
+        self.assertEqual(context.exception.status_code, 400)
+        self.assertEqual(
+            context.exception.detail, "bucket cannot be combined with limit or cursor"
+        )
+        self.get_candles_by_ticker_id_query.execute.assert_not_called()
+
+    @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler.logger")
+    async def test_handle_bucket_ticker_not_found(self, logger: Mock) -> None:
+        self.get_candles_by_ticker_id_query.execute.side_effect = (
+            TickerNotFoundException(100)
+        )
+
+        with self.assertRaises(HTTPException) as context:
+            await self.handler.handle(100, None, None, bucket=CandleInterval.ONE_HOUR)
+
+        self.assertEqual(context.exception.status_code, 404)
+        logger.error.assert_called_once_with("Ticker with id '100' not found")
+
+    @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler.logger")
+    async def test_handle_ndjson(self, logger: Mock) -> None:
+        self.stream_price_columns_by_ticker_id_query.execute.return_value = (
+            StreamPriceColumnsByTickerIdQueryResponse(
+                price_columns=iter(self.price_columns)
+            )
+        )
+
+        result = await self.handler.handle(
+            1,
+            self.start_date,
+            self.end_date,
+            export_format=PriceExportFormat.NDJSON,
+        )
+
+        self.assertEqual("application/x-ndjson", result.media_type)
+        self.assertEqual(
+            self.prices_json,
+            [
+                json.loads(line)
+                for line in (await self.__read_body(result)).splitlines()
+            ],
+        )
+        self.stream_price_columns_by_ticker_id_query.execute.assert_called_once_with(
+            1, self.start_date, self.end_date, None
+        )
+        self.stream_prices_by_ticker_id_query.execute.assert_not_called()
+        logger.error.assert_not_called()
+
+    @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler.logger")
+    async def test_handle_csv_paginated(self, logger: Mock) -> None:
+        self.stream_price_columns_by_ticker_id_query.execute.return_value = (
+            StreamPriceColumnsByTickerIdQueryResponse(
+                price_columns=iter(self.price_columns)
+            )
+        )
+
+        result = await self.handler.handle(
+            1, self.start_date, self.end_date, 2, accept="text/csv"
+        )
+
+        self.assertEqual("text/csv", result.media_type)
+        self.assertEqual(
+            "id,ticker_id,price,timestamp\n"
+            "1,1,2.0,2013-01-01T00:00:00\n"
+            "2,1,20.0,2014-01-01T00:00:00\n",
+            await self.__read_body(result),
+        )
+        self.assertEqual(
+            PriceCursor(timestamp=datetime(2014, 1, 1), id=2),
+            PriceCursorSchema.to_domain(
+                PriceCursorSchema.decode(result.headers["x-next-cursor"])
+            ),
+        )
+        self.stream_price_columns_by_ticker_id_query.execute.assert_called_once_with(
+            1, self.start_date, self.end_date, None, 3
+        )
+        logger.error.assert_not_called()
+
+    @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler.logger")
+    async def test_handle_arrow(self, logger: Mock) -> None:
+        self.stream_price_columns_by_ticker_id_query.execute.return_value = (
+            StreamPriceColumnsByTickerIdQueryResponse(
+                price_columns=iter(self.price_columns)
+            )
+        )
+
+        result = await self.handler.handle(
+            1,
+            self.start_date,
+            self.end_date,
+            accept="application/vnd.apache.arrow.stream",
+        )
+
+        price_table = pa.ipc.open_stream(await self.__read_bytes(result)).read_all()
+        self.assertEqual("application/vnd.apache.arrow.stream", result.media_type)
+        self.assertEqual(
+            {
+                "id": [1, 2, 3],
+                "ticker_id": [1, 1, 1],
+                "price": [2.0, 20.0, 200.0],
+                "timestamp": [
+                    datetime(2013, 1, 1),
+                    datetime(2014, 1, 1),
+                    datetime(2015, 1, 1),
+                ],
+            },
+            price_table.to_pydict(),
         )
         logger.error.assert_not_called()
 
     @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler.logger")
-    def test_handle_invalid_range(self, logger: Mock) -> None:
+    async def test_handle_export_ticker_not_found(self, logger: Mock) -> None:
+        self.stream_price_columns_by_ticker_id_query.execute.side_effect = (
+            TickerNotFoundException(1)
+        )
+
+        with self.assertRaises(HTTPException) as context:
+            await self.handler.handle(
+                1, None, None, export_format=PriceExportFormat.CSV
+            )
+
+        self.assertEqual(404, context.exception.status_code)
+        logger.error.assert_called_once_with("Ticker with id '1' not found")
+
+    @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler.logger")
+    async def test_handle_bucket_export(self, logger: Mock) -> None:
+        with self.assertRaises(HTTPException) as context:
+            await self.handler.handle(
+                1,
+                None,
+                None,
+                bucket=CandleInterval.ONE_HOUR,
+                export_format=PriceExportFormat.ARROW,
+            )
+
+        self.assertEqual(400, context.exception.status_code)
+        self.assertEqual(
+            "bucket is only available in json format", context.exception.detail
+        )
+        self.get_candles_by_ticker_id_query.execute.assert_not_called()
+        logger.error.assert_called_once_with(
+            "Bucket '1h' cannot be exported as 'arrow' for querying prices for ticker '1'"
+        )
+
+    @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler.logger")
+    async def test_handle_invalid_range(self, logger: Mock) -> None:
         with self.assertRaises(HTTPException) as context:
-            self.handler.handle(1, self.end_date, self.start_date)
+            await self.handler.handle(1, self.end_date, self.start_date)
 
             self.assertEqual(context.exception.status_code, 400)
             self.assertEqual(
@@ -83,29 +508,29 @@ class TestGetAllPricesByTickerIdHandler(TestCase):
         logger.info.assert_not_called()
 
     @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler.logger")
-    def test_handle_ticker_not_found(self, logger: Mock) -> None:
-        self.get_all_prices_by_ticker_id_query.execute.side_effect = (
+    async def test_handle_ticker_not_found(self, logger: Mock) -> None:
+        self.stream_prices_by_ticker_id_query.execute.side_effect = (
             TickerNotFoundException(100)
         )
 
         with self.assertRaises(HTTPException) as context:
-            self.handler.handle(100, self.start_date, self.end_date)
+            await self.handler.handle(100, self.start_date, self.end_date)
 
             self.assertEqual(context.exception.status_code, 404)
             self.assertEqual(context.exception.detail, "Ticker not found")
             logger.error.assert_called_once_with("Ticker with id '100' not found")
 
-        self.get_all_prices_by_ticker_id_query.execute.assert_called_once()
+        self.stream_prices_by_ticker_id_query.execute.assert_called_once()
         logger.info.assert_called_once_with(
             f"Getting prices for ticker '100' in date range [{self.start_date}, {self.end_date}]"
         )
 
     @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler.logger")
-    def test_handle_unexpected_error(self, logger: Mock) -> None:
-        self.get_all_prices_by_ticker_id_query.execute.side_effect = Exception()
+    async def test_handle_unexpected_error(self, logger: Mock) -> None:
+        self.stream_prices_by_ticker_id_query.execute.side_effect = Exception()
 
         with self.assertRaises(HTTPException) as context:
-            self.handler.handle(1, self.start_date, self.end_date)
+            await self.handler.handle(1, self.start_date, self.end_date)
 
             self.assertEqual(context.exception.status_code, 500)
             self.assertEqual(context.exception.detail, "An unexpected error happened.")
@@ -113,32 +538,100 @@ class TestGetAllPricesByTickerIdHandler(TestCase):
                 f"Unexpected error occurred while retrieving prices for ticker with id '1' in date range [{self.start_date}, {self.end_date}]: {e}"
             )
 
-        self.get_all_prices_by_ticker_id_query.execute.assert_called_once()
+        self.stream_prices_by_ticker_id_query.execute.assert_called_once()
         logger.info.assert_called_once_with(
             f"Getting prices for ticker '1' in date range [{self.start_date}, {self.end_date}]"
         )
 
     @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler.logger")
     async def test_handle_websocket(self, logger: Mock) -> None:
-        prices = [
-            Price(id=1, price=2.0, ticker_id=1, timestamp=datetime(2013, 1, 1)),
-            Price(id=2, price=20.0, ticker_id=1, timestamp=datetime(2014, 1, 1)),
-            Price(id=3, price=200.0, ticker_id=1, timestamp=datetime(2015, 1, 1)),
-        ]
         self.get_all_prices_by_ticker_id_query.execute.return_value = (
-            GetAllPricesByTickerIdQueryResponse(prices=prices)
+            GetAllPricesByTickerIdQueryResponse(prices=self.prices)
         )
+        late_price = Price(
+            id=4, price=2000.0, ticker_id=1, timestamp=datetime(2016, 1, 1)
+        )
+        self.subscription.put_nowait([self.prices[0], late_price])
         websocket = Mock(spec=WebSocket)
-        websocket.send_json.side_effect = [None, None, WebSocketDisconnect()]
+        websocket.send_json.side_effect = [None, None, None, WebSocketDisconnect()]
 
-        try:
+        with self.assertRaises(WebSocketDisconnect):
             await self.handler.handle_websocket(websocket, 1, 100)
-        except WebSocketDisconnect:
-            self.assertEqual(
-                3, self.get_all_prices_by_ticker_id_query.execute.call_count
+
+        self.get_all_prices_by_ticker_id_query.execute.assert_called_once()
+        self.price_broadcaster.subscribe.assert_called_once_with(1)
+        self.price_broadcaster.unsubscribe.assert_called_once_with(1, self.subscription)
+        self.assertEqual(4, websocket.send_json.call_count)
+        self.assertEqual(4, websocket.send_json.call_args.args[0]["id"])
+        logger.info.assert_not_called()
+        logger.error.assert_not_called()
+
+    @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler.logger")
+    async def test_handle_websocket_batch(self, logger: Mock) -> None:
+        self.get_all_prices_by_ticker_id_query.execute.return_value = (
+            GetAllPricesByTickerIdQueryResponse(prices=self.prices)
+        )
+        websocket = Mock(spec=WebSocket)
+        websocket.send_text.side_effect = [None, WebSocketDisconnect()]
+        self.subscription.put_nowait([])
+        self.subscription.put_nowait(
+            [
+                Price(
+                    id=4,
+                    price=2.0,
+                    ticker_id=1,
+                    timestamp=datetime.now() + timedelta(1),
+                )
+            ]
+        )
+
+        with self.assertRaises(WebSocketDisconnect):
+            await self.handler.handle_websocket(
+                websocket, 1, 100, PriceFrameFormat.BATCH
+            )
+
+        websocket.send_json.assert_not_called()
+        self.assertEqual(2, websocket.send_text.call_count)
+        self.assertEqual(
+            self.prices_json, json.loads(websocket.send_text.call_args_list[0].args[0])
+        )
+        self.assertEqual(
+            [4],
+            [
+                price["id"]
+                for price in json.loads(websocket.send_text.call_args_list[1].args[0])
+            ],
+        )
+        logger.error.assert_not_called()
+
+    @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler.logger")
+    async def test_handle_websocket_columnar(self, logger: Mock) -> None:
+        self.get_all_prices_by_ticker_id_query.execute.return_value = (
+            GetAllPricesByTickerIdQueryResponse(prices=self.prices)
+        )
+        websocket = Mock(spec=WebSocket)
+        websocket.send_text.side_effect = WebSocketDisconnect()
+
+        with self.assertRaises(WebSocketDisconnect):
+            await self.handler.handle_websocket(
+                websocket, 1, 100, PriceFrameFormat.COLUMNAR
             )
-            logger.info.assert_not_called()
-            logger.error.assert_not_called()
+
+        websocket.send_text.assert_called_once()
+        self.assertEqual(
+            {
+                "ticker_id": 1,
+                "ids": [1, 2, 3],
+                "prices": [2.0, 20.0, 200.0],
+                "timestamps": [
+                    "2013-01-01T00:00:00",
+                    "2014-01-01T00:00:00",
+                    "2015-01-01T00:00:00",
+                ],
+            },
+            json.loads(websocket.send_text.call_args.args[0]),
+        )
+        logger.error.assert_not_called()
 
     @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler.logger")
     async def test_handle_websocket_ticker_not_found(self, logger: Mock) -> None:
@@ -147,27 +640,65 @@ class TestGetAllPricesByTickerIdHandler(TestCase):
         )
         websocket = Mock(spec=WebSocket)
 
-        try:
+        with self.assertRaises(TickerNotFoundException):
             await self.handler.handle_websocket(websocket, 1, 100)
-        except TickerNotFoundException:
-            self.get_all_prices_by_ticker_id_query.execute.assert_called_once()
-            logger.info.assert_not_called()
-            logger.error.assert_called_once_with("Ticker with id '1' not found")
-            websocket.send_json.assert_called_once_with({"error": "Ticker not found"})
+
+        self.get_all_prices_by_ticker_id_query.execute.assert_called_once()
+        self.price_broadcaster.unsubscribe.assert_called_once_with(1, self.subscription)
+        logger.info.assert_not_called()
+        logger.error.assert_called_once_with("Ticker with id '1' not found")
+        websocket.send_json.assert_called_once_with({"error": "Ticker not found"})
 
     @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler.logger")
     async def test_handle_websocket_unexpected_error(self, logger: Mock) -> None:
         self.get_all_prices_by_ticker_id_query.execute.side_effect = Exception()
         websocket = Mock(spec=WebSocket)
 
-        try:
+        with self.assertRaises(Exception) as context:
             await self.handler.handle_websocket(websocket, 1, 100)
-        except Exception as e:
-            self.get_all_prices_by_ticker_id_query.execute.assert_called_once()
-            logger.info.assert_not_called()
-            logger.error.assert_called_once_with(
-                f"An unexpected error happened in price websocket: {e}"
-            )
-            websocket.send_json.assert_called_once_with(
-                {"error": "An unexpected error happened"}
-            )
+
+        self.get_all_prices_by_ticker_id_query.execute.assert_called_once()
+        self.price_broadcaster.unsubscribe.assert_called_once_with(1, self.subscription)
+        logger.info.assert_not_called()
+        logger.error.assert_called_once_with(
+            f"An unexpected error happened in price websocket: {context.exception}"
+        )
+        websocket.send_json.assert_called_once_with(
+            {"error": "An unexpected error happened"}
+        )
+
+    @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler.logger")
+    async def test_handle_websocket_subscription_overflow(self, logger: Mock) -> None:
+        self.get_all_prices_by_ticker_id_query.execute.return_value = (
+            GetAllPricesByTickerIdQueryResponse(prices=[])
+        )
+        error = PriceSubscriptionOverflowException(1, 100)
+        self.subscription.put_nowait(error)
+        websocket = Mock(spec=WebSocket)
+
+        with self.assertRaises(PriceSubscriptionOverflowException):
+            await self.handler.handle_websocket(websocket, 1, 100)
+
+        self.price_broadcaster.unsubscribe.assert_called_once_with(1, self.subscription)
+        logger.warning.assert_called_once_with(str(error))
+        logger.error.assert_not_called()
+        websocket.send_json.assert_called_once_with({"error": "Client is too slow"})
+
+    @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler.logger")
+    async def test_handle_websocket_broadcast_error(self, logger: Mock) -> None:
+        self.get_all_prices_by_ticker_id_query.execute.return_value = (
+            GetAllPricesByTickerIdQueryResponse(prices=[])
+        )
+        self.subscription.put_nowait(Exception("boom"))
+        websocket = Mock(spec=WebSocket)
+
+        with self.assertRaises(Exception):
+            await self.handler.handle_websocket(websocket, 1, 100)
+
+        self.price_broadcaster.unsubscribe.assert_called_once_with(1, self.subscription)
+        logger.error.assert_called_once_with(
+            "An unexpected error happened in price websocket: boom"
+        )
+        websocket.send_json.assert_called_once_with(
+            {"error": "An unexpected error happened"}
+        )
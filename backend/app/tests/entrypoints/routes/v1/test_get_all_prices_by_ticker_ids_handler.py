@@ -0,0 +1,266 @@
+import asyncio
+import json
+from datetime import datetime
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+
+from app.application.get_all_prices_by_ticker_ids.get_all_prices_by_ticker_ids_query import (
+    GetAllPricesByTickerIdsQuery,
+)
+from app.application.get_all_prices_by_ticker_ids.get_all_prices_by_ticker_ids_query_response import (
+    GetAllPricesByTickerIdsQueryResponse,
+)
+from app.application.get_candles_by_ticker_ids.get_candles_by_ticker_ids_query import (
+    GetCandlesByTickerIdsQuery,
+)
+from app.application.get_candles_by_ticker_ids.get_candles_by_ticker_ids_query_response import (
+    GetCandlesByTickerIdsQueryResponse,
+)
+from app.domain.crypto.exceptions.ticker_not_found_exception import (
+    TickerNotFoundException,
+)
+from app.domain.crypto.models.candle import Candle
+from app.domain.crypto.models.candle_interval import CandleInterval
+from app.domain.crypto.models.price import Price
+from app.entrypoints.routes.v1.get_all_prices_by_ticker_ids_handler import (
+    GetAllPricesByTickerIdsHandler,
+)
+
+
+class TestGetAllPricesByTickerIdsHandler(TestCase):
+    def setUp(self) -> None:
+        self.get_all_prices_by_ticker_ids_query = Mock(
+            spec=GetAllPricesByTickerIdsQuery
+        )
+        self.get_candles_by_ticker_ids_query = Mock(spec=GetCandlesByTickerIdsQuery)
+        self.start_date = datetime(2013, 1, 1)
+        self.end_date = datetime(2015, 1, 1)
+
+        self.handler = GetAllPricesByTickerIdsHandler(
+            self.get_all_prices_by_ticker_ids_query,
+            self.get_candles_by_ticker_ids_query,
+        )
+
+    @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_ids_handler.logger")
+    def test_handle(self, logger: Mock) -> None:
+        self.get_all_prices_by_ticker_ids_query.execute.return_value = (
+            GetAllPricesByTickerIdsQueryResponse(
+                ticker_ids=[1, 2, 3],
+                prices=iter(
+                    [
+                        Price(
+                            id=1,
+                            price=2.0,
+                            ticker_id=2,
+                            timestamp=datetime(2013, 1, 1),
+                        )
+                    ]
+                ),
+            )
+        )
+
+        result = self.handler.handle([2, 1, 3, 2], self.start_date, self.end_date)
+
+        self.assertEqual(
+            [
+                {"ticker_id": 1, "prices": []},
+                {
+                    "ticker_id": 2,
+                    "prices": [
+                        {
+                            "id": 1,
+                            "ticker_id": 2,
+                            "price": 2.0,
+                            "timestamp": "2013-01-01T00:00:00",
+                        }
+                    ],
+                },
+                {"ticker_id": 3, "prices": []},
+            ],
+            json.loads(self.__read_bytes(result)),
+        )
+        self.get_all_prices_by_ticker_ids_query.execute.assert_called_once_with(
+            [1, 2, 3], self.start_date, self.end_date
+        )
+        self.get_candles_by_ticker_ids_query.execute.assert_not_called()
+        logger.info.assert_called_once_with(
+            f"Getting prices for tickers [1, 2, 3] in date range [{self.start_date}, {self.end_date}]"
+        )
+        logger.error.assert_not_called()
+
+    @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_ids_handler.logger")
+    def test_handle_streams_chunks(self, logger: Mock) -> None:
+        prices = [
+            Price(id=index, price=1.0, ticker_id=1, timestamp=datetime(2013, 1, 1))
+            for index in range(1500)
+        ]
+        self.get_all_prices_by_ticker_ids_query.execute.return_value = (
+            GetAllPricesByTickerIdsQueryResponse(
+                ticker_ids=[1, 2],
+                prices=iter(
+                    prices
+                    + [
+                        Price(
+                            id=1500,
+                            price=1.0,
+                            ticker_id=2,
+                            timestamp=datetime(2013, 1, 1),
+                        )
+                    ]
+                ),
+            )
+        )
+
+        result = self.handler.handle([1, 2], self.start_date, self.end_date)
+        chunks = self.__read_chunks(result)
+
+        self.assertIsInstance(result, StreamingResponse)
+        self.assertEqual(9, len(chunks))
+        self.assertEqual(
+            [1500, 1],
+            [len(series["prices"]) for series in json.loads(b"".join(chunks))],
+        )
+
+    @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_ids_handler.logger")
+    def test_handle_stream_error(self, logger: Mock) -> None:
+        def failing_prices():
+            yield Price(id=1, price=1.0, ticker_id=1, timestamp=datetime(2013, 1, 1))
+            raise Exception("Connection lost")
+
+        self.get_all_prices_by_ticker_ids_query.execute.return_value = (
+            GetAllPricesByTickerIdsQueryResponse(
+                ticker_ids=[1], prices=failing_prices()
+            )
+        )
+
+        result = self.handler.handle([1], self.start_date, self.end_date)
+
+        with self.assertRaisesRegex(Exception, "Connection lost"):
+            self.__read_bytes(result)
+
+        logger.error.assert_called_once_with(
+            "Unexpected error occurred while streaming prices for tickers [1]: Connection lost"
+        )
+
+    @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_ids_handler.logger")
+    def test_handle_not_modified(self, logger: Mock) -> None:
+        self.get_all_prices_by_ticker_ids_query.execute.return_value = (
+            GetAllPricesByTickerIdsQueryResponse(ticker_ids=[1], prices=iter([]))
+        )
+        entity_tag = self.handler.handle([1], self.start_date, self.end_date).headers[
+            "etag"
+        ]
+
+        result = self.handler.handle(
+            [1], self.start_date, self.end_date, if_none_match=entity_tag
+        )
+
+        self.assertEqual(304, result.status_code)
+        self.assertIn("immutable", result.headers["cache-control"])
+        self.get_all_prices_by_ticker_ids_query.execute.assert_called_once()
+        logger.error.assert_not_called()
+
+    @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_ids_handler.logger")
+    def test_handle_bucket(self, logger: Mock) -> None:
+        self.get_candles_by_ticker_ids_query.execute.return_value = (
+            GetCandlesByTickerIdsQueryResponse(
+                interval=CandleInterval.ONE_DAY,
+                candles={
+                    1: [
+                        Candle(
+                            ticker_id=1,
+                            timestamp=datetime(2013, 1, 1),
+                            open=2.0,
+                            high=20.0,
+                            low=1.0,
+                            close=10.0,
+                            count=5,
+                        )
+                    ],
+                    2: [],
+                },
+            )
+        )
+
+        result = self.handler.handle(
+            [1, 2], self.start_date, self.end_date, CandleInterval.AUTO, 100
+        )
+
+        self.assertEqual(
+            [
+                {
+                    "ticker_id": 1,
+                    "candles": [
+                        {
+                            "ticker_id": 1,
+                            "timestamp": "2013-01-01T00:00:00",
+                            "open": 2.0,
+                            "high": 20.0,
+                            "low": 1.0,
+                            "close": 10.0,
+                            "count": 5,
+                        }
+                    ],
+                },
+                {"ticker_id": 2, "candles": []},
+            ],
+            json.loads(result.body),
+        )
+        self.assertEqual("1d", result.headers["x-candle-interval"])
+        self.get_candles_by_ticker_ids_query.execute.assert_called_once_with(
+            [1, 2], self.start_date, self.end_date, CandleInterval.AUTO, 100
+        )
+        self.get_all_prices_by_ticker_ids_query.execute.assert_not_called()
+        logger.error.assert_not_called()
+
+    @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_ids_handler.logger")
+    def test_handle_invalid_date_range(self, logger: Mock) -> None:
+        with self.assertRaises(HTTPException) as context:
+            self.handler.handle([1, 2], self.end_date, self.start_date)
+
+        self.assertEqual(context.exception.status_code, 400)
+        self.assertEqual(context.exception.detail, "start_date must be before end_date")
+        self.get_all_prices_by_ticker_ids_query.execute.assert_not_called()
+        logger.error.assert_called_once()
+
+    @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_ids_handler.logger")
+    def test_handle_ticker_not_found(self, logger: Mock) -> None:
+        self.get_all_prices_by_ticker_ids_query.execute.side_effect = (
+            TickerNotFoundException(100)
+        )
+
+        with self.assertRaises(HTTPException) as context:
+            self.handler.handle([1, 100], self.start_date, self.end_date)
+
+        self.assertEqual(context.exception.status_code, 404)
+        self.assertEqual(context.exception.detail, "Ticker not found")
+        logger.error.assert_called_once_with("Ticker with id '100' not found.")
+
+    @patch("app.entrypoints.routes.v1.get_all_prices_by_ticker_ids_handler.logger")
+    def test_handle_unexpected_error(self, logger: Mock) -> None:
+        self.get_all_prices_by_ticker_ids_query.execute.side_effect = Exception(
+            "Unexpected error"
+        )
+
+        with self.assertRaises(HTTPException) as context:
+            self.handler.handle([1, 2], self.start_date, self.end_date)
+
+        self.assertEqual(context.exception.status_code, 500)
+        self.assertEqual(context.exception.detail, "An unexpected error happened.")
+        logger.error.assert_called_once_with(
+            f"Unexpected error occurred while retrieving prices for tickers [1, 2] in date range [{self.start_date}, {self.end_date}]: Unexpected error"
+        )
+
+    @staticmethod
+    def __read_chunks(response: StreamingResponse) -> list[bytes]:
+        async def read() -> list[bytes]:
+            return [chunk async for chunk in response.body_iterator]
+
+        return asyncio.run(read())
+
+    @staticmethod
+    def __read_bytes(response: StreamingResponse) -> bytes:
+        return b"".join(TestGetAllPricesByTickerIdsHandler.__read_chunks(response))
@@ -1,4 +1,5 @@
-from unittest import TestCase
+import json
+from unittest import IsolatedAsyncioTestCase
 from unittest.mock import Mock, patch
 
 from fastapi import HTTPException
@@ -8,37 +9,77 @@ from app.application.get_all_symbols.get_all_symbols_query_response import (
     GetAllSymbolsQueryResponse,
 )
 from app.domain.crypto.models.symbol import Symbol
+from app.entrypoints.routes.http_cache import HttpCache
 from app.entrypoints.routes.v1.get_all_symbols_handler import GetAllSymbolsHandler
+from app.infrastructure.crypto.caches.catalog_version_cache import CatalogVersionCache
 from app.interfaces.api.v1.schemas.symbol_schema import SymbolSchema
 
 
-class TestGetAllSymbolsHandler(TestCase):
+class TestGetAllSymbolsHandler(IsolatedAsyncioTestCase):
     def setUp(self) -> None:
         self.get_all_symbols_query = Mock(spec=GetAllSymbolsQuery)
+        self.catalog_version_cache = Mock(spec=CatalogVersionCache)
+        self.catalog_version_cache.get.return_value = None
 
-        self.handler = GetAllSymbolsHandler(self.get_all_symbols_query)
+        self.handler = GetAllSymbolsHandler(
+            self.get_all_symbols_query, self.catalog_version_cache
+        )
 
     @patch("app.entrypoints.routes.v1.get_all_symbols_handler.logger")
-    def test_handle(self, logger: Mock) -> None:
+    async def test_handle(self, logger: Mock) -> None:
         symbol_schemas = [SymbolSchema(id=1, name="test", symbol="TST")]
         domain_schemas = [Symbol(id=1, name="test", symbol="TST")]
         self.get_all_symbols_query.execute.return_value = GetAllSymbolsQueryResponse(
             symbols=domain_schemas
         )
 
-        result = self.handler.handle()
+        result = await self.handler.handle()
 
-        self.assertEqual(result, symbol_schemas)
+        self.assertEqual(200, result.status_code)
+        self.assertEqual(
+            [symbol_schema.model_dump() for symbol_schema in symbol_schemas],
+            json.loads(result.body),
+        )
+        self.assertEqual(HttpCache.entity_tag(result.body), result.headers["etag"])
+        self.assertEqual("no-cache", result.headers["cache-control"])
+        self.catalog_version_cache.set.assert_called_once_with(
+            "symbols", result.headers["etag"]
+        )
         self.get_all_symbols_query.execute.assert_called_once()
         logger.info.assert_called_once_with("Getting all symbols from database")
         logger.error.assert_not_called()
 
     @patch("app.entrypoints.routes.v1.get_all_symbols_handler.logger")
-    def test_handle_unexpected_error(self, logger: Mock) -> None:
+    async def test_handle_not_modified(self, logger: Mock) -> None:
+        self.catalog_version_cache.get.return_value = '"version"'
+
+        result = await self.handler.handle('"version"')
+
+        self.assertEqual(304, result.status_code)
+        self.assertEqual('"version"', result.headers["etag"])
+        self.catalog_version_cache.get.assert_called_once_with("symbols")
+        self.get_all_symbols_query.execute.assert_not_called()
+        logger.error.assert_not_called()
+
+    @patch("app.entrypoints.routes.v1.get_all_symbols_handler.logger")
+    async def test_handle_not_modified_after_query(self, logger: Mock) -> None:
+        self.get_all_symbols_query.execute.return_value = GetAllSymbolsQueryResponse(
+            symbols=[Symbol(id=1, name="test", symbol="TST")]
+        )
+        entity_tag = (await self.handler.handle()).headers["etag"]
+
+        result = await self.handler.handle(f'W/"other", {entity_tag}')
+
+        self.assertEqual(304, result.status_code)
+        self.assertEqual(b"", result.body)
+        self.assertEqual(2, self.get_all_symbols_query.execute.call_count)
+
+    @patch("app.entrypoints.routes.v1.get_all_symbols_handler.logger")
+    async def test_handle_unexpected_error(self, logger: Mock) -> None:
         self.get_all_symbols_query.execute.side_effect = Exception()
 
         with self.assertRaises(HTTPException) as context:
-            self.handler.handle()
+            await self.handler.handle()
 
             self.assertEqual(context.exception.status_code, 500)
             self.assertEqual(context.exception.detail, "An unexpected error happened.")
@@ -1,4 +1,5 @@
-from unittest import TestCase
+import json
+from unittest import IsolatedAsyncioTestCase
 from unittest.mock import Mock, patch
 
 from fastapi import HTTPException
@@ -13,24 +14,29 @@ from app.domain.crypto.models.ticker import Ticker
 from app.domain.exchange.exceptions.exchange_not_found_exception import (
     ExchangeNotFoundException,
 )
+from app.entrypoints.routes.http_cache import HttpCache
 from app.entrypoints.routes.v1.get_all_tickers_by_exchange_id_handler import (
     GetAllTickersByExchangeIdHandler,
 )
+from app.infrastructure.crypto.caches.catalog_version_cache import CatalogVersionCache
 from app.interfaces.api.v1.schemas.ticker_schema import TickerSchema
 
 
-class TestGetAllTickersByExchangeIdHandler(TestCase):
+class TestGetAllTickersByExchangeIdHandler(IsolatedAsyncioTestCase):
     def setUp(self) -> None:
         self.get_all_tickers_by_exchange_id_query = Mock(
             spec=GetAllTickersByExchangeIdQuery
         )
 
+        self.catalog_version_cache = Mock(spec=CatalogVersionCache)
+        self.catalog_version_cache.get.return_value = None
+
         self.handler = GetAllTickersByExchangeIdHandler(
-            self.get_all_tickers_by_exchange_id_query
+            self.get_all_tickers_by_exchange_id_query, self.catalog_version_cache
         )
 
     @patch("app.entrypoints.routes.v1.get_all_tickers_by_exchange_id_handler.logger")
-    def test_handle(self, logger: Mock) -> None:
+    async def test_handle(self, logger: Mock) -> None:
         tickers = [
             Ticker(id=1, symbol_id=1, exchange_id=1, ticker="BTCUSDT"),
             Ticker(id=2, symbol_id=1, exchange_id=1, ticker="BTCEUR"),
@@ -38,14 +44,22 @@ class TestGetAllTickersByExchangeIdHandler(TestCase):
         query_response = GetAllTickersByExchangeIdQueryResponse(tickers=tickers)
         self.get_all_tickers_by_exchange_id_query.execute.return_value = query_response
 
-        result = self.handler.handle(1)
+        result = await self.handler.handle(1)
 
         self.assertEqual(
             [
-                TickerSchema(id=1, symbol_id=1, exchange_id=1, ticker="BTCUSDT"),
-                TickerSchema(id=2, symbol_id=1, exchange_id=1, ticker="BTCEUR"),
+                TickerSchema(
+                    id=1, symbol_id=1, exchange_id=1, ticker="BTCUSDT"
+                ).model_dump(),
+                TickerSchema(
+                    id=2, symbol_id=1, exchange_id=1, ticker="BTCEUR"
+                ).model_dump(),
             ],
-            result,
+            json.loads(result.body),
+        )
+        self.assertEqual(HttpCache.entity_tag(result.body), result.headers["etag"])
+        self.catalog_version_cache.set.assert_called_once_with(
+            "exchanges/1/tickers", result.headers["etag"]
         )
         logger.info.assert_called_once_with(
             "Getting all tickers for exchange '1' from database"
@@ -53,13 +67,23 @@ class TestGetAllTickersByExchangeIdHandler(TestCase):
         logger.error.assert_not_called()
 
     @patch("app.entrypoints.routes.v1.get_all_tickers_by_exchange_id_handler.logger")
-    def test_handle_not_found(self, logger: Mock) -> None:
+    async def test_handle_not_modified(self, logger: Mock) -> None:
+        self.catalog_version_cache.get.return_value = '"version"'
+
+        result = await self.handler.handle(1, '"version"')
+
+        self.assertEqual(304, result.status_code)
+        self.catalog_version_cache.get.assert_called_once_with("exchanges/1/tickers")
+        self.get_all_tickers_by_exchange_id_query.execute.assert_not_called()
+
+    @patch("app.entrypoints.routes.v1.get_all_tickers_by_exchange_id_handler.logger")
+    async def test_handle_not_found(self, logger: Mock) -> None:
         self.get_all_tickers_by_exchange_id_query.execute.side_effect = (
             ExchangeNotFoundException("id", 12)
         )
 
         with self.assertRaises(HTTPException) as context:
-            self.handler.handle(12)
+            await self.handler.handle(12)
 
             self.assertEqual(context.exception.status_code, 404)
             self.assertEqual(context.exception.detail, "Exchange not found")
@@ -70,11 +94,11 @@ class TestGetAllTickersByExchangeIdHandler(TestCase):
         )
 
     @patch("app.entrypoints.routes.v1.get_all_tickers_by_exchange_id_handler.logger")
-    def test_handle_unexpected_error(self, logger: Mock) -> None:
+    async def test_handle_unexpected_error(self, logger: Mock) -> None:
         self.get_all_tickers_by_exchange_id_query.execute.side_effect = Exception()
 
         with self.assertRaises(HTTPException) as context:
-            self.handler.handle(1)
+            await self.handler.handle(1)
 
             self.assertEqual(context.exception.status_code, 500)
             self.assertEqual(context.exception.detail, "An unexpected error happened.")
@@ -0,0 +1,50 @@
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from fastapi import HTTPException
+
+from app.entrypoints.routes.v1.get_database_pool_metrics_handler import (
+    GetDatabasePoolMetricsHandler,
+)
+from app.infrastructure.database.pool_metrics import PoolMetricsSnapshot
+from app.interfaces.api.v1.schemas.database_pool_metrics_schema import (
+    DatabasePoolMetricsSchema,
+)
+
+
+class TestGetDatabasePoolMetricsHandler(TestCase):
+    def setUp(self) -> None:
+        self.pool_metrics_provider = Mock()
+
+        self.handler = GetDatabasePoolMetricsHandler(self.pool_metrics_provider)
+
+    @patch("app.entrypoints.routes.v1.get_database_pool_metrics_handler.logger")
+    def test_handle(self, logger: Mock) -> None:
+        snapshot = PoolMetricsSnapshot(
+            name="sync",
+            pool_size=5,
+            checked_out=1,
+            overflow=-4,
+            checkouts=10,
+            timeouts=0,
+            checkout_latency_buckets={"0.001": 10, "+Inf": 10},
+            checkout_latency_sum=0.002,
+        )
+        self.pool_metrics_provider.return_value = [snapshot]
+
+        result = self.handler.handle()
+
+        self.assertEqual([DatabasePoolMetricsSchema.from_snapshot(snapshot)], result)
+        logger.error.assert_not_called()
+
+    @patch("app.entrypoints.routes.v1.get_database_pool_metrics_handler.logger")
+    def test_handle_unexpected_error(self, logger: Mock) -> None:
+        self.pool_metrics_provider.side_effect = Exception("boom")
+
+        with self.assertRaises(HTTPException) as context:
+            self.handler.handle()
+
+        self.assertEqual(500, context.exception.status_code)
+        logger.error.assert_called_once_with(
+            "An unexpected error happened while retrieving database pool metrics: boom"
+        )
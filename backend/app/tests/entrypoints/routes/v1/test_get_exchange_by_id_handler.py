@@ -1,4 +1,4 @@
-from unittest import TestCase
+from unittest import IsolatedAsyncioTestCase
 from unittest.mock import Mock, patch
 
 from fastapi import HTTPException
@@ -17,20 +17,20 @@ from app.entrypoints.routes.v1.get_exchange_by_id_handler import GetExchangeById
 from app.interfaces.api.v1.schemas.exchange_schema import ExchangeSchema
 
 
-class TestGetExchangeByIdHandler(TestCase):
+class TestGetExchangeByIdHandler(IsolatedAsyncioTestCase):
     def setUp(self) -> None:
         self.get_exchange_by_id_query = Mock(spec=GetExchangeByIdQuery)
 
         self.handler = GetExchangeByIdHandler(self.get_exchange_by_id_query)
 
     @patch("app.entrypoints.routes.v1.get_exchange_by_id_handler.logger")
-    def test_handle(self, logger: Mock) -> None:
+    async def test_handle(self, logger: Mock) -> None:
         query_response = GetExchangeByIdQueryResponse(
             exchange=Exchange(id=1, name="test")
         )
         self.get_exchange_by_id_query.execute.return_value = query_response
 
-        result = self.handler.handle(1)
+        result = await self.handler.handle(1)
 
         self.assertEqual(ExchangeSchema(id=1, name="test"), result)
         logger.info.assert_called_once_with(
@@ -39,13 +39,13 @@ class TestGetExchangeByIdHandler(TestCase):
         logger.error.assert_not_called()
 
     @patch("app.entrypoints.routes.v1.get_exchange_by_id_handler.logger")
-    def test_handle_not_found(self, logger: Mock) -> None:
+    async def test_handle_not_found(self, logger: Mock) -> None:
         self.get_exchange_by_id_query.execute.side_effect = ExchangeNotFoundException(
             "id", 12
         )
 
         with self.assertRaises(HTTPException) as context:
-            self.handler.handle(12)
+            await self.handler.handle(12)
 
             self.assertEqual(context.exception.status_code, 404)
             self.assertEqual(context.exception.detail, "Exchange not found")
@@ -56,11 +56,11 @@ class TestGetExchangeByIdHandler(TestCase):
         )
 
     @patch("app.entrypoints.routes.v1.get_exchange_by_id_handler.logger")
-    def test_handle_unexpected_error(self, logger: Mock) -> None:
+    async def test_handle_unexpected_error(self, logger: Mock) -> None:
         self.get_exchange_by_id_query.execute.side_effect = Exception()
 
         with self.assertRaises(HTTPException) as context:
-            self.handler.handle(1)
+            await self.handler.handle(1)
 
             self.assertEqual(context.exception.status_code, 500)
             self.assertEqual(context.exception.detail, "An unexpected error happened.")
@@ -0,0 +1,67 @@
+from datetime import datetime
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import Mock, patch
+
+from fastapi import HTTPException
+
+from app.application.get_latest_prices.get_latest_prices_query import (
+    GetLatestPricesQuery,
+)
+from app.application.get_latest_prices.get_latest_prices_query_response import (
+    GetLatestPricesQueryResponse,
+)
+from app.domain.crypto.models.price import Price
+from app.entrypoints.routes.v1.get_latest_prices_handler import (
+    GetLatestPricesHandler,
+)
+from app.interfaces.api.v1.schemas.price_schema import PriceSchema
+
+
+class TestGetLatestPricesHandler(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.get_latest_prices_query = Mock(spec=GetLatestPricesQuery)
+
+        self.handler = GetLatestPricesHandler(self.get_latest_prices_query)
+
+    @patch("app.entrypoints.routes.v1.get_latest_prices_handler.logger")
+    async def test_handle(self, logger: Mock) -> None:
+        self.get_latest_prices_query.execute.return_value = (
+            GetLatestPricesQueryResponse(
+                prices=[
+                    Price(id=1, ticker_id=1, price=1.0, timestamp=datetime(2020, 1, 1)),
+                    Price(id=2, ticker_id=2, price=2.0, timestamp=datetime(2020, 1, 2)),
+                ]
+            )
+        )
+
+        result = await self.handler.handle(None, [1])
+
+        self.assertEqual(
+            [
+                PriceSchema(
+                    id=1, ticker_id=1, price=1.0, timestamp=datetime(2020, 1, 1)
+                ),
+                PriceSchema(
+                    id=2, ticker_id=2, price=2.0, timestamp=datetime(2020, 1, 2)
+                ),
+            ],
+            result,
+        )
+        self.get_latest_prices_query.execute.assert_called_once_with(None, [1])
+        logger.info.assert_called_once_with(
+            "Getting latest prices for tickers None and exchanges [1] from cache"
+        )
+        logger.error.assert_not_called()
+
+    @patch("app.entrypoints.routes.v1.get_latest_prices_handler.logger")
+    async def test_handle_unexpected_error(self, logger: Mock) -> None:
+        self.get_latest_prices_query.execute.side_effect = Exception("Unexpected error")
+
+        with self.assertRaises(HTTPException) as context:
+            await self.handler.handle([1], None)
+
+        self.assertEqual(context.exception.status_code, 500)
+        self.assertEqual(context.exception.detail, "An unexpected error happened.")
+        logger.error.assert_called_once_with(
+            "Unexpected error occurred while retrieving latest prices for tickers [1] and exchanges None: Unexpected error"
+        )
@@ -1,4 +1,4 @@
-from unittest import TestCase
+from unittest import IsolatedAsyncioTestCase
 from unittest.mock import Mock, patch
 
 from fastapi import HTTPException
@@ -15,31 +15,31 @@ from app.entrypoints.routes.v1.get_symbol_by_id_handler import GetSymbolByIdHand
 from app.interfaces.api.v1.schemas.symbol_schema import SymbolSchema
 
 
-class TestGetSymbolByIdHandler(TestCase):
+class TestGetSymbolByIdHandler(IsolatedAsyncioTestCase):
     def setUp(self) -> None:
         self.query = Mock(spec=GetSymbolByIdQuery)
 
         self.handler = GetSymbolByIdHandler(self.query)
 
     @patch("app.entrypoints.routes.v1.get_symbol_by_id_handler.logger")
-    def test_handle(self, logger: Mock) -> None:
+    async def test_handle(self, logger: Mock) -> None:
         query_response = GetSymbolByIdQueryResponse(
             symbol=Symbol(id=1, name="test", symbol="TST")
         )
         self.query.execute.return_value = query_response
 
-        result = self.handler.handle(1)
+        result = await self.handler.handle(1)
 
         self.assertEqual(SymbolSchema(id=1, name="test", symbol="TST"), result)
         logger.info.assert_called_once_with("Getting symbol with id '1' from database")
         logger.error.assert_not_called()
 
     @patch("app.entrypoints.routes.v1.get_symbol_by_id_handler.logger")
-    def test_handle_not_found(self, logger: Mock) -> None:
+    async def test_handle_not_found(self, logger: Mock) -> None:
         self.query.execute.side_effect = SymbolNotFoundException(12)
 
         with self.assertRaises(HTTPException) as context:
-            self.handler.handle(12)
+            await self.handler.handle(12)
 
             self.assertEqual(context.exception.status_code, 404)
             self.assertEqual(context.exception.detail, "Symbol not found")
@@ -48,11 +48,11 @@ class TestGetSymbolByIdHandler(TestCase):
         logger.info.assert_called_once_with("Getting symbol with id '12' from database")
 
     @patch("app.entrypoints.routes.v1.get_symbol_by_id_handler.logger")
-    def test_handle_unexpected_error(self, logger: Mock) -> None:
+    async def test_handle_unexpected_error(self, logger: Mock) -> None:
         self.query.execute.side_effect = Exception()
 
         with self.assertRaises(HTTPException) as context:
-            self.handler.handle(1)
+            await self.handler.handle(1)
 
             self.assertEqual(context.exception.status_code, 500)
             self.assertEqual(context.exception.detail, "An unexpected error happened.")
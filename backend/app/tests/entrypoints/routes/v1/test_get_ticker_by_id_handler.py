@@ -1,4 +1,4 @@
-from unittest import TestCase
+from unittest import IsolatedAsyncioTestCase
 from unittest.mock import Mock, patch
 
 from fastapi import HTTPException
@@ -15,20 +15,20 @@ from app.entrypoints.routes.v1.get_ticker_by_id_handler import GetTickerByIdHand
 from app.interfaces.api.v1.schemas.ticker_schema import TickerSchema
 
 
-class TestGetTickerByIdHandler(TestCase):
+class TestGetTickerByIdHandler(IsolatedAsyncioTestCase):
     def setUp(self) -> None:
         self.get_ticker_by_id_query = Mock(spec=GetTickerByIdQuery)
 
         self.handler = GetTickerByIdHandler(self.get_ticker_by_id_query)
 
     @patch("app.entrypoints.routes.v1.get_ticker_by_id_handler.logger")
-    def test_handle(self, logger: Mock) -> None:
+    async def test_handle(self, logger: Mock) -> None:
         query_response = GetTickerByIdQueryResponse(
             ticker=Ticker(id=1, symbol_id=1, exchange_id=1, ticker="BTCUSDT")
         )
         self.get_ticker_by_id_query.execute.return_value = query_response
 
-        result = self.handler.handle(1)
+        result = await self.handler.handle(1)
 
         self.assertEqual(
             TickerSchema(id=1, symbol_id=1, exchange_id=1, ticker="BTCUSDT"), result
@@ -37,11 +37,11 @@ class TestGetTickerByIdHandler(TestCase):
         logger.error.assert_not_called()
 
     @patch("app.entrypoints.routes.v1.get_ticker_by_id_handler.logger")
-    def test_handle_not_found(self, logger: Mock) -> None:
+    async def test_handle_not_found(self, logger: Mock) -> None:
         self.get_ticker_by_id_query.execute.side_effect = TickerNotFoundException(12)
 
         with self.assertRaises(HTTPException) as context:
-            self.handler.handle(12)
+            await self.handler.handle(12)
 
             self.assertEqual(context.exception.status_code, 404)
             self.assertEqual(context.exception.detail, "Ticker not found")
@@ -50,11 +50,11 @@ class TestGetTickerByIdHandler(TestCase):
         logger.info.assert_called_once_with("Retrieving ticker with id '12'")
 
     @patch("app.entrypoints.routes.v1.get_ticker_by_id_handler.logger")
-    def test_handle_unexpected_error(self, logger: Mock) -> None:
+    async def test_handle_unexpected_error(self, logger: Mock) -> None:
         self.get_ticker_by_id_query.execute.side_effect = Exception()
 
         with self.assertRaises(HTTPException) as context:
-            self.handler.handle(1)
+            await self.handler.handle(1)
 
             self.assertEqual(context.exception.status_code, 500)
             self.assertEqual(context.exception.detail, "An unexpected error happened.")
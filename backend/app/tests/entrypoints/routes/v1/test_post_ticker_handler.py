@@ -1,4 +1,4 @@
-from unittest import TestCase
+from unittest import IsolatedAsyncioTestCase
 from unittest.mock import Mock, patch
 
 from fastapi import HTTPException
@@ -15,25 +15,29 @@ from app.domain.crypto.exceptions.ticker_already_exists_exception import (
 )
 from app.domain.crypto.models.ticker import Ticker
 from app.entrypoints.routes.v1.post_ticker_handler import PostTickerHandler
+from app.infrastructure.crypto.caches.catalog_version_cache import CatalogVersionCache
 from app.interfaces.api.v1.schemas.ticker_create_schema import TickerCreateSchema
 from app.interfaces.api.v1.schemas.ticker_schema import TickerSchema
 
 
-class TestPostTickerHandler(TestCase):
+class TestPostTickerHandler(IsolatedAsyncioTestCase):
     def setUp(self) -> None:
         self.create_ticker_command = Mock(spec=CreateTickerCommand)
+        self.catalog_version_cache = Mock(spec=CatalogVersionCache)
 
-        self.handler = PostTickerHandler(self.create_ticker_command)
+        self.handler = PostTickerHandler(
+            self.create_ticker_command, self.catalog_version_cache
+        )
 
     @patch("app.entrypoints.routes.v1.post_ticker_handler.logger")
-    def test_handle(self, logger: Mock) -> None:
+    async def test_handle(self, logger: Mock) -> None:
         command_response = CreateTickerCommandResponse(
             created_ticker=Ticker(id=1, ticker="BTCUSDT", exchange_id=1, symbol_id=1)
         )
         self.create_ticker_command.execute.return_value = command_response
         ticker_create = TickerCreateSchema(ticker="BTCUSDT", exchange_id=1, symbol_id=1)
 
-        result = self.handler.handle(ticker_create)
+        result = await self.handler.handle(ticker_create)
 
         self.assertEqual(
             result, TickerSchema(id=1, ticker="BTCUSDT", exchange_id=1, symbol_id=1)
@@ -44,17 +48,18 @@ class TestPostTickerHandler(TestCase):
         logger.info.assert_called_once_with(
             "Creating ticker 'BTCUSDT' for exchange '1' and symbol '1'"
         )
+        self.catalog_version_cache.invalidate.assert_called_once()
         logger.error.assert_not_called()
 
     @patch("app.entrypoints.routes.v1.post_ticker_handler.logger")
-    def test_handle_symbol_exists(self, logger: Mock) -> None:
+    async def test_handle_symbol_exists(self, logger: Mock) -> None:
         self.create_ticker_command.execute.side_effect = TickerAlreadyExistsException(
             "BTCUSDT", 1
         )
         ticker_create = TickerCreateSchema(ticker="BTCUSDT", exchange_id=1, symbol_id=1)
 
         with self.assertRaises(HTTPException) as context:
-            self.handler.handle(ticker_create)
+            await self.handler.handle(ticker_create)
 
             self.assertEqual(context.exception.status_code, 409)
             self.assertEqual(
@@ -68,12 +73,13 @@ class TestPostTickerHandler(TestCase):
         self.create_ticker_command.execute.assert_called_once_with(
             Ticker(ticker="BTCUSDT", exchange_id=1, symbol_id=1)
         )
+        self.catalog_version_cache.invalidate.assert_not_called()
         logger.info.assert_called_once_with(
             "Creating ticker 'BTCUSDT' for exchange '1' and symbol '1'"
         )
 
     @patch("app.entrypoints.routes.v1.post_ticker_handler.logger")
-    def test_handle_symbol_exchange_id_not_exists(self, logger: Mock) -> None:
+    async def test_handle_symbol_exchange_id_not_exists(self, logger: Mock) -> None:
         self.create_ticker_command.execute.side_effect = (
             ReferenceToNonExistentIdException("exchange_id", 15)
         )
@@ -82,7 +88,7 @@ class TestPostTickerHandler(TestCase):
         )
 
         with self.assertRaises(HTTPException) as context:
-            self.handler.handle(ticker_create)
+            await self.handler.handle(ticker_create)
 
             self.assertEqual(context.exception.status_code, 400)
             self.assertEqual(
@@ -100,7 +106,7 @@ class TestPostTickerHandler(TestCase):
         )
 
     @patch("app.entrypoints.routes.v1.post_ticker_handler.logger")
-    def test_handle_symbol_symbol_id_not_exists(self, logger: Mock) -> None:
+    async def test_handle_symbol_symbol_id_not_exists(self, logger: Mock) -> None:
         self.create_ticker_command.execute.side_effect = (
             ReferenceToNonExistentIdException("symbol_id", 15)
         )
@@ -109,7 +115,7 @@ class TestPostTickerHandler(TestCase):
         )
 
         with self.assertRaises(HTTPException) as context:
-            self.handler.handle(ticker_create)
+            await self.handler.handle(ticker_create)
 
             self.assertEqual(context.exception.status_code, 400)
             self.assertEqual(context.exception.detail, "symbol_id '15' is non-existent")
@@ -125,12 +131,12 @@ class TestPostTickerHandler(TestCase):
         )
 
     @patch("app.entrypoints.routes.v1.post_ticker_handler.logger")
-    def test_handle_unexpected_error(self, logger: Mock) -> None:
+    async def test_handle_unexpected_error(self, logger: Mock) -> None:
         self.create_ticker_command.execute.side_effect = Exception()
         ticker_create = TickerCreateSchema(ticker="BTCUSDT", exchange_id=1, symbol_id=1)
 
         with self.assertRaises(HTTPException) as context:
-            self.handler.handle(ticker_create)
+            await self.handler.handle(ticker_create)
 
             self.assertEqual(context.exception.status_code, 500)
             self.assertEqual(context.exception.detail, "An unexpected error happened.")
@@ -0,0 +1,61 @@
+from datetime import datetime
+from unittest import TestCase
+from unittest.mock import Mock, patch, call
+
+from app.application.apply_price_retention.apply_price_retention_command import (
+    ApplyPriceRetentionCommand,
+)
+from app.application.apply_price_retention.apply_price_retention_command_response import (
+    ApplyPriceRetentionCommandResponse,
+)
+from app.domain.crypto.models.candle_interval import CandleInterval
+from app.entrypoints.tasks.apply_price_retention_handler import (
+    ApplyPriceRetentionHandler,
+)
+
+
+class TestApplyPriceRetentionHandler(TestCase):
+    def setUp(self) -> None:
+        self.apply_price_retention_command = Mock(spec=ApplyPriceRetentionCommand)
+
+        self.handler = ApplyPriceRetentionHandler(
+            command=self.apply_price_retention_command
+        )
+
+    @patch("app.entrypoints.tasks.apply_price_retention_handler.task_logger")
+    def test_handle(self, logger: Mock) -> None:
+        self.apply_price_retention_command.execute.return_value = (
+            ApplyPriceRetentionCommandResponse(
+                removed_partitions=[datetime(2025, 9, 1)],
+                skipped_partitions=[datetime(2025, 10, 1)],
+                deleted_candles={CandleInterval.ONE_MINUTE: 120},
+            )
+        )
+
+        self.handler.handle()
+
+        self.apply_price_retention_command.execute.assert_called_once()
+        logger.info.assert_has_calls(
+            [
+                call("Applying price retention policy..."),
+                call("Removed price partition starting at 2025-09-01 00:00:00"),
+                call("Deleted 120 expired 1m price candles"),
+            ]
+        )
+        logger.warning.assert_called_once_with(
+            "Kept expired price partition starting at 2025-10-01 00:00:00 because it is not fully archived yet"
+        )
+        logger.error.assert_not_called()
+
+    @patch("app.entrypoints.tasks.apply_price_retention_handler.task_logger")
+    def test_handle_unexpected_error(self, logger: Mock) -> None:
+        error = Exception("Something broke")
+        self.apply_price_retention_command.execute.side_effect = error
+
+        self.handler.handle()
+
+        self.apply_price_retention_command.execute.assert_called_once()
+        logger.info.assert_called_once_with("Applying price retention policy...")
+        logger.error.assert_called_once_with(
+            f"An unexpected error happened while applying price retention: {error}"
+        )
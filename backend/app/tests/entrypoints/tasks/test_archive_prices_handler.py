@@ -0,0 +1,48 @@
+from datetime import date
+from unittest import TestCase
+from unittest.mock import Mock, patch, call
+
+from app.application.archive_prices.archive_prices_command import (
+    ArchivePricesCommand,
+)
+from app.application.archive_prices.archive_prices_command_response import (
+    ArchivePricesCommandResponse,
+)
+from app.entrypoints.tasks.archive_prices_handler import ArchivePricesHandler
+
+
+class TestArchivePricesHandler(TestCase):
+    def setUp(self) -> None:
+        self.archive_prices_command = Mock(spec=ArchivePricesCommand)
+
+        self.handler = ArchivePricesHandler(command=self.archive_prices_command)
+
+    @patch("app.entrypoints.tasks.archive_prices_handler.task_logger")
+    def test_handle(self, logger: Mock) -> None:
+        self.archive_prices_command.execute.return_value = ArchivePricesCommandResponse(
+            archived_days={1: [date(2020, 1, 1), date(2020, 1, 2)]}
+        )
+
+        self.handler.handle()
+
+        self.archive_prices_command.execute.assert_called_once()
+        logger.info.assert_has_calls(
+            [
+                call("Archiving closed days of prices..."),
+                call("Archived 2 days of prices for ticker 1"),
+            ]
+        )
+        logger.error.assert_not_called()
+
+    @patch("app.entrypoints.tasks.archive_prices_handler.task_logger")
+    def test_handle_unexpected_error(self, logger: Mock) -> None:
+        error = Exception("Something broke")
+        self.archive_prices_command.execute.side_effect = error
+
+        self.handler.handle()
+
+        self.archive_prices_command.execute.assert_called_once()
+        logger.info.assert_called_once_with("Archiving closed days of prices...")
+        logger.error.assert_called_once_with(
+            f"An unexpected error happened while archiving prices: {error}"
+        )
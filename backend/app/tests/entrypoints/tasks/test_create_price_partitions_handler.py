@@ -0,0 +1,54 @@
+from datetime import datetime
+from unittest import TestCase
+from unittest.mock import Mock, patch, call
+
+from app.application.create_price_partitions.create_price_partitions_command import (
+    CreatePricePartitionsCommand,
+)
+from app.application.create_price_partitions.create_price_partitions_command_response import (
+    CreatePricePartitionsCommandResponse,
+)
+from app.entrypoints.tasks.create_price_partitions_handler import (
+    CreatePricePartitionsHandler,
+)
+
+
+class TestCreatePricePartitionsHandler(TestCase):
+    def setUp(self) -> None:
+        self.create_price_partitions_command = Mock(spec=CreatePricePartitionsCommand)
+
+        self.handler = CreatePricePartitionsHandler(
+            command=self.create_price_partitions_command
+        )
+
+    @patch("app.entrypoints.tasks.create_price_partitions_handler.task_logger")
+    def test_handle(self, logger: Mock) -> None:
+        self.create_price_partitions_command.execute.return_value = (
+            CreatePricePartitionsCommandResponse(
+                created_partitions=[datetime(2025, 12, 1)]
+            )
+        )
+
+        self.handler.handle()
+
+        self.create_price_partitions_command.execute.assert_called_once()
+        logger.info.assert_has_calls(
+            [
+                call("Creating upcoming price partitions..."),
+                call("Created price partition starting at 2025-12-01 00:00:00"),
+            ]
+        )
+        logger.error.assert_not_called()
+
+    @patch("app.entrypoints.tasks.create_price_partitions_handler.task_logger")
+    def test_handle_unexpected_error(self, logger: Mock) -> None:
+        error = Exception("Something broke")
+        self.create_price_partitions_command.execute.side_effect = error
+
+        self.handler.handle()
+
+        self.create_price_partitions_command.execute.assert_called_once()
+        logger.info.assert_called_once_with("Creating upcoming price partitions...")
+        logger.error.assert_called_once_with(
+            f"An unexpected error happened while creating price partitions: {error}"
+        )
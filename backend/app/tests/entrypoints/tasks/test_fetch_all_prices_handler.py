@@ -0,0 +1,77 @@
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import Mock, patch
+
+from httpx import ConnectTimeout
+
+from app.application.update_all_prices_from_remote.update_all_prices_from_remote_command import (
+    UpdateAllPricesFromRemoteCommand,
+)
+from app.application.update_all_prices_from_remote.update_all_prices_from_remote_command_response import (
+    UpdateAllPricesFromRemoteCommandResponse,
+)
+from app.entrypoints.tasks.fetch_all_prices_handler import FetchAllPricesHandler
+
+
+class TestFetchAllPricesHandler(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.update_all_prices_from_remote_command = Mock(
+            spec=UpdateAllPricesFromRemoteCommand
+        )
+
+        self.handler = FetchAllPricesHandler(
+            command=self.update_all_prices_from_remote_command
+        )
+
+    @patch("app.entrypoints.tasks.fetch_all_prices_handler.task_logger")
+    async def test_handle(self, logger: Mock) -> None:
+        self.update_all_prices_from_remote_command.execute.return_value = (
+            UpdateAllPricesFromRemoteCommandResponse(
+                saved_prices=3, missing_exchanges=[], failed_exchanges={}
+            )
+        )
+
+        await self.handler.handle()
+
+        self.update_all_prices_from_remote_command.execute.assert_awaited_once()
+        self.assertEqual(logger.info.call_count, 2)
+        logger.info.assert_any_call("Fetching prices from all exchanges...")
+        logger.info.assert_any_call("Stored 3 prices")
+        logger.error.assert_not_called()
+
+    @patch("app.entrypoints.tasks.fetch_all_prices_handler.task_logger")
+    async def test_handle_exchange_errors(self, logger: Mock) -> None:
+        error = Exception("Something broke")
+        self.update_all_prices_from_remote_command.execute.return_value = (
+            UpdateAllPricesFromRemoteCommandResponse(
+                saved_prices=0,
+                missing_exchanges=["Binance"],
+                failed_exchanges={
+                    "Kraken": ConnectTimeout("timed out"),
+                    "Other": error,
+                },
+            )
+        )
+
+        await self.handler.handle()
+
+        self.update_all_prices_from_remote_command.execute.assert_awaited_once()
+        self.assertEqual(logger.error.call_count, 3)
+        logger.error.assert_any_call("Binance is not a registered exchange")
+        logger.error.assert_any_call("The connection to Kraken API has timed out")
+        logger.error.assert_any_call(
+            f"An unexpected error happened while fetching Other prices: {error}"
+        )
+        logger.info.assert_any_call("Stored 0 prices")
+
+    @patch("app.entrypoints.tasks.fetch_all_prices_handler.task_logger")
+    async def test_handle_unexpected_error(self, logger: Mock) -> None:
+        error = Exception("Something broke")
+        self.update_all_prices_from_remote_command.execute.side_effect = error
+
+        await self.handler.handle()
+
+        self.update_all_prices_from_remote_command.execute.assert_awaited_once()
+        logger.info.assert_called_once_with("Fetching prices from all exchanges...")
+        logger.error.assert_called_once_with(
+            f"An unexpected error happened while fetching exchange prices: {error}"
+        )
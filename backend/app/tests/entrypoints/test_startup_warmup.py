@@ -0,0 +1,70 @@
+import logging
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+from app.entrypoints.startup_warmup import StartupWarmup
+
+
+class TestStartupWarmup(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.logger = Mock(spec=logging.Logger)
+        self.handler_factories = [Mock(), Mock()]
+        self.startup_warmup = StartupWarmup(self.logger, self.handler_factories)
+
+    def test_preload_handlers(self) -> None:
+        self.startup_warmup.preload_handlers()
+
+        for handler_factory in self.handler_factories:
+            handler_factory.assert_called_once_with()
+        self.logger.info.assert_called_once()
+
+    @patch("app.entrypoints.startup_warmup.configure_mappers")
+    def test_configure_mappers(self, configure_mappers: Mock) -> None:
+        self.startup_warmup.configure_mappers()
+
+        configure_mappers.assert_called_once_with()
+        self.logger.info.assert_called_once()
+
+    @patch("app.entrypoints.startup_warmup.engine")
+    def test_connect_database(self, engine: Mock) -> None:
+        connection = MagicMock()
+        engine.connect.return_value.__enter__.return_value = connection
+
+        self.startup_warmup.connect_database()
+
+        connection.execute.assert_called_once()
+        self.logger.info.assert_called_once()
+        self.logger.error.assert_not_called()
+
+    @patch("app.entrypoints.startup_warmup.engine")
+    def test_connect_database_fail(self, engine: Mock) -> None:
+        engine.connect.side_effect = Exception("Connection refused")
+
+        self.startup_warmup.connect_database()
+
+        self.logger.error.assert_called_once_with(
+            "Failed to warm database connection: Connection refused"
+        )
+        self.logger.info.assert_not_called()
+
+    @patch("app.entrypoints.startup_warmup.async_engine")
+    async def test_connect_async_database(self, async_engine: Mock) -> None:
+        connection = AsyncMock()
+        async_engine.connect.return_value.__aenter__.return_value = connection
+
+        await self.startup_warmup.connect_async_database()
+
+        connection.execute.assert_awaited_once()
+        self.logger.info.assert_called_once()
+        self.logger.error.assert_not_called()
+
+    @patch("app.entrypoints.startup_warmup.async_engine")
+    async def test_connect_async_database_fail(self, async_engine: Mock) -> None:
+        async_engine.connect.side_effect = Exception("Connection refused")
+
+        await self.startup_warmup.connect_async_database()
+
+        self.logger.error.assert_called_once_with(
+            "Failed to warm async database connection: Connection refused"
+        )
+        self.logger.info.assert_not_called()
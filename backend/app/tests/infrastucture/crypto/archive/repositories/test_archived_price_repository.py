@@ -0,0 +1,440 @@
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+from unittest.mock import Mock
+
+from app.domain.crypto.exceptions.ticker_not_found_exception import (
+    TickerNotFoundException,
+)
+from app.domain.crypto.models.candle_interval import CandleInterval
+from app.domain.crypto.models.price import Price
+from app.domain.crypto.models.price_columns import PriceColumns
+from app.domain.crypto.models.price_cursor import PriceCursor
+from app.domain.crypto.repositories.price_archive_repository import (
+    PriceArchiveRepository,
+)
+from app.domain.crypto.repositories.price_repository import PriceRepository
+from app.infrastructure.crypto.archive.repositories.archived_price_repository import (
+    ArchivedPriceRepository,
+)
+
+
+class TestArchivedPriceRepository(TestCase):
+    def setUp(self) -> None:
+        self.price_repository = Mock(spec=PriceRepository)
+        self.price_archive_repository = Mock(spec=PriceArchiveRepository)
+        self.archive_end = datetime(2020, 1, 3)
+        self.price_archive_repository.get_archive_end_by_ticker_id.return_value = (
+            self.archive_end
+        )
+
+        self.archived_prices = [
+            Price(id=1, ticker_id=1, price=10.0, timestamp=datetime(2020, 1, 1)),
+            Price(id=2, ticker_id=1, price=11.0, timestamp=datetime(2020, 1, 2)),
+        ]
+        self.recent_prices = [
+            Price(id=3, ticker_id=1, price=12.0, timestamp=datetime(2020, 1, 4)),
+        ]
+
+        self.repository = ArchivedPriceRepository(
+            self.price_repository, self.price_archive_repository
+        )
+
+    def test_get_all_or_fail_by_ticker_id(self) -> None:
+        self.price_archive_repository.stream_all_by_ticker_id.return_value = iter(
+            self.archived_prices
+        )
+        self.price_repository.get_all_or_fail_by_ticker_id.return_value = (
+            self.recent_prices
+        )
+
+        result = self.repository.get_all_or_fail_by_ticker_id(
+            1, datetime(2020, 1, 1), None
+        )
+
+        self.assertEqual(result, self.archived_prices + self.recent_prices)
+        self.price_archive_repository.stream_all_by_ticker_id.assert_called_once_with(
+            1, datetime(2020, 1, 1), self.archive_end, False
+        )
+        self.price_repository.get_all_or_fail_by_ticker_id.assert_called_once_with(
+            1, self.archive_end, None, True, True
+        )
+
+    def test_get_all_or_fail_by_ticker_id_before_archive_end(self) -> None:
+        self.price_archive_repository.stream_all_by_ticker_id.return_value = iter(
+            self.archived_prices[:1]
+        )
+        self.price_repository.get_all_or_fail_by_ticker_id.return_value = []
+
+        result = self.repository.get_all_or_fail_by_ticker_id(
+            1, None, datetime(2020, 1, 1)
+        )
+
+        self.assertEqual(result, self.archived_prices[:1])
+        self.price_archive_repository.stream_all_by_ticker_id.assert_called_once_with(
+            1, None, datetime(2020, 1, 1), True
+        )
+
+    def test_get_all_or_fail_by_ticker_id_after_archive_end(self) -> None:
+        self.price_repository.get_all_or_fail_by_ticker_id.return_value = (
+            self.recent_prices
+        )
+
+        result = self.repository.get_all_or_fail_by_ticker_id(
+            1, datetime(2020, 1, 3), None, include_end=False
+        )
+
+        self.assertEqual(result, self.recent_prices)
+        self.price_archive_repository.stream_all_by_ticker_id.assert_not_called()
+        self.price_repository.get_all_or_fail_by_ticker_id.assert_called_once_with(
+            1, datetime(2020, 1, 3), None, False, True
+        )
+
+    def test_get_all_or_fail_by_ticker_id_not_archived(self) -> None:
+        self.price_archive_repository.get_archive_end_by_ticker_id.return_value = None
+        self.price_repository.get_all_or_fail_by_ticker_id.return_value = (
+            self.recent_prices
+        )
+
+        result = self.repository.get_all_or_fail_by_ticker_id(1, None, None)
+
+        self.assertEqual(result, self.recent_prices)
+        self.price_archive_repository.stream_all_by_ticker_id.assert_not_called()
+
+    def test_get_all_or_fail_by_ticker_id_ticker_not_found(self) -> None:
+        self.price_repository.get_all_or_fail_by_ticker_id.side_effect = (
+            TickerNotFoundException(1)
+        )
+
+        with self.assertRaises(TickerNotFoundException):
+            self.repository.get_all_or_fail_by_ticker_id(1, None, None)
+
+    def test_stream_all_or_fail_by_ticker_id(self) -> None:
+        self.price_archive_repository.stream_all_by_ticker_id.return_value = iter(
+            self.archived_prices
+        )
+        self.price_repository.stream_all_or_fail_by_ticker_id.return_value = iter(
+            self.recent_prices
+        )
+
+        result = self.repository.stream_all_or_fail_by_ticker_id(
+            1, None, None, PriceCursor(timestamp=datetime(2020, 1, 1), id=1), 2
+        )
+
+        self.assertEqual(list(result), [self.archived_prices[1], self.recent_prices[0]])
+        self.price_repository.stream_all_or_fail_by_ticker_id.assert_called_once_with(
+            1, self.archive_end, None, None, 2
+        )
+
+    def test_stream_all_or_fail_by_ticker_id_aware_cursor(self) -> None:
+        self.price_archive_repository.stream_all_by_ticker_id.return_value = iter(
+            self.archived_prices
+        )
+        self.price_repository.stream_all_or_fail_by_ticker_id.return_value = iter(
+            self.recent_prices
+        )
+
+        result = self.repository.stream_all_or_fail_by_ticker_id(
+            1,
+            None,
+            None,
+            PriceCursor(
+                timestamp=datetime(2020, 1, 1, 1, tzinfo=timezone(timedelta(hours=1))),
+                id=1,
+            ),
+            2,
+        )
+
+        self.assertEqual(list(result), [self.archived_prices[1], self.recent_prices[0]])
+
+    def test_stream_all_or_fail_by_ticker_id_aware_cursor_after_archive_end(
+        self,
+    ) -> None:
+        self.price_repository.stream_all_or_fail_by_ticker_id.return_value = iter(
+            self.recent_prices
+        )
+
+        result = self.repository.stream_all_or_fail_by_ticker_id(
+            1,
+            None,
+            None,
+            PriceCursor(timestamp=datetime(2020, 1, 3, tzinfo=timezone.utc), id=2),
+            10,
+        )
+
+        self.assertEqual(list(result), self.recent_prices)
+        self.price_archive_repository.stream_all_by_ticker_id.assert_not_called()
+        self.price_repository.stream_all_or_fail_by_ticker_id.assert_called_once_with(
+            1, None, None, PriceCursor(timestamp=datetime(2020, 1, 3), id=2), 10
+        )
+
+    def test_stream_all_or_fail_by_ticker_id_cursor_after_archive_end(self) -> None:
+        after = PriceCursor(timestamp=datetime(2020, 1, 3), id=2)
+        self.price_repository.stream_all_or_fail_by_ticker_id.return_value = iter(
+            self.recent_prices
+        )
+
+        result = self.repository.stream_all_or_fail_by_ticker_id(
+            1, None, None, after, 10
+        )
+
+        self.assertEqual(list(result), self.recent_prices)
+        self.price_archive_repository.stream_all_by_ticker_id.assert_not_called()
+        self.price_repository.stream_all_or_fail_by_ticker_id.assert_called_once_with(
+            1, None, None, after, 10
+        )
+
+    def test_stream_all_or_fail_by_ticker_ids(self) -> None:
+        self.price_archive_repository.get_archive_end_by_ticker_id.side_effect = [
+            self.archive_end,
+            None,
+            self.archive_end,
+        ]
+        self.price_archive_repository.stream_all_by_ticker_id.side_effect = [
+            iter(self.archived_prices),
+            iter([Price(id=4, ticker_id=3, price=1.0, timestamp=datetime(2020, 1, 1))]),
+        ]
+        recent_prices = [
+            Price(id=1, ticker_id=1, price=10.0, timestamp=datetime(2020, 1, 1)),
+            *self.recent_prices,
+            Price(id=5, ticker_id=2, price=2.0, timestamp=datetime(2020, 1, 1)),
+        ]
+        self.price_repository.stream_all_or_fail_by_ticker_ids.return_value = iter(
+            recent_prices
+        )
+
+        result = self.repository.stream_all_or_fail_by_ticker_ids([1, 2, 3], None, None)
+
+        self.assertEqual(
+            [
+                *self.archived_prices,
+                *self.recent_prices,
+                recent_prices[-1],
+                Price(id=4, ticker_id=3, price=1.0, timestamp=datetime(2020, 1, 1)),
+            ],
+            list(result),
+        )
+        self.price_repository.stream_all_or_fail_by_ticker_ids.assert_called_once_with(
+            [1, 2, 3], None, None
+        )
+
+    def test_stream_all_or_fail_by_ticker_ids_all_archived(self) -> None:
+        self.price_archive_repository.stream_all_by_ticker_id.return_value = iter([])
+        self.price_repository.stream_all_or_fail_by_ticker_ids.return_value = iter(
+            self.recent_prices
+        )
+
+        result = self.repository.stream_all_or_fail_by_ticker_ids(
+            [1], datetime(2020, 1, 1, tzinfo=timezone.utc), None
+        )
+
+        self.assertEqual(self.recent_prices, list(result))
+        self.price_repository.stream_all_or_fail_by_ticker_ids.assert_called_once_with(
+            [1], self.archive_end, None
+        )
+
+    def test_stream_all_or_fail_by_ticker_ids_not_archived(self) -> None:
+        self.price_archive_repository.get_archive_end_by_ticker_id.return_value = None
+        self.price_repository.stream_all_or_fail_by_ticker_ids.return_value = iter(
+            self.recent_prices
+        )
+
+        result = self.repository.stream_all_or_fail_by_ticker_ids([1], None, None)
+
+        self.assertEqual(self.recent_prices, list(result))
+        self.price_archive_repository.stream_all_by_ticker_id.assert_not_called()
+
+    def test_stream_columns_or_fail_by_ticker_id(self) -> None:
+        self.price_archive_repository.stream_columns_by_ticker_id.return_value = iter(
+            [
+                PriceColumns(
+                    ticker_id=1,
+                    ids=[1, 2],
+                    prices=[10.0, 11.0],
+                    timestamps=[datetime(2020, 1, 1), datetime(2020, 1, 2)],
+                )
+            ]
+        )
+        self.price_repository.stream_columns_or_fail_by_ticker_id.return_value = iter(
+            [
+                PriceColumns(
+                    ticker_id=1,
+                    ids=[3, 4],
+                    prices=[12.0, 13.0],
+                    timestamps=[datetime(2020, 1, 4), datetime(2020, 1, 5)],
+                )
+            ]
+        )
+
+        result = self.repository.stream_columns_or_fail_by_ticker_id(
+            1, None, None, PriceCursor(timestamp=datetime(2020, 1, 1), id=1), 2
+        )
+
+        self.assertEqual(
+            list(result),
+            [
+                PriceColumns(
+                    ticker_id=1,
+                    ids=[2],
+                    prices=[11.0],
+                    timestamps=[datetime(2020, 1, 2)],
+                ),
+                PriceColumns(
+                    ticker_id=1,
+                    ids=[3],
+                    prices=[12.0],
+                    timestamps=[datetime(2020, 1, 4)],
+                ),
+            ],
+        )
+        self.price_archive_repository.stream_columns_by_ticker_id.assert_called_once_with(
+            1, None, self.archive_end, False
+        )
+        self.price_repository.stream_columns_or_fail_by_ticker_id.assert_called_once_with(
+            1, self.archive_end, None, None, 2
+        )
+
+    def test_stream_columns_or_fail_by_ticker_id_aware_cursor(self) -> None:
+        self.price_archive_repository.stream_columns_by_ticker_id.return_value = iter(
+            [
+                PriceColumns(
+                    ticker_id=1,
+                    ids=[1, 2],
+                    prices=[10.0, 11.0],
+                    timestamps=[datetime(2020, 1, 1), datetime(2020, 1, 2)],
+                )
+            ]
+        )
+        self.price_repository.stream_columns_or_fail_by_ticker_id.return_value = iter(
+            [
+                PriceColumns(
+                    ticker_id=1,
+                    ids=[3, 4],
+                    prices=[12.0, 13.0],
+                    timestamps=[datetime(2020, 1, 4), datetime(2020, 1, 5)],
+                )
+            ]
+        )
+
+        result = self.repository.stream_columns_or_fail_by_ticker_id(
+            1,
+            None,
+            None,
+            PriceCursor(timestamp=datetime(2020, 1, 1, tzinfo=timezone.utc), id=1),
+            2,
+        )
+
+        self.assertEqual(
+            list(result),
+            [
+                PriceColumns(
+                    ticker_id=1,
+                    ids=[2],
+                    prices=[11.0],
+                    timestamps=[datetime(2020, 1, 2)],
+                ),
+                PriceColumns(
+                    ticker_id=1,
+                    ids=[3],
+                    prices=[12.0],
+                    timestamps=[datetime(2020, 1, 4)],
+                ),
+            ],
+        )
+        self.price_archive_repository.stream_columns_by_ticker_id.assert_called_once_with(
+            1, None, self.archive_end, False
+        )
+        self.price_repository.stream_columns_or_fail_by_ticker_id.assert_called_once_with(
+            1, self.archive_end, None, None, 2
+        )
+
+    def test_stream_columns_or_fail_by_ticker_id_not_archived(self) -> None:
+        self.price_archive_repository.get_archive_end_by_ticker_id.return_value = None
+
+        self.repository.stream_columns_or_fail_by_ticker_id(1, None, None)
+
+        self.price_archive_repository.stream_columns_by_ticker_id.assert_not_called()
+        self.price_repository.stream_columns_or_fail_by_ticker_id.assert_called_once_with(
+            1, None, None, None, None
+        )
+
+    def test_get_timestamp_range_by_ticker_id(self) -> None:
+        self.price_archive_repository.get_timestamp_range_by_ticker_id.return_value = (
+            datetime(2020, 1, 1),
+            datetime(2020, 1, 2),
+        )
+        self.price_repository.get_timestamp_range_by_ticker_id.return_value = (
+            datetime(2020, 1, 4),
+            datetime(2020, 1, 5),
+        )
+
+        result = self.repository.get_timestamp_range_by_ticker_id(1, None, None)
+
+        self.assertEqual(result, (datetime(2020, 1, 1), datetime(2020, 1, 5)))
+        self.price_archive_repository.get_timestamp_range_by_ticker_id.assert_called_once_with(
+            1, None, self.archive_end, False
+        )
+        self.price_repository.get_timestamp_range_by_ticker_id.assert_called_once_with(
+            1, self.archive_end, None
+        )
+
+    def test_get_timestamp_range_by_ticker_id_empty(self) -> None:
+        self.price_archive_repository.get_timestamp_range_by_ticker_id.return_value = (
+            None
+        )
+        self.price_repository.get_timestamp_range_by_ticker_id.return_value = None
+
+        result = self.repository.get_timestamp_range_by_ticker_id(1, None, None)
+
+        self.assertIsNone(result)
+
+    def test_get_timestamp_range_by_ticker_ids(self) -> None:
+        self.price_archive_repository.get_archive_end_by_ticker_id.side_effect = (
+            lambda ticker_id: (None if ticker_id == 2 else self.archive_end)
+        )
+        self.price_archive_repository.get_timestamp_range_by_ticker_id.return_value = (
+            datetime(2020, 1, 1),
+            datetime(2020, 1, 2),
+        )
+        self.price_repository.get_timestamp_range_by_ticker_id.return_value = None
+        self.price_repository.get_timestamp_range_by_ticker_ids.return_value = (
+            datetime(2020, 1, 2),
+            datetime(2020, 1, 5),
+        )
+
+        result = self.repository.get_timestamp_range_by_ticker_ids([1, 2], None, None)
+
+        self.assertEqual(result, (datetime(2020, 1, 1), datetime(2020, 1, 5)))
+        self.price_archive_repository.get_timestamp_range_by_ticker_id.assert_called_once_with(
+            1, None, self.archive_end, False
+        )
+        self.price_repository.get_timestamp_range_by_ticker_ids.assert_called_once_with(
+            [1, 2], None, None
+        )
+
+    def test_get_timestamp_range_by_ticker_ids_empty(self) -> None:
+        self.price_archive_repository.get_archive_end_by_ticker_id.return_value = None
+        self.price_repository.get_timestamp_range_by_ticker_ids.return_value = None
+
+        result = self.repository.get_timestamp_range_by_ticker_ids([1, 2], None, None)
+
+        self.assertIsNone(result)
+
+    def test_get_candles_or_fail_by_ticker_id(self) -> None:
+        self.repository.get_candles_or_fail_by_ticker_id(
+            1, None, None, CandleInterval.ONE_HOUR
+        )
+
+        self.price_repository.get_candles_or_fail_by_ticker_id.assert_called_once_with(
+            1, None, None, CandleInterval.ONE_HOUR
+        )
+        self.price_archive_repository.get_archive_end_by_ticker_id.assert_not_called()
+
+    def test_get_candles_or_fail_by_ticker_ids(self) -> None:
+        self.repository.get_candles_or_fail_by_ticker_ids(
+            [1, 2], None, None, CandleInterval.ONE_HOUR
+        )
+
+        self.price_repository.get_candles_or_fail_by_ticker_ids.assert_called_once_with(
+            [1, 2], None, None, CandleInterval.ONE_HOUR
+        )
+        self.price_archive_repository.get_archive_end_by_ticker_id.assert_not_called()
@@ -0,0 +1,128 @@
+import os
+from datetime import date, datetime, timezone, timedelta
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import pyarrow.parquet as pq
+
+from app.domain.crypto.models.price import Price
+from app.domain.crypto.models.price_columns import PriceColumns
+from app.infrastructure.crypto.archive.repositories.parquet_price_archive_repository import (
+    ParquetPriceArchiveRepository,
+)
+from app.infrastructure.crypto.archive.translators.arrow_price_translator import (
+    ArrowPriceTranslator,
+)
+
+
+class TestParquetPriceArchiveRepository(TestCase):
+    def setUp(self) -> None:
+        self.archive_directory = TemporaryDirectory()
+        self.addCleanup(self.archive_directory.cleanup)
+
+        self.repository = ParquetPriceArchiveRepository(
+            self.archive_directory.name, "zstd", ArrowPriceTranslator()
+        )
+
+        self.first_day_prices = [
+            Price(
+                id=index,
+                ticker_id=1,
+                price=10.0 + index,
+                timestamp=datetime(2020, 1, 1) + timedelta(hours=index),
+            )
+            for index in range(1, 4)
+        ]
+        self.second_day_prices = [
+            Price(
+                id=index,
+                ticker_id=1,
+                price=10.0 + index,
+                timestamp=datetime(2020, 1, 2) + timedelta(hours=index),
+            )
+            for index in range(4, 6)
+        ]
+        self.repository.save(1, date(2020, 1, 1), self.first_day_prices[::-1])
+        self.repository.save(1, date(2020, 1, 2), self.second_day_prices)
+
+    def test_save(self) -> None:
+        file_path = os.path.join(
+            self.archive_directory.name,
+            "ticker_id=1",
+            "date=2020-01-01",
+            "prices.parquet",
+        )
+
+        parquet_file = pq.ParquetFile(file_path)
+
+        self.assertEqual(parquet_file.metadata.num_rows, 3)
+        self.assertEqual(
+            parquet_file.metadata.row_group(0).column(0).compression, "ZSTD"
+        )
+        self.assertEqual(parquet_file.read().column("id").to_pylist(), [1, 2, 3])
+
+    def test_get_archive_end_by_ticker_id(self) -> None:
+        result = self.repository.get_archive_end_by_ticker_id(1)
+
+        self.assertEqual(result, datetime(2020, 1, 3))
+
+    def test_get_archive_end_by_ticker_id_not_archived(self) -> None:
+        result = self.repository.get_archive_end_by_ticker_id(2)
+
+        self.assertIsNone(result)
+
+    def test_stream_all_by_ticker_id(self) -> None:
+        result = list(self.repository.stream_all_by_ticker_id(1, None, None))
+
+        self.assertEqual(result, self.first_day_prices + self.second_day_prices)
+
+    def test_stream_all_by_ticker_id_in_range(self) -> None:
+        result = list(
+            self.repository.stream_all_by_ticker_id(
+                1,
+                datetime(2020, 1, 1, 2, tzinfo=timezone.utc),
+                datetime(2020, 1, 2, 5),
+                include_end=False,
+            )
+        )
+
+        self.assertEqual(result, self.first_day_prices[1:] + self.second_day_prices[:1])
+
+    def test_stream_columns_by_ticker_id(self) -> None:
+        result = list(
+            self.repository.stream_columns_by_ticker_id(
+                1, datetime(2020, 1, 1, 3), None
+            )
+        )
+
+        self.assertEqual(
+            result,
+            [
+                PriceColumns(
+                    ticker_id=1,
+                    ids=[3],
+                    prices=[13.0],
+                    timestamps=[datetime(2020, 1, 1, 3)],
+                ),
+                PriceColumns(
+                    ticker_id=1,
+                    ids=[4, 5],
+                    prices=[14.0, 15.0],
+                    timestamps=[datetime(2020, 1, 2, 4), datetime(2020, 1, 2, 5)],
+                ),
+            ],
+        )
+
+    def test_get_timestamp_range_by_ticker_id(self) -> None:
+        result = self.repository.get_timestamp_range_by_ticker_id(
+            1, datetime(2020, 1, 1, 2), datetime(2020, 1, 2, 4)
+        )
+
+        self.assertEqual(result, (datetime(2020, 1, 1, 2), datetime(2020, 1, 2, 4)))
+
+    def test_get_timestamp_range_by_ticker_id_empty(self) -> None:
+        result = self.repository.get_timestamp_range_by_ticker_id(
+            1, datetime(2020, 1, 1, 4), datetime(2020, 1, 2, 3)
+        )
+
+        self.assertIsNone(result)
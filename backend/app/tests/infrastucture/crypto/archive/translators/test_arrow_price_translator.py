@@ -0,0 +1,63 @@
+from datetime import datetime
+from unittest import TestCase
+
+import pyarrow as pa
+
+from app.domain.crypto.models.price import Price
+from app.domain.crypto.models.price_columns import PriceColumns
+from app.infrastructure.crypto.archive.translators.arrow_price_translator import (
+    ArrowPriceTranslator,
+)
+
+
+class TestArrowPriceTranslator(TestCase):
+    def setUp(self) -> None:
+        self.translator = ArrowPriceTranslator()
+        self.domain_prices = [
+            Price(id=1, ticker_id=1, price=10.5, timestamp=datetime(2020, 1, 1)),
+            Price(
+                id=2, ticker_id=1, price=11.5, timestamp=datetime(2020, 1, 1, 0, 0, 10)
+            ),
+        ]
+
+    def test_bulk_translate_to_table(self) -> None:
+        result = self.translator.bulk_translate_to_table(self.domain_prices)
+
+        self.assertEqual(result.schema, self.translator.schema)
+        self.assertEqual(
+            result.to_pydict(),
+            {
+                "id": [1, 2],
+                "price": [10.5, 11.5],
+                "timestamp": [datetime(2020, 1, 1), datetime(2020, 1, 1, 0, 0, 10)],
+            },
+        )
+
+    def test_bulk_translate_to_domain_model(self) -> None:
+        price_table = pa.table(
+            {
+                "id": [1, 2],
+                "price": [10.5, 11.5],
+                "timestamp": [datetime(2020, 1, 1), datetime(2020, 1, 1, 0, 0, 10)],
+            },
+            schema=self.translator.schema,
+        )
+
+        result = self.translator.bulk_translate_to_domain_model(1, price_table)
+
+        self.assertEqual(result, self.domain_prices)
+
+    def test_translate_to_domain_columns(self) -> None:
+        price_table = self.translator.bulk_translate_to_table(self.domain_prices)
+
+        result = self.translator.translate_to_domain_columns(1, price_table)
+
+        self.assertEqual(
+            result,
+            PriceColumns(
+                ticker_id=1,
+                ids=[1, 2],
+                prices=[10.5, 11.5],
+                timestamps=[datetime(2020, 1, 1), datetime(2020, 1, 1, 0, 0, 10)],
+            ),
+        )
@@ -0,0 +1,182 @@
+import asyncio
+from datetime import datetime
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import Mock
+
+from app.domain.crypto.exceptions.price_subscription_overflow_exception import (
+    PriceSubscriptionOverflowException,
+)
+from app.domain.crypto.models.price import Price
+from app.domain.crypto.repositories.async_price_repository import (
+    AsyncPriceRepository,
+)
+from app.infrastructure.crypto.broadcasters.price_broadcaster import PriceBroadcaster
+
+
+class TestPriceBroadcaster(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.price_repository = Mock(spec=AsyncPriceRepository)
+        self.price_repository.get_last_id.return_value = 10
+        self.price_repository.get_all_by_ticker_ids_after_id.return_value = []
+        self.price_broadcaster = PriceBroadcaster(self.price_repository, 0.001, 100, 5)
+        self.prices = [
+            Price(id=11, price=2.0, ticker_id=1, timestamp=datetime(2013, 1, 1)),
+            Price(id=12, price=20.0, ticker_id=1, timestamp=datetime(2014, 1, 1)),
+        ]
+
+    async def test_subscribe(self) -> None:
+        self.price_repository.get_all_by_ticker_ids_after_id.side_effect = [
+            [],
+            self.prices,
+        ] + [[]] * 100
+
+        first_subscription = self.price_broadcaster.subscribe(1)
+        second_subscription = self.price_broadcaster.subscribe(1)
+
+        self.assertEqual(
+            self.prices, await asyncio.wait_for(first_subscription.get(), 1)
+        )
+        self.assertEqual(
+            self.prices, await asyncio.wait_for(second_subscription.get(), 1)
+        )
+        self.assertEqual(2, self.price_broadcaster.subscribers(1))
+
+        self.price_broadcaster.unsubscribe(1, first_subscription)
+        self.price_broadcaster.unsubscribe(1, second_subscription)
+
+    async def test_subscribe_shares_polling(self) -> None:
+        subscriptions = [self.price_broadcaster.subscribe(1) for _ in range(10)]
+        subscriptions.append(self.price_broadcaster.subscribe(2))
+
+        await asyncio.sleep(0.05)
+
+        polls = self.price_repository.get_all_by_ticker_ids_after_id.call_count
+        self.assertGreater(polls, 0)
+        self.assertLess(polls, 100)
+        self.price_repository.get_last_id.assert_called_once()
+        self.price_repository.get_all_by_ticker_ids_after_id.assert_called_with(
+            [1, 2], 5
+        )
+
+        for subscription in subscriptions[:-1]:
+            self.price_broadcaster.unsubscribe(1, subscription)
+        self.price_broadcaster.unsubscribe(2, subscriptions[-1])
+
+    async def test_subscribe_polls_by_id(self) -> None:
+        late_price = Price(id=9, price=3.0, ticker_id=1, timestamp=datetime(2012, 1, 1))
+        other_price = Price(
+            id=13, price=4.0, ticker_id=2, timestamp=datetime(2013, 1, 1)
+        )
+        self.price_repository.get_all_by_ticker_ids_after_id.side_effect = [
+            self.prices,
+            [late_price, *self.prices, other_price],
+        ] + [[]] * 100
+
+        subscription = self.price_broadcaster.subscribe(1)
+        other_subscription = self.price_broadcaster.subscribe(2)
+
+        self.assertEqual(self.prices, await asyncio.wait_for(subscription.get(), 1))
+        self.assertEqual([late_price], await asyncio.wait_for(subscription.get(), 1))
+        self.assertEqual(
+            [other_price], await asyncio.wait_for(other_subscription.get(), 1)
+        )
+        self.assertEqual(
+            [([1, 2], 5), ([1, 2], 7), ([1, 2], 8)],
+            [
+                call.args
+                for call in self.price_repository.get_all_by_ticker_ids_after_id.call_args_list[
+                    :3
+                ]
+            ],
+        )
+
+        self.price_broadcaster.unsubscribe(1, subscription)
+        self.price_broadcaster.unsubscribe(2, other_subscription)
+
+    async def test_subscribe_empty_table(self) -> None:
+        self.price_repository.get_last_id.return_value = None
+        self.price_repository.get_all_by_ticker_ids_after_id.side_effect = [
+            [],
+            self.prices,
+        ] + [[]] * 100
+
+        subscription = self.price_broadcaster.subscribe(1)
+
+        self.assertEqual(self.prices, await asyncio.wait_for(subscription.get(), 1))
+        self.assertEqual(
+            [([1], None), ([1], None), ([1], 7)],
+            [
+                call.args
+                for call in self.price_repository.get_all_by_ticker_ids_after_id.call_args_list[
+                    :3
+                ]
+            ],
+        )
+
+        self.price_broadcaster.unsubscribe(1, subscription)
+
+    async def test_unsubscribe_stops_polling(self) -> None:
+        subscription = self.price_broadcaster.subscribe(1)
+        await asyncio.sleep(0.01)
+
+        self.price_broadcaster.unsubscribe(1, subscription)
+        await asyncio.sleep(0)
+        polls = self.price_repository.get_all_by_ticker_ids_after_id.call_count
+        await asyncio.sleep(0.02)
+
+        self.assertEqual(0, self.price_broadcaster.subscribers(1))
+        self.assertEqual(
+            polls, self.price_repository.get_all_by_ticker_ids_after_id.call_count
+        )
+
+    async def test_unsubscribe_unknown(self) -> None:
+        self.price_broadcaster.unsubscribe(1, asyncio.Queue())
+
+        self.assertEqual(0, self.price_broadcaster.subscribers(1))
+
+    async def test_subscribe_error(self) -> None:
+        self.price_repository.get_all_by_ticker_ids_after_id.side_effect = Exception(
+            "Database unavailable"
+        )
+
+        subscription = self.price_broadcaster.subscribe(1)
+        other_subscription = self.price_broadcaster.subscribe(2)
+
+        self.assertIsInstance(await asyncio.wait_for(subscription.get(), 1), Exception)
+        self.assertIsInstance(
+            await asyncio.wait_for(other_subscription.get(), 1), Exception
+        )
+        self.price_broadcaster.unsubscribe(1, subscription)
+        self.price_broadcaster.unsubscribe(2, other_subscription)
+
+    async def test_subscribe_overflow(self) -> None:
+        price_broadcaster = PriceBroadcaster(self.price_repository, 0.001, 2, 5)
+        self.price_repository.get_all_by_ticker_ids_after_id.side_effect = [
+            [Price(id=price_id, price=1.0, ticker_id=1, timestamp=datetime(2013, 1, 1))]
+            for price_id in range(11, 111)
+        ]
+
+        slow_subscription = price_broadcaster.subscribe(1)
+        subscription = price_broadcaster.subscribe(1)
+        for price_id in range(11, 14):
+            self.assertEqual(
+                [price_id],
+                [price.id for price in await asyncio.wait_for(subscription.get(), 1)],
+            )
+
+        self.assertEqual(
+            [[11], [12]],
+            [
+                [price.id for price in slow_subscription.get_nowait()],
+                [price.id for price in slow_subscription.get_nowait()],
+            ],
+        )
+        self.assertIsInstance(
+            slow_subscription.get_nowait(), PriceSubscriptionOverflowException
+        )
+        self.assertTrue(slow_subscription.empty())
+        self.assertEqual(1, price_broadcaster.subscribers(1))
+
+        price_broadcaster.unsubscribe(1, slow_subscription)
+        price_broadcaster.unsubscribe(1, subscription)
+        self.assertEqual(0, price_broadcaster.subscribers(1))
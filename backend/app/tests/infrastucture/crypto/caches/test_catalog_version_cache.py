@@ -0,0 +1,35 @@
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from app.infrastructure.crypto.caches.catalog_version_cache import CatalogVersionCache
+
+
+class TestCatalogVersionCache(TestCase):
+    def setUp(self) -> None:
+        self.cache = CatalogVersionCache(30.0)
+
+    def test_get_missing(self) -> None:
+        self.assertIsNone(self.cache.get("symbols"))
+
+    def test_set_and_get(self) -> None:
+        self.cache.set("symbols", '"version"')
+
+        self.assertEqual('"version"', self.cache.get("symbols"))
+        self.assertIsNone(self.cache.get("exchanges"))
+
+    @patch("app.infrastructure.crypto.caches.catalog_version_cache.time")
+    def test_get_expired(self, time: Mock) -> None:
+        time.monotonic.return_value = 100.0
+        self.cache.set("symbols", '"version"')
+        time.monotonic.return_value = 130.0
+
+        self.assertIsNone(self.cache.get("symbols"))
+
+    def test_invalidate(self) -> None:
+        self.cache.set("symbols", '"version"')
+        self.cache.set("exchanges", '"version"')
+
+        self.cache.invalidate()
+
+        self.assertIsNone(self.cache.get("symbols"))
+        self.assertIsNone(self.cache.get("exchanges"))
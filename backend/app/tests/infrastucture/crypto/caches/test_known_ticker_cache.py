@@ -0,0 +1,25 @@
+from unittest import TestCase
+
+from app.infrastructure.crypto.caches.known_ticker_cache import KnownTickerCache
+
+
+class TestKnownTickerCache(TestCase):
+    def setUp(self) -> None:
+        self.cache = KnownTickerCache()
+
+    def test_contains_all_not_loaded(self) -> None:
+        self.assertFalse(self.cache.contains_all([1]))
+
+    def test_contains_all(self) -> None:
+        result = self.cache.set([1, 2, 3])
+
+        self.assertEqual(frozenset({1, 2, 3}), result)
+        self.assertTrue(self.cache.contains_all([3, 1]))
+        self.assertFalse(self.cache.contains_all([1, 1000]))
+
+    def test_invalidate(self) -> None:
+        self.cache.set([1, 2, 3])
+
+        self.cache.invalidate()
+
+        self.assertFalse(self.cache.contains_all([1]))
@@ -0,0 +1,149 @@
+import asyncio
+from datetime import datetime
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import Mock
+
+from app.domain.crypto.models.price import Price
+from app.domain.crypto.models.ticker import Ticker
+from app.domain.crypto.repositories.async_price_repository import (
+    AsyncPriceRepository,
+)
+from app.domain.crypto.repositories.async_ticker_repository import (
+    AsyncTickerRepository,
+)
+from app.infrastructure.crypto.caches.latest_price_cache import LatestPriceCache
+
+
+class TestLatestPriceCache(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.price_repository = Mock(spec=AsyncPriceRepository)
+        self.ticker_repository = Mock(spec=AsyncTickerRepository)
+        self.ticker_repository.get_all.return_value = [
+            Ticker(id=1, ticker="BTCUSDT", symbol_id=1, exchange_id=1),
+            Ticker(id=2, ticker="ETHUSDT", symbol_id=2, exchange_id=1),
+            Ticker(id=3, ticker="XBTUSD", symbol_id=1, exchange_id=2),
+        ]
+        self.prices = [
+            Price(id=5, ticker_id=1, price=10.0, timestamp=datetime(2020, 1, 2)),
+            Price(id=4, ticker_id=2, price=20.0, timestamp=datetime(2020, 1, 1)),
+            Price(id=6, ticker_id=3, price=30.0, timestamp=datetime(2020, 1, 3)),
+        ]
+        self.price_repository.get_all_latest.return_value = self.prices
+
+        self.cache = LatestPriceCache(
+            self.price_repository, self.ticker_repository, 0.001, 2
+        )
+
+    async def test_get_all_warms_once(self) -> None:
+        self.cache.start()
+
+        first_result = await self.cache.get_all()
+        second_result = await self.cache.get_all()
+
+        self.assertEqual([self.prices[0], self.prices[1], self.prices[2]], first_result)
+        self.assertEqual(first_result, second_result)
+        self.price_repository.get_all_latest.assert_called_once_with()
+        self.ticker_repository.get_all.assert_called_once()
+
+        self.cache.stop()
+
+    async def test_get_all_by_ticker_ids(self) -> None:
+        await self.cache.warm()
+        self.cache.start()
+
+        result = await self.cache.get_all(ticker_ids=[3, 1, 1000])
+
+        self.assertEqual([self.prices[0], self.prices[2]], result)
+
+        self.cache.stop()
+
+    async def test_get_all_by_exchange_ids(self) -> None:
+        await self.cache.warm()
+        self.cache.start()
+
+        result = await self.cache.get_all(exchange_ids=[1])
+        filtered_result = await self.cache.get_all(ticker_ids=[2, 3], exchange_ids=[2])
+
+        self.assertEqual([self.prices[0], self.prices[1]], result)
+        self.assertEqual([self.prices[2]], filtered_result)
+
+        self.cache.stop()
+
+    async def test_refresh(self) -> None:
+        await self.cache.warm()
+        newer_price = Price(
+            id=8, ticker_id=1, price=11.0, timestamp=datetime(2020, 1, 4)
+        )
+        older_price = Price(
+            id=7, ticker_id=3, price=29.0, timestamp=datetime(2020, 1, 1)
+        )
+        self.price_repository.get_all_latest.return_value = [newer_price, older_price]
+
+        await self.cache.refresh()
+
+        self.price_repository.get_all_latest.assert_called_with(4)
+        self.assertEqual(
+            [newer_price, self.prices[1], self.prices[2]], await self.cache.get_all()
+        )
+        self.price_repository.get_all_latest.assert_called_with(6)
+        self.ticker_repository.get_all.assert_called_once()
+
+    async def test_refresh_late_commit(self) -> None:
+        await self.cache.warm()
+        newer_price = Price(
+            id=8, ticker_id=1, price=11.0, timestamp=datetime(2020, 1, 4)
+        )
+        self.price_repository.get_all_latest.return_value = [newer_price]
+        await self.cache.refresh()
+        late_price = Price(
+            id=7, ticker_id=2, price=21.0, timestamp=datetime(2020, 1, 4)
+        )
+        self.price_repository.get_all_latest.return_value = [newer_price, late_price]
+
+        await self.cache.refresh()
+
+        self.price_repository.get_all_latest.assert_called_with(6)
+        self.assertEqual(
+            [newer_price, late_price, self.prices[2]], await self.cache.get_all()
+        )
+
+    async def test_refresh_unknown_ticker(self) -> None:
+        await self.cache.warm()
+        new_ticker_price = Price(
+            id=7, ticker_id=4, price=1.0, timestamp=datetime(2020, 1, 4)
+        )
+        self.price_repository.get_all_latest.return_value = [new_ticker_price]
+        self.ticker_repository.get_all.return_value.append(
+            Ticker(id=4, ticker="ADAUSD", symbol_id=3, exchange_id=2)
+        )
+
+        await self.cache.refresh()
+
+        self.assertEqual(2, self.ticker_repository.get_all.call_count)
+        self.assertEqual(
+            [self.prices[2], new_ticker_price],
+            await self.cache.get_all(exchange_ids=[2]),
+        )
+
+    async def test_start_refreshes_periodically(self) -> None:
+        await self.cache.warm()
+        self.price_repository.get_all_latest.return_value = []
+
+        self.cache.start()
+        await asyncio.sleep(0.05)
+        self.cache.stop()
+
+        self.assertGreater(self.price_repository.get_all_latest.call_count, 2)
+        self.price_repository.get_all_latest.assert_called_with(4)
+
+    async def test_start_keeps_refreshing_after_error(self) -> None:
+        await self.cache.warm()
+        self.price_repository.get_all_latest.side_effect = [
+            Exception("Database unavailable")
+        ] + [[]] * 100
+
+        self.cache.start()
+        await asyncio.sleep(0.05)
+        self.cache.stop()
+
+        self.assertGreater(self.price_repository.get_all_latest.call_count, 2)
@@ -0,0 +1,175 @@
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+
+from app.domain.crypto.models.price import Price
+from app.infrastructure.crypto.caches.recent_price_buffer import RecentPriceBuffer
+
+
+class TestRecentPriceBuffer(TestCase):
+    def setUp(self) -> None:
+        self.instant = datetime(2020, 1, 1, 12)
+        self.prices = [
+            Price(
+                id=index,
+                ticker_id=1,
+                price=float(index),
+                timestamp=self.instant + timedelta(seconds=index),
+            )
+            for index in range(1, 6)
+        ]
+
+    def test_extend_and_get_all(self) -> None:
+        buffer = RecentPriceBuffer(1, 10, self.instant)
+
+        unsettled_prices = buffer.extend(
+            self.prices, self.instant + timedelta(seconds=4), self.instant
+        )
+
+        self.assertEqual(3, len(buffer))
+        self.assertEqual(self.prices[3:], unsettled_prices)
+        self.assertEqual(self.instant + timedelta(seconds=4), buffer.covered_until)
+        self.assertEqual(self.prices[:3], buffer.get_all(self.instant, None))
+        self.assertEqual(
+            self.prices[1:2],
+            buffer.get_all(
+                self.instant + timedelta(seconds=2),
+                self.instant + timedelta(seconds=3),
+                False,
+            ),
+        )
+        self.assertEqual(
+            self.prices[1:3],
+            buffer.get_all(
+                self.instant + timedelta(seconds=2),
+                self.instant + timedelta(seconds=3),
+            ),
+        )
+
+    def test_extend_with_aware_timestamps(self) -> None:
+        buffer = RecentPriceBuffer(1, 10, self.instant)
+
+        buffer.extend(
+            [
+                Price(
+                    id=1,
+                    ticker_id=1,
+                    price=1.0,
+                    timestamp=datetime(
+                        2020, 1, 1, 13, 1, tzinfo=timezone(timedelta(hours=1))
+                    ),
+                )
+            ],
+            self.instant + timedelta(minutes=2),
+            self.instant,
+        )
+
+        self.assertEqual(
+            [
+                Price(
+                    id=1, ticker_id=1, price=1.0, timestamp=datetime(2020, 1, 1, 12, 1)
+                )
+            ],
+            buffer.get_all(datetime(2020, 1, 1, 12, 1, tzinfo=timezone.utc), None),
+        )
+
+    def test_extend_wraps_around_capacity(self) -> None:
+        buffer = RecentPriceBuffer(1, 3, self.instant)
+
+        buffer.extend(
+            self.prices[:2], self.instant + timedelta(seconds=3), self.instant
+        )
+        buffer.extend(
+            self.prices[2:], self.instant + timedelta(seconds=6), self.instant
+        )
+
+        self.assertEqual(3, len(buffer))
+        self.assertEqual(self.prices[2:], buffer.get_all(self.instant, None))
+        self.assertEqual(
+            self.prices[3:4],
+            buffer.get_all(
+                self.instant + timedelta(seconds=4),
+                self.instant + timedelta(seconds=5),
+                False,
+            ),
+        )
+        self.assertFalse(buffer.covers_start(self.instant + timedelta(seconds=2)))
+        self.assertTrue(
+            buffer.covers_start(self.instant + timedelta(seconds=2, microseconds=1))
+        )
+
+    def test_extend_over_capacity(self) -> None:
+        buffer = RecentPriceBuffer(1, 2, self.instant)
+
+        buffer.extend(self.prices, self.instant + timedelta(seconds=6), self.instant)
+
+        self.assertEqual(self.prices[3:], buffer.get_all(self.instant, None))
+        self.assertFalse(buffer.covers_start(self.instant + timedelta(seconds=3)))
+
+    def test_extend_evicts_outside_window(self) -> None:
+        buffer = RecentPriceBuffer(1, 10, self.instant)
+        buffer.extend(self.prices, self.instant + timedelta(seconds=6), self.instant)
+
+        buffer.extend(
+            [],
+            self.instant + timedelta(seconds=7),
+            self.instant + timedelta(seconds=3),
+        )
+
+        self.assertEqual(3, len(buffer))
+        self.assertEqual(self.prices[2:], buffer.get_all(self.instant, None))
+        self.assertFalse(buffer.covers_start(self.instant))
+        self.assertTrue(buffer.covers_start(self.instant + timedelta(seconds=3)))
+
+    def test_version(self) -> None:
+        buffer = RecentPriceBuffer(1, 3, self.instant)
+
+        self.assertEqual((0, None), buffer.version)
+
+        buffer.extend(
+            self.prices[:2], self.instant + timedelta(seconds=3), self.instant
+        )
+        buffer.extend(
+            [
+                Price(
+                    id=0,
+                    ticker_id=1,
+                    price=0.0,
+                    timestamp=self.instant + timedelta(seconds=3),
+                ),
+                Price(
+                    id=1,
+                    ticker_id=1,
+                    price=1.0,
+                    timestamp=self.instant + timedelta(seconds=4),
+                ),
+            ],
+            self.instant + timedelta(seconds=5),
+            self.instant,
+        )
+
+        self.assertEqual((3, 2), buffer.version)
+        self.assertEqual(
+            self.instant + timedelta(seconds=1, microseconds=1), buffer.covered_from
+        )
+
+    def test_covers(self) -> None:
+        buffer = RecentPriceBuffer(1, 10, self.instant)
+        buffer.extend(self.prices, self.instant + timedelta(seconds=6), self.instant)
+
+        self.assertTrue(buffer.covers_start(self.instant))
+        self.assertFalse(buffer.covers_start(self.instant - timedelta(seconds=1)))
+        self.assertFalse(buffer.covers(self.instant, None))
+        self.assertFalse(
+            buffer.covers(
+                self.instant - timedelta(seconds=1), self.instant + timedelta(seconds=1)
+            )
+        )
+        self.assertTrue(
+            buffer.covers(self.instant, self.instant + timedelta(seconds=6), False)
+        )
+        self.assertFalse(
+            buffer.covers(self.instant, self.instant + timedelta(seconds=6))
+        )
+        self.assertTrue(
+            buffer.covers(self.instant, self.instant + timedelta(seconds=5))
+        )
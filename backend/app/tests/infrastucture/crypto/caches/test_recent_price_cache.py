@@ -0,0 +1,239 @@
+from datetime import datetime, timedelta, timezone
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import Mock, call
+
+from app.domain.crypto.exceptions.ticker_not_found_exception import (
+    TickerNotFoundException,
+)
+from app.domain.crypto.models.price import Price
+from app.domain.crypto.repositories.async_price_repository import (
+    AsyncPriceRepository,
+)
+from app.infrastructure.crypto.caches.recent_price_cache import RecentPriceCache
+
+
+class TestRecentPriceCache(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.price_repository = Mock(spec=AsyncPriceRepository)
+        self.now = datetime.now(timezone.utc).replace(tzinfo=None)
+        self.prices = [
+            Price(
+                id=index,
+                ticker_id=1,
+                price=float(index),
+                timestamp=self.now - timedelta(minutes=index),
+            )
+            for index in range(5, 0, -1)
+        ]
+        self.price_repository.get_all_or_fail_by_ticker_id.return_value = self.prices
+        self.price_repository.get_version_by_ticker_id.return_value = (4, 5)
+
+        self.cache = RecentPriceCache(
+            self.price_repository, timedelta(minutes=10), 100, timedelta(minutes=2)
+        )
+
+    async def test_get_all_or_fail_by_ticker_id_outside_window(self) -> None:
+        start_date = self.now - timedelta(minutes=20)
+
+        result = await self.cache.get_all_or_fail_by_ticker_id(1, start_date, None)
+
+        self.assertEqual(self.prices, result)
+        self.price_repository.get_all_or_fail_by_ticker_id.assert_called_once_with(
+            1, start_date, None, True, True
+        )
+
+    async def test_get_all_or_fail_by_ticker_id_without_start_date(self) -> None:
+        await self.cache.get_all_or_fail_by_ticker_id(1, None, None)
+
+        self.price_repository.get_all_or_fail_by_ticker_id.assert_called_once_with(
+            1, None, None, True, True
+        )
+
+    async def test_get_all_or_fail_by_ticker_id_populates_buffer(self) -> None:
+        result = await self.cache.get_all_or_fail_by_ticker_id(
+            1, self.now - timedelta(minutes=4, seconds=30), None
+        )
+
+        self.assertEqual(self.prices[1:], result)
+        self.price_repository.get_all_or_fail_by_ticker_id.assert_called_once()
+        ticker_id, start_date, end_date, include_end, check_ticker = (
+            self.price_repository.get_all_or_fail_by_ticker_id.call_args.args
+        )
+        self.assertEqual(1, ticker_id)
+        self.assertAlmostEqual(
+            self.now - timedelta(minutes=10), start_date, delta=timedelta(seconds=5)
+        )
+        self.assertEqual((None, True, True), (end_date, include_end, check_ticker))
+
+    async def test_get_all_or_fail_by_ticker_id_from_memory(self) -> None:
+        await self.cache.get_all_or_fail_by_ticker_id(
+            1, self.now - timedelta(minutes=5), None
+        )
+
+        result = await self.cache.get_all_or_fail_by_ticker_id(
+            1,
+            self.now - timedelta(minutes=4, seconds=30),
+            self.now - timedelta(minutes=3),
+            False,
+        )
+
+        self.assertEqual([self.prices[1]], result)
+        self.price_repository.get_all_or_fail_by_ticker_id.assert_called_once()
+        ticker_id, start_date, end_date = (
+            self.price_repository.get_version_by_ticker_id.call_args.args
+        )
+        self.assertEqual(1, ticker_id)
+        self.assertAlmostEqual(
+            self.now - timedelta(minutes=10), start_date, delta=timedelta(seconds=5)
+        )
+        self.assertAlmostEqual(
+            self.now - timedelta(minutes=2), end_date, delta=timedelta(seconds=5)
+        )
+
+    async def test_get_all_or_fail_by_ticker_id_late_commit(self) -> None:
+        await self.cache.get_all_or_fail_by_ticker_id(
+            1, self.now - timedelta(minutes=5), None
+        )
+        late_price = Price(
+            id=6,
+            ticker_id=1,
+            price=6.0,
+            timestamp=self.now - timedelta(minutes=3, seconds=30),
+        )
+        prices = self.prices[:2] + [late_price] + self.prices[2:]
+        self.price_repository.get_all_or_fail_by_ticker_id.return_value = prices
+        self.price_repository.get_version_by_ticker_id.return_value = (5, 6)
+
+        result = await self.cache.get_all_or_fail_by_ticker_id(
+            1,
+            self.now - timedelta(minutes=5),
+            self.now - timedelta(minutes=3),
+            False,
+        )
+
+        self.assertEqual(prices[:3], result)
+        self.assertEqual(
+            2, self.price_repository.get_all_or_fail_by_ticker_id.call_count
+        )
+        _, start_date, _, _, _ = (
+            self.price_repository.get_all_or_fail_by_ticker_id.call_args.args
+        )
+        self.assertAlmostEqual(
+            self.now - timedelta(minutes=10), start_date, delta=timedelta(seconds=5)
+        )
+
+    async def test_get_all_or_fail_by_ticker_id_extends_buffer(self) -> None:
+        self.price_repository.get_all_or_fail_by_ticker_id.return_value = self.prices[
+            :3
+        ]
+        self.price_repository.get_version_by_ticker_id.return_value = (3, 5)
+        await self.cache.get_all_or_fail_by_ticker_id(
+            1, self.now - timedelta(minutes=5), None
+        )
+        self.price_repository.get_all_or_fail_by_ticker_id.return_value = self.prices[
+            3:
+        ]
+
+        result = await self.cache.get_all_or_fail_by_ticker_id(
+            1, self.now - timedelta(minutes=5), None, True, True
+        )
+
+        self.assertEqual(self.prices, result)
+        self.assertEqual(
+            2, self.price_repository.get_all_or_fail_by_ticker_id.call_count
+        )
+        ticker_id, start_date, end_date, include_end, check_ticker = (
+            self.price_repository.get_all_or_fail_by_ticker_id.call_args.args
+        )
+        self.assertEqual(1, ticker_id)
+        self.assertAlmostEqual(
+            self.now - timedelta(minutes=2), start_date, delta=timedelta(seconds=5)
+        )
+        self.assertEqual((None, True, False), (end_date, include_end, check_ticker))
+
+    async def test_get_all_or_fail_by_ticker_id_unsettled_prices(self) -> None:
+        await self.cache.get_all_or_fail_by_ticker_id(
+            1, self.now - timedelta(minutes=5), None
+        )
+        self.price_repository.get_all_or_fail_by_ticker_id.return_value = []
+
+        result = await self.cache.get_all_or_fail_by_ticker_id(
+            1, self.now - timedelta(minutes=5), self.now - timedelta(minutes=1), False
+        )
+
+        self.assertEqual(self.prices[:4], result)
+
+    async def test_get_all_or_fail_by_ticker_id_evicted_by_capacity(self) -> None:
+        cache = RecentPriceCache(
+            self.price_repository, timedelta(minutes=10), 1, timedelta(minutes=2)
+        )
+        self.price_repository.get_version_by_ticker_id.return_value = (1, 2)
+        await cache.get_all_or_fail_by_ticker_id(
+            1, self.now - timedelta(minutes=3, seconds=30), None
+        )
+        self.price_repository.get_all_or_fail_by_ticker_id.reset_mock()
+        start_date = self.now - timedelta(minutes=5)
+
+        result = await cache.get_all_or_fail_by_ticker_id(1, start_date, None)
+
+        self.assertEqual(self.prices, result)
+        self.price_repository.get_all_or_fail_by_ticker_id.assert_called_once_with(
+            1, start_date, None, True, False
+        )
+
+    async def test_get_all_or_fail_by_ticker_id_ticker_not_found(self) -> None:
+        self.price_repository.get_all_or_fail_by_ticker_id.side_effect = (
+            TickerNotFoundException(1)
+        )
+
+        with self.assertRaises(TickerNotFoundException):
+            await self.cache.get_all_or_fail_by_ticker_id(
+                1, self.now - timedelta(minutes=5), None
+            )
+
+        with self.assertRaises(TickerNotFoundException):
+            await self.cache.get_all_or_fail_by_ticker_id(
+                1, self.now - timedelta(minutes=5), None
+            )
+
+        self.assertEqual(
+            2, self.price_repository.get_all_or_fail_by_ticker_id.call_count
+        )
+
+    async def test_bulk_save(self) -> None:
+        await self.cache.bulk_save(self.prices)
+
+        self.price_repository.bulk_save.assert_called_once_with(self.prices)
+
+    async def test_get_version_by_ticker_id(self) -> None:
+        start_date = self.now - timedelta(minutes=5)
+
+        result = await self.cache.get_version_by_ticker_id(1, start_date, self.now)
+
+        self.assertEqual((4, 5), result)
+        self.price_repository.get_version_by_ticker_id.assert_called_once_with(
+            1, start_date, self.now
+        )
+
+    async def test_get_all_latest(self) -> None:
+        self.price_repository.get_all_latest.return_value = self.prices
+
+        result = await self.cache.get_all_latest(3)
+
+        self.assertEqual(self.prices, result)
+        self.price_repository.get_all_latest.assert_has_calls([call(3)])
+
+    async def test_get_all_by_ticker_ids_after_id(self) -> None:
+        self.price_repository.get_all_by_ticker_ids_after_id.return_value = self.prices
+
+        result = await self.cache.get_all_by_ticker_ids_after_id([1], 3)
+
+        self.assertEqual(self.prices, result)
+        self.price_repository.get_all_by_ticker_ids_after_id.assert_has_calls(
+            [call([1], 3)]
+        )
+
+    async def test_get_last_id(self) -> None:
+        self.price_repository.get_last_id.return_value = 3
+
+        self.assertEqual(3, await self.cache.get_last_id())
@@ -0,0 +1,334 @@
+from datetime import datetime
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch, Mock
+
+from sqlalchemy import Result
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.crypto.exceptions.ticker_not_found_exception import (
+    TickerNotFoundException,
+)
+from app.domain.crypto.models.candle_interval import ROLLUP_CANDLE_INTERVALS
+from app.domain.crypto.models.price import Price
+from app.infrastructure.crypto.caches.known_ticker_cache import KnownTickerCache
+from app.infrastructure.crypto.database.repositories.async_db_price_repository import (
+    AsyncDbPriceRepository,
+)
+from app.infrastructure.crypto.database.table_models import PriceTableModel
+from app.infrastructure.crypto.database.translators.db_candle_translator import (
+    DbCandleTranslator,
+)
+from app.infrastructure.crypto.database.translators.db_price_translator import (
+    DbPriceTranslator,
+)
+from app.infrastructure.exchange.caches.exchange_catalog_cache import (
+    ExchangeCatalogCache,
+)
+
+
+class TestAsyncDbPriceRepository(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.start_date = datetime(2020, 1, 1)
+        self.domain_prices = [
+            Price(ticker_id=1, price=1.0),
+            Price(ticker_id=1, price=2.0),
+        ]
+        self.price_table_models = [
+            PriceTableModel(ticker_id=1, price=1.0),
+            PriceTableModel(ticker_id=1, price=2.0),
+        ]
+        self.price_table_rows = [
+            (1, 1, 1.0, self.start_date),
+            (2, 1, 2.0, self.start_date),
+        ]
+        self.db_price_translator = Mock(spec=DbPriceTranslator)
+        self.db_candle_translator = Mock(spec=DbCandleTranslator)
+        self.known_ticker_cache = Mock(spec=KnownTickerCache)
+        self.known_ticker_cache.contains_all.return_value = False
+        self.known_ticker_cache.set.side_effect = frozenset
+        self.exchange_catalog_cache = Mock(spec=ExchangeCatalogCache)
+
+        self.repository = AsyncDbPriceRepository(
+            self.db_price_translator,
+            self.db_candle_translator,
+            self.known_ticker_cache,
+            self.exchange_catalog_cache,
+        )
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.async_db_price_repository.get_async_session"
+    )
+    async def test_bulk_save(self, get_async_session: Mock) -> None:
+        session = Mock(spec=AsyncSession)
+        get_async_session.return_value.__aenter__.return_value = session
+        price_table_rows = [
+            {"ticker_id": 1, "price": 1.0, "timestamp": self.start_date},
+            {"ticker_id": 1, "price": 2.0, "timestamp": self.start_date},
+        ]
+        self.db_price_translator.bulk_translate_to_table_rows.return_value = (
+            price_table_rows
+        )
+
+        candle_table_rows = [{"ticker_id": 1, "interval": "1m", "count": 2}]
+        self.db_candle_translator.bulk_translate_prices_to_table_rows.return_value = (
+            candle_table_rows
+        )
+        session.get_bind.return_value.dialect.name = "postgresql"
+
+        await self.repository.bulk_save(self.domain_prices)
+
+        self.db_price_translator.bulk_translate_to_table_rows.assert_called_once_with(
+            self.domain_prices
+        )
+        self.db_candle_translator.bulk_translate_prices_to_table_rows.assert_called_once_with(
+            self.domain_prices, ROLLUP_CANDLE_INTERVALS
+        )
+        self.assertEqual(2, session.execute.await_count)
+        self.assertEqual(price_table_rows, session.execute.call_args_list[0].args[1])
+        self.assertEqual(candle_table_rows, session.execute.call_args_list[1].args[1])
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.async_db_price_repository.get_async_session"
+    )
+    async def test_bulk_save_unknown_ticker(self, get_async_session: Mock) -> None:
+        session = Mock(spec=AsyncSession)
+        get_async_session.return_value.__aenter__.return_value = session
+        session.execute.side_effect = IntegrityError("INSERT", {}, Exception())
+
+        with self.assertRaises(IntegrityError):
+            await self.repository.bulk_save(self.domain_prices)
+
+        self.exchange_catalog_cache.invalidate.assert_called_once()
+        self.known_ticker_cache.invalidate.assert_called_once()
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.async_db_price_repository.get_async_session"
+    )
+    async def test_bulk_save_empty(self, get_async_session: Mock) -> None:
+        await self.repository.bulk_save([])
+
+        get_async_session.assert_not_called()
+        self.db_price_translator.bulk_translate_to_table_rows.assert_not_called()
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.async_db_price_repository.get_async_session"
+    )
+    async def test_get_all_or_fail_by_ticker_id(self, get_async_session: Mock) -> None:
+        session = Mock(spec=AsyncSession)
+        get_async_session.return_value.__aenter__.return_value = session
+        ticker_query_result = Mock(spec=Result)
+        ticker_query_result.scalars.return_value.all.return_value = [1]
+        query_result = Mock(spec=Result)
+        query_result.all.return_value = self.price_table_rows
+        session.execute.side_effect = [ticker_query_result, query_result]
+        self.db_price_translator.bulk_translate_table_rows_to_domain_model.return_value = (
+            self.domain_prices
+        )
+
+        result = await self.repository.get_all_or_fail_by_ticker_id(
+            1, self.start_date, self.start_date
+        )
+
+        self.assertEqual(self.domain_prices, result)
+        self.assertEqual(2, session.execute.call_count)
+        self.db_price_translator.bulk_translate_table_rows_to_domain_model.assert_called_once_with(
+            self.price_table_rows
+        )
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.async_db_price_repository.get_async_session"
+    )
+    async def test_get_all_or_fail_by_ticker_id_known_ticker(
+        self, get_async_session: Mock
+    ) -> None:
+        session = Mock(spec=AsyncSession)
+        get_async_session.return_value.__aenter__.return_value = session
+        query_result = Mock(spec=Result)
+        query_result.all.return_value = self.price_table_rows
+        session.execute.return_value = query_result
+        self.known_ticker_cache.contains_all.return_value = True
+
+        await self.repository.get_all_or_fail_by_ticker_id(
+            1, self.start_date, self.start_date
+        )
+
+        session.execute.assert_called_once()
+        self.known_ticker_cache.contains_all.assert_called_once_with([1])
+        self.known_ticker_cache.set.assert_not_called()
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.async_db_price_repository.get_async_session"
+    )
+    async def test_get_all_or_fail_by_ticker_id_not_found(
+        self, get_async_session: Mock
+    ) -> None:
+        session = Mock(spec=AsyncSession)
+        get_async_session.return_value.__aenter__.return_value = session
+        ticker_query_result = Mock(spec=Result)
+        ticker_query_result.scalars.return_value.all.return_value = [1]
+        session.execute.return_value = ticker_query_result
+
+        with self.assertRaisesRegex(
+            TickerNotFoundException, "Ticker with id '1000' not found."
+        ):
+            await self.repository.get_all_or_fail_by_ticker_id(
+                1000, self.start_date, self.start_date
+            )
+
+        session.execute.assert_called_once()
+        self.db_price_translator.bulk_translate_table_rows_to_domain_model.assert_not_called()
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.async_db_price_repository.get_async_session"
+    )
+    async def test_get_all_or_fail_by_ticker_id_ignore_ticker(
+        self, get_async_session: Mock
+    ) -> None:
+        session = Mock(spec=AsyncSession)
+        get_async_session.return_value.__aenter__.return_value = session
+        query_result = Mock(spec=Result)
+        query_result.all.return_value = self.price_table_rows
+        session.execute.return_value = query_result
+        self.db_price_translator.bulk_translate_table_rows_to_domain_model.return_value = (
+            self.domain_prices
+        )
+
+        result = await self.repository.get_all_or_fail_by_ticker_id(
+            1000, self.start_date, None, False, False
+        )
+
+        self.assertEqual(self.domain_prices, result)
+        session.execute.assert_called_once()
+        self.assertIn(
+            "SELECT prices.id, prices.ticker_id, prices.price, prices.timestamp \n"
+            "FROM prices",
+            str(session.execute.call_args.args[0]),
+        )
+        self.db_price_translator.bulk_translate_table_rows_to_domain_model.assert_called_once_with(
+            self.price_table_rows
+        )
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.async_db_price_repository.get_async_session"
+    )
+    async def test_get_version_by_ticker_id(self, get_async_session: Mock) -> None:
+        session = Mock(spec=AsyncSession)
+        get_async_session.return_value.__aenter__.return_value = session
+        query_result = Mock(spec=Result)
+        query_result.one.return_value = (2, 10)
+        session.execute.return_value = query_result
+
+        result = await self.repository.get_version_by_ticker_id(
+            1, self.start_date, self.start_date
+        )
+
+        self.assertEqual((2, 10), result)
+        session.execute.assert_called_once()
+        self.known_ticker_cache.contains_all.assert_not_called()
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.async_db_price_repository.get_async_session"
+    )
+    async def test_get_all_latest(self, get_async_session: Mock) -> None:
+        session = Mock(spec=AsyncSession)
+        get_async_session.return_value.__aenter__.return_value = session
+        session.get_bind.return_value.dialect.name = "postgresql"
+        query_result = Mock(spec=Result)
+        query_result.scalars.return_value.all.return_value = self.price_table_models
+        session.execute.return_value = query_result
+        self.db_price_translator.bulk_translate_to_domain_model.return_value = (
+            self.domain_prices
+        )
+
+        result = await self.repository.get_all_latest(100)
+
+        self.assertEqual(self.domain_prices, result)
+        compiled_statement = session.execute.call_args.args[0].compile(
+            dialect=postgresql.dialect()
+        )
+        self.assertIn("SELECT DISTINCT ON (prices.ticker_id)", str(compiled_statement))
+        self.assertIn("prices.id > ", str(compiled_statement))
+        self.assertEqual([100], list(compiled_statement.params.values()))
+        self.db_price_translator.bulk_translate_to_domain_model.assert_called_once_with(
+            self.price_table_models
+        )
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.async_db_price_repository.get_async_session"
+    )
+    async def test_get_all_latest_sqlite(self, get_async_session: Mock) -> None:
+        session = Mock(spec=AsyncSession)
+        get_async_session.return_value.__aenter__.return_value = session
+        session.get_bind.return_value.dialect.name = "sqlite"
+        session.execute.return_value = Mock(spec=Result)
+        self.db_price_translator.bulk_translate_to_domain_model.return_value = []
+
+        await self.repository.get_all_latest()
+
+        statement = str(session.execute.call_args.args[0])
+        self.assertNotIn("DISTINCT", statement)
+        self.assertIn("row_number() OVER (PARTITION BY prices.ticker_id", statement)
+        self.assertNotIn("prices.id >", statement)
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.async_db_price_repository.get_async_session"
+    )
+    async def test_get_all_by_ticker_ids_after_id(
+        self, get_async_session: Mock
+    ) -> None:
+        session = Mock(spec=AsyncSession)
+        get_async_session.return_value.__aenter__.return_value = session
+        query_result = Mock(spec=Result)
+        query_result.all.return_value = self.price_table_rows
+        session.execute.return_value = query_result
+        self.db_price_translator.bulk_translate_table_rows_to_domain_model.return_value = (
+            self.domain_prices
+        )
+
+        result = await self.repository.get_all_by_ticker_ids_after_id([1, 2], 100)
+
+        self.assertEqual(self.domain_prices, result)
+        compiled_statement = session.execute.call_args.args[0].compile(
+            dialect=postgresql.dialect()
+        )
+        self.assertIn("prices.ticker_id IN", str(compiled_statement))
+        self.assertIn("prices.id > ", str(compiled_statement))
+        self.assertIn("ORDER BY prices.id ASC", str(compiled_statement))
+        self.assertIn(100, compiled_statement.params.values())
+        self.db_price_translator.bulk_translate_table_rows_to_domain_model.assert_called_once_with(
+            self.price_table_rows
+        )
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.async_db_price_repository.get_async_session"
+    )
+    async def test_get_all_by_ticker_ids_after_id_without_id(
+        self, get_async_session: Mock
+    ) -> None:
+        session = Mock(spec=AsyncSession)
+        get_async_session.return_value.__aenter__.return_value = session
+        session.execute.return_value = Mock(spec=Result)
+        self.db_price_translator.bulk_translate_table_rows_to_domain_model.return_value = (
+            []
+        )
+
+        await self.repository.get_all_by_ticker_ids_after_id([1], None)
+
+        self.assertNotIn("prices.id >", str(session.execute.call_args.args[0]))
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.async_db_price_repository.get_async_session"
+    )
+    async def test_get_last_id(self, get_async_session: Mock) -> None:
+        session = Mock(spec=AsyncSession)
+        get_async_session.return_value.__aenter__.return_value = session
+        query_result = Mock(spec=Result)
+        query_result.scalar_one.return_value = 10
+        session.execute.return_value = query_result
+
+        result = await self.repository.get_last_id()
+
+        self.assertEqual(10, result)
+        self.assertIn("max(prices.id)", str(session.execute.call_args.args[0]))
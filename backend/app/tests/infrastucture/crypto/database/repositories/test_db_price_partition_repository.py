@@ -0,0 +1,177 @@
+from datetime import datetime
+from unittest import TestCase
+from unittest.mock import patch, Mock, MagicMock
+
+from sqlalchemy import Result
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.orm import Session
+
+from app.infrastructure.crypto.database.repositories.db_price_partition_repository import (
+    DbPricePartitionRepository,
+)
+
+
+class TestDbPricePartitionRepository(TestCase):
+    def setUp(self) -> None:
+        self.start_date = datetime(2025, 12, 1)
+        self.end_date = datetime(2026, 1, 1)
+
+        self.repository = DbPricePartitionRepository()
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.db_price_partition_repository.get_session"
+    )
+    def test_create_partition(self, get_session: Mock) -> None:
+        session = self.__build_session(get_session, "postgresql", False)
+
+        result = self.repository.create_partition(self.start_date, self.end_date)
+
+        self.assertTrue(result)
+        self.assertEqual(session.execute.call_count, 4)
+        session.begin_nested.assert_called_once()
+        statements = [str(args.args[0]) for args in session.execute.call_args_list]
+        self.assertIn("CREATE TABLE prices_p20251201", statements[1])
+        self.assertIn("DELETE FROM prices_default", statements[2])
+        self.assertIn(
+            "ATTACH PARTITION prices_p20251201 "
+            "FOR VALUES FROM ('2025-12-01T00:00:00') TO ('2026-01-01T00:00:00')",
+            statements[3],
+        )
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.db_price_partition_repository.get_session"
+    )
+    def test_create_partition_already_exists(self, get_session: Mock) -> None:
+        session = self.__build_session(get_session, "postgresql", True)
+
+        result = self.repository.create_partition(self.start_date, self.end_date)
+
+        self.assertFalse(result)
+        session.execute.assert_called_once()
+        session.begin_nested.assert_not_called()
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.db_price_partition_repository.get_session"
+    )
+    def test_create_partition_overlapping(self, get_session: Mock) -> None:
+        session = self.__build_session(get_session, "postgresql", False)
+        session.execute.side_effect = [
+            session.execute.return_value,
+            ProgrammingError("overlap", None, Exception("would overlap partition")),
+        ]
+
+        result = self.repository.create_partition(self.start_date, self.end_date)
+
+        self.assertFalse(result)
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.db_price_partition_repository.get_session"
+    )
+    def test_create_partition_not_partitioned_dialect(self, get_session: Mock) -> None:
+        session = self.__build_session(get_session, "sqlite", False)
+
+        result = self.repository.create_partition(self.start_date, self.end_date)
+
+        self.assertFalse(result)
+        session.execute.assert_not_called()
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.db_price_partition_repository.get_session"
+    )
+    def test_get_partition_start_dates(self, get_session: Mock) -> None:
+        session = self.__build_session(get_session, "postgresql", False)
+        session.execute.return_value.scalars.return_value = [
+            "prices_p20251201",
+            "prices_default",
+            "prices_p20251101",
+        ]
+
+        result = self.repository.get_partition_start_dates()
+
+        self.assertEqual(result, [datetime(2025, 11, 1), datetime(2025, 12, 1)])
+        self.assertIn("pg_inherits", str(session.execute.call_args.args[0]))
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.db_price_partition_repository.get_session"
+    )
+    def test_get_partition_start_dates_not_partitioned_dialect(
+        self, get_session: Mock
+    ) -> None:
+        session = self.__build_session(get_session, "sqlite", False)
+
+        result = self.repository.get_partition_start_dates()
+
+        self.assertEqual(result, [])
+        session.execute.assert_not_called()
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.db_price_partition_repository.get_session"
+    )
+    def test_remove_partition(self, get_session: Mock) -> None:
+        session = self.__build_session(get_session, "postgresql", False)
+
+        result = self.repository.remove_partition(self.start_date, True)
+
+        self.assertTrue(result)
+        session.begin_nested.assert_called_once()
+        statements = [str(args.args[0]) for args in session.execute.call_args_list]
+        self.assertEqual(
+            statements,
+            [
+                "ALTER TABLE prices DETACH PARTITION prices_p20251201",
+                "DROP TABLE prices_p20251201",
+            ],
+        )
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.db_price_partition_repository.get_session"
+    )
+    def test_remove_partition_detach_only(self, get_session: Mock) -> None:
+        session = self.__build_session(get_session, "postgresql", False)
+
+        result = self.repository.remove_partition(self.start_date, False)
+
+        self.assertTrue(result)
+        session.execute.assert_called_once()
+        self.assertEqual(
+            "ALTER TABLE prices DETACH PARTITION prices_p20251201",
+            str(session.execute.call_args.args[0]),
+        )
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.db_price_partition_repository.get_session"
+    )
+    def test_remove_partition_not_found(self, get_session: Mock) -> None:
+        session = self.__build_session(get_session, "postgresql", False)
+        session.execute.side_effect = ProgrammingError(
+            "detach", None, Exception("is not a partition of relation")
+        )
+
+        result = self.repository.remove_partition(self.start_date, True)
+
+        self.assertFalse(result)
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.db_price_partition_repository.get_session"
+    )
+    def test_remove_partition_not_partitioned_dialect(self, get_session: Mock) -> None:
+        session = self.__build_session(get_session, "sqlite", False)
+
+        result = self.repository.remove_partition(self.start_date, True)
+
+        self.assertFalse(result)
+        session.execute.assert_not_called()
+
+    @staticmethod
+    def __build_session(
+        get_session: Mock, dialect_name: str, partition_exists: bool
+    ) -> Mock:
+        query_result = Mock(spec=Result)
+        query_result.scalar_one.return_value = partition_exists
+        session = Mock(spec=Session)
+        session.get_bind.return_value.dialect.name = dialect_name
+        session.execute.return_value = query_result
+        session.begin_nested.return_value = MagicMock()
+        get_session.return_value.__enter__.return_value = session
+
+        return session
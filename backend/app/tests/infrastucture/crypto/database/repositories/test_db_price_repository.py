@@ -3,21 +3,34 @@ from unittest import TestCase
 from unittest.mock import patch, Mock
 
 from sqlalchemy import Result
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Session
 
 from app.domain.crypto.exceptions.ticker_not_found_exception import (
     TickerNotFoundException,
 )
+from app.domain.crypto.models.candle import Candle
+from app.domain.crypto.models.candle_interval import (
+    CandleInterval,
+    ROLLUP_CANDLE_INTERVALS,
+)
 from app.domain.crypto.models.price import Price
+from app.domain.crypto.models.price_columns import PriceColumns
+from app.domain.crypto.models.price_cursor import PriceCursor
+from app.infrastructure.crypto.caches.known_ticker_cache import KnownTickerCache
 from app.infrastructure.crypto.database.repositories.db_price_repository import (
     DbPriceRepository,
 )
-from app.infrastructure.crypto.database.table_models import (
-    PriceTableModel,
+from app.infrastructure.crypto.database.translators.db_candle_translator import (
+    DbCandleTranslator,
 )
 from app.infrastructure.crypto.database.translators.db_price_translator import (
     DbPriceTranslator,
 )
+from app.infrastructure.exchange.caches.exchange_catalog_cache import (
+    ExchangeCatalogCache,
+)
 
 
 class TestDbPriceRepository(TestCase):
@@ -29,14 +42,24 @@ class TestDbPriceRepository(TestCase):
             Price(ticker_id=1, price=2.0),
             Price(ticker_id=1, price=3.0),
         ]
-        self.price_table_models = [
-            PriceTableModel(ticker_id=1, price=1.0),
-            PriceTableModel(ticker_id=1, price=2.0),
-            PriceTableModel(ticker_id=1, price=3.0),
+        self.price_table_rows = [
+            (1, 1, 1.0, self.start_date),
+            (2, 1, 2.0, self.start_date),
+            (3, 1, 3.0, self.start_date),
         ]
         self.db_price_translator = Mock(spec=DbPriceTranslator)
+        self.db_candle_translator = Mock(spec=DbCandleTranslator)
+        self.known_ticker_cache = Mock(spec=KnownTickerCache)
+        self.known_ticker_cache.contains_all.return_value = False
+        self.known_ticker_cache.set.side_effect = frozenset
+        self.exchange_catalog_cache = Mock(spec=ExchangeCatalogCache)
 
-        self.repository = DbPriceRepository(self.db_price_translator)
+        self.repository = DbPriceRepository(
+            self.db_price_translator,
+            self.db_candle_translator,
+            self.known_ticker_cache,
+            self.exchange_catalog_cache,
+        )
 
     @patch(
         "app.infrastructure.crypto.database.repositories.db_price_repository.get_session"
@@ -44,16 +67,57 @@ class TestDbPriceRepository(TestCase):
     def test_bulk_save(self, get_session: Mock) -> None:
         session = Mock(spec=Session)
         get_session.return_value.__enter__.return_value = session
-        self.db_price_translator.bulk_translate_to_table_model.return_value = (
-            self.price_table_models
+        price_table_rows = [
+            {"ticker_id": 1, "price": 1.0, "timestamp": self.start_date},
+            {"ticker_id": 1, "price": 2.0, "timestamp": self.start_date},
+            {"ticker_id": 1, "price": 3.0, "timestamp": self.start_date},
+        ]
+        self.db_price_translator.bulk_translate_to_table_rows.return_value = (
+            price_table_rows
         )
 
+        candle_table_rows = [{"ticker_id": 1, "interval": "1m", "count": 3}]
+        self.db_candle_translator.bulk_translate_prices_to_table_rows.return_value = (
+            candle_table_rows
+        )
+        session.get_bind.return_value.dialect.name = "sqlite"
+
         self.repository.bulk_save(self.domain_prices)
 
-        self.db_price_translator.bulk_translate_to_table_model.assert_called_once_with(
+        self.db_price_translator.bulk_translate_to_table_rows.assert_called_once_with(
             self.domain_prices
         )
-        session.add_all.assert_called_once_with(self.price_table_models)
+        self.db_candle_translator.bulk_translate_prices_to_table_rows.assert_called_once_with(
+            self.domain_prices, ROLLUP_CANDLE_INTERVALS
+        )
+        self.assertEqual(2, session.execute.call_count)
+        self.assertEqual(price_table_rows, session.execute.call_args_list[0].args[1])
+        self.assertEqual(candle_table_rows, session.execute.call_args_list[1].args[1])
+        self.db_price_translator.bulk_translate_to_table_model.assert_not_called()
+        session.add_all.assert_not_called()
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.db_price_repository.get_session"
+    )
+    def test_bulk_save_unknown_ticker(self, get_session: Mock) -> None:
+        session = Mock(spec=Session)
+        get_session.return_value.__enter__.return_value = session
+        session.execute.side_effect = IntegrityError("INSERT", {}, Exception())
+
+        with self.assertRaises(IntegrityError):
+            self.repository.bulk_save(self.domain_prices)
+
+        self.exchange_catalog_cache.invalidate.assert_called_once()
+        self.known_ticker_cache.invalidate.assert_called_once()
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.db_price_repository.get_session"
+    )
+    def test_bulk_save_empty(self, get_session: Mock) -> None:
+        self.repository.bulk_save([])
+
+        get_session.assert_not_called()
+        self.db_price_translator.bulk_translate_to_table_rows.assert_not_called()
 
     @patch(
         "app.infrastructure.crypto.database.repositories.db_price_repository.get_session"
@@ -62,10 +126,11 @@ class TestDbPriceRepository(TestCase):
         session = Mock(spec=Session)
         get_session.return_value.__enter__.return_value = session
         ticker_query_result = Mock(spec=Result)
+        ticker_query_result.scalars.return_value.all.return_value = [1]
         query_result = Mock(spec=Result)
-        query_result.scalars.return_value.all.return_value = self.price_table_models
+        query_result.all.return_value = self.price_table_rows
         session.execute.side_effect = [ticker_query_result, query_result]
-        self.db_price_translator.bulk_translate_to_domain_model.return_value = (
+        self.db_price_translator.bulk_translate_table_rows_to_domain_model.return_value = (
             self.domain_prices
         )
 
@@ -75,10 +140,30 @@ class TestDbPriceRepository(TestCase):
 
         self.assertEqual(self.domain_prices, result)
         self.assertEqual(2, session.execute.call_count)
-        self.db_price_translator.bulk_translate_to_domain_model.assert_called_once_with(
-            self.price_table_models
+        self.known_ticker_cache.set.assert_called_once_with([1])
+        self.db_price_translator.bulk_translate_table_rows_to_domain_model.assert_called_once_with(
+            self.price_table_rows
+        )
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.db_price_repository.get_session"
+    )
+    def test_get_all_or_fail_by_ticker_id_known_ticker(self, get_session: Mock) -> None:
+        session = Mock(spec=Session)
+        get_session.return_value.__enter__.return_value = session
+        query_result = Mock(spec=Result)
+        query_result.all.return_value = self.price_table_rows
+        session.execute.return_value = query_result
+        self.known_ticker_cache.contains_all.return_value = True
+
+        self.repository.get_all_or_fail_by_ticker_id(
+            1, self.start_date, self.start_date
         )
 
+        session.execute.assert_called_once()
+        self.known_ticker_cache.contains_all.assert_called_once_with([1])
+        self.known_ticker_cache.set.assert_not_called()
+
     @patch(
         "app.infrastructure.crypto.database.repositories.db_price_repository.get_session"
     )
@@ -86,7 +171,7 @@ class TestDbPriceRepository(TestCase):
         session = Mock(spec=Session)
         get_session.return_value.__enter__.return_value = session
         ticker_query_result = Mock(spec=Result)
-        ticker_query_result.scalar_one_or_none.return_value = None
+        ticker_query_result.scalars.return_value.all.return_value = [1]
         session.execute.return_value = ticker_query_result
 
         with self.assertRaisesRegex(
@@ -97,7 +182,7 @@ class TestDbPriceRepository(TestCase):
             )
 
         session.execute.assert_called_once()
-        self.db_price_translator.bulk_translate_to_domain_model.assert_not_called()
+        self.db_price_translator.bulk_translate_table_rows_to_domain_model.assert_not_called()
 
     @patch(
         "app.infrastructure.crypto.database.repositories.db_price_repository.get_session"
@@ -108,9 +193,9 @@ class TestDbPriceRepository(TestCase):
         session = Mock(spec=Session)
         get_session.return_value.__enter__.return_value = session
         query_result = Mock(spec=Result)
-        query_result.scalars.return_value.all.return_value = self.price_table_models
+        query_result.all.return_value = self.price_table_rows
         session.execute.return_value = query_result
-        self.db_price_translator.bulk_translate_to_domain_model.return_value = (
+        self.db_price_translator.bulk_translate_table_rows_to_domain_model.return_value = (
             self.domain_prices
         )
 
@@ -120,6 +205,391 @@ class TestDbPriceRepository(TestCase):
 
         self.assertEqual(self.domain_prices, result)
         session.execute.assert_called_once()
-        self.db_price_translator.bulk_translate_to_domain_model.assert_called_once_with(
-            self.price_table_models
+        self.assertIn(
+            "SELECT prices.id, prices.ticker_id, prices.price, prices.timestamp \n"
+            "FROM prices",
+            str(session.execute.call_args.args[0]),
+        )
+        self.db_price_translator.bulk_translate_table_rows_to_domain_model.assert_called_once_with(
+            self.price_table_rows
+        )
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.db_price_repository.get_session"
+    )
+    def test_stream_all_or_fail_by_ticker_id(self, get_session: Mock) -> None:
+        ticker_check_session = Mock(spec=Session)
+        ticker_check_session.execute.return_value.scalars.return_value.all.return_value = [
+            1
+        ]
+        stream_session = Mock(spec=Session)
+        get_session.return_value.__enter__.side_effect = [
+            ticker_check_session,
+            stream_session,
+        ]
+        query_result = Mock(spec=Result)
+        query_result.__iter__ = Mock(return_value=iter(self.price_table_rows))
+        stream_session.execute.return_value = query_result
+        self.db_price_translator.translate_table_row_to_domain_model.side_effect = (
+            self.domain_prices
+        )
+
+        result = self.repository.stream_all_or_fail_by_ticker_id(
+            1,
+            self.start_date,
+            self.end_date,
+            PriceCursor(timestamp=self.start_date, id=10),
+            3,
+        )
+
+        ticker_check_session.execute.assert_called_once()
+        stream_session.execute.assert_not_called()
+        self.assertEqual(self.domain_prices, list(result))
+        stream_session.execute.assert_called_once()
+        statement = stream_session.execute.call_args.args[0]
+        self.assertEqual(3, statement._limit)
+        self.assertEqual(1000, statement.get_execution_options()["yield_per"])
+        self.assertEqual(
+            3, self.db_price_translator.translate_table_row_to_domain_model.call_count
+        )
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.db_price_repository.get_session"
+    )
+    def test_stream_all_or_fail_by_ticker_ids(self, get_session: Mock) -> None:
+        ticker_check_session = Mock(spec=Session)
+        ticker_check_session.execute.return_value.scalars.return_value.all.return_value = [
+            1,
+            2,
+        ]
+        stream_session = Mock(spec=Session)
+        get_session.return_value.__enter__.side_effect = [
+            ticker_check_session,
+            stream_session,
+        ]
+        query_result = Mock(spec=Result)
+        query_result.__iter__ = Mock(return_value=iter(self.price_table_rows))
+        stream_session.execute.return_value = query_result
+        self.db_price_translator.translate_table_row_to_domain_model.side_effect = (
+            self.domain_prices
+        )
+
+        result = self.repository.stream_all_or_fail_by_ticker_ids(
+            [1, 2], self.start_date, self.end_date
+        )
+
+        self.assertEqual(self.domain_prices, list(result))
+        stream_session.execute.assert_called_once()
+        statement = stream_session.execute.call_args.args[0]
+        self.assertEqual(1000, statement.get_execution_options()["yield_per"])
+        self.assertEqual(
+            ["ticker_id", "timestamp", "id"],
+            [clause.element.name for clause in statement._order_by_clauses],
+        )
+        self.assertIn(
+            "prices.ticker_id IN",
+            str(statement.compile(dialect=postgresql.dialect())),
+        )
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.db_price_repository.get_session"
+    )
+    def test_stream_columns_or_fail_by_ticker_id(self, get_session: Mock) -> None:
+        ticker_check_session = Mock(spec=Session)
+        ticker_check_session.execute.return_value.scalars.return_value.all.return_value = [
+            1
+        ]
+        stream_session = Mock(spec=Session)
+        get_session.return_value.__enter__.side_effect = [
+            ticker_check_session,
+            stream_session,
+        ]
+        query_result = Mock(spec=Result)
+        query_result.partitions.return_value = iter(
+            [
+                [(1, 10.0, datetime(2020, 1, 1)), (2, 11.0, datetime(2020, 1, 2))],
+                [(3, 12.0, datetime(2020, 1, 3))],
+            ]
+        )
+        stream_session.execute.return_value = query_result
+
+        result = self.repository.stream_columns_or_fail_by_ticker_id(
+            1, self.start_date, self.end_date, None, 3
+        )
+
+        ticker_check_session.execute.assert_called_once()
+        stream_session.execute.assert_not_called()
+        self.assertEqual(
+            [
+                PriceColumns(
+                    ticker_id=1,
+                    ids=[1, 2],
+                    prices=[10.0, 11.0],
+                    timestamps=[datetime(2020, 1, 1), datetime(2020, 1, 2)],
+                ),
+                PriceColumns(
+                    ticker_id=1,
+                    ids=[3],
+                    prices=[12.0],
+                    timestamps=[datetime(2020, 1, 3)],
+                ),
+            ],
+            list(result),
+        )
+        statement = stream_session.execute.call_args.args[0]
+        self.assertEqual(3, statement._limit)
+        self.assertEqual(1000, statement.get_execution_options()["yield_per"])
+        self.assertEqual(
+            ["id", "price", "timestamp"],
+            [column.name for column in statement.selected_columns],
+        )
+        self.db_price_translator.translate_to_domain_model.assert_not_called()
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.db_price_repository.get_session"
+    )
+    def test_stream_all_or_fail_by_ticker_id_not_found(self, get_session: Mock) -> None:
+        session = Mock(spec=Session)
+        get_session.return_value.__enter__.return_value = session
+        ticker_query_result = Mock(spec=Result)
+        ticker_query_result.scalars.return_value.all.return_value = [1]
+        session.execute.return_value = ticker_query_result
+
+        with self.assertRaisesRegex(
+            TickerNotFoundException, "Ticker with id '1000' not found."
+        ):
+            self.repository.stream_all_or_fail_by_ticker_id(
+                1000, self.start_date, self.end_date
+            )
+
+        session.execute.assert_called_once()
+        self.db_price_translator.translate_to_domain_model.assert_not_called()
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.db_price_repository.get_session"
+    )
+    def test_get_timestamp_range_by_ticker_id(self, get_session: Mock) -> None:
+        session = Mock(spec=Session)
+        get_session.return_value.__enter__.return_value = session
+        query_result = Mock(spec=Result)
+        query_result.one.return_value = (self.start_date, self.end_date)
+        session.execute.return_value = query_result
+
+        result = self.repository.get_timestamp_range_by_ticker_id(1, None, None)
+
+        self.assertEqual((self.start_date, self.end_date), result)
+        session.execute.assert_called_once()
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.db_price_repository.get_session"
+    )
+    def test_get_timestamp_range_by_ticker_id_no_prices(
+        self, get_session: Mock
+    ) -> None:
+        session = Mock(spec=Session)
+        get_session.return_value.__enter__.return_value = session
+        query_result = Mock(spec=Result)
+        query_result.one.return_value = (None, None)
+        session.execute.return_value = query_result
+
+        result = self.repository.get_timestamp_range_by_ticker_id(1, None, None)
+
+        self.assertIsNone(result)
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.db_price_repository.get_session"
+    )
+    def test_get_candles_or_fail_by_ticker_id(self, get_session: Mock) -> None:
+        session = Mock(spec=Session)
+        get_session.return_value.__enter__.return_value = session
+        ticker_query_result = Mock(spec=Result)
+        ticker_query_result.scalars.return_value.all.return_value = [1]
+        query_result = Mock(spec=Result)
+        candle_rows = [Mock(), Mock()]
+        query_result.all.return_value = candle_rows
+        session.execute.side_effect = [ticker_query_result, query_result]
+        candles = [
+            Candle(
+                ticker_id=1,
+                timestamp=self.start_date,
+                open=1.0,
+                high=2.0,
+                low=0.5,
+                close=1.5,
+                count=4,
+            )
+        ]
+        self.db_candle_translator.bulk_translate_to_domain_model.return_value = candles
+
+        result = self.repository.get_candles_or_fail_by_ticker_id(
+            1, self.start_date, self.end_date, CandleInterval.ONE_HOUR
+        )
+
+        self.assertEqual(candles, result)
+        self.assertEqual(2, session.execute.call_count)
+        self.db_candle_translator.bulk_translate_to_domain_model.assert_called_once_with(
+            1, candle_rows
+        )
+        statement = str(session.execute.call_args_list[1].args[0])
+        self.assertIn("FROM price_candles", statement)
+        self.assertNotIn("FROM prices", statement)
+        self.assertNotIn("first_value", statement)
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.db_price_repository.get_session"
+    )
+    def test_get_candles_or_fail_by_ticker_id_aggregating_rollup(
+        self, get_session: Mock
+    ) -> None:
+        session = Mock(spec=Session)
+        get_session.return_value.__enter__.return_value = session
+        ticker_query_result = Mock(spec=Result)
+        ticker_query_result.scalars.return_value.all.return_value = [1]
+        query_result = Mock(spec=Result)
+        candle_rows = [Mock()]
+        query_result.all.return_value = candle_rows
+        session.execute.side_effect = [ticker_query_result, query_result]
+        self.db_candle_translator.bulk_translate_to_domain_model.return_value = []
+
+        self.repository.get_candles_or_fail_by_ticker_id(
+            1, self.start_date, self.end_date, CandleInterval.FIVE_MINUTES
+        )
+
+        compiled_statement = (
+            session.execute.call_args_list[1]
+            .args[0]
+            .compile(dialect=postgresql.dialect())
+        )
+        self.assertIn("FROM price_candles", str(compiled_statement))
+        self.assertIn("first_value", str(compiled_statement))
+        self.assertIn("1m", compiled_statement.params.values())
+        self.db_candle_translator.bulk_translate_to_domain_model.assert_called_once_with(
+            1, candle_rows
+        )
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.db_price_repository.get_session"
+    )
+    def test_get_candles_or_fail_by_ticker_id_whole_candles(
+        self, get_session: Mock
+    ) -> None:
+        session = Mock(spec=Session)
+        get_session.return_value.__enter__.return_value = session
+        ticker_query_result = Mock(spec=Result)
+        ticker_query_result.scalars.return_value.all.return_value = [1]
+        session.execute.side_effect = [ticker_query_result, Mock(spec=Result)]
+
+        self.repository.get_candles_or_fail_by_ticker_id(
+            1,
+            datetime(2020, 1, 1, 10, 7),
+            datetime(2020, 1, 1, 10, 12, 30),
+            CandleInterval.FIVE_MINUTES,
+        )
+
+        compiled_statement = (
+            session.execute.call_args_list[1]
+            .args[0]
+            .compile(dialect=postgresql.dialect())
+        )
+        self.assertIn(
+            "price_candles.timestamp >= %(timestamp_1)s", str(compiled_statement)
+        )
+        self.assertIn(
+            "price_candles.timestamp < %(timestamp_2)s", str(compiled_statement)
+        )
+        self.assertEqual(
+            datetime(2020, 1, 1, 10, 5), compiled_statement.params["timestamp_1"]
+        )
+        self.assertEqual(
+            datetime(2020, 1, 1, 10, 15), compiled_statement.params["timestamp_2"]
+        )
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.db_price_repository.get_session"
+    )
+    def test_get_candles_or_fail_by_ticker_id_not_found(
+        self, get_session: Mock
+    ) -> None:
+        session = Mock(spec=Session)
+        get_session.return_value.__enter__.return_value = session
+        ticker_query_result = Mock(spec=Result)
+        ticker_query_result.scalars.return_value.all.return_value = [1]
+        session.execute.return_value = ticker_query_result
+
+        with self.assertRaisesRegex(
+            TickerNotFoundException, "Ticker with id '1000' not found."
+        ):
+            self.repository.get_candles_or_fail_by_ticker_id(
+                1000, self.start_date, self.end_date, CandleInterval.ONE_HOUR
+            )
+
+        session.execute.assert_called_once()
+        self.db_candle_translator.bulk_translate_to_domain_model.assert_not_called()
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.db_price_repository.get_session"
+    )
+    def test_get_candles_or_fail_by_ticker_ids(self, get_session: Mock) -> None:
+        session = Mock(spec=Session)
+        get_session.return_value.__enter__.return_value = session
+        ticker_query_result = Mock(spec=Result)
+        ticker_query_result.scalars.return_value.all.return_value = [1, 2]
+        query_result = Mock(spec=Result)
+        candle_rows = [Mock(ticker_id=1), Mock(ticker_id=1)]
+        query_result.all.return_value = candle_rows
+        session.execute.side_effect = [ticker_query_result, query_result]
+        candles = [Mock(spec=Candle), Mock(spec=Candle)]
+        self.db_candle_translator.translate_to_domain_model.side_effect = candles
+
+        result = self.repository.get_candles_or_fail_by_ticker_ids(
+            [1, 2], self.start_date, self.end_date, CandleInterval.FIVE_MINUTES
+        )
+
+        self.assertEqual({1: candles, 2: []}, result)
+        self.assertEqual(2, session.execute.call_count)
+        compiled_statement = str(
+            session.execute.call_args_list[1]
+            .args[0]
+            .compile(dialect=postgresql.dialect())
+        )
+        self.assertIn("FROM price_candles", compiled_statement)
+        self.assertIn("PARTITION BY anon_2.ticker_id, date_bin", compiled_statement)
+        self.assertIn("GROUP BY anon_1.ticker_id, anon_1.bucket", compiled_statement)
+        self.db_candle_translator.translate_to_domain_model.assert_any_call(
+            1, candle_rows[0]
+        )
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.db_price_repository.get_session"
+    )
+    def test_get_timestamp_range_by_ticker_ids(self, get_session: Mock) -> None:
+        session = Mock(spec=Session)
+        get_session.return_value.__enter__.return_value = session
+        query_result = Mock(spec=Result)
+        query_result.one.return_value = (self.start_date, self.end_date)
+        session.execute.return_value = query_result
+
+        result = self.repository.get_timestamp_range_by_ticker_ids([1, 2], None, None)
+
+        self.assertEqual((self.start_date, self.end_date), result)
+        session.execute.assert_called_once()
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.db_price_repository.get_session"
+    )
+    def test_delete_candles_before(self, get_session: Mock) -> None:
+        session = Mock(spec=Session)
+        get_session.return_value.__enter__.return_value = session
+        session.execute.return_value.rowcount = 42
+
+        result = self.repository.delete_candles_before(
+            CandleInterval.ONE_HOUR, datetime(2025, 1, 1, 10, 30)
+        )
+
+        self.assertEqual(42, result)
+        compiled_statement = session.execute.call_args.args[0].compile()
+        self.assertIn("DELETE FROM price_candles", str(compiled_statement))
+        self.assertEqual(
+            ["1h", datetime(2025, 1, 1, 10, 0)],
+            list(compiled_statement.params.values()),
         )
@@ -25,13 +25,50 @@ from app.infrastructure.crypto.database.table_models import TickerTableModel
 from app.infrastructure.crypto.database.translators.db_ticker_translator import (
     DbTickerTranslator,
 )
+from app.infrastructure.crypto.caches.known_ticker_cache import KnownTickerCache
+from app.infrastructure.exchange.caches.exchange_catalog_cache import (
+    ExchangeCatalogCache,
+)
 
 
 class TestDbTickerRepository(TestCase):
     def setUp(self) -> None:
         self.db_ticker_translator = Mock(spec=DbTickerTranslator)
 
-        self.repository = DbTickerRepository(self.db_ticker_translator)
+        self.exchange_catalog_cache = Mock(spec=ExchangeCatalogCache)
+        self.known_ticker_cache = Mock(spec=KnownTickerCache)
+
+        self.repository = DbTickerRepository(
+            self.db_ticker_translator,
+            self.exchange_catalog_cache,
+            self.known_ticker_cache,
+        )
+
+    @patch(
+        "app.infrastructure.crypto.database.repositories.db_ticker_repository.get_session"
+    )
+    def test_get_all(self, get_session: Mock) -> None:
+        ticker_table_models = [
+            TickerTableModel(id=1, ticker="BTCUSDT", symbol_id=1, exchange_id=1),
+            TickerTableModel(id=2, ticker="XBTUSDT", symbol_id=1, exchange_id=2),
+        ]
+        query_result = Mock(spec=Result)
+        query_result.scalars.return_value.all.return_value = ticker_table_models
+        session = Mock(spec=Session)
+        get_session.return_value.__enter__.return_value = session
+        session.execute.return_value = query_result
+        tickers = [
+            Ticker(id=1, ticker="BTCUSDT", symbol_id=1, exchange_id=1),
+            Ticker(id=2, ticker="XBTUSDT", symbol_id=1, exchange_id=2),
+        ]
+        self.db_ticker_translator.bulk_translate_to_domain_model.return_value = tickers
+
+        result = self.repository.get_all()
+
+        self.assertEqual(result, tickers)
+        self.db_ticker_translator.bulk_translate_to_domain_model.assert_called_once_with(
+            ticker_table_models
+        )
 
     @patch(
         "app.infrastructure.crypto.database.repositories.db_ticker_repository.get_session"
@@ -146,6 +183,8 @@ class TestDbTickerRepository(TestCase):
             ticker_table_model
         )
         session.add.assert_called_once_with(ticker_table_model)
+        self.exchange_catalog_cache.invalidate.assert_called_once()
+        self.known_ticker_cache.invalidate.assert_called_once()
 
     @patch(
         "app.infrastructure.crypto.database.repositories.db_ticker_repository.get_session"
@@ -177,6 +216,8 @@ class TestDbTickerRepository(TestCase):
         )
         self.db_ticker_translator.translate_to_domain_model.assert_not_called()
         session.add.assert_called_once_with(ticker_table_model)
+        self.exchange_catalog_cache.invalidate.assert_not_called()
+        self.known_ticker_cache.invalidate.assert_not_called()
 
     @patch(
         "app.infrastructure.crypto.database.repositories.db_ticker_repository.get_session"
@@ -0,0 +1,143 @@
+from datetime import datetime, timezone
+from unittest import TestCase
+from unittest.mock import Mock
+
+from app.domain.crypto.models.candle import Candle
+from app.domain.crypto.models.candle_interval import CandleInterval
+from app.domain.crypto.models.price import Price
+from app.infrastructure.crypto.database.translators.db_candle_translator import (
+    DbCandleTranslator,
+)
+
+
+class TestDbCandleTranslator(TestCase):
+    def setUp(self) -> None:
+        self.translator = DbCandleTranslator()
+
+    def test_bulk_translate_to_domain_model(self) -> None:
+        first_candle_row = Mock(
+            timestamp=datetime(2020, 1, 1),
+            open=1.0,
+            high=2.0,
+            low=0.5,
+            close=1.5,
+            count=10,
+        )
+        second_candle_row = Mock(
+            timestamp=datetime(2020, 1, 2),
+            open=1.5,
+            high=1.5,
+            low=1.5,
+            close=1.5,
+            count=1,
+        )
+
+        result = self.translator.bulk_translate_to_domain_model(
+            1, [first_candle_row, second_candle_row]
+        )
+
+        self.assertEqual(
+            result,
+            [
+                Candle(
+                    ticker_id=1,
+                    timestamp=datetime(2020, 1, 1),
+                    open=1.0,
+                    high=2.0,
+                    low=0.5,
+                    close=1.5,
+                    count=10,
+                ),
+                Candle(
+                    ticker_id=1,
+                    timestamp=datetime(2020, 1, 2),
+                    open=1.5,
+                    high=1.5,
+                    low=1.5,
+                    close=1.5,
+                    count=1,
+                ),
+            ],
+        )
+
+    def test_bulk_translate_prices_to_table_rows(self) -> None:
+        prices = [
+            Price(ticker_id=1, price=2.0, timestamp=datetime(2020, 1, 1, 10, 0, 30)),
+            Price(ticker_id=1, price=1.0, timestamp=datetime(2020, 1, 1, 10, 0, 10)),
+            Price(ticker_id=1, price=3.0, timestamp=datetime(2020, 1, 1, 10, 1, 5)),
+            Price(
+                ticker_id=2,
+                price=5.0,
+                timestamp=datetime(2020, 1, 1, 11, 0, 0, tzinfo=timezone.utc),
+            ),
+        ]
+
+        result = self.translator.bulk_translate_prices_to_table_rows(
+            prices, (CandleInterval.ONE_MINUTE, CandleInterval.ONE_HOUR)
+        )
+
+        self.assertEqual(
+            result,
+            [
+                {
+                    "ticker_id": 1,
+                    "interval": "1m",
+                    "timestamp": datetime(2020, 1, 1, 10, 0),
+                    "open": 1.0,
+                    "high": 2.0,
+                    "low": 1.0,
+                    "close": 2.0,
+                    "count": 2,
+                    "open_timestamp": datetime(2020, 1, 1, 10, 0, 10),
+                    "close_timestamp": datetime(2020, 1, 1, 10, 0, 30),
+                },
+                {
+                    "ticker_id": 1,
+                    "interval": "1h",
+                    "timestamp": datetime(2020, 1, 1, 10, 0),
+                    "open": 1.0,
+                    "high": 3.0,
+                    "low": 1.0,
+                    "close": 3.0,
+                    "count": 3,
+                    "open_timestamp": datetime(2020, 1, 1, 10, 0, 10),
+                    "close_timestamp": datetime(2020, 1, 1, 10, 1, 5),
+                },
+                {
+                    "ticker_id": 1,
+                    "interval": "1m",
+                    "timestamp": datetime(2020, 1, 1, 10, 1),
+                    "open": 3.0,
+                    "high": 3.0,
+                    "low": 3.0,
+                    "close": 3.0,
+                    "count": 1,
+                    "open_timestamp": datetime(2020, 1, 1, 10, 1, 5),
+                    "close_timestamp": datetime(2020, 1, 1, 10, 1, 5),
+                },
+                {
+                    "ticker_id": 2,
+                    "interval": "1m",
+                    "timestamp": datetime(2020, 1, 1, 11, 0),
+                    "open": 5.0,
+                    "high": 5.0,
+                    "low": 5.0,
+                    "close": 5.0,
+                    "count": 1,
+                    "open_timestamp": datetime(2020, 1, 1, 11, 0),
+                    "close_timestamp": datetime(2020, 1, 1, 11, 0),
+                },
+                {
+                    "ticker_id": 2,
+                    "interval": "1h",
+                    "timestamp": datetime(2020, 1, 1, 11, 0),
+                    "open": 5.0,
+                    "high": 5.0,
+                    "low": 5.0,
+                    "close": 5.0,
+                    "count": 1,
+                    "open_timestamp": datetime(2020, 1, 1, 11, 0),
+                    "close_timestamp": datetime(2020, 1, 1, 11, 0),
+                },
+            ],
+        )
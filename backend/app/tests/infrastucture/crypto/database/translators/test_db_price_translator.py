@@ -1,3 +1,4 @@
+from datetime import datetime
 from unittest import TestCase
 
 from app.domain.crypto.models.price import Price
@@ -53,6 +54,50 @@ class TestDbPriceTranslator(TestCase):
         self.assertEqual(result[2].id, 15)
         self.assertEqual(result[2].timestamp, third_domain_price.timestamp)
 
+    def test_translate_to_table_row(self) -> None:
+        domain_price = Price(ticker_id=1, price=5.0)
+
+        result = self.translator.translate_to_table_row(domain_price)
+
+        self.assertEqual(
+            result,
+            {"ticker_id": 1, "price": 5.0, "timestamp": domain_price.timestamp},
+        )
+
+    def test_translate_to_table_row_with_id(self) -> None:
+        domain_price = Price(id=10, ticker_id=1, price=5.0)
+
+        result = self.translator.translate_to_table_row(domain_price)
+
+        self.assertEqual(
+            result,
+            {"ticker_id": 1, "price": 5.0, "timestamp": domain_price.timestamp},
+        )
+
+    def test_bulk_translate_to_table_rows(self) -> None:
+        first_domain_price = Price(id=10, ticker_id=1, price=5.0)
+        second_domain_price = Price(ticker_id=2, price=5.1)
+
+        result = self.translator.bulk_translate_to_table_rows(
+            [first_domain_price, second_domain_price]
+        )
+
+        self.assertEqual(
+            result,
+            [
+                {
+                    "ticker_id": 1,
+                    "price": 5.0,
+                    "timestamp": first_domain_price.timestamp,
+                },
+                {
+                    "ticker_id": 2,
+                    "price": 5.1,
+                    "timestamp": second_domain_price.timestamp,
+                },
+            ],
+        )
+
     def test_translate_to_domain_model(self) -> None:
         price_table_model = PriceTableModel(ticker_id=1, price=5.0)
 
@@ -79,8 +124,34 @@ class TestDbPriceTranslator(TestCase):
         self.assertEqual(result[1].price, 5.1)
         self.assertEqual(result[1].ticker_id, 1)
         self.assertIsNone(result[1].id)
-        self.assertEqual(result[1].timestamp,second_price_table_model.timestamp)
+        self.assertEqual(result[1].timestamp, second_price_table_model.timestamp)
         self.assertEqual(result[2].price, 4.9)
         self.assertEqual(result[2].ticker_id, 1)
         self.assertEqual(result[2].id, 15)
         self.assertEqual(result[2].timestamp, third_price_table_model.timestamp)
+
+    def test_translate_table_row_to_domain_model(self) -> None:
+        timestamp = datetime(2020, 1, 1)
+
+        result = self.translator.translate_table_row_to_domain_model(
+            (10, 1, 5.0, timestamp)
+        )
+
+        self.assertEqual(
+            Price(id=10, ticker_id=1, price=5.0, timestamp=timestamp), result
+        )
+
+    def test_bulk_translate_table_rows_to_domain_model(self) -> None:
+        timestamp = datetime(2020, 1, 1)
+
+        result = self.translator.bulk_translate_table_rows_to_domain_model(
+            [(10, 1, 5.0, timestamp), (11, 2, 4.9, timestamp)]
+        )
+
+        self.assertEqual(
+            [
+                Price(id=10, ticker_id=1, price=5.0, timestamp=timestamp),
+                Price(id=11, ticker_id=2, price=4.9, timestamp=timestamp),
+            ],
+            result,
+        )
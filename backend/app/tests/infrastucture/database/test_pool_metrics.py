@@ -0,0 +1,103 @@
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from sqlalchemy import NullPool, QueuePool
+
+from app.infrastructure.database.pool_metrics import PoolMetrics, PoolMetricsSnapshot
+
+
+class TestPoolMetrics(TestCase):
+    def setUp(self) -> None:
+        self.pool = Mock(spec=QueuePool)
+        self.pool.size.return_value = 5
+        self.pool.checkedout.return_value = 2
+        self.pool.overflow.return_value = -3
+        self.pool.status.return_value = "Pool status"
+
+        self.pool_metrics = PoolMetrics(1.0)
+
+    @patch("app.infrastructure.database.pool_metrics.logger")
+    def test_record_checkout(self, logger: Mock) -> None:
+        self.pool_metrics.record_checkout(0.0005, self.pool)
+        self.pool_metrics.record_checkout(0.02, self.pool)
+        self.pool_metrics.record_checkout(0.02, self.pool)
+
+        result = self.pool_metrics.snapshot("sync", self.pool)
+
+        self.assertEqual(3, result.checkouts)
+        self.assertEqual(0, result.timeouts)
+        self.assertAlmostEqual(0.0405, result.checkout_latency_sum)
+        self.assertEqual(
+            {
+                "0.001": 1,
+                "0.005": 1,
+                "0.01": 1,
+                "0.05": 3,
+                "0.1": 3,
+                "0.5": 3,
+                "1.0": 3,
+                "5.0": 3,
+                "+Inf": 3,
+            },
+            result.checkout_latency_buckets,
+        )
+        logger.warning.assert_not_called()
+
+    @patch("app.infrastructure.database.pool_metrics.logger")
+    def test_record_checkout_slow(self, logger: Mock) -> None:
+        self.pool_metrics.record_checkout(10.0, self.pool)
+
+        result = self.pool_metrics.snapshot("sync", self.pool)
+
+        self.assertEqual(0, result.checkout_latency_buckets["5.0"])
+        self.assertEqual(1, result.checkout_latency_buckets["+Inf"])
+        logger.warning.assert_called_once_with(
+            "Database connection checkout took 10.000s: Pool status"
+        )
+
+    @patch("app.infrastructure.database.pool_metrics.logger")
+    def test_record_timeout(self, logger: Mock) -> None:
+        self.pool_metrics.record_timeout(self.pool)
+
+        result = self.pool_metrics.snapshot("sync", self.pool)
+
+        self.assertEqual(1, result.timeouts)
+        self.assertEqual(0, result.checkouts)
+        logger.error.assert_called_once_with(
+            "Database connection checkout timed out: Pool status"
+        )
+
+    def test_snapshot(self) -> None:
+        result = self.pool_metrics.snapshot("sync", self.pool)
+
+        self.assertEqual(
+            PoolMetricsSnapshot(
+                name="sync",
+                pool_size=5,
+                checked_out=2,
+                overflow=-3,
+                checkouts=0,
+                timeouts=0,
+                checkout_latency_buckets={
+                    "0.001": 0,
+                    "0.005": 0,
+                    "0.01": 0,
+                    "0.05": 0,
+                    "0.1": 0,
+                    "0.5": 0,
+                    "1.0": 0,
+                    "5.0": 0,
+                    "+Inf": 0,
+                },
+                checkout_latency_sum=0.0,
+            ),
+            result,
+        )
+
+    def test_snapshot_without_queue_pool(self) -> None:
+        result = self.pool_metrics.snapshot("async", Mock(spec=NullPool))
+
+        self.assertEqual("async", result.name)
+        self.assertIsNone(result.pool_size)
+        self.assertIsNone(result.checked_out)
+        self.assertIsNone(result.overflow)
@@ -0,0 +1,91 @@
+from unittest import TestCase
+from unittest.mock import patch, Mock
+
+from app.domain.crypto.models.ticker import Ticker
+from app.domain.exchange.models.exchange import Exchange
+from app.infrastructure.exchange.caches.exchange_catalog_cache import (
+    ExchangeCatalogCache,
+)
+
+
+class TestExchangeCatalogCache(TestCase):
+    def setUp(self) -> None:
+        self.exchange = Exchange(
+            id=1,
+            name="Binance",
+            tickers=[Ticker(id=1, symbol_id=1, exchange_id=1, ticker="BTCUSDT")],
+        )
+
+        self.cache = ExchangeCatalogCache(60.0)
+
+    def test_get_missing(self) -> None:
+        self.assertIsNone(self.cache.get("Binance"))
+
+    @patch("app.infrastructure.exchange.caches.exchange_catalog_cache.time")
+    def test_get_cached(self, time: Mock) -> None:
+        time.monotonic.return_value = 100.0
+        self.cache.set("Binance", (1, 1), self.exchange)
+
+        time.monotonic.return_value = 159.0
+        result = self.cache.get("Binance")
+
+        self.assertEqual(result, self.exchange)
+
+    @patch("app.infrastructure.exchange.caches.exchange_catalog_cache.time")
+    def test_get_expired(self, time: Mock) -> None:
+        time.monotonic.return_value = 100.0
+        self.cache.set("Binance", (1, 1), self.exchange)
+
+        time.monotonic.return_value = 160.0
+        result = self.cache.get("Binance")
+
+        self.assertIsNone(result)
+
+    def test_invalidate(self) -> None:
+        self.cache.set("Binance", (1, 1), self.exchange)
+        self.cache.set("all", (1, 1), [self.exchange])
+
+        self.cache.invalidate()
+
+        self.assertIsNone(self.cache.get("Binance"))
+        self.assertIsNone(self.cache.get("all"))
+
+    def test_set_disabled(self) -> None:
+        cache = ExchangeCatalogCache(0)
+
+        cache.set("Binance", (1, 1), self.exchange)
+
+        self.assertIsNone(cache.get("Binance"))
+
+    @patch("app.infrastructure.exchange.caches.exchange_catalog_cache.time")
+    def test_revalidate(self, time: Mock) -> None:
+        time.monotonic.return_value = 100.0
+        self.cache.set("Binance", (1, 1), self.exchange)
+
+        time.monotonic.return_value = 160.0
+        result = self.cache.revalidate("Binance", (1, 1))
+
+        self.assertEqual(result, self.exchange)
+        time.monotonic.return_value = 219.0
+        self.assertEqual(self.cache.get("Binance"), self.exchange)
+
+    def test_revalidate_outdated_catalog_version(self) -> None:
+        self.cache.set("Binance", (1, 1), self.exchange)
+
+        self.assertIsNone(self.cache.revalidate("Binance", (2, 2)))
+        self.assertIsNone(self.cache.get("Binance"))
+        self.assertIsNone(self.cache.revalidate("Binance", (1, 1)))
+
+    def test_get_returns_copies(self) -> None:
+        self.cache.set("all", (1, 1), [self.exchange])
+        self.exchange.tickers.clear()
+
+        result = self.cache.get("all")
+        result[0].tickers.append(
+            Ticker(id=2, symbol_id=2, exchange_id=1, ticker="ETHUSDT")
+        )
+
+        self.assertEqual(
+            [Ticker(id=1, symbol_id=1, exchange_id=1, ticker="BTCUSDT")],
+            self.cache.get("all")[0].tickers,
+        )
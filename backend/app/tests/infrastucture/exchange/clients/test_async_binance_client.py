@@ -0,0 +1,67 @@
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import Mock
+
+from httpx import Response, AsyncClient
+
+from app.domain.crypto.models.ticker import Ticker
+from app.infrastructure.exchange.clients.async_binance_client import (
+    AsyncBinanceClient,
+)
+
+
+class TestAsyncBinanceClient(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.btcusdt_ticker = Ticker(id=1, ticker="BTCUSDT", symbol_id=1, exchange_id=1)
+        self.btceur_ticker = Ticker(id=2, ticker="BTCEUR", symbol_id=2, exchange_id=1)
+        self.http_client = Mock(spec=AsyncClient)
+
+        self.client = AsyncBinanceClient(
+            "http://binance.example.test", self.http_client
+        )
+
+    def test_exchange_name(self) -> None:
+        self.assertEqual(self.client.exchange_name, "Binance")
+
+    async def test_fetch_price_for_tickers(self) -> None:
+        response = Mock(spec=Response)
+        response.status_code = 200
+        response.json.return_value = [
+            {"symbol": "BTCUSDT", "price": "100.000020"},
+            {"symbol": "BTCEUR", "price": "200.0"},
+        ]
+        self.http_client.get.return_value = response
+
+        result = await self.client.fetch_price_for_tickers(
+            [self.btcusdt_ticker, self.btceur_ticker]
+        )
+
+        self.assertEqual(len(result), 2)
+        self.assertEqual(result[0].ticker_id, self.btcusdt_ticker.id)
+        self.assertEqual(result[0].price, 100.000020)
+        self.assertEqual(result[1].ticker_id, self.btceur_ticker.id)
+        self.assertEqual(result[1].price, 200.0)
+        self.http_client.get.assert_awaited_once_with(
+            "http://binance.example.test/api/v3/ticker/price",
+            params={"symbols": '["BTCUSDT","BTCEUR"]'},
+        )
+
+    async def test_fetch_price_for_empty_tickers(self) -> None:
+        result = await self.client.fetch_price_for_tickers([])
+
+        self.assertEqual(result, [])
+        self.http_client.get.assert_not_called()
+
+    async def test_fetch_price_for_tickers_request_fails(self) -> None:
+        response = Mock(spec=Response)
+        response.status_code = 500
+        self.http_client.get.return_value = response
+
+        result = await self.client.fetch_price_for_tickers(
+            [self.btcusdt_ticker, self.btceur_ticker]
+        )
+
+        self.assertEqual(result, [])
+        self.http_client.get.assert_awaited_once_with(
+            "http://binance.example.test/api/v3/ticker/price",
+            params={"symbols": '["BTCUSDT","BTCEUR"]'},
+        )
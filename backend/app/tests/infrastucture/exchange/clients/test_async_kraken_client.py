@@ -0,0 +1,76 @@
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import Mock
+
+from httpx import Response, AsyncClient
+
+from app.domain.crypto.models.ticker import Ticker
+from app.infrastructure.exchange.clients.async_kraken_client import AsyncKrakenClient
+
+
+class TestAsyncKrakenClient(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.xbtusdt_ticker = Ticker(id=3, ticker="XBTUSDT", symbol_id=1, exchange_id=2)
+        self.xxbtzeur_ticker = Ticker(
+            id=4, ticker="XXBTZEUR", symbol_id=2, exchange_id=2
+        )
+        self.http_client = Mock(spec=AsyncClient)
+
+        self.client = AsyncKrakenClient("http://kraken.example.test", self.http_client)
+
+    def test_exchange_name(self) -> None:
+        self.assertEqual(self.client.exchange_name, "Kraken")
+
+    async def test_fetch_price_for_tickers(self) -> None:
+        response = Mock(spec=Response)
+        response.status_code = 200
+        response.json.return_value = {
+            "error": [],
+            "result": {
+                "XBTUSDT": {
+                    "a": ["10.000020", "1", "1.000"],
+                    "b": ["98380.60000", "1", "1.000"],
+                    "c": ["98380.70000", "0.00000508"],
+                },
+                "XXBTZEUR": {
+                    "a": ["2.0", "1", "1.000"],
+                    "b": ["98380.60000", "1", "1.000"],
+                    "c": ["98380.70000", "0.00000508"],
+                },
+            },
+        }
+        self.http_client.get.return_value = response
+
+        result = await self.client.fetch_price_for_tickers(
+            [self.xbtusdt_ticker, self.xxbtzeur_ticker]
+        )
+
+        self.assertEqual(len(result), 2)
+        self.assertEqual(result[0].ticker_id, self.xbtusdt_ticker.id)
+        self.assertEqual(result[0].price, 10.000020)
+        self.assertEqual(result[1].ticker_id, self.xxbtzeur_ticker.id)
+        self.assertEqual(result[1].price, 2.0)
+        self.http_client.get.assert_awaited_once_with(
+            "http://kraken.example.test/0/public/Ticker",
+            params={"pair": "XBTUSDT,XXBTZEUR"},
+        )
+
+    async def test_fetch_price_for_empty_tickers(self) -> None:
+        result = await self.client.fetch_price_for_tickers([])
+
+        self.assertEqual(result, [])
+        self.http_client.get.assert_not_called()
+
+    async def test_fetch_price_for_tickers_request_fails(self) -> None:
+        response = Mock(spec=Response)
+        response.status_code = 500
+        self.http_client.get.return_value = response
+
+        result = await self.client.fetch_price_for_tickers(
+            [self.xbtusdt_ticker, self.xxbtzeur_ticker]
+        )
+
+        self.assertEqual(result, [])
+        self.http_client.get.assert_awaited_once_with(
+            "http://kraken.example.test/0/public/Ticker",
+            params={"pair": "XBTUSDT,XXBTZEUR"},
+        )
@@ -1,5 +1,5 @@
 from unittest import TestCase
-from unittest.mock import patch, Mock
+from unittest.mock import Mock
 
 from httpx import Response, Client
 
@@ -12,19 +12,18 @@ class TestBinanceClient(TestCase):
         self.btcusdt_ticker = Ticker(id=1, ticker="BTCUSDT", symbol_id=1, exchange_id=1)
         self.btceur_ticker = Ticker(id=2, ticker="BTCEUR", symbol_id=2, exchange_id=1)
 
-        self.client = BinanceClient("http://binance.example.test")
+        self.http_client = Mock(spec=Client)
 
-    @patch("app.infrastructure.exchange.clients.binance_client.httpx.Client")
-    def test_fetch_price_for_tickers(self, httpx_client_class: Mock) -> None:
+        self.client = BinanceClient("http://binance.example.test", self.http_client)
+
+    def test_fetch_price_for_tickers(self) -> None:
         response = Mock(spec=Response)
         response.status_code = 200
         response.json.return_value = [
             {"symbol": "BTCUSDT", "price": "100.000020"},
             {"symbol": "BTCEUR", "price": "200.0"},
         ]
-        httpx_client = Mock(spec=Client)
-        httpx_client.get.return_value = response
-        httpx_client_class.return_value.__enter__.return_value = httpx_client
+        self.http_client.get.return_value = response
 
         result = self.client.fetch_price_for_tickers(
             [self.btcusdt_ticker, self.btceur_ticker]
@@ -35,7 +34,7 @@ class TestBinanceClient(TestCase):
         self.assertEqual(result[0].price, 100.000020)
         self.assertEqual(result[1].ticker_id, self.btceur_ticker.id)
         self.assertEqual(result[1].price, 200.0)
-        httpx_client.get.assert_called_once_with(
+        self.http_client.get.assert_called_once_with(
             "http://binance.example.test/api/v3/ticker/price",
             params={"symbols": '["BTCUSDT","BTCEUR"]'},
         )
@@ -44,23 +43,19 @@ class TestBinanceClient(TestCase):
         result = self.client.fetch_price_for_tickers([])
 
         self.assertEqual(result, [])
+        self.http_client.get.assert_not_called()
 
-    @patch("app.infrastructure.exchange.clients.binance_client.httpx.Client")
-    def test_fetch_price_for_tickers_request_fails(
-        self, httpx_client_class: Mock
-    ) -> None:
+    def test_fetch_price_for_tickers_request_fails(self) -> None:
         response = Mock(spec=Response)
         response.status_code = 500
-        httpx_client = Mock(spec=Client)
-        httpx_client.get.return_value = response
-        httpx_client_class.return_value.__enter__.return_value = httpx_client
+        self.http_client.get.return_value = response
 
         result = self.client.fetch_price_for_tickers(
             [self.btcusdt_ticker, self.btceur_ticker]
         )
 
         self.assertEqual(result, [])
-        httpx_client.get.assert_called_once_with(
+        self.http_client.get.assert_called_once_with(
             "http://binance.example.test/api/v3/ticker/price",
             params={"symbols": '["BTCUSDT","BTCEUR"]'},
         )
@@ -1,5 +1,5 @@
 from unittest import TestCase
-from unittest.mock import patch, Mock
+from unittest.mock import Mock
 
 from httpx import Response, Client
 
@@ -14,10 +14,11 @@ class TestKrakenClient(TestCase):
             id=4, ticker="XXBTZEUR", symbol_id=2, exchange_id=2
         )
 
-        self.client = KrakenClient("http://kraken.example.test")
+        self.http_client = Mock(spec=Client)
 
-    @patch("app.infrastructure.exchange.clients.kraken_client.httpx.Client")
-    def test_fetch_price_for_tickers(self, httpx_client_class: Mock) -> None:
+        self.client = KrakenClient("http://kraken.example.test", self.http_client)
+
+    def test_fetch_price_for_tickers(self) -> None:
         response = Mock(spec=Response)
         response.status_code = 200
         response.json.return_value = {
@@ -47,9 +48,7 @@ class TestKrakenClient(TestCase):
                 },
             },
         }
-        httpx_client = Mock(spec=Client)
-        httpx_client.get.return_value = response
-        httpx_client_class.return_value.__enter__.return_value = httpx_client
+        self.http_client.get.return_value = response
 
         result = self.client.fetch_price_for_tickers(
             [self.xbtusdt_ticker, self.xxbtzeur_ticker]
@@ -60,7 +59,7 @@ class TestKrakenClient(TestCase):
         self.assertEqual(result[0].price, 10.000020)
         self.assertEqual(result[1].ticker_id, self.xxbtzeur_ticker.id)
         self.assertEqual(result[1].price, 2.0)
-        httpx_client.get.assert_called_once_with(
+        self.http_client.get.assert_called_once_with(
             "http://kraken.example.test/0/public/Ticker",
             params={"pair": "XBTUSDT,XXBTZEUR"},
         )
@@ -69,23 +68,19 @@ class TestKrakenClient(TestCase):
         result = self.client.fetch_price_for_tickers([])
 
         self.assertEqual(result, [])
+        self.http_client.get.assert_not_called()
 
-    @patch("app.infrastructure.exchange.clients.kraken_client.httpx.Client")
-    def test_fetch_price_for_tickers_request_fails(
-        self, httpx_client_class: Mock
-    ) -> None:
+    def test_fetch_price_for_tickers_request_fails(self) -> None:
         response = Mock(spec=Response)
         response.status_code = 500
-        httpx_client = Mock(spec=Client)
-        httpx_client.get.return_value = response
-        httpx_client_class.return_value.__enter__.return_value = httpx_client
+        self.http_client.get.return_value = response
 
         result = self.client.fetch_price_for_tickers(
             [self.xbtusdt_ticker, self.xxbtzeur_ticker]
         )
 
         self.assertEqual(result, [])
-        httpx_client.get.assert_called_once_with(
+        self.http_client.get.assert_called_once_with(
             "http://kraken.example.test/0/public/Ticker",
             params={"pair": "XBTUSDT,XXBTZEUR"},
         )
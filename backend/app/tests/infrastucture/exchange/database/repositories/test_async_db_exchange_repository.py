@@ -0,0 +1,167 @@
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch, Mock
+
+from sqlalchemy import Result
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.exchange.exceptions.exchange_not_found_exception import (
+    ExchangeNotFoundException,
+)
+from app.domain.exchange.models.exchange import Exchange
+from app.infrastructure.exchange.caches.exchange_catalog_cache import (
+    ExchangeCatalogCache,
+)
+from app.infrastructure.exchange.database.repositories.async_db_exchange_repository import (
+    AsyncDbExchangeRepository,
+)
+from app.infrastructure.exchange.database.table_models import ExchangeTableModel
+from app.infrastructure.exchange.database.translators.db_exchange_translator import (
+    DbExchangeTranslator,
+)
+
+
+class TestAsyncDbExchangeRepository(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.exchange = Exchange(name="Binance")
+        self.exchange_table_model = ExchangeTableModel(name="Binance")
+        self.db_exchange_translator = Mock(spec=DbExchangeTranslator)
+
+        self.exchange_catalog_cache = Mock(spec=ExchangeCatalogCache)
+        self.exchange_catalog_cache.get.return_value = None
+        self.exchange_catalog_cache.revalidate.return_value = None
+
+        self.repository = AsyncDbExchangeRepository(
+            self.db_exchange_translator, self.exchange_catalog_cache
+        )
+
+    @patch(
+        "app.infrastructure.exchange.database.repositories.async_db_exchange_repository.get_async_session"
+    )
+    async def test_get_all(self, get_async_session: Mock) -> None:
+        query_result = Mock(spec=Result)
+        query_result.scalars.return_value.all.return_value = [self.exchange_table_model]
+        session = Mock(spec=AsyncSession)
+        session.execute.return_value = query_result
+        get_async_session.return_value.__aenter__.return_value = session
+        self.db_exchange_translator.bulk_translate_to_domain_model.return_value = [
+            self.exchange
+        ]
+
+        result = await self.repository.get_all()
+
+        self.assertEqual(result, [self.exchange])
+        self.db_exchange_translator.bulk_translate_to_domain_model.assert_called_once_with(
+            [self.exchange_table_model], False
+        )
+        self.exchange_catalog_cache.get.assert_not_called()
+        self.exchange_catalog_cache.set.assert_not_called()
+        query_result.scalars.assert_called_once()
+        query_result.scalars.return_value.all.assert_called_once()
+        session.execute.assert_called_once()
+
+    @patch(
+        "app.infrastructure.exchange.database.repositories.async_db_exchange_repository.get_async_session"
+    )
+    async def test_get_all_fetching_tickers(self, get_async_session: Mock) -> None:
+        query_result = Mock(spec=Result)
+        query_result.scalars.return_value.all.return_value = [self.exchange_table_model]
+        query_result.one.return_value = (4, 7)
+        session = Mock(spec=AsyncSession)
+        session.execute.return_value = query_result
+        get_async_session.return_value.__aenter__.return_value = session
+        self.db_exchange_translator.bulk_translate_to_domain_model.return_value = [
+            self.exchange
+        ]
+
+        result = await self.repository.get_all(fetch_tickers=True)
+
+        self.assertEqual(result, [self.exchange])
+        self.db_exchange_translator.bulk_translate_to_domain_model.assert_called_once_with(
+            [self.exchange_table_model], True
+        )
+        self.assertEqual(2, session.execute.call_count)
+        self.exchange_catalog_cache.get.assert_called_once_with("all")
+        self.exchange_catalog_cache.revalidate.assert_called_once_with("all", (4, 7))
+        self.exchange_catalog_cache.set.assert_called_once_with(
+            "all", (4, 7), [self.exchange]
+        )
+
+    @patch(
+        "app.infrastructure.exchange.database.repositories.async_db_exchange_repository.get_async_session"
+    )
+    async def test_get_all_fetching_cached_tickers(
+        self, get_async_session: Mock
+    ) -> None:
+        self.exchange_catalog_cache.get.return_value = [self.exchange]
+
+        result = await self.repository.get_all(fetch_tickers=True)
+
+        self.assertEqual(result, [self.exchange])
+        self.exchange_catalog_cache.get.assert_called_once_with("all")
+        self.exchange_catalog_cache.revalidate.assert_not_called()
+        self.exchange_catalog_cache.set.assert_not_called()
+        get_async_session.assert_not_called()
+        self.db_exchange_translator.bulk_translate_to_domain_model.assert_not_called()
+
+    @patch(
+        "app.infrastructure.exchange.database.repositories.async_db_exchange_repository.get_async_session"
+    )
+    async def test_get_all_fetching_revalidated_tickers(
+        self, get_async_session: Mock
+    ) -> None:
+        query_result = Mock(spec=Result)
+        query_result.one.return_value = (4, 7)
+        session = Mock(spec=AsyncSession)
+        session.execute.return_value = query_result
+        get_async_session.return_value.__aenter__.return_value = session
+        self.exchange_catalog_cache.revalidate.return_value = [self.exchange]
+
+        result = await self.repository.get_all(fetch_tickers=True)
+
+        self.assertEqual(result, [self.exchange])
+        self.exchange_catalog_cache.revalidate.assert_called_once_with("all", (4, 7))
+        self.exchange_catalog_cache.set.assert_not_called()
+        session.execute.assert_called_once()
+        self.db_exchange_translator.bulk_translate_to_domain_model.assert_not_called()
+
+    @patch(
+        "app.infrastructure.exchange.database.repositories.async_db_exchange_repository.get_async_session"
+    )
+    async def test_get_or_fail_by_id(self, get_async_session: Mock) -> None:
+        query_result = Mock(spec=Result)
+        query_result.scalar_one_or_none.return_value = self.exchange_table_model
+        session = Mock(spec=AsyncSession)
+        session.execute.return_value = query_result
+        get_async_session.return_value.__aenter__.return_value = session
+        self.db_exchange_translator.translate_to_domain_model.return_value = (
+            self.exchange
+        )
+
+        result = await self.repository.get_or_fail_by_id(1)
+
+        self.assertEqual(result, self.exchange)
+        self.assertEqual(result.tickers, None)
+        self.db_exchange_translator.translate_to_domain_model.assert_called_once_with(
+            self.exchange_table_model
+        )
+        query_result.scalar_one_or_none.assert_called_once()
+        session.execute.assert_called_once()
+
+    @patch(
+        "app.infrastructure.exchange.database.repositories.async_db_exchange_repository.get_async_session"
+    )
+    async def test_get_or_fail_by_id_not_found(self, get_async_session: Mock) -> None:
+        query_result = Mock(spec=Result)
+        query_result.scalar_one_or_none.return_value = None
+        session = Mock(spec=AsyncSession)
+        session.execute.return_value = query_result
+        get_async_session.return_value.__aenter__.return_value = session
+
+        with self.assertRaisesRegex(
+            ExchangeNotFoundException, "exchange with id '1000' not found"
+        ):
+            await self.repository.get_or_fail_by_id(1000)
+
+        self.db_exchange_translator.translate_to_domain_model.assert_not_called()
+        query_result.scalar_one_or_none.assert_called_once()
+        session.execute.assert_called_once()
@@ -9,6 +9,9 @@ from app.domain.exchange.exceptions.exchange_not_found_exception import (
     ExchangeNotFoundException,
 )
 from app.domain.exchange.models.exchange import Exchange
+from app.infrastructure.exchange.caches.exchange_catalog_cache import (
+    ExchangeCatalogCache,
+)
 from app.infrastructure.exchange.database.repositories.db_exchange_repository import (
     DbExchangeRepository,
 )
@@ -24,7 +27,13 @@ class TestDbExchangeRepository(TestCase):
         self.exchange_table_model = ExchangeTableModel(name="Binance")
         self.db_exchange_translator = Mock(spec=DbExchangeTranslator)
 
-        self.repository = DbExchangeRepository(self.db_exchange_translator)
+        self.exchange_catalog_cache = Mock(spec=ExchangeCatalogCache)
+        self.exchange_catalog_cache.get.return_value = None
+        self.exchange_catalog_cache.revalidate.return_value = None
+
+        self.repository = DbExchangeRepository(
+            self.db_exchange_translator, self.exchange_catalog_cache
+        )
 
     @patch(
         "app.infrastructure.exchange.database.repositories.db_exchange_repository.get_session"
@@ -43,6 +52,9 @@ class TestDbExchangeRepository(TestCase):
 
         self.assertEqual(result, self.exchange)
         self.assertEqual(result.tickers, None)
+        self.exchange_catalog_cache.get.assert_not_called()
+        self.exchange_catalog_cache.revalidate.assert_not_called()
+        self.exchange_catalog_cache.set.assert_not_called()
         self.db_exchange_translator.translate_to_domain_model.assert_called_once_with(
             self.exchange_table_model, False
         )
@@ -65,6 +77,7 @@ class TestDbExchangeRepository(TestCase):
         )
         query_result = Mock(spec=Result)
         query_result.scalar_one_or_none.return_value = self.exchange_table_model
+        query_result.one.return_value = (4, 7)
         session = Mock(spec=Session)
         session.execute.return_value = query_result
         get_session.return_value.__enter__.return_value = session
@@ -77,7 +90,54 @@ class TestDbExchangeRepository(TestCase):
             self.exchange_table_model, True
         )
         query_result.scalar_one_or_none.assert_called_once()
+        self.assertEqual(2, session.execute.call_count)
+        self.exchange_catalog_cache.get.assert_called_once_with("Binance")
+        self.exchange_catalog_cache.revalidate.assert_called_once_with(
+            "Binance", (4, 7)
+        )
+        self.exchange_catalog_cache.set.assert_called_once_with(
+            "Binance", (4, 7), self.exchange
+        )
+
+    @patch(
+        "app.infrastructure.exchange.database.repositories.db_exchange_repository.get_session"
+    )
+    def test_get_or_fail_by_name_fetching_cached_tickers(
+        self, get_session: Mock
+    ) -> None:
+        self.exchange_catalog_cache.get.return_value = self.exchange
+
+        result = self.repository.get_or_fail_by_name("Binance", True)
+
+        self.assertEqual(result, self.exchange)
+        self.exchange_catalog_cache.get.assert_called_once_with("Binance")
+        self.exchange_catalog_cache.revalidate.assert_not_called()
+        self.exchange_catalog_cache.set.assert_not_called()
+        get_session.assert_not_called()
+        self.db_exchange_translator.translate_to_domain_model.assert_not_called()
+
+    @patch(
+        "app.infrastructure.exchange.database.repositories.db_exchange_repository.get_session"
+    )
+    def test_get_or_fail_by_name_fetching_revalidated_tickers(
+        self, get_session: Mock
+    ) -> None:
+        query_result = Mock(spec=Result)
+        query_result.one.return_value = (4, 7)
+        session = Mock(spec=Session)
+        session.execute.return_value = query_result
+        get_session.return_value.__enter__.return_value = session
+        self.exchange_catalog_cache.revalidate.return_value = self.exchange
+
+        result = self.repository.get_or_fail_by_name("Binance", True)
+
+        self.assertEqual(result, self.exchange)
+        self.exchange_catalog_cache.revalidate.assert_called_once_with(
+            "Binance", (4, 7)
+        )
+        self.exchange_catalog_cache.set.assert_not_called()
         session.execute.assert_called_once()
+        self.db_exchange_translator.translate_to_domain_model.assert_not_called()
 
     @patch(
         "app.infrastructure.exchange.database.repositories.db_exchange_repository.get_session"
@@ -0,0 +1,50 @@
+from datetime import datetime
+from unittest import TestCase
+
+from app.domain.crypto.models.candle import Candle
+from app.interfaces.api.v1.schemas.candle_schema import CandleSchema
+
+
+class TestCandleSchema(TestCase):
+    def test_from_domain(self) -> None:
+        result = CandleSchema.from_domain(
+            Candle(
+                ticker_id=1,
+                timestamp=datetime(2020, 3, 3),
+                open=1.0,
+                high=2.0,
+                low=0.5,
+                close=1.5,
+                count=3,
+            )
+        )
+
+        self.assertEqual(
+            result,
+            CandleSchema(
+                ticker_id=1,
+                timestamp=datetime(2020, 3, 3),
+                open=1.0,
+                high=2.0,
+                low=0.5,
+                close=1.5,
+                count=3,
+            ),
+        )
+
+    def test_dump_json(self) -> None:
+        candle = Candle(
+            ticker_id=1,
+            timestamp=datetime(2020, 3, 3),
+            open=1.0,
+            high=2.0,
+            low=0.5,
+            close=1.5,
+            count=3,
+        )
+
+        result = CandleSchema.dump_json([candle])
+
+        self.assertEqual(
+            f"[{CandleSchema.from_domain(candle).model_dump_json()}]", result.decode()
+        )
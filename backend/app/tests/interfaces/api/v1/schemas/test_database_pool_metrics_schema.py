@@ -0,0 +1,36 @@
+from unittest import TestCase
+
+from app.infrastructure.database.pool_metrics import PoolMetricsSnapshot
+from app.interfaces.api.v1.schemas.database_pool_metrics_schema import (
+    DatabasePoolMetricsSchema,
+)
+
+
+class TestDatabasePoolMetricsSchema(TestCase):
+    def test_from_snapshot(self) -> None:
+        result = DatabasePoolMetricsSchema.from_snapshot(
+            PoolMetricsSnapshot(
+                name="async",
+                pool_size=None,
+                checked_out=None,
+                overflow=None,
+                checkouts=2,
+                timeouts=1,
+                checkout_latency_buckets={"0.001": 1, "+Inf": 2},
+                checkout_latency_sum=0.5,
+            )
+        )
+
+        self.assertEqual(
+            DatabasePoolMetricsSchema(
+                name="async",
+                pool_size=None,
+                checked_out=None,
+                overflow=None,
+                checkouts=2,
+                timeouts=1,
+                checkout_latency_buckets={"0.001": 1, "+Inf": 2},
+                checkout_latency_sum=0.5,
+            ),
+            result,
+        )
@@ -0,0 +1,46 @@
+from datetime import datetime
+from unittest import TestCase
+
+from app.domain.crypto.models.price import Price
+from app.interfaces.api.v1.schemas.price_columns_schema import PriceColumnsSchema
+
+
+class TestPriceColumnsSchema(TestCase):
+    def test_from_domain(self) -> None:
+        result = PriceColumnsSchema.from_domain(
+            1,
+            [
+                Price(id=1, ticker_id=1, price=1.0, timestamp=datetime(2020, 3, 3)),
+                Price(id=2, ticker_id=1, price=2.0, timestamp=datetime(2020, 3, 4)),
+            ],
+        )
+
+        self.assertEqual(
+            result,
+            PriceColumnsSchema(
+                ticker_id=1,
+                ids=[1, 2],
+                prices=[1.0, 2.0],
+                timestamps=[datetime(2020, 3, 3), datetime(2020, 3, 4)],
+            ),
+        )
+
+    def test_from_domain_empty(self) -> None:
+        result = PriceColumnsSchema.from_domain(1, [])
+
+        self.assertEqual(
+            result, PriceColumnsSchema(ticker_id=1, ids=[], prices=[], timestamps=[])
+        )
+
+    def test_dump_json(self) -> None:
+        prices = [
+            Price(id=1, ticker_id=1, price=1.0, timestamp=datetime(2020, 3, 3)),
+            Price(id=2, ticker_id=1, price=2.0, timestamp=datetime(2020, 3, 4)),
+        ]
+
+        result = PriceColumnsSchema.dump_json(1, prices)
+
+        self.assertEqual(
+            PriceColumnsSchema.from_domain(1, prices).model_dump_json(),
+            result.decode(),
+        )
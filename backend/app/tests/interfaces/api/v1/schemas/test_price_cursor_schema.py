@@ -0,0 +1,35 @@
+from datetime import datetime
+from unittest import TestCase
+
+from app.domain.crypto.models.price import Price
+from app.domain.crypto.models.price_cursor import PriceCursor
+from app.interfaces.api.v1.schemas.price_cursor_schema import PriceCursorSchema
+
+
+class TestPriceCursorSchema(TestCase):
+    def test_from_domain(self) -> None:
+        result = PriceCursorSchema.from_domain(
+            Price(id=1, price=2.0, ticker_id=1, timestamp=datetime(2020, 3, 3))
+        )
+
+        self.assertEqual(
+            result, PriceCursorSchema(id=1, timestamp=datetime(2020, 3, 3))
+        )
+
+    def test_to_domain(self) -> None:
+        result = PriceCursorSchema.to_domain(
+            PriceCursorSchema(id=1, timestamp=datetime(2020, 3, 3))
+        )
+
+        self.assertEqual(result, PriceCursor(id=1, timestamp=datetime(2020, 3, 3)))
+
+    def test_encode_decode(self) -> None:
+        price_cursor_schema = PriceCursorSchema(id=1, timestamp=datetime(2020, 3, 3))
+
+        result = PriceCursorSchema.decode(PriceCursorSchema.encode(price_cursor_schema))
+
+        self.assertEqual(result, price_cursor_schema)
+
+    def test_decode_invalid(self) -> None:
+        with self.assertRaisesRegex(ValueError, "Invalid cursor 'nope'"):
+            PriceCursorSchema.decode("nope")
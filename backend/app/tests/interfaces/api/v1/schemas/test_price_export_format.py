@@ -0,0 +1,24 @@
+from unittest import TestCase
+
+from app.interfaces.api.v1.schemas.price_export_format import PriceExportFormat
+
+
+class TestPriceExportFormat(TestCase):
+    def test_media_type(self) -> None:
+        self.assertEqual(
+            "application/vnd.apache.arrow.stream", PriceExportFormat.ARROW.media_type
+        )
+
+    def test_from_accept(self) -> None:
+        self.assertEqual(
+            PriceExportFormat.NDJSON,
+            PriceExportFormat.from_accept("application/x-ndjson"),
+        )
+        self.assertEqual(
+            PriceExportFormat.CSV,
+            PriceExportFormat.from_accept("text/html, Text/CSV;q=0.9, */*;q=0.1"),
+        )
+
+    def test_from_accept_default(self) -> None:
+        self.assertEqual(PriceExportFormat.JSON, PriceExportFormat.from_accept(None))
+        self.assertEqual(PriceExportFormat.JSON, PriceExportFormat.from_accept("*/*"))
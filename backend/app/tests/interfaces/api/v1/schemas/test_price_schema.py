@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from unittest import TestCase
 
 from app.domain.crypto.models.price import Price
@@ -15,3 +15,25 @@ class TestPriceSchema(TestCase):
             result,
             PriceSchema(id=1, price=2.0, ticker_id=1, timestamp=datetime(2020, 3, 3)),
         )
+
+    def test_dump_json(self) -> None:
+        prices = [
+            Price(id=1, price=2.0, ticker_id=1, timestamp=datetime(2020, 3, 3)),
+            Price(
+                id=2,
+                price=2.5,
+                ticker_id=1,
+                timestamp=datetime(2020, 3, 3, 0, 0, 1, 500, tzinfo=timezone.utc),
+            ),
+        ]
+
+        result = PriceSchema.dump_json(prices)
+
+        self.assertEqual(
+            "["
+            + ",".join(
+                PriceSchema.from_domain(price).model_dump_json() for price in prices
+            )
+            + "]",
+            result.decode(),
+        )
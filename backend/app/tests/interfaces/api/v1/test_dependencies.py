@@ -0,0 +1,14 @@
+from unittest import IsolatedAsyncioTestCase
+
+from app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler import (
+    GetAllPricesByTickerIdHandler,
+)
+from app.interfaces.api.v1.dependencies import get_all_prices_by_ticker_id_handler
+
+
+class TestDependencies(IsolatedAsyncioTestCase):
+    async def test_get_all_prices_by_ticker_id_handler(self) -> None:
+        handler = await get_all_prices_by_ticker_id_handler()
+
+        self.assertIsInstance(handler, GetAllPricesByTickerIdHandler)
+        self.assertIs(handler, await get_all_prices_by_ticker_id_handler())
@@ -1,19 +1,53 @@
-from datetime import datetime, timedelta
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+from typing import Callable
 from unittest import TestCase
 from unittest.mock import patch, Mock
 
+import pyarrow as pa
+
 from sqlalchemy import create_engine, event
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 from sqlalchemy.orm import sessionmaker
 from starlette.testclient import TestClient
 
 from app.db import Base
+from app.dependency_injection_factories.infrastructure.crypto.database.repositories.db_price_repository_factory import (
+    DbPriceRepositoryFactory,
+)
+from app.domain.crypto.models.price import Price
+from app.entrypoints.routes.v1.get_all_exchanges_handler import GetAllExchangesHandler
+from app.entrypoints.routes.v1.get_all_prices_by_ticker_id_handler import (
+    GetAllPricesByTickerIdHandler,
+)
+from app.entrypoints.routes.v1.get_all_symbols_handler import GetAllSymbolsHandler
+from app.entrypoints.routes.v1.get_all_tickers_by_exchange_id_handler import (
+    GetAllTickersByExchangeIdHandler,
+)
+from app.entrypoints.routes.v1.get_exchange_by_id_handler import GetExchangeByIdHandler
+from app.entrypoints.routes.v1.get_symbol_by_id_handler import GetSymbolByIdHandler
+from app.entrypoints.routes.v1.get_ticker_by_id_handler import GetTickerByIdHandler
+from app.entrypoints.routes.v1.post_symbol_handler import PostSymbolHandler
+from app.entrypoints.routes.v1.post_ticker_handler import PostTickerHandler
 from app.infrastructure.crypto.database.table_models import (
     SymbolTableModel,
     TickerTableModel,
     PriceTableModel,
 )
 from app.infrastructure.exchange.database.table_models import ExchangeTableModel
+from app.interfaces.api.v1.dependencies import (
+    get_all_exchanges_handler,
+    get_all_prices_by_ticker_id_handler,
+    get_all_symbols_handler,
+    get_all_tickers_by_exchange_id_handler,
+    get_exchange_by_id_handler,
+    get_symbol_by_id_handler,
+    get_ticker_by_id_handler,
+    post_symbol_handler,
+    post_ticker_handler,
+)
 from app.main import app
 
 import app.db as db
@@ -22,26 +56,41 @@ import app.db as db
 class TestRoutes(TestCase):
     @classmethod
     def setUpClass(cls) -> None:
+        database_file, cls.database_path = tempfile.mkstemp(suffix=".sqlite")
+        os.close(database_file)
+
         cls.engine = create_engine(
-            "sqlite:///:memory:",
+            f"sqlite:///{cls.database_path}",
             connect_args={"check_same_thread": False},
-            poolclass=StaticPool,
+        )
+        cls.async_engine = create_async_engine(
+            f"sqlite+aiosqlite:///{cls.database_path}", poolclass=NullPool
         )
 
         @event.listens_for(cls.engine, "connect")
+        @event.listens_for(cls.async_engine.sync_engine, "connect")
         def set_sqlite_pragma(dbapi_connection, connection_record):
             cursor = dbapi_connection.cursor()
             cursor.execute("PRAGMA foreign_keys=ON;")
             cursor.close()
 
         cls.TestingSessionLocal = sessionmaker(bind=cls.engine, expire_on_commit=False)
+        cls.AsyncTestingSessionLocal = async_sessionmaker(
+            bind=cls.async_engine, expire_on_commit=False
+        )
         Base.metadata.create_all(bind=cls.engine)
 
         cls.patcher_engine = patch.object(db, "engine", cls.engine)
         cls.patcher_session = patch.object(db, "SessionLocal", cls.TestingSessionLocal)
+        cls.patcher_async_engine = patch.object(db, "async_engine", cls.async_engine)
+        cls.patcher_async_session = patch.object(
+            db, "AsyncSessionLocal", cls.AsyncTestingSessionLocal
+        )
 
         cls.patcher_engine.start()
         cls.patcher_session.start()
+        cls.patcher_async_engine.start()
+        cls.patcher_async_session.start()
 
         with cls.TestingSessionLocal() as session:
             session.add_all(
@@ -71,38 +120,19 @@ class TestRoutes(TestCase):
             )
             session.commit()
 
-            session.add_all(
-                [
-                    PriceTableModel(
-                        id=1, ticker_id=1, price=10.001, timestamp=datetime(2020, 1, 1)
-                    ),
-                    PriceTableModel(
-                        id=2, ticker_id=1, price=10.002, timestamp=datetime(2020, 1, 2)
-                    ),
-                    PriceTableModel(
-                        id=3, ticker_id=1, price=10.003, timestamp=datetime(2020, 1, 3)
-                    ),
-                    PriceTableModel(
-                        id=4, ticker_id=1, price=10.004, timestamp=datetime(2020, 1, 4)
-                    ),
-                    PriceTableModel(
-                        id=5, ticker_id=1, price=10.003, timestamp=datetime(2020, 1, 5)
-                    ),
-                    PriceTableModel(
-                        id=6, ticker_id=1, price=10.002, timestamp=datetime(2020, 1, 6)
-                    ),
-                    PriceTableModel(
-                        id=7, ticker_id=1, price=10.001, timestamp=datetime(2020, 1, 7)
-                    ),
-                    PriceTableModel(
-                        id=8, ticker_id=1, price=10.0009, timestamp=datetime(2020, 1, 8)
-                    ),
-                    PriceTableModel(
-                        id=9, ticker_id=1, price=10.0008, timestamp=datetime(2020, 1, 9)
-                    ),
-                ]
-            )
-            session.commit()
+        DbPriceRepositoryFactory.create().bulk_save(
+            [
+                Price(id=1, ticker_id=1, price=10.001, timestamp=datetime(2020, 1, 1)),
+                Price(id=2, ticker_id=1, price=10.002, timestamp=datetime(2020, 1, 2)),
+                Price(id=3, ticker_id=1, price=10.003, timestamp=datetime(2020, 1, 3)),
+                Price(id=4, ticker_id=1, price=10.004, timestamp=datetime(2020, 1, 4)),
+                Price(id=5, ticker_id=1, price=10.003, timestamp=datetime(2020, 1, 5)),
+                Price(id=6, ticker_id=1, price=10.002, timestamp=datetime(2020, 1, 6)),
+                Price(id=7, ticker_id=1, price=10.001, timestamp=datetime(2020, 1, 7)),
+                Price(id=8, ticker_id=1, price=10.0009, timestamp=datetime(2020, 1, 8)),
+                Price(id=9, ticker_id=1, price=10.0008, timestamp=datetime(2020, 1, 9)),
+            ]
+        )
 
         cls.client = TestClient(app)
 
@@ -110,6 +140,14 @@ class TestRoutes(TestCase):
     def tearDownClass(cls) -> None:
         cls.patcher_engine.stop()
         cls.patcher_session.stop()
+        cls.patcher_async_engine.stop()
+        cls.patcher_async_session.stop()
+        cls.engine.dispose()
+        os.remove(cls.database_path)
+
+    def __override_handler(self, dependency: Callable, handler_class: type) -> None:
+        app.dependency_overrides[dependency] = lambda: handler_class()
+        self.addCleanup(app.dependency_overrides.pop, dependency)
 
     def test_get_all_symbols(self) -> None:
         expected_status_code = 200
@@ -124,10 +162,20 @@ class TestRoutes(TestCase):
         self.assertEqual(expected_status_code, response.status_code)
         self.assertEqual(expected_content, response.json())
 
+    def test_get_all_symbols_not_modified(self) -> None:
+        entity_tag = self.client.get("/v1/symbols").headers["etag"]
+
+        response = self.client.get("/v1/symbols", headers={"If-None-Match": entity_tag})
+
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(entity_tag, response.headers["etag"])
+        self.assertEqual(b"", response.content)
+
     @patch(
         "app.dependency_injection_factories.application.get_all_symbols.get_all_symbols_query_factory.GetAllSymbolsQueryFactory.create"
     )
     def test_get_all_symbols_fail(self, get_all_symbols_query_create: Mock) -> None:
+        self.__override_handler(get_all_symbols_handler, GetAllSymbolsHandler)
         get_all_symbols_query_create.return_value.execute.side_effect = Exception()
         expected_status_code = 500
         expected_content = {"detail": "An unexpected error happened."}
@@ -177,6 +225,7 @@ class TestRoutes(TestCase):
         "app.dependency_injection_factories.application.get_symbol_by_id.get_symbol_by_id_query_factory.GetSymbolByIdQueryFactory.create"
     )
     def test_get_symbol_by_id_fail(self, get_symbol_by_id_query_create: Mock) -> None:
+        self.__override_handler(get_symbol_by_id_handler, GetSymbolByIdHandler)
         get_symbol_by_id_query_create.return_value.execute.side_effect = Exception()
         expected_status_code = 500
         expected_content = {"detail": "An unexpected error happened."}
@@ -230,6 +279,7 @@ class TestRoutes(TestCase):
         "app.dependency_injection_factories.application.create_symbol.create_symbol_command_factory.CreateSymbolCommandFactory.create"
     )
     def test_post_symbol_fail(self, create_symbol_command_create: Mock) -> None:
+        self.__override_handler(post_symbol_handler, PostSymbolHandler)
         create_symbol_command_create.return_value.execute.side_effect = Exception()
         expected_status_code = 500
         expected_content = {"detail": "An unexpected error happened."}
@@ -254,6 +304,7 @@ class TestRoutes(TestCase):
         "app.dependency_injection_factories.application.get_all_exchanges.get_all_exchanges_query_factory.GetAllExchangesQueryFactory.create"
     )
     def test_get_all_exchanges_fail(self, get_all_exchanges_query_create: Mock) -> None:
+        self.__override_handler(get_all_exchanges_handler, GetAllExchangesHandler)
         get_all_exchanges_query_create.return_value.execute.side_effect = Exception()
         expected_status_code = 500
         expected_content = {"detail": "An unexpected error happened."}
@@ -305,6 +356,7 @@ class TestRoutes(TestCase):
     def test_get_exchanges_by_id_fail(
         self, get_exchange_by_id_query_create: Mock
     ) -> None:
+        self.__override_handler(get_exchange_by_id_handler, GetExchangeByIdHandler)
         get_exchange_by_id_query_create.return_value.execute.side_effect = Exception()
         expected_status_code = 500
         expected_content = {"detail": "An unexpected error happened."}
@@ -359,6 +411,9 @@ class TestRoutes(TestCase):
     def test_get_tickers_by_exchanges_id_fail(
         self, get_all_tickers_by_exchange_id_query: Mock
     ) -> None:
+        self.__override_handler(
+            get_all_tickers_by_exchange_id_handler, GetAllTickersByExchangeIdHandler
+        )
         get_all_tickers_by_exchange_id_query.return_value.execute.side_effect = (
             Exception()
         )
@@ -415,6 +470,7 @@ class TestRoutes(TestCase):
         "app.dependency_injection_factories.application.get_ticker_by_id.get_ticker_by_id_query_factory.GetTickerByIdQueryFactory.create"
     )
     def test_get_ticker_by_id_fail(self, get_ticker_by_id_query_create: Mock) -> None:
+        self.__override_handler(get_ticker_by_id_handler, GetTickerByIdHandler)
         get_ticker_by_id_query_create.return_value.execute.side_effect = Exception()
         expected_status_code = 500
         expected_content = {"detail": "An unexpected error happened."}
@@ -491,6 +547,7 @@ class TestRoutes(TestCase):
         "app.dependency_injection_factories.application.create_ticker.create_ticker_command_factory.CreateTickerCommandFactory.create"
     )
     def test_post_ticker_fail(self, create_ticker_command_create: Mock) -> None:
+        self.__override_handler(post_ticker_handler, PostTickerHandler)
         create_ticker_command_create.return_value.execute.side_effect = Exception()
         expected_status_code = 500
         expected_content = {"detail": "An unexpected error happened."}
@@ -567,6 +624,25 @@ class TestRoutes(TestCase):
         self.assertEqual(expected_status_code, response.status_code)
         self.assertEqual(expected_content, response.json())
 
+    def test_get_all_prices_by_ticker_id_warm_checkouts(self) -> None:
+        checkouts = []
+
+        def count_checkouts(dbapi_connection, connection_record, connection_proxy):
+            checkouts.append(connection_record)
+
+        self.client.get("/v1/tickers/1/prices", params={"end_date": "2020-01-02"})
+        event.listen(self.engine, "checkout", count_checkouts)
+        try:
+            response = self.client.get(
+                "/v1/tickers/1/prices", params={"end_date": "2020-01-02"}
+            )
+        finally:
+            event.remove(self.engine, "checkout", count_checkouts)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual([1, 2], [price["id"] for price in response.json()])
+        self.assertEqual(1, len(checkouts))
+
     def test_get_all_prices_by_ticker_id_start_date(self) -> None:
         expected_status_code = 200
         expected_content = [
@@ -649,6 +725,15 @@ class TestRoutes(TestCase):
         self.assertEqual(expected_status_code, response.status_code)
         self.assertEqual(expected_content, response.json())
 
+    def test_get_all_prices_by_ticker_id_end_date_not_modified(self) -> None:
+        url = "/v1/tickers/1/prices?end_date=2020-01-03T00:00:00"
+        entity_tag = self.client.get(url).headers["etag"]
+
+        response = self.client.get(url, headers={"If-None-Match": entity_tag})
+
+        self.assertEqual(304, response.status_code)
+        self.assertIn("immutable", response.headers["cache-control"])
+
     def test_get_all_prices_by_ticker_id_start_date_and_end_date(self) -> None:
         expected_status_code = 200
         expected_content = [
@@ -719,13 +804,339 @@ class TestRoutes(TestCase):
         self.assertEqual(expected_status_code, response.status_code)
         self.assertEqual(expected_content, response.json())
 
+    def test_get_all_prices_by_ticker_id_paginated(self) -> None:
+        expected_status_code = 200
+        expected_pages = [
+            [
+                {
+                    "id": 3,
+                    "ticker_id": 1,
+                    "price": 10.003,
+                    "timestamp": "2020-01-03T00:00:00",
+                },
+                {
+                    "id": 4,
+                    "ticker_id": 1,
+                    "price": 10.004,
+                    "timestamp": "2020-01-04T00:00:00",
+                },
+            ],
+            [
+                {
+                    "id": 5,
+                    "ticker_id": 1,
+                    "price": 10.003,
+                    "timestamp": "2020-01-05T00:00:00",
+                },
+                {
+                    "id": 6,
+                    "ticker_id": 1,
+                    "price": 10.002,
+                    "timestamp": "2020-01-06T00:00:00",
+                },
+            ],
+            [
+                {
+                    "id": 7,
+                    "ticker_id": 1,
+                    "price": 10.001,
+                    "timestamp": "2020-01-07T00:00:00",
+                },
+            ],
+        ]
+
+        pages = []
+        cursor = None
+        url = "/v1/tickers/1/prices?start_date=2020-01-03T00:00:00&end_date=2020-01-07T00:00:00&limit=2"
+        while True:
+            response = self.client.get(
+                url if cursor is None else f"{url}&cursor={cursor}"
+            )
+            self.assertEqual(expected_status_code, response.status_code)
+            pages.append(response.json())
+
+            cursor = response.headers.get("x-next-cursor")
+            if cursor is None:
+                break
+
+        self.assertEqual(expected_pages, pages)
+
+    def test_get_all_prices_by_ticker_id_ndjson(self) -> None:
+        expected_status_code = 200
+        expected_content = (
+            '{"id":3,"ticker_id":1,"price":10.003,"timestamp":"2020-01-03T00:00:00"}\n'
+            '{"id":4,"ticker_id":1,"price":10.004,"timestamp":"2020-01-04T00:00:00"}\n'
+        )
+
+        response = self.client.get(
+            "/v1/tickers/1/prices?start_date=2020-01-03T00:00:00&end_date=2020-01-04T00:00:00&format=ndjson"
+        )
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual("application/x-ndjson", response.headers["content-type"])
+        self.assertEqual(expected_content, response.text)
+
+    def test_get_all_prices_by_ticker_id_csv_accept(self) -> None:
+        expected_status_code = 200
+        expected_content = (
+            "id,ticker_id,price,timestamp\n"
+            "8,1,10.0009,2020-01-08T00:00:00\n"
+            "9,1,10.0008,2020-01-09T00:00:00\n"
+        )
+
+        response = self.client.get(
+            "/v1/tickers/1/prices?start_date=2020-01-08T00:00:00",
+            headers={"Accept": "text/csv;q=0.9, application/json;q=0.5"},
+        )
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertTrue(response.headers["content-type"].startswith("text/csv"))
+        self.assertEqual(expected_content, response.text)
+
+    def test_get_all_prices_by_ticker_id_csv_paginated(self) -> None:
+        expected_status_code = 200
+        expected_pages = [
+            "id,ticker_id,price,timestamp\n"
+            "3,1,10.003,2020-01-03T00:00:00\n"
+            "4,1,10.004,2020-01-04T00:00:00\n",
+            "id,ticker_id,price,timestamp\n" "5,1,10.003,2020-01-05T00:00:00\n",
+        ]
+
+        pages = []
+        cursor = None
+        url = "/v1/tickers/1/prices?start_date=2020-01-03T00:00:00&end_date=2020-01-05T00:00:00&limit=2&format=csv"
+        while True:
+            response = self.client.get(
+                url if cursor is None else f"{url}&cursor={cursor}"
+            )
+            self.assertEqual(expected_status_code, response.status_code)
+            pages.append(response.text)
+
+            cursor = response.headers.get("x-next-cursor")
+            if cursor is None:
+                break
+
+        self.assertEqual(expected_pages, pages)
+
+    def test_get_all_prices_by_ticker_id_arrow(self) -> None:
+        expected_status_code = 200
+
+        response = self.client.get(
+            "/v1/tickers/1/prices?end_date=2020-01-02T00:00:00",
+            headers={"Accept": "application/vnd.apache.arrow.stream"},
+        )
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual(
+            "application/vnd.apache.arrow.stream", response.headers["content-type"]
+        )
+        self.assertEqual(
+            {
+                "id": [1, 2],
+                "ticker_id": [1, 1],
+                "price": [10.001, 10.002],
+                "timestamp": [datetime(2020, 1, 1), datetime(2020, 1, 2)],
+            },
+            pa.ipc.open_stream(response.content).read_all().to_pydict(),
+        )
+
+    def test_get_all_prices_by_ticker_id_arrow_empty(self) -> None:
+        expected_status_code = 200
+
+        response = self.client.get(
+            "/v1/tickers/1/prices?start_date=2030-01-01T00:00:00&format=arrow"
+        )
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual(0, pa.ipc.open_stream(response.content).read_all().num_rows)
+
+    def test_get_all_prices_by_ticker_id_export_not_found(self) -> None:
+        expected_status_code = 404
+        expected_content = {"detail": "Ticker not found"}
+
+        response = self.client.get("/v1/tickers/10000/prices?format=csv")
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual(expected_content, response.json())
+
+    def test_get_all_prices_by_ticker_id_recent_window(self) -> None:
+        expected_status_code = 200
+        start_date = (datetime.now(timezone.utc) - timedelta(minutes=5)).isoformat()
+
+        response = self.client.get(
+            "/v1/tickers/1/prices", params={"start_date": start_date}
+        )
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual([], response.json())
+
+    def test_get_all_prices_by_ticker_id_recent_window_not_found(self) -> None:
+        expected_status_code = 404
+        expected_content = {"detail": "Ticker not found"}
+        start_date = (datetime.now(timezone.utc) - timedelta(minutes=5)).isoformat()
+
+        response = self.client.get(
+            "/v1/tickers/10000/prices", params={"start_date": start_date}
+        )
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual(expected_content, response.json())
+
+    def test_get_all_prices_by_ticker_id_bucket_export(self) -> None:
+        expected_status_code = 400
+        expected_content = {"detail": "bucket is only available in json format"}
+
+        response = self.client.get("/v1/tickers/1/prices?bucket=1d&format=arrow")
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual(expected_content, response.json())
+
+    def test_get_all_prices_by_ticker_id_bucket(self) -> None:
+        expected_status_code = 200
+        expected_content = [
+            {
+                "ticker_id": 1,
+                "timestamp": "2020-01-01T00:00:00",
+                "open": 10.001,
+                "high": 10.001,
+                "low": 10.001,
+                "close": 10.001,
+                "count": 1,
+            },
+            {
+                "ticker_id": 1,
+                "timestamp": "2020-01-02T00:00:00",
+                "open": 10.002,
+                "high": 10.002,
+                "low": 10.002,
+                "close": 10.002,
+                "count": 1,
+            },
+            {
+                "ticker_id": 1,
+                "timestamp": "2020-01-03T00:00:00",
+                "open": 10.003,
+                "high": 10.003,
+                "low": 10.003,
+                "close": 10.003,
+                "count": 1,
+            },
+        ]
+
+        response = self.client.get(
+            "/v1/tickers/1/prices?end_date=2020-01-03T00:00:00&bucket=1d"
+        )
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual(expected_content, response.json())
+        self.assertEqual("1d", response.headers["x-candle-interval"])
+
+    def test_get_all_prices_by_ticker_id_bucket_auto(self) -> None:
+        expected_status_code = 200
+
+        response = self.client.get(
+            "/v1/tickers/1/prices?start_date=2020-01-01T00:00:00&end_date=2020-01-09T00:00:00&bucket=auto&points=200"
+        )
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual("1h", response.headers["x-candle-interval"])
+        self.assertEqual(9, len(response.json()))
+        self.assertEqual(9, sum(candle["count"] for candle in response.json()))
+
+    def test_get_all_prices_by_ticker_id_bucket_auto_aware_start_date(self) -> None:
+        expected_status_code = 200
+
+        response = self.client.get(
+            "/v1/tickers/1/prices?start_date=2020-01-01T00:00:00Z&bucket=auto&points=200"
+        )
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual("1h", response.headers["x-candle-interval"])
+        self.assertEqual(9, sum(candle["count"] for candle in response.json()))
+
+    def test_get_all_prices_by_ticker_id_bucket_from_rollup(self) -> None:
+        expected_status_code = 200
+
+        response = self.client.get(
+            "/v1/tickers/1/prices?start_date=2020-01-01T00:00:00&end_date=2020-01-09T00:00:00&bucket=5m"
+        )
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual("5m", response.headers["x-candle-interval"])
+        self.assertEqual(9, len(response.json()))
+        self.assertEqual([1] * 9, [candle["count"] for candle in response.json()])
+
+    def test_get_all_prices_by_ticker_id_bucket_whole_candles(self) -> None:
+        expected_status_code = 200
+
+        response = self.client.get(
+            "/v1/tickers/1/prices?start_date=2020-01-01T00:03:00&end_date=2020-01-08T23:59:00&bucket=5m"
+        )
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual(
+            ["2020-01-01T00:00:00", "2020-01-08T00:00:00"],
+            [response.json()[0]["timestamp"], response.json()[-1]["timestamp"]],
+        )
+        self.assertEqual(8, len(response.json()))
+
+    def test_get_all_prices_by_ticker_id_bucket_aware_dates(self) -> None:
+        expected_status_code = 200
+
+        for bucket in ("1m", "5m", "1h"):
+            with self.subTest(bucket=bucket):
+                response = self.client.get(
+                    f"/v1/tickers/1/prices?start_date=2020-01-01T02:00:00%2B02:00&end_date=2020-01-09T00:00:00Z&bucket={bucket}"
+                )
+
+                self.assertEqual(expected_status_code, response.status_code)
+                self.assertEqual(bucket, response.headers["x-candle-interval"])
+                self.assertEqual(
+                    [1] * 9, [candle["count"] for candle in response.json()]
+                )
+
+    def test_get_all_prices_by_ticker_id_bucket_not_found(self) -> None:
+        expected_status_code = 404
+        expected_content = {"detail": "Ticker not found"}
+
+        response = self.client.get("/v1/tickers/10000/prices?bucket=auto")
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual(expected_content, response.json())
+
+    def test_get_all_prices_by_ticker_id_invalid_bucket(self) -> None:
+        expected_status_code = 422
+
+        response = self.client.get("/v1/tickers/1/prices?bucket=7m")
+
+        self.assertEqual(expected_status_code, response.status_code)
+
+    def test_get_all_prices_by_ticker_id_invalid_cursor(self) -> None:
+        expected_status_code = 400
+        expected_content = {"detail": "Invalid cursor"}
+
+        response = self.client.get("/v1/tickers/1/prices?limit=2&cursor=nope")
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual(expected_content, response.json())
+
+    def test_get_all_prices_by_ticker_id_invalid_limit(self) -> None:
+        expected_status_code = 422
+
+        response = self.client.get("/v1/tickers/1/prices?limit=0")
+
+        self.assertEqual(expected_status_code, response.status_code)
+
     @patch(
-        "app.dependency_injection_factories.application.get_all_prices_by_ticker_id.get_all_prices_by_ticker_id_query_factory.GetAllPricesByTickerIdQueryFactory.create"
+        "app.dependency_injection_factories.application.stream_prices_by_ticker_id.stream_prices_by_ticker_id_query_factory.StreamPricesByTickerIdQueryFactory.create"
     )
     def test_get_all_prices_by_ticker_id_fail(
-        self, get_all_prices_by_ticker_id_query_create: Mock
+        self, stream_prices_by_ticker_id_query_create: Mock
     ) -> None:
-        get_all_prices_by_ticker_id_query_create.return_value.execute.side_effect = (
+        self.__override_handler(
+            get_all_prices_by_ticker_id_handler, GetAllPricesByTickerIdHandler
+        )
+        stream_prices_by_ticker_id_query_create.return_value.execute.side_effect = (
             Exception()
         )
         expected_status_code = 500
@@ -744,61 +1155,71 @@ class TestRoutes(TestCase):
                         id=10000000,
                         ticker_id=1,
                         price=10.001,
-                        timestamp=datetime.now() - timedelta(minutes=20),
+                        timestamp=datetime.now(timezone.utc).replace(tzinfo=None)
+                        - timedelta(minutes=20),
                     ),
                     PriceTableModel(
                         id=10,
                         ticker_id=1,
                         price=10.001,
-                        timestamp=datetime.now() - timedelta(minutes=9),
+                        timestamp=datetime.now(timezone.utc).replace(tzinfo=None)
+                        - timedelta(minutes=9),
                     ),
                     PriceTableModel(
                         id=11,
                         ticker_id=1,
                         price=10.002,
-                        timestamp=datetime.now() - timedelta(minutes=8),
+                        timestamp=datetime.now(timezone.utc).replace(tzinfo=None)
+                        - timedelta(minutes=8),
                     ),
                     PriceTableModel(
                         id=12,
                         ticker_id=1,
                         price=10.003,
-                        timestamp=datetime.now() - timedelta(minutes=7),
+                        timestamp=datetime.now(timezone.utc).replace(tzinfo=None)
+                        - timedelta(minutes=7),
                     ),
                     PriceTableModel(
                         id=13,
                         ticker_id=1,
                         price=10.004,
-                        timestamp=datetime.now() - timedelta(minutes=6),
+                        timestamp=datetime.now(timezone.utc).replace(tzinfo=None)
+                        - timedelta(minutes=6),
                     ),
                     PriceTableModel(
                         id=14,
                         ticker_id=1,
                         price=10.003,
-                        timestamp=datetime.now() - timedelta(minutes=5),
+                        timestamp=datetime.now(timezone.utc).replace(tzinfo=None)
+                        - timedelta(minutes=5),
                     ),
                     PriceTableModel(
                         id=15,
                         ticker_id=1,
                         price=10.002,
-                        timestamp=datetime.now() - timedelta(minutes=4),
+                        timestamp=datetime.now(timezone.utc).replace(tzinfo=None)
+                        - timedelta(minutes=4),
                     ),
                     PriceTableModel(
                         id=16,
                         ticker_id=1,
                         price=10.001,
-                        timestamp=datetime.now() - timedelta(minutes=3),
+                        timestamp=datetime.now(timezone.utc).replace(tzinfo=None)
+                        - timedelta(minutes=3),
                     ),
                     PriceTableModel(
                         id=17,
                         ticker_id=1,
                         price=10.0009,
-                        timestamp=datetime.now() - timedelta(minutes=2),
+                        timestamp=datetime.now(timezone.utc).replace(tzinfo=None)
+                        - timedelta(minutes=2),
                     ),
                     PriceTableModel(
                         id=18,
                         ticker_id=1,
                         price=10.0008,
-                        timestamp=datetime.now() - timedelta(minutes=1),
+                        timestamp=datetime.now(timezone.utc).replace(tzinfo=None)
+                        - timedelta(minutes=1),
                     ),
                 ]
             )
@@ -815,10 +1236,16 @@ class TestRoutes(TestCase):
                 session.add_all(
                     [
                         PriceTableModel(
-                            id=19, ticker_id=1, price=0.001, timestamp=datetime.now()
+                            id=19,
+                            ticker_id=1,
+                            price=0.001,
+                            timestamp=datetime.now(timezone.utc).replace(tzinfo=None),
                         ),
                         PriceTableModel(
-                            id=20, ticker_id=1, price=100.002, timestamp=datetime.now()
+                            id=20,
+                            ticker_id=1,
+                            price=100.002,
+                            timestamp=datetime.now(timezone.utc).replace(tzinfo=None),
                         ),
                     ]
                 )
@@ -829,8 +1256,225 @@ class TestRoutes(TestCase):
             self.assertEqual(more_prices[0]["price"], 0.001)
             self.assertEqual(more_prices[1]["price"], 100.002)
 
+    def test_get_all_prices_by_ticker_id_ws_batch(self):
+        with self.TestingSessionLocal() as session:
+            session.add_all(
+                [
+                    PriceTableModel(
+                        id=30,
+                        ticker_id=2,
+                        price=1.5,
+                        timestamp=datetime.now(timezone.utc).replace(tzinfo=None)
+                        - timedelta(minutes=2),
+                    ),
+                    PriceTableModel(
+                        id=31,
+                        ticker_id=2,
+                        price=2.5,
+                        timestamp=datetime.now(timezone.utc).replace(tzinfo=None)
+                        - timedelta(minutes=1),
+                    ),
+                ]
+            )
+            session.commit()
+
+        with self.client.websocket_connect(
+            "/v1/tickers/2/prices/ws?frame=batch"
+        ) as websocket:
+            initial_prices = websocket.receive_json()
+
+            self.assertEqual([30, 31], [price["id"] for price in initial_prices])
+            self.assertEqual([1.5, 2.5], [price["price"] for price in initial_prices])
+
+            with self.TestingSessionLocal() as session:
+                session.add(
+                    PriceTableModel(
+                        id=32,
+                        ticker_id=2,
+                        price=3.5,
+                        timestamp=datetime.now(timezone.utc).replace(tzinfo=None),
+                    )
+                )
+                session.commit()
+
+            more_prices = websocket.receive_json()
+            self.assertEqual([32], [price["id"] for price in more_prices])
+
+        with self.client.websocket_connect(
+            "/v1/tickers/2/prices/ws?frame=columnar"
+        ) as websocket:
+            initial_prices = websocket.receive_json()
+
+            self.assertEqual(2, initial_prices["ticker_id"])
+            self.assertEqual([30, 31, 32], initial_prices["ids"])
+            self.assertEqual([1.5, 2.5, 3.5], initial_prices["prices"])
+            self.assertEqual(3, len(initial_prices["timestamps"]))
+
     def test_get_all_prices_by_ticker_id_ws_ticker_not_found(self):
         with self.client.websocket_connect("/v1/tickers/15000/prices/ws") as websocket:
             error_response = websocket.receive_json()
 
             self.assertEqual({"error": "Ticker not found"}, error_response)
+
+    def test_get_all_prices_by_ticker_ids(self) -> None:
+        expected_status_code = 200
+        expected_content = [
+            {
+                "ticker_id": 1,
+                "prices": [
+                    {
+                        "id": 8,
+                        "ticker_id": 1,
+                        "price": 10.0009,
+                        "timestamp": "2020-01-08T00:00:00",
+                    },
+                    {
+                        "id": 9,
+                        "ticker_id": 1,
+                        "price": 10.0008,
+                        "timestamp": "2020-01-09T00:00:00",
+                    },
+                ],
+            },
+            {
+                "ticker_id": 2,
+                "prices": [],
+            },
+        ]
+        price_statements = []
+
+        def count_price_statements(
+            connection, cursor, statement, parameters, context, executemany
+        ):
+            if "FROM prices" in statement:
+                price_statements.append(statement)
+
+        event.listen(self.engine, "before_cursor_execute", count_price_statements)
+        try:
+            response = self.client.get(
+                "/v1/prices?ticker_ids=2&ticker_ids=1&ticker_ids=2&start_date=2020-01-08T00:00:00&end_date=2020-01-09T00:00:00"
+            )
+        finally:
+            event.remove(self.engine, "before_cursor_execute", count_price_statements)
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual(expected_content, response.json())
+        self.assertEqual(1, len(price_statements))
+
+    def test_get_all_prices_by_ticker_ids_bucket(self) -> None:
+        expected_status_code = 200
+
+        response = self.client.get(
+            "/v1/prices?ticker_ids=1&ticker_ids=2&start_date=2020-01-01T00:00:00&end_date=2020-01-09T00:00:00&bucket=5m"
+        )
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual("5m", response.headers["x-candle-interval"])
+        self.assertEqual([1, 2], [series["ticker_id"] for series in response.json()])
+        self.assertEqual(
+            [1] * 9, [candle["count"] for candle in response.json()[0]["candles"]]
+        )
+        self.assertEqual([], response.json()[1]["candles"])
+
+    def test_get_all_prices_by_ticker_ids_bucket_aware_dates(self) -> None:
+        expected_status_code = 200
+
+        for bucket in ("1m", "5m", "1h"):
+            with self.subTest(bucket=bucket):
+                response = self.client.get(
+                    f"/v1/prices?ticker_ids=1&ticker_ids=2&start_date=2020-01-01T02:00:00%2B02:00&end_date=2020-01-09T00:00:00Z&bucket={bucket}"
+                )
+
+                self.assertEqual(expected_status_code, response.status_code)
+                self.assertEqual(bucket, response.headers["x-candle-interval"])
+                self.assertEqual(
+                    [1] * 9,
+                    [candle["count"] for candle in response.json()[0]["candles"]],
+                )
+
+    def test_get_all_prices_by_ticker_ids_bucket_auto_aware_start_date(self) -> None:
+        expected_status_code = 200
+
+        response = self.client.get(
+            "/v1/prices?ticker_ids=1&ticker_ids=2&start_date=2020-01-01T00:00:00Z&bucket=auto"
+        )
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual(
+            9, sum(candle["count"] for candle in response.json()[0]["candles"])
+        )
+
+    def test_get_all_prices_by_ticker_ids_not_found(self) -> None:
+        expected_status_code = 404
+        expected_content = {"detail": "Ticker not found"}
+
+        response = self.client.get("/v1/prices?ticker_ids=1&ticker_ids=10000")
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual(expected_content, response.json())
+
+    def test_get_all_prices_by_ticker_ids_missing_ticker_ids(self) -> None:
+        expected_status_code = 422
+
+        response = self.client.get("/v1/prices")
+
+        self.assertEqual(expected_status_code, response.status_code)
+
+    def test_get_all_prices_by_ticker_ids_start_date_and_end_date_incorrect(
+        self,
+    ) -> None:
+        expected_status_code = 400
+        expected_content = {"detail": "start_date must be before end_date"}
+
+        response = self.client.get(
+            "/v1/prices?ticker_ids=1&start_date=2020-01-09T00:00:00&end_date=2020-01-01T00:00:00"
+        )
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual(expected_content, response.json())
+
+    def test_get_latest_prices(self) -> None:
+        expected_status_code = 200
+        expected_content = [
+            {"ticker_id": 2, "price": 7.5, "timestamp": "2100-01-01T00:00:00"}
+        ]
+
+        previous_prices = self.client.get("/v1/prices/latest").json()
+        DbPriceRepositoryFactory.create().bulk_save(
+            [Price(ticker_id=2, price=7.5, timestamp=datetime(2100, 1, 1))]
+        )
+        response = self.client.get("/v1/prices/latest?ticker_ids=2&ticker_ids=10000")
+
+        self.assertEqual(expected_status_code, response.status_code)
+        prices = response.json()
+        self.assertGreater(
+            prices[0].pop("id"), max(price["id"] for price in previous_prices)
+        )
+        self.assertEqual(expected_content, prices)
+
+    def test_get_latest_prices_by_exchange_ids(self) -> None:
+        expected_status_code = 200
+
+        response = self.client.get("/v1/prices/latest?exchange_ids=1")
+        empty_response = self.client.get("/v1/prices/latest?exchange_ids=2")
+
+        self.assertEqual(expected_status_code, response.status_code)
+        self.assertEqual([1, 2], [price["ticker_id"] for price in response.json()])
+        self.assertEqual(expected_status_code, empty_response.status_code)
+        self.assertEqual([], empty_response.json())
+
+    def test_get_database_pool_metrics(self):
+        self.client.get("/v1/symbols")
+
+        response = self.client.get("/v1/metrics/database")
+
+        self.assertEqual(200, response.status_code)
+        metrics = {pool["name"]: pool for pool in response.json()}
+        self.assertEqual({"sync", "async"}, set(metrics))
+        self.assertGreater(metrics["async"]["checkouts"], 0)
+        self.assertEqual(
+            metrics["async"]["checkouts"],
+            metrics["async"]["checkout_latency_buckets"]["+Inf"],
+        )
+        self.assertIsNotNone(metrics["sync"]["pool_size"])
+        self.assertIsNone(metrics["async"]["pool_size"])
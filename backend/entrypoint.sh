@@ -12,4 +12,5 @@ alembic upgrade head
 echo "Migrations complete!"
 
 echo "Starting the FastAPI server..."
-exec uvicorn app.main:app --host "${BACKEND_HOST:-0.0.0.0}" --port "${BACKEND_PORT:-8000}"
\ No newline at end of file
+exec uvicorn app.main:app --host "${BACKEND_HOST:-0.0.0.0}" --port "${BACKEND_PORT:-8000}" \
+  --ws websockets --ws-per-message-deflate "${WEBSOCKET_PER_MESSAGE_DEFLATE:-true}"
\ No newline at end of file
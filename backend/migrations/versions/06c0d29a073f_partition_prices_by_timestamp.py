@@ -0,0 +1,146 @@
+"""partition prices by timestamp
+
+Revision ID: 06c0d29a073f
+Revises: 56c8a737efdc
+Create Date: 2026-10-18 10:12:31.402518
+
+"""
+
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "06c0d29a073f"
+down_revision: Union[str, Sequence[str], None] = "56c8a737efdc"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen at this revision: monthly partitions, three of them made ahead of time.
+PARTITIONS_PREMADE = 3
+
+
+def floor_partition_start(instant: datetime) -> datetime:
+    return datetime(instant.year, instant.month, 1)
+
+
+def next_partition_start(start: datetime) -> datetime:
+    if start.month == 12:
+        return datetime(start.year + 1, 1, 1)
+
+    return datetime(start.year, start.month + 1, 1)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("ALTER TABLE prices RENAME TO prices_unpartitioned")
+    op.execute(
+        "ALTER TABLE prices_unpartitioned "
+        "RENAME CONSTRAINT prices_pkey TO prices_unpartitioned_pkey"
+    )
+    op.execute(
+        "ALTER TABLE prices_unpartitioned "
+        "RENAME CONSTRAINT prices_ticker_id_fkey TO prices_unpartitioned_ticker_id_fkey"
+    )
+    op.execute(
+        "ALTER INDEX prices_index_ticker_id_timestamp "
+        "RENAME TO prices_unpartitioned_index_ticker_id_timestamp"
+    )
+    op.execute("ALTER SEQUENCE prices_id_seq OWNED BY NONE")
+
+    op.execute("""
+        CREATE TABLE prices (
+            id INTEGER NOT NULL DEFAULT nextval('prices_id_seq'),
+            ticker_id INTEGER NOT NULL,
+            price DOUBLE PRECISION NOT NULL,
+            timestamp TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            CONSTRAINT prices_pkey PRIMARY KEY (id, timestamp),
+            CONSTRAINT prices_ticker_id_fkey FOREIGN KEY (ticker_id)
+                REFERENCES tickers (id) ON DELETE CASCADE
+        ) PARTITION BY RANGE (timestamp)
+        """)
+    op.create_index(
+        "prices_index_ticker_id_timestamp",
+        "prices",
+        ["ticker_id", "timestamp"],
+        unique=False,
+    )
+    op.execute("CREATE TABLE prices_default PARTITION OF prices DEFAULT")
+
+    first_timestamp = (
+        op.get_bind()
+        .execute(sa.text("SELECT min(timestamp) FROM prices_unpartitioned"))
+        .scalar_one()
+    )
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    partition_start = floor_partition_start(first_timestamp or now)
+    last_partition_start = floor_partition_start(now)
+    for _ in range(PARTITIONS_PREMADE):
+        last_partition_start = next_partition_start(last_partition_start)
+
+    while partition_start <= last_partition_start:
+        partition_end = next_partition_start(partition_start)
+        op.execute(
+            f"CREATE TABLE prices_p{partition_start:%Y%m%d} PARTITION OF prices "
+            f"FOR VALUES FROM ('{partition_start.isoformat()}') "
+            f"TO ('{partition_end.isoformat()}')"
+        )
+        partition_start = partition_end
+
+    op.execute(
+        "INSERT INTO prices (id, ticker_id, price, timestamp) "
+        "SELECT id, ticker_id, price, timestamp FROM prices_unpartitioned"
+    )
+    op.drop_table("prices_unpartitioned")
+    op.execute("ALTER SEQUENCE prices_id_seq OWNED BY prices.id")
+    op.execute("ANALYZE prices")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("ALTER TABLE prices RENAME TO prices_partitioned")
+    op.execute(
+        "ALTER TABLE prices_partitioned "
+        "RENAME CONSTRAINT prices_pkey TO prices_partitioned_pkey"
+    )
+    op.execute(
+        "ALTER TABLE prices_partitioned "
+        "RENAME CONSTRAINT prices_ticker_id_fkey TO prices_partitioned_ticker_id_fkey"
+    )
+    op.execute(
+        "ALTER INDEX prices_index_ticker_id_timestamp "
+        "RENAME TO prices_partitioned_index_ticker_id_timestamp"
+    )
+    op.execute("ALTER SEQUENCE prices_id_seq OWNED BY NONE")
+
+    op.execute("""
+        CREATE TABLE prices (
+            id INTEGER NOT NULL DEFAULT nextval('prices_id_seq'),
+            ticker_id INTEGER NOT NULL,
+            price DOUBLE PRECISION NOT NULL,
+            timestamp TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            CONSTRAINT prices_pkey PRIMARY KEY (id),
+            CONSTRAINT prices_ticker_id_fkey FOREIGN KEY (ticker_id)
+                REFERENCES tickers (id) ON DELETE CASCADE
+        )
+        """)
+    op.execute(
+        "INSERT INTO prices (id, ticker_id, price, timestamp) "
+        "SELECT id, ticker_id, price, timestamp FROM prices_partitioned"
+    )
+    op.create_index(
+        "prices_index_ticker_id_timestamp",
+        "prices",
+        ["ticker_id", "timestamp"],
+        unique=False,
+    )
+    op.drop_table("prices_partitioned")
+    op.execute("ALTER SEQUENCE prices_id_seq OWNED BY prices.id")
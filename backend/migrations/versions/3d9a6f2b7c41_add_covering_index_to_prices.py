@@ -0,0 +1,48 @@
+"""add covering index to prices
+
+Revision ID: 3d9a6f2b7c41
+Revises: 8b3e4f1c2a90
+Create Date: 2026-10-18 16:40:12.583091
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3d9a6f2b7c41"
+down_revision: Union[str, Sequence[str], None] = "8b3e4f1c2a90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.drop_index("prices_index_ticker_id_timestamp", table_name="prices")
+    op.create_index(
+        "prices_index_ticker_id_timestamp",
+        "prices",
+        ["ticker_id", "timestamp"],
+        unique=False,
+        postgresql_include=["price", "id"],
+    )
+    with op.get_context().autocommit_block():
+        op.execute("VACUUM (ANALYZE) prices")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.drop_index("prices_index_ticker_id_timestamp", table_name="prices")
+    op.create_index(
+        "prices_index_ticker_id_timestamp",
+        "prices",
+        ["ticker_id", "timestamp"],
+        unique=False,
+    )
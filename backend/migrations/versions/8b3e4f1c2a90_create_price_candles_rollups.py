@@ -0,0 +1,84 @@
+"""create price candles rollups
+
+Revision ID: 8b3e4f1c2a90
+Revises: 06c0d29a073f
+Create Date: 2026-10-18 11:02:47.118204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "8b3e4f1c2a90"
+down_revision: Union[str, Sequence[str], None] = "06c0d29a073f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ROLLUP_INTERVALS = {"1m": "minute", "1h": "hour", "1d": "day"}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "price_candles",
+        sa.Column("ticker_id", sa.Integer(), nullable=False),
+        sa.Column("interval", sa.String(), nullable=False),
+        sa.Column("timestamp", sa.DateTime(), nullable=False),
+        sa.Column("open", sa.Float(), nullable=False),
+        sa.Column("high", sa.Float(), nullable=False),
+        sa.Column("low", sa.Float(), nullable=False),
+        sa.Column("close", sa.Float(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.Column("open_timestamp", sa.DateTime(), nullable=False),
+        sa.Column("close_timestamp", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["ticker_id"], ["tickers.id"], ondelete="cascade"),
+        sa.PrimaryKeyConstraint("ticker_id", "interval", "timestamp"),
+    )
+
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for interval, precision in ROLLUP_INTERVALS.items():
+        op.execute(f"""
+            INSERT INTO price_candles (
+                ticker_id, interval, timestamp, open, high, low, close, count,
+                open_timestamp, close_timestamp
+            )
+            SELECT
+                ticker_id,
+                '{interval}',
+                bucket,
+                min(open),
+                max(price),
+                min(price),
+                min(close),
+                count(*),
+                min(timestamp),
+                max(timestamp)
+            FROM (
+                SELECT
+                    ticker_id,
+                    price,
+                    timestamp,
+                    date_trunc('{precision}', timestamp) AS bucket,
+                    first_value(price) OVER bucket_window AS open,
+                    last_value(price) OVER bucket_window AS close
+                FROM prices
+                WINDOW bucket_window AS (
+                    PARTITION BY ticker_id, date_trunc('{precision}', timestamp)
+                    ORDER BY timestamp, id
+                    ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
+                )
+            ) AS bucketed_prices
+            GROUP BY ticker_id, bucket
+            """)
+    op.execute("ANALYZE price_candles")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("price_candles")
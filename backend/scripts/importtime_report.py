@@ -0,0 +1,170 @@
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from time import perf_counter
+
+BACKEND_PATH = Path(__file__).resolve().parent.parent
+IMPORT_TIME_PATTERN = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+@dataclass
+class ImportTime:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class ColdStart:
+    target: str
+    wall_ms: float
+    import_ms: float
+    packages_ms: dict[str, float] = field(default_factory=dict)
+
+
+def measure(target: str) -> tuple[float, list[ImportTime]]:
+    environment = os.environ.copy()
+    environment["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(BACKEND_PATH), environment.get("PYTHONPATH")])
+    )
+
+    start = perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=BACKEND_PATH,
+        env=environment,
+        capture_output=True,
+        text=True,
+    )
+    wall_ms = (perf_counter() - start) * 1000
+
+    if process.returncode != 0:
+        raise RuntimeError(f"Importing {target} failed:\n{process.stderr}")
+
+    import_times = []
+    for line in process.stderr.splitlines():
+        match = IMPORT_TIME_PATTERN.match(line)
+        if match is not None:
+            self_us, cumulative_us, indent, module = match.groups()
+            import_times.append(
+                ImportTime(module, int(self_us), int(cumulative_us), len(indent) // 2)
+            )
+
+    return wall_ms, import_times
+
+
+def summarize(target: str, wall_ms: float, import_times: list[ImportTime]) -> ColdStart:
+    packages_us: dict[str, int] = {}
+    for import_time in import_times:
+        package = import_time.module.split(".")[0]
+        packages_us[package] = packages_us.get(package, 0) + import_time.self_us
+
+    return ColdStart(
+        target=target,
+        wall_ms=round(wall_ms, 1),
+        import_ms=round(
+            sum(
+                import_time.cumulative_us
+                for import_time in import_times
+                if import_time.depth == 0
+            )
+            / 1000,
+            1,
+        ),
+        packages_ms={
+            package: round(self_us / 1000, 1)
+            for package, self_us in sorted(
+                packages_us.items(), key=lambda item: item[1], reverse=True
+            )
+        },
+    )
+
+
+def print_report(
+    cold_start: ColdStart,
+    import_times: list[ImportTime],
+    top: int,
+    baseline: None | ColdStart,
+) -> None:
+    print(f"== {cold_start.target}")
+    print(
+        f"wall {cold_start.wall_ms:.1f} ms{delta(cold_start.wall_ms, baseline and baseline.wall_ms)}"
+        f", imports {cold_start.import_ms:.1f} ms{delta(cold_start.import_ms, baseline and baseline.import_ms)}"
+    )
+
+    print("\nslowest packages (self time)")
+    for package, package_ms in list(cold_start.packages_ms.items())[:top]:
+        previous_ms = None if baseline is None else baseline.packages_ms.get(package)
+        print(f"{package_ms:10.1f} ms{delta(package_ms, previous_ms):>14}  {package}")
+
+    print("\nslowest app modules (cumulative time)")
+    app_import_times = sorted(
+        (
+            import_time
+            for import_time in import_times
+            if import_time.module.split(".")[0] == "app"
+        ),
+        key=lambda import_time: import_time.cumulative_us,
+        reverse=True,
+    )
+    for import_time in app_import_times[:top]:
+        print(f"{import_time.cumulative_us / 1000:10.1f} ms  {import_time.module}")
+    print()
+
+
+def delta(current: float, previous: None | float) -> str:
+    if previous is None:
+        return ""
+
+    return f" ({current - previous:+.1f} ms)"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Cold start import time report based on python -X importtime"
+    )
+    parser.add_argument("targets", nargs="*", default=["app.main", "app.tasks"])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--save", type=Path)
+    parser.add_argument("--baseline", type=Path)
+    arguments = parser.parse_args()
+
+    baselines = {}
+    if arguments.baseline is not None:
+        baselines = {
+            target: ColdStart(**cold_start)
+            for target, cold_start in json.loads(arguments.baseline.read_text()).items()
+        }
+
+    cold_starts = {}
+    for target in arguments.targets:
+        wall_ms, import_times = min(
+            (measure(target) for _ in range(arguments.repeat)),
+            key=lambda measurement: measurement[0],
+        )
+        cold_starts[target] = summarize(target, wall_ms, import_times)
+        print_report(
+            cold_starts[target], import_times, arguments.top, baselines.get(target)
+        )
+
+    if arguments.save is not None:
+        arguments.save.write_text(
+            json.dumps(
+                {
+                    target: asdict(cold_start)
+                    for target, cold_start in cold_starts.items()
+                },
+                indent=2,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
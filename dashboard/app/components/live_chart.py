@@ -24,7 +24,6 @@ from app.settings import (
 )
 from queue import Queue
 
-
 data_queue = Queue()
 
 
@@ -63,14 +62,17 @@ def render_live_chart() -> None:
         )
 
     try:
+        new_prices: list[Price] = []
         while not data_queue.empty():
-            new_price = Price(**data_queue.get(block=False))
-            new_rof_df = pd.DataFrame([new_price])
-            new_rof_df["timestamp"] = pd.to_datetime(
-                new_rof_df["timestamp"]
-            ).dt.tz_localize(timezone.utc)
-            st.session_state.data = pd.concat([st.session_state.data, new_rof_df])
+            new_prices.extend(Price(**price) for price in data_queue.get(block=False))
             data_queue.task_done()
+
+        if new_prices:
+            new_rows_df = pd.DataFrame(new_prices)
+            new_rows_df["timestamp"] = pd.to_datetime(
+                new_rows_df["timestamp"]
+            ).dt.tz_localize(timezone.utc)
+            st.session_state.data = pd.concat([st.session_state.data, new_rows_df])
     except Exception:
         st.error("Error processing live data")
 
@@ -102,10 +104,10 @@ def render_live_chart() -> None:
 
 def __websocket_data(ticker_id: None | int, last_minutes: None | int) -> None:
     ws_url_template = BACKEND_WEBSOCKET_URL + "/v1/tickers/{ticker_id}/prices/ws"
-    url = ws_url_template.format(ticker_id=ticker_id)
+    url = f"{ws_url_template.format(ticker_id=ticker_id)}?frame=batch"
 
     if last_minutes is not None:
-        url = f"{url}?last_minutes={last_minutes}"
+        url = f"{url}&last_minutes={last_minutes}"
 
     try:
         ws = create_connection(url)
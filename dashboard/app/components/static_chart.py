@@ -8,7 +8,7 @@ from app.data.schemas.ticker import Ticker
 from requests import HTTPError
 
 from app.data.schemas.exchange import Exchange
-from app.settings import BACKEND_URL
+from app.settings import BACKEND_URL, STATIC_CHART_POINTS
 
 
 def render_static_chart() -> None:
@@ -24,8 +24,11 @@ def render_static_chart() -> None:
     price_df: pd.DataFrame
     try:
         price_df = pd.DataFrame(
-            rest_client.get_all_prices_by_ticker_id(
-                ticker_id, start_date=start_date, end_date=end_date
+            rest_client.get_candles_by_ticker_id(
+                ticker_id,
+                start_date=start_date,
+                end_date=end_date,
+                points=STATIC_CHART_POINTS,
             )
         )
         if price_df.empty:
@@ -53,9 +56,9 @@ def render_static_chart() -> None:
     fig = px.line(
         price_df,
         x="timestamp",
-        y="price",
+        y="close",
         title=f"Historic Prices of {ticker.ticker if ticker else 'UNKNOWN'} in {exchange.name if exchange else 'UNKNOWN'}",
-        labels={"timestamp": "Date and Time", "price": "Price"},
+        labels={"timestamp": "Date and Time", "close": "Price"},
     )
 
     fig.update_layout(
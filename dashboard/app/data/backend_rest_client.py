@@ -2,6 +2,7 @@ from typing import Type, TypeVar
 
 import requests
 
+from app.data.schemas.candle import Candle
 from app.data.schemas.exchange import Exchange
 from app.data.schemas.price import Price
 from app.data.schemas.symbol import Symbol
@@ -22,6 +23,7 @@ class BackendRestClient:
         )
         self.__get_ticker_by_id_endpoint = "/v1/tickers/{ticker_id}"
         self.__get_all_prices_by_ticker_id_endpoint = "/v1/tickers/{ticker_id}/prices"
+        self.__get_all_prices_by_ticker_ids_endpoint = "/v1/prices"
 
     def get_all_symbols(self) -> list[Symbol]:
         return self.__get_all_by_endpoint(self.__get_all_symbols_endpoint, Symbol)
@@ -63,6 +65,81 @@ class BackendRestClient:
 
         return self.__get_all_by_endpoint(endpoint, Price)
 
+    def get_candles_by_ticker_id(
+        self,
+        ticker_id: int,
+        start_date: None | str = None,
+        end_date: None | str = None,
+        bucket: str = "auto",
+        points: None | int = None,
+    ) -> list[Candle]:
+        endpoint = self.__get_all_prices_by_ticker_id_endpoint.format(
+            ticker_id=ticker_id
+        )
+
+        endpoint = f"{endpoint}?bucket={bucket}"
+        if points is not None:
+            endpoint = f"{endpoint}&points={points}"
+        if start_date is not None:
+            endpoint = f"{endpoint}&start_date={start_date}"
+        if end_date is not None:
+            endpoint = f"{endpoint}&end_date={end_date}"
+
+        return self.__get_all_by_endpoint(endpoint, Candle)
+
+    def get_all_prices_by_ticker_ids(
+        self,
+        ticker_ids: list[int],
+        start_date: None | str = None,
+        end_date: None | str = None,
+    ) -> dict[int, list[Price]]:
+        series = self.__get_series_by_ticker_ids(
+            ticker_ids, {"start_date": start_date, "end_date": end_date}
+        )
+
+        return {
+            price_series["ticker_id"]: [
+                Price(**price_dict) for price_dict in price_series["prices"]
+            ]
+            for price_series in series
+        }
+
+    def get_candles_by_ticker_ids(
+        self,
+        ticker_ids: list[int],
+        start_date: None | str = None,
+        end_date: None | str = None,
+        bucket: str = "auto",
+        points: None | int = None,
+    ) -> dict[int, list[Candle]]:
+        series = self.__get_series_by_ticker_ids(
+            ticker_ids,
+            {
+                "start_date": start_date,
+                "end_date": end_date,
+                "bucket": bucket,
+                "points": points,
+            },
+        )
+
+        return {
+            candle_series["ticker_id"]: [
+                Candle(**candle_dict) for candle_dict in candle_series["candles"]
+            ]
+            for candle_series in series
+        }
+
+    def __get_series_by_ticker_ids(
+        self, ticker_ids: list[int], params: dict[str, None | str | int]
+    ) -> list[dict]:
+        response = requests.get(
+            self.__base_url + self.__get_all_prices_by_ticker_ids_endpoint,
+            params={"ticker_ids": ticker_ids, **params},
+        )
+        response.raise_for_status()
+
+        return response.json()
+
     def __get_one_by_endpoint(self, endpoint: str, dataclass_: Type[T]) -> T:
         response = requests.get(self.__base_url + endpoint)
         response.raise_for_status()
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class Candle:
+    ticker_id: int
+    timestamp: datetime
+    open: float
+    high: float
+    low: float
+    close: float
+    count: int